@@ -251,6 +251,8 @@ async def _decommission_worker(db_url: str, worker_id: str, schema: str = "publi
         typer.echo(f"Starting embedded PostgreSQL (instance: {instance_name})...")
     resolved_url = await resolve_database_url(db_url)
 
+    from ..engine.task_backend import notify_task_workers
+
     conn = await asyncpg.connect(resolved_url)
     try:
         table = _fq_table("async_operations", schema)
@@ -263,6 +265,8 @@ async def _decommission_worker(db_url: str, worker_id: str, schema: str = "publi
             """,
             worker_id,
         )
+        if result:
+            await notify_task_workers(conn, schema)
         return len(result)
     finally:
         await conn.close()
@@ -303,6 +307,109 @@ def decommission_worker(
         typer.echo(f"No tasks found for worker '{worker_id}'")
 
 
+async def _import_facts(
+    db_url: str,
+    bank_id: str,
+    input_path: Path,
+    import_id: str,
+    schema: str = "public",
+    batch_size: int = 5000,
+):
+    """Import pre-extracted facts from an NDJSON or Parquet file."""
+    from ..config import get_config
+    from ..engine.embedding_cache import EmbeddingCache
+    from ..engine.embeddings import create_embeddings_from_env
+    from ..engine.memory_engine import _current_schema
+    from ..engine.retain import embedding_processing
+    from ..engine.retain.fact_import import (
+        import_facts,
+        iter_file_chunks,
+        iter_ndjson_records,
+        iter_parquet_records,
+    )
+
+    is_pg0, instance_name, _ = parse_pg0_url(db_url)
+    if is_pg0:
+        typer.echo(f"Starting embedded PostgreSQL (instance: {instance_name})...")
+    resolved_url = await resolve_database_url(db_url)
+
+    _current_schema.set(schema)
+    config = get_config()
+    pool = await asyncpg.create_pool(resolved_url, min_size=1, max_size=2)
+    embeddings = None
+
+    async def embed(texts: list[str]) -> list[list[float]]:
+        # The embedding model is only loaded when some records come without embeddings
+        nonlocal embeddings
+        if embeddings is None:
+            typer.echo("  Loading embedding model for records without embeddings...")
+            embeddings = create_embeddings_from_env()
+            await embeddings.initialize()
+        cache = (
+            EmbeddingCache(pool, config.embeddings_cache_max_age_days, schema)
+            if config.embeddings_cache_enabled
+            else None
+        )
+        return await embedding_processing.generate_embeddings_batch(embeddings, texts, cache=cache)
+
+    try:
+        if input_path.suffix == ".parquet":
+            records = iter_parquet_records(input_path, batch_size=batch_size)
+        else:
+            records = iter_ndjson_records(iter_file_chunks(input_path))
+        return await import_facts(pool, bank_id, records, import_id=import_id, embed=embed, batch_size=batch_size)
+    finally:
+        await pool.close()
+
+
+@app.command(name="import-facts")
+def import_facts_command(
+    bank_id: str = typer.Argument(..., help="Bank to import into"),
+    input_file: Path = typer.Argument(..., help="Input file (.ndjson/.jsonl, or .parquet)"),
+    import_id: str = typer.Option(
+        None,
+        "--import-id",
+        help="Import identifier; reuse it to resume an interrupted import (default: BANK_ID:file name)",
+    ),
+    schema: str = typer.Option("public", "--schema", "-s", help="Database schema"),
+    batch_size: int = typer.Option(5000, "--batch-size", help="Records per transaction"),
+):
+    """Import pre-extracted facts into a bank without LLM extraction.
+
+    Facts are written in batches with a checkpoint per batch. If the import is
+    interrupted, run the same command again to resume after the last committed batch.
+    """
+    from ..engine.retain.fact_import import FactImportError
+
+    config = HindsightConfig.from_env()
+
+    if not config.database_url:
+        typer.echo("Error: Database URL not configured.", err=True)
+        typer.echo("Set HINDSIGHT_API_DATABASE_URL environment variable.", err=True)
+        raise typer.Exit(1)
+
+    if not input_file.exists():
+        typer.echo(f"Error: File not found: {input_file}", err=True)
+        raise typer.Exit(1)
+
+    import_id = import_id or f"{bank_id}:{input_file.name}"
+    typer.echo(f"Importing facts from {input_file} into bank '{bank_id}' (schema: {schema}, import: {import_id})...")
+
+    try:
+        result = asyncio.run(
+            _import_facts(config.database_url, bank_id, input_file, import_id, schema, batch_size=batch_size)
+        )
+    except (FactImportError, ImportError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        typer.echo("Batches before the error were committed; run the command again to resume.", err=True)
+        raise typer.Exit(1)
+
+    if result.records_skipped:
+        typer.echo(f"Skipped {result.records_skipped} records committed by an earlier run")
+    typer.echo(f"Imported {result.records_committed - result.records_skipped} records")
+    typer.echo(f"Import '{result.import_id}' complete: {result.units_imported} memory units")
+
+
 def main():
     app()
 
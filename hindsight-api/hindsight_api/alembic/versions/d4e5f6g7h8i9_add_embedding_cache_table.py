@@ -0,0 +1,57 @@
+"""Add embedding_cache table for content-addressed embeddings
+
+Revision ID: d4e5f6g7h8i9
+Revises: c3d4e5f6g7h8
+Create Date: 2026-03-10
+
+Stores computed embeddings keyed by (model_key, dimension, sha256(text)) so
+re-retained documents, recurring observation text and repeated queries reuse
+vectors instead of calling the embedding provider again.
+
+Vectors are stored as REAL[] rather than vector(n) so one table can hold
+entries for any model dimension.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "d4e5f6g7h8i9"
+down_revision: str | Sequence[str] | None = "c3d4e5f6g7h8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Create embedding_cache table."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}embedding_cache (
+            model_key TEXT NOT NULL,
+            dimension INTEGER NOT NULL,
+            text_hash BYTEA NOT NULL,
+            embedding REAL[] NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (model_key, dimension, text_hash)
+        )
+    """
+    )
+
+    # Age-based eviction scans by creation time
+    op.execute(f"CREATE INDEX IF NOT EXISTS idx_embedding_cache_created_at ON {schema}embedding_cache (created_at)")
+
+
+def downgrade() -> None:
+    """Drop embedding_cache table."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"DROP INDEX IF EXISTS {schema}idx_embedding_cache_created_at")
+    op.execute(f"DROP TABLE IF EXISTS {schema}embedding_cache")
@@ -0,0 +1,46 @@
+"""Add entity_index_generations table
+
+Revision ID: e5f6g7h8i9j0
+Revises: d4e5f6g7h8i9
+Create Date: 2026-03-12
+
+Tracks a per-bank generation counter for entity data. Workers keep an in-memory
+entity index per bank and bump the generation after committing entity changes;
+an index whose generation differs from the stored value is reloaded.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "e5f6g7h8i9j0"
+down_revision: str | Sequence[str] | None = "d4e5f6g7h8i9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Create entity_index_generations table."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}entity_index_generations (
+            bank_id TEXT PRIMARY KEY,
+            generation BIGINT NOT NULL DEFAULT 0
+        )
+    """
+    )
+
+
+def downgrade() -> None:
+    """Drop entity_index_generations table."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"DROP TABLE IF EXISTS {schema}entity_index_generations")
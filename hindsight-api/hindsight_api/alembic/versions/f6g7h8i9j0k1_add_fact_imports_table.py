@@ -0,0 +1,51 @@
+"""Add fact_imports table for resumable bulk fact imports
+
+Revision ID: f6g7h8i9j0k1
+Revises: e5f6g7h8i9j0
+Create Date: 2026-03-12
+
+One row per bulk import of pre-extracted facts. records_committed is advanced
+in the same transaction as each imported batch, so an interrupted import can
+be resumed with the same import_id by skipping the records already committed.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "f6g7h8i9j0k1"
+down_revision: str | Sequence[str] | None = "e5f6g7h8i9j0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Create fact_imports table."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}fact_imports (
+            import_id TEXT PRIMARY KEY,
+            bank_id TEXT NOT NULL,
+            records_committed BIGINT NOT NULL DEFAULT 0,
+            units_imported BIGINT NOT NULL DEFAULT 0,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            completed_at TIMESTAMPTZ
+        )
+    """
+    )
+
+
+def downgrade() -> None:
+    """Drop fact_imports table."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"DROP TABLE IF EXISTS {schema}fact_imports")
@@ -0,0 +1,53 @@
+"""Add pending_links table for staged retain commits
+
+Revision ID: g7h8i9j0k1l2
+Revises: f6g7h8i9j0k1
+Create Date: 2026-03-14
+
+With staged retain commits, memory units are committed before their entity,
+temporal and semantic links exist. Each such unit gets a pending_links row in
+the same transaction; the row is deleted in the transaction that creates the
+unit's links. batch_id is the operation_id of the retain_links recovery task
+that finishes linking if the inline pass is interrupted.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "g7h8i9j0k1l2"
+down_revision: str | Sequence[str] | None = "f6g7h8i9j0k1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Create pending_links table."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}pending_links (
+            unit_id UUID PRIMARY KEY REFERENCES {schema}memory_units(id) ON DELETE CASCADE,
+            batch_id UUID NOT NULL,
+            bank_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            entities JSONB NOT NULL DEFAULT '[]'::jsonb,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+    """
+    )
+    op.execute(f"CREATE INDEX IF NOT EXISTS idx_pending_links_batch ON {schema}pending_links (batch_id, position)")
+
+
+def downgrade() -> None:
+    """Drop pending_links table."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"DROP TABLE IF EXISTS {schema}pending_links")
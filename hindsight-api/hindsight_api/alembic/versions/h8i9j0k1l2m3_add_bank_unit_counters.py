@@ -0,0 +1,143 @@
+"""Add bank_unit_counters table maintained by triggers on memory_units
+
+Revision ID: h8i9j0k1l2m3
+Revises: g7h8i9j0k1l2
+Create Date: 2026-03-16
+
+Bank statistics, the consolidation job and reflect's staleness signal used to
+COUNT(*) memory_units on every call. bank_unit_counters keeps one row per
+(bank_id, fact_type) with the unit count, the number of source units waiting
+for consolidation and the latest consolidated_at. Statement-level triggers
+apply the deltas of every INSERT, UPDATE and DELETE on memory_units in the same
+transaction, so retain, consolidation, delete and clear operations keep the
+counters exact without any changes to their SQL.
+
+last_consolidated_at only moves forward in the trigger; the worker's periodic
+reconciliation (engine/bank_counters.py) recomputes it together with the
+counts.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "h8i9j0k1l2m3"
+down_revision: str | Sequence[str] | None = "g7h8i9j0k1l2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def _delta_upsert(schema: str, delta_select: str) -> str:
+    """Upsert summed deltas into bank_unit_counters, locking counter rows in key order."""
+    return f"""
+        INSERT INTO {schema}bank_unit_counters AS c
+            (bank_id, fact_type, total, pending_consolidation, last_consolidated_at)
+        SELECT bank_id, fact_type, SUM(total), SUM(pending), MAX(consolidated_at)
+        FROM ({delta_select}) d
+        GROUP BY bank_id, fact_type
+        HAVING SUM(total) <> 0 OR SUM(pending) <> 0 OR MAX(consolidated_at) IS NOT NULL
+        ORDER BY bank_id, fact_type
+        ON CONFLICT (bank_id, fact_type) DO UPDATE SET
+            total = c.total + EXCLUDED.total,
+            pending_consolidation = c.pending_consolidation + EXCLUDED.pending_consolidation,
+            last_consolidated_at = GREATEST(c.last_consolidated_at, EXCLUDED.last_consolidated_at);
+    """
+
+
+def _pending(alias: str = "") -> str:
+    """1 if the unit is a source memory waiting for consolidation, else 0."""
+    return f"({alias}consolidated_at IS NULL AND {alias}fact_type IN ('experience', 'world'))::int"
+
+
+def upgrade() -> None:
+    """Create bank_unit_counters, its triggers, and backfill it from memory_units."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}bank_unit_counters (
+            bank_id TEXT NOT NULL,
+            fact_type TEXT NOT NULL,
+            total BIGINT NOT NULL DEFAULT 0,
+            pending_consolidation BIGINT NOT NULL DEFAULT 0,
+            last_consolidated_at TIMESTAMPTZ,
+            PRIMARY KEY (bank_id, fact_type)
+        )
+    """
+    )
+
+    added = f"SELECT bank_id, fact_type, 1 AS total, {_pending()} AS pending, consolidated_at FROM new_units"
+    removed = f"SELECT bank_id, fact_type, -1 AS total, -{_pending()} AS pending, NULL::timestamptz AS consolidated_at FROM old_units"
+    # Only consolidated_at changes on an UPDATE are recorded as a new last_consolidated_at
+    updated = f"""
+        SELECT n.bank_id, n.fact_type, 1 AS total, {_pending("n.")} AS pending,
+               CASE WHEN n.consolidated_at IS DISTINCT FROM o.consolidated_at THEN n.consolidated_at END AS consolidated_at
+        FROM new_units n JOIN old_units o ON o.id = n.id
+        WHERE (n.bank_id, n.fact_type, n.consolidated_at) IS DISTINCT FROM (o.bank_id, o.fact_type, o.consolidated_at)
+        UNION ALL
+        SELECT o.bank_id, o.fact_type, -1, -{_pending("o.")}, NULL::timestamptz
+        FROM new_units n JOIN old_units o ON o.id = n.id
+        WHERE (n.bank_id, n.fact_type, n.consolidated_at) IS DISTINCT FROM (o.bank_id, o.fact_type, o.consolidated_at)
+    """
+
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION {schema}bank_unit_counters_apply() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {_delta_upsert(schema, added)}
+            ELSIF TG_OP = 'DELETE' THEN
+                {_delta_upsert(schema, removed)}
+            ELSE
+                {_delta_upsert(schema, updated)}
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+    """
+    )
+
+    for event, transition in (
+        ("INSERT", "NEW TABLE AS new_units"),
+        ("UPDATE", "OLD TABLE AS old_units NEW TABLE AS new_units"),
+        ("DELETE", "OLD TABLE AS old_units"),
+    ):
+        op.execute(f"DROP TRIGGER IF EXISTS bank_unit_counters_{event.lower()} ON {schema}memory_units")
+        op.execute(
+            f"""
+            CREATE TRIGGER bank_unit_counters_{event.lower()}
+            AFTER {event} ON {schema}memory_units
+            REFERENCING {transition}
+            FOR EACH STATEMENT EXECUTE FUNCTION {schema}bank_unit_counters_apply()
+        """
+        )
+
+    # Creating the triggers locks memory_units against writes until this migration
+    # commits, so the backfill cannot miss or double count concurrent changes.
+    op.execute(f"DELETE FROM {schema}bank_unit_counters")
+    op.execute(
+        f"""
+        INSERT INTO {schema}bank_unit_counters
+            (bank_id, fact_type, total, pending_consolidation, last_consolidated_at)
+        SELECT bank_id, fact_type, COUNT(*), SUM({_pending()}), MAX(consolidated_at)
+        FROM {schema}memory_units
+        GROUP BY bank_id, fact_type
+    """
+    )
+
+
+def downgrade() -> None:
+    """Drop bank_unit_counters and its triggers."""
+    schema = _get_schema_prefix()
+
+    for event in ("insert", "update", "delete"):
+        op.execute(f"DROP TRIGGER IF EXISTS bank_unit_counters_{event} ON {schema}memory_units")
+    op.execute(f"DROP FUNCTION IF EXISTS {schema}bank_unit_counters_apply()")
+    op.execute(f"DROP TABLE IF EXISTS {schema}bank_unit_counters")
@@ -0,0 +1,48 @@
+"""Record the memory units a mental model was built from
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2026-03-18
+
+source_unit_ids holds the memories and observations the last refresh was based
+on, and source_fingerprint a digest of their ids and texts at that time. After
+consolidation, only mental models whose sources changed (or that are close to
+a new observation) are refreshed. Models without recorded sources are
+refreshed as before and record them on that refresh.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "i9j0k1l2m3n4"
+down_revision: str | Sequence[str] | None = "h8i9j0k1l2m3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Add source_unit_ids and source_fingerprint to mental_models."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"ALTER TABLE {schema}mental_models ADD COLUMN IF NOT EXISTS source_unit_ids UUID[]")
+    op.execute(f"ALTER TABLE {schema}mental_models ADD COLUMN IF NOT EXISTS source_fingerprint TEXT")
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_mental_models_source_unit_ids "
+        f"ON {schema}mental_models USING GIN(source_unit_ids)"
+    )
+
+
+def downgrade() -> None:
+    """Remove source_unit_ids and source_fingerprint from mental_models."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"DROP INDEX IF EXISTS {schema}idx_mental_models_source_unit_ids")
+    op.execute(f"ALTER TABLE {schema}mental_models DROP COLUMN IF EXISTS source_fingerprint")
+    op.execute(f"ALTER TABLE {schema}mental_models DROP COLUMN IF EXISTS source_unit_ids")
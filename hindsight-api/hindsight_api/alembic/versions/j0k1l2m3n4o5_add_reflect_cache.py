@@ -0,0 +1,114 @@
+"""Add reflect_cache and per-bank generations
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2026-03-20
+
+bank_generations holds a counter per bank that statement-level triggers bump
+on every INSERT, UPDATE and DELETE of the bank's memory_units and
+mental_models. reflect_cache stores reflect answers together with the
+embedding of their query and the bank generation they were computed at, so a
+paraphrased question can reuse an answer for as long as the bank's memories
+are unchanged.
+
+Query embeddings are stored as REAL[] rather than vector(n) so one table can
+hold entries for any model dimension.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "j0k1l2m3n4o5"
+down_revision: str | Sequence[str] | None = "i9j0k1l2m3n4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tables whose changes invalidate the reflect answers of a bank
+_GENERATION_TABLES = ("memory_units", "mental_models")
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Create bank_generations with its triggers, and reflect_cache."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}bank_generations (
+            bank_id TEXT PRIMARY KEY,
+            generation BIGINT NOT NULL DEFAULT 0
+        )
+    """
+    )
+
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION {schema}bank_generations_bump() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO {schema}bank_generations AS g (bank_id, generation)
+            SELECT DISTINCT bank_id, 1 FROM changed_rows
+            ORDER BY bank_id
+            ON CONFLICT (bank_id) DO UPDATE SET generation = g.generation + 1;
+            RETURN NULL;
+        END;
+        $$
+    """
+    )
+
+    for table in _GENERATION_TABLES:
+        for event, transition in (
+            ("INSERT", "NEW TABLE AS changed_rows"),
+            ("UPDATE", "NEW TABLE AS changed_rows"),
+            ("DELETE", "OLD TABLE AS changed_rows"),
+        ):
+            trigger = f"bank_generations_{event.lower()}"
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger} ON {schema}{table}")
+            op.execute(
+                f"""
+                CREATE TRIGGER {trigger}
+                AFTER {event} ON {schema}{table}
+                REFERENCING {transition}
+                FOR EACH STATEMENT EXECUTE FUNCTION {schema}bank_generations_bump()
+            """
+            )
+
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}reflect_cache (
+            id BIGSERIAL PRIMARY KEY,
+            bank_id TEXT NOT NULL,
+            scope_key BYTEA NOT NULL,
+            generation BIGINT NOT NULL,
+            query TEXT NOT NULL,
+            query_embedding REAL[] NOT NULL,
+            result JSONB NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+    """
+    )
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_reflect_cache_scope ON {schema}reflect_cache (bank_id, scope_key, generation)"
+    )
+    # Age-based eviction scans by creation time
+    op.execute(f"CREATE INDEX IF NOT EXISTS idx_reflect_cache_created_at ON {schema}reflect_cache (created_at)")
+
+
+def downgrade() -> None:
+    """Drop reflect_cache, bank_generations and its triggers."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"DROP INDEX IF EXISTS {schema}idx_reflect_cache_created_at")
+    op.execute(f"DROP INDEX IF EXISTS {schema}idx_reflect_cache_scope")
+    op.execute(f"DROP TABLE IF EXISTS {schema}reflect_cache")
+    for table in _GENERATION_TABLES:
+        for event in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS bank_generations_{event} ON {schema}{table}")
+    op.execute(f"DROP FUNCTION IF EXISTS {schema}bank_generations_bump()")
+    op.execute(f"DROP TABLE IF EXISTS {schema}bank_generations")
@@ -0,0 +1,81 @@
+"""Notify bank profile and directive changes
+
+Revision ID: k1l2m3n4o5p6
+Revises: j0k1l2m3n4o5
+Create Date: 2026-03-24
+
+Row triggers on banks and directives send a NOTIFY on the
+hindsight_bank_changed channel with the schema and bank_id of every changed
+row. API servers and workers LISTEN to it to drop their in-process snapshots
+of the bank's profile, config and directives.
+
+On banks, only changes to the columns held in snapshots (name, disposition,
+mission, config) notify; consolidation bookkeeping updates do not.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "k1l2m3n4o5p6"
+down_revision: str | Sequence[str] | None = "j0k1l2m3n4o5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Trigger events per table
+_NOTIFY_EVENTS = {
+    "banks": "INSERT OR DELETE OR UPDATE OF name, disposition, mission, config",
+    "directives": "INSERT OR DELETE OR UPDATE",
+}
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Create the notification function and its triggers."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION {schema}bank_changed_notify() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            changed_bank_id TEXT;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                changed_bank_id := OLD.bank_id;
+            ELSE
+                changed_bank_id := NEW.bank_id;
+            END IF;
+            PERFORM pg_notify(
+                'hindsight_bank_changed',
+                json_build_object('schema', TG_TABLE_SCHEMA, 'bank_id', changed_bank_id)::text
+            );
+            RETURN NULL;
+        END;
+        $$
+    """
+    )
+
+    for table, events in _NOTIFY_EVENTS.items():
+        op.execute(f"DROP TRIGGER IF EXISTS bank_changed_notify ON {schema}{table}")
+        op.execute(
+            f"""
+            CREATE TRIGGER bank_changed_notify
+            AFTER {events} ON {schema}{table}
+            FOR EACH ROW EXECUTE FUNCTION {schema}bank_changed_notify()
+        """
+        )
+
+
+def downgrade() -> None:
+    """Drop the triggers and the notification function."""
+    schema = _get_schema_prefix()
+
+    for table in _NOTIFY_EVENTS:
+        op.execute(f"DROP TRIGGER IF EXISTS bank_changed_notify ON {schema}{table}")
+    op.execute(f"DROP FUNCTION IF EXISTS {schema}bank_changed_notify()")
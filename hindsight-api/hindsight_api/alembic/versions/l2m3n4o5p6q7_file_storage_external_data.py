@@ -0,0 +1,42 @@
+"""Store file_storage data uncompressed out of line
+
+Revision ID: l2m3n4o5p6q7
+Revises: k1l2m3n4o5p6
+Create Date: 2026-03-25
+
+PostgreSQLFileStorage.retrieve_to_file reads files in substring() slices.
+With the default EXTENDED storage a slice of a compressed value decompresses
+everything before it, so copying a file costs O(n^2). EXTERNAL storage keeps
+values uncompressed in TOAST, where a slice reads only the chunks it covers.
+Uploaded documents (PDF, DOCX, images) are compressed formats already.
+
+Only values written after the upgrade use the new storage; older files stay
+readable as before.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "l2m3n4o5p6q7"
+down_revision: str | Sequence[str] | None = "k1l2m3n4o5p6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Switch file_storage.data to EXTERNAL storage."""
+    schema = _get_schema_prefix()
+    op.execute(f"ALTER TABLE {schema}file_storage ALTER COLUMN data SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    """Restore the default EXTENDED storage."""
+    schema = _get_schema_prefix()
+    op.execute(f"ALTER TABLE {schema}file_storage ALTER COLUMN data SET STORAGE EXTENDED")
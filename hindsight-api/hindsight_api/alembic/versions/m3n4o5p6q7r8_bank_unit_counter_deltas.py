@@ -0,0 +1,143 @@
+"""Append unit counter changes to bank_unit_counter_deltas
+
+Revision ID: m3n4o5p6q7r8
+Revises: l2m3n4o5p6q7
+Create Date: 2026-03-26
+
+The memory_units triggers of h8i9j0k1l2m3 upserted their deltas into the
+bank's bank_unit_counters rows, so every transaction writing units to a bank
+waited on the row lock of the previous one until it committed. The triggers
+now insert their summed deltas into bank_unit_counter_deltas instead, which
+takes no row locks. Readers add a bank's deltas to its bank_unit_counters rows,
+and the worker's periodic reconciliation (engine/bank_counters.py) folds them
+back into those rows.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "m3n4o5p6q7r8"
+down_revision: str | Sequence[str] | None = "l2m3n4o5p6q7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def _summed(delta_select: str) -> str:
+    """Sum the per-row deltas of a statement by bank and fact type."""
+    return f"""
+        SELECT bank_id, fact_type, SUM(total), SUM(pending), MAX(consolidated_at)
+        FROM ({delta_select}) d
+        GROUP BY bank_id, fact_type
+        HAVING SUM(total) <> 0 OR SUM(pending) <> 0 OR MAX(consolidated_at) IS NOT NULL
+    """
+
+
+def _delta_insert(schema: str, delta_select: str) -> str:
+    """Append summed deltas to bank_unit_counter_deltas."""
+    return f"""
+        INSERT INTO {schema}bank_unit_counter_deltas
+            (bank_id, fact_type, total, pending_consolidation, last_consolidated_at)
+        {_summed(delta_select)};
+    """
+
+
+def _delta_upsert(schema: str, delta_select: str) -> str:
+    """Upsert summed deltas into bank_unit_counters, locking counter rows in key order (h8i9j0k1l2m3)."""
+    return f"""
+        INSERT INTO {schema}bank_unit_counters AS c
+            (bank_id, fact_type, total, pending_consolidation, last_consolidated_at)
+        {_summed(delta_select)}
+        ORDER BY bank_id, fact_type
+        ON CONFLICT (bank_id, fact_type) DO UPDATE SET
+            total = c.total + EXCLUDED.total,
+            pending_consolidation = c.pending_consolidation + EXCLUDED.pending_consolidation,
+            last_consolidated_at = GREATEST(c.last_consolidated_at, EXCLUDED.last_consolidated_at);
+    """
+
+
+def _pending(alias: str = "") -> str:
+    """1 if the unit is a source memory waiting for consolidation, else 0."""
+    return f"({alias}consolidated_at IS NULL AND {alias}fact_type IN ('experience', 'world'))::int"
+
+
+def _create_apply_function(schema: str, write) -> None:
+    """(Re)create the trigger function with write(schema, delta_select) as the statement applying deltas."""
+    added = f"SELECT bank_id, fact_type, 1 AS total, {_pending()} AS pending, consolidated_at FROM new_units"
+    removed = f"SELECT bank_id, fact_type, -1 AS total, -{_pending()} AS pending, NULL::timestamptz AS consolidated_at FROM old_units"
+    # Only consolidated_at changes on an UPDATE are recorded as a new last_consolidated_at
+    updated = f"""
+        SELECT n.bank_id, n.fact_type, 1 AS total, {_pending("n.")} AS pending,
+               CASE WHEN n.consolidated_at IS DISTINCT FROM o.consolidated_at THEN n.consolidated_at END AS consolidated_at
+        FROM new_units n JOIN old_units o ON o.id = n.id
+        WHERE (n.bank_id, n.fact_type, n.consolidated_at) IS DISTINCT FROM (o.bank_id, o.fact_type, o.consolidated_at)
+        UNION ALL
+        SELECT o.bank_id, o.fact_type, -1, -{_pending("o.")}, NULL::timestamptz
+        FROM new_units n JOIN old_units o ON o.id = n.id
+        WHERE (n.bank_id, n.fact_type, n.consolidated_at) IS DISTINCT FROM (o.bank_id, o.fact_type, o.consolidated_at)
+    """
+
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION {schema}bank_unit_counters_apply() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {write(schema, added)}
+            ELSIF TG_OP = 'DELETE' THEN
+                {write(schema, removed)}
+            ELSE
+                {write(schema, updated)}
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+    """
+    )
+
+
+def upgrade() -> None:
+    """Create bank_unit_counter_deltas and point the counter triggers at it."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}bank_unit_counter_deltas (
+            bank_id TEXT NOT NULL,
+            fact_type TEXT NOT NULL,
+            total BIGINT NOT NULL DEFAULT 0,
+            pending_consolidation BIGINT NOT NULL DEFAULT 0,
+            last_consolidated_at TIMESTAMPTZ
+        )
+    """
+    )
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_bank_unit_counter_deltas_bank_id ON {schema}bank_unit_counter_deltas (bank_id)"
+    )
+    # The triggers keep calling the same function, so replacing it switches them over
+    _create_apply_function(schema, _delta_insert)
+
+
+def downgrade() -> None:
+    """Fold pending deltas into bank_unit_counters and restore the upserting triggers."""
+    schema = _get_schema_prefix()
+
+    _create_apply_function(schema, _delta_upsert)
+    op.execute(f"LOCK TABLE {schema}bank_unit_counter_deltas IN EXCLUSIVE MODE")
+    op.execute(
+        _delta_upsert(
+            schema,
+            f"""
+            SELECT bank_id, fact_type, total, pending_consolidation AS pending,
+                   last_consolidated_at AS consolidated_at
+            FROM {schema}bank_unit_counter_deltas
+            """,
+        )
+    )
+    op.execute(f"DROP TABLE IF EXISTS {schema}bank_unit_counter_deltas")
@@ -0,0 +1,90 @@
+"""Append bank generation bumps to bank_generation_deltas
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-03-26
+
+The memory_units and mental_models triggers of j0k1l2m3n4o5 upserted the
+bank's bank_generations row on every statement, so every transaction writing
+to a bank waited on the previous one's row lock until it committed, whether
+or not the reflect cache was enabled. The triggers now insert one row per
+changed bank into bank_generation_deltas, which takes no row locks. A bank's
+generation is its bank_generations row plus the sum of its deltas, and the
+worker's periodic reconciliation folds the deltas back into bank_generations.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "n4o5p6q7r8s9"
+down_revision: str | Sequence[str] | None = "m3n4o5p6q7r8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def _create_bump_function(schema: str, statement: str) -> None:
+    """(Re)create the trigger function shared by all generation triggers."""
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION {schema}bank_generations_bump() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            {statement}
+            RETURN NULL;
+        END;
+        $$
+    """
+    )
+
+
+def upgrade() -> None:
+    """Create bank_generation_deltas and point the generation triggers at it."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}bank_generation_deltas (
+            bank_id TEXT NOT NULL,
+            changes BIGINT NOT NULL DEFAULT 1
+        )
+    """
+    )
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_bank_generation_deltas_bank_id ON {schema}bank_generation_deltas (bank_id)"
+    )
+    # The triggers keep calling the same function, so replacing it switches them over
+    _create_bump_function(
+        schema,
+        f"INSERT INTO {schema}bank_generation_deltas (bank_id) SELECT DISTINCT bank_id FROM changed_rows;",
+    )
+
+
+def downgrade() -> None:
+    """Fold pending deltas into bank_generations and restore the upserting triggers."""
+    schema = _get_schema_prefix()
+
+    _create_bump_function(
+        schema,
+        f"""
+            INSERT INTO {schema}bank_generations AS g (bank_id, generation)
+            SELECT DISTINCT bank_id, 1 FROM changed_rows
+            ORDER BY bank_id
+            ON CONFLICT (bank_id) DO UPDATE SET generation = g.generation + 1;
+        """,
+    )
+    op.execute(f"LOCK TABLE {schema}bank_generation_deltas IN EXCLUSIVE MODE")
+    op.execute(
+        f"""
+        INSERT INTO {schema}bank_generations AS g (bank_id, generation)
+        SELECT bank_id, SUM(changes) FROM {schema}bank_generation_deltas GROUP BY bank_id
+        ON CONFLICT (bank_id) DO UPDATE SET generation = g.generation + EXCLUDED.generation
+    """
+    )
+    op.execute(f"DROP TABLE IF EXISTS {schema}bank_generation_deltas")
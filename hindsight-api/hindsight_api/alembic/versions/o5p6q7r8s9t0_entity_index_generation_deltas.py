@@ -0,0 +1,61 @@
+"""Append entity generation bumps to entity_index_generation_deltas
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-03-27
+
+Every retain batch upserted its bank's entity_index_generations row after
+committing, so concurrent batches of a bank queued on that row's lock. Bumps
+now insert a row into entity_index_generation_deltas, which takes no row
+locks. A bank's entity generation is its entity_index_generations row plus the
+sum of its deltas, and the worker's periodic fold moves the deltas back into
+entity_index_generations.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "o5p6q7r8s9t0"
+down_revision: str | Sequence[str] | None = "n4o5p6q7r8s9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Create entity_index_generation_deltas."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}entity_index_generation_deltas (
+            bank_id TEXT NOT NULL,
+            changes BIGINT NOT NULL DEFAULT 1
+        )
+    """
+    )
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_entity_index_generation_deltas_bank_id "
+        f"ON {schema}entity_index_generation_deltas (bank_id)"
+    )
+
+
+def downgrade() -> None:
+    """Fold pending deltas into entity_index_generations and drop the deltas table."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"LOCK TABLE {schema}entity_index_generation_deltas IN EXCLUSIVE MODE")
+    op.execute(
+        f"""
+        INSERT INTO {schema}entity_index_generations AS g (bank_id, generation)
+        SELECT bank_id, SUM(changes) FROM {schema}entity_index_generation_deltas GROUP BY bank_id
+        ON CONFLICT (bank_id) DO UPDATE SET generation = g.generation + EXCLUDED.generation
+    """
+    )
+    op.execute(f"DROP TABLE IF EXISTS {schema}entity_index_generation_deltas")
@@ -13,7 +13,8 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any, Literal
 
-from fastapi import Depends, FastAPI, File, Form, Header, HTTPException, Query, UploadFile
+from fastapi import Depends, FastAPI, File, Form, Header, HTTPException, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
 
 from hindsight_api.extensions import AuthenticationError
 
@@ -73,7 +74,7 @@ def FieldWithDefault(default_factory: Callable, **kwargs) -> Any:
 
 from hindsight_api.config import get_config
 from hindsight_api.engine.memory_engine import Budget, _current_schema, _get_tiktoken_encoding, fq_table
-from hindsight_api.engine.response_models import VALID_RECALL_FACT_TYPES, MemoryFact, TokenUsage
+from hindsight_api.engine.response_models import VALID_RECALL_FACT_TYPES, MemoryFact, ReflectResult, TokenUsage
 from hindsight_api.engine.search.tags import TagsMatch
 from hindsight_api.extensions import HttpExtension, OperationValidationError, load_extension
 from hindsight_api.metrics import create_metrics_collector, get_metrics_collector, initialize_metrics
@@ -585,6 +586,30 @@ class FileRetainResponse(BaseModel):
     )
 
 
+class ImportMemoriesResponse(BaseModel):
+    """Response model for the bulk fact import endpoint."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "success": True,
+                "bank_id": "user123",
+                "import_id": "migration-2024-01-15",
+                "records_committed": 250000,
+                "records_skipped": 0,
+                "units_imported": 250000,
+            }
+        },
+    )
+
+    success: bool
+    bank_id: str
+    import_id: str = Field(description="Import identifier. Send it again to resume an interrupted import.")
+    records_committed: int = Field(description="Records of the import committed so far, including earlier attempts")
+    records_skipped: int = Field(description="Records skipped because an earlier attempt already committed them")
+    units_imported: int = Field(description="Memory units created by this import, including earlier attempts")
+
+
 class FactsIncludeOptions(BaseModel):
     """Options for including facts (based_on) in reflect results."""
 
@@ -794,6 +819,83 @@ class ReflectResponse(BaseModel):
         default=None,
         description="Execution trace of tool and LLM calls. Only present when include.tool_calls is set.",
     )
+    cache_hit: bool = Field(
+        default=False,
+        description="Whether the response was served from the reflect cache (HINDSIGHT_API_REFLECT_CACHE_ENABLED).",
+    )
+
+
+def _build_reflect_response(request: ReflectRequest, core_result: ReflectResult) -> ReflectResponse:
+    """Build the HTTP response of a reflect from the engine's ReflectResult."""
+    # Build based_on (memories + mental_models + directives) if facts are requested
+    based_on_result: ReflectBasedOn | None = None
+    if request.include.facts is not None:
+        memories = []
+        mental_models = []
+        directives = []
+        for fact_type, facts in core_result.based_on.items():
+            if fact_type == "directives":
+                # Directives are dicts with id, name, content (not MemoryFact objects)
+                for directive in facts:
+                    directives.append(
+                        ReflectDirective(
+                            id=directive["id"],
+                            name=directive["name"],
+                            content=directive["content"],
+                        )
+                    )
+            elif fact_type == "mental-models":
+                # Mental models are MemoryFact with type "mental-models" (note: hyphen, not underscore)
+                for fact in facts:
+                    mental_models.append(
+                        ReflectMentalModel(
+                            id=fact.id,
+                            text=fact.text,
+                            context=fact.context,
+                        )
+                    )
+            else:
+                for fact in facts:
+                    memories.append(
+                        ReflectFact(
+                            id=fact.id,
+                            text=fact.text,
+                            type=fact.fact_type,
+                            context=fact.context,
+                            occurred_start=fact.occurred_start,
+                            occurred_end=fact.occurred_end,
+                        )
+                    )
+        based_on_result = ReflectBasedOn(memories=memories, mental_models=mental_models, directives=directives)
+
+    # Build trace (tool_calls + llm_calls + observations) if tool_calls is requested
+    trace_result: ReflectTrace | None = None
+    if request.include.tool_calls is not None:
+        include_output = request.include.tool_calls.output
+        tool_calls = [
+            ReflectToolCall(
+                tool=tc.tool,
+                input=tc.input,
+                output=tc.output if include_output else None,
+                duration_ms=tc.duration_ms,
+                iteration=tc.iteration,
+            )
+            for tc in core_result.tool_trace
+        ]
+        llm_calls = [ReflectLLMCall(scope=lc.scope, duration_ms=lc.duration_ms) for lc in core_result.llm_trace]
+        trace_result = ReflectTrace(
+            tool_calls=tool_calls,
+            llm_calls=llm_calls,
+        )
+
+    return ReflectResponse(
+        text=core_result.text,
+        based_on=based_on_result,
+        structured_output=core_result.structured_output,
+        usage=core_result.usage,
+        trace=trace_result,
+        cache_hit=core_result.cache_hit,
+    )
 
 
 class DispositionTraits(BaseModel):
@@ -1867,6 +1969,9 @@ def create_app(
                 tenant_extension=memory._tenant_extension,
                 max_slots=config.worker_max_slots,
                 consolidation_max_slots=config.worker_consolidation_max_slots,
+                counters_reconcile_interval=config.worker_counters_reconcile_interval_seconds,
+                listen_dsn=memory.db_url if config.worker_notify_enabled else None,
+                notify_poll_interval_ms=config.worker_notify_poll_interval_ms,
             )
             poller_task = asyncio.create_task(poller.run())
             logging.info(f"Worker poller started (worker_id={worker_id})")
@@ -2442,74 +2547,7 @@ def _register_routes(app: FastAPI):
                     tags_match=request.tags_match,
                 )
 
-            # Build based_on (memories + mental_models + directives) if facts are requested
-            based_on_result: ReflectBasedOn | None = None
-            if request.include.facts is not None:
-                memories = []
-                mental_models = []
-                directives = []
-                for fact_type, facts in core_result.based_on.items():
-                    if fact_type == "directives":
-                        # Directives are dicts with id, name, content (not MemoryFact objects)
-                        for directive in facts:
-                            directives.append(
-                                ReflectDirective(
-                                    id=directive["id"],
-                                    name=directive["name"],
-                                    content=directive["content"],
-                                )
-                            )
-                    elif fact_type == "mental-models":
-                        # Mental models are MemoryFact with type "mental-models" (note: hyphen, not underscore)
-                        for fact in facts:
-                            mental_models.append(
-                                ReflectMentalModel(
-                                    id=fact.id,
-                                    text=fact.text,
-                                    context=fact.context,
-                                )
-                            )
-                    else:
-                        for fact in facts:
-                            memories.append(
-                                ReflectFact(
-                                    id=fact.id,
-                                    text=fact.text,
-                                    type=fact.fact_type,
-                                    context=fact.context,
-                                    occurred_start=fact.occurred_start,
-                                    occurred_end=fact.occurred_end,
-                                )
-                            )
-                based_on_result = ReflectBasedOn(memories=memories, mental_models=mental_models, directives=directives)
-
-            # Build trace (tool_calls + llm_calls + observations) if tool_calls is requested
-            trace_result: ReflectTrace | None = None
-            if request.include.tool_calls is not None:
-                include_output = request.include.tool_calls.output
-                tool_calls = [
-                    ReflectToolCall(
-                        tool=tc.tool,
-                        input=tc.input,
-                        output=tc.output if include_output else None,
-                        duration_ms=tc.duration_ms,
-                        iteration=tc.iteration,
-                    )
-                    for tc in core_result.tool_trace
-                ]
-                llm_calls = [ReflectLLMCall(scope=lc.scope, duration_ms=lc.duration_ms) for lc in core_result.llm_trace]
-                trace_result = ReflectTrace(
-                    tool_calls=tool_calls,
-                    llm_calls=llm_calls,
-                )
-
-            return ReflectResponse(
-                text=core_result.text,
-                based_on=based_on_result,
-                structured_output=core_result.structured_output,
-                usage=core_result.usage,
-                trace=trace_result,
-            )
+            return _build_reflect_response(request, core_result)
 
         except OperationValidationError as e:
             raise HTTPException(status_code=e.status_code, detail=e.reason)
@@ -2522,6 +2560,79 @@ def _register_routes(app: FastAPI):
             logger.error(f"Error in /v1/default/banks/{bank_id}/reflect: {error_detail}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    @app.post(
+        "/v1/default/banks/{bank_id}/reflect/stream",
+        summary="Reflect and stream the answer",
+        description="Same as reflect, but streams the agent's progress and the answer as newline-delimited JSON "
+        "(`application/x-ndjson`).\n\n"
+        "Each line is an event object with a `type`:\n"
+        "- `tool_call`: a tool the agent ran (`tool`, `reason`, `input`, `duration_ms`, `iteration`)\n"
+        "- `answer_delta`: the next chunk of the answer text (`text`)\n"
+        "- `done`: the last event, with the complete reflect response as `response`\n"
+        "- `error`: the reflect failed after the stream started (`status_code`, `detail`)\n\n"
+        "A synthesized answer is streamed token by token by providers that support streaming; an answer the "
+        "agent returns through its done tool arrives as one delta. The `text` of the final response is "
+        "authoritative. Authentication and validation errors are returned as regular HTTP errors.",
+        operation_id="reflect_stream",
+        tags=["Memory"],
+        response_class=StreamingResponse,
+        responses={200: {"description": "Stream of reflect events", "content": {"application/x-ndjson": {}}}},
+    )
+    async def api_reflect_stream(
+        bank_id: str, request: ReflectRequest, request_context: RequestContext = Depends(get_request_context)
+    ):
+        metrics = get_metrics_collector()
+
+        # Handle deprecated context field by concatenating with query
+        query = request.query
+        if request.context:
+            query = f"{request.query}\n\nAdditional context: {request.context}"
+
+        events = app.state.memory.reflect_stream(
+            bank_id=bank_id,
+            query=query,
+            budget=request.budget,
+            context=None,  # Deprecated, now concatenated with query
+            max_tokens=request.max_tokens,
+            response_schema=request.response_schema,
+            request_context=request_context,
+            tags=request.tags,
+            tags_match=request.tags_match,
+        )
+        # The run starts once the request is authenticated and validated
+        try:
+            await anext(events)
+        except OperationValidationError as e:
+            raise HTTPException(status_code=e.status_code, detail=e.reason)
+        except (AuthenticationError, HTTPException):
+            raise
+        except Exception as e:
+            import traceback
+
+            error_detail = f"{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+            logger.error(f"Error in /v1/default/banks/{bank_id}/reflect/stream: {error_detail}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+        async def stream_events():
+            try:
+                with metrics.record_operation("reflect", bank_id=bank_id, source="api", budget=request.budget.value):
+                    async for event in events:
+                        if event["type"] == "done":
+                            response = _build_reflect_response(request, event["result"])
+                            event = {"type": "done", "response": response.model_dump(mode="json")}
+                        yield json.dumps(event, default=str) + "\n"
+            except Exception as e:
+                import traceback
+
+                error_detail = f"{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+                logger.error(f"Error in /v1/default/banks/{bank_id}/reflect/stream: {error_detail}")
+                status_code = e.status_code if isinstance(e, OperationValidationError) else 500
+                yield json.dumps({"type": "error", "status_code": status_code, "detail": str(e)}) + "\n"
+            finally:
+                await events.aclose()
+
+        return StreamingResponse(stream_events(), media_type="application/x-ndjson")
+
     @app.get(
         "/v1/default/banks",
         response_model=BankListResponse,
@@ -4405,6 +4516,95 @@ def _register_routes(app: FastAPI):
             logger.error(f"Error in /v1/default/banks/{bank_id}/memories (retain): {error_detail}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    @app.post(
+        "/v1/default/banks/{bank_id}/memories/import",
+        response_model=ImportMemoriesResponse,
+        summary="Import pre-extracted facts",
+        description="Bulk import facts that were already extracted, without chunking or LLM extraction.\n\n"
+        "Intended for migrations from other memory systems and for replaying exports. The request body is a "
+        "stream of fact records, as NDJSON (`format=ndjson`, default) or a Parquet file (`format=parquet`).\n\n"
+        "**Record fields:**\n"
+        "- `text` (required), `fact_type` (`world` or `experience`), `context`, `document_id`\n"
+        "- `occurred_start`, `occurred_end`, `mentioned_at` (ISO datetimes)\n"
+        "- `entities` (names), `tags`, `metadata`\n"
+        "- `embedding` (optional; computed when missing)\n"
+        "- `causal_relations`: `[{target_index, relation_type, strength}]`, where `target_index` is the "
+        "0-based position of an earlier record of the import\n\n"
+        "Records are written in batched transactions together with a checkpoint. If an import is interrupted, "
+        "send the same body with the same `import_id` to resume it: records that were already committed are skipped.",
+        operation_id="import_memories",
+        tags=["Memory"],
+        # The body is read as a raw stream, so it is declared here for the generated clients
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {"application/octet-stream": {"schema": {"type": "string", "format": "binary"}}},
+            }
+        },
+    )
+    async def api_import_memories(
+        bank_id: str,
+        request: Request,
+        import_id: str | None = Query(
+            default=None, description="Import identifier to resume an interrupted import (generated when omitted)"
+        ),
+        format: Literal["ndjson", "parquet"] = Query(default="ndjson", description="Format of the request body"),
+        request_context: RequestContext = Depends(get_request_context),
+    ):
+        """Import pre-extracted facts from an NDJSON or Parquet request body."""
+        import os
+        import tempfile
+
+        from hindsight_api.engine.retain.fact_import import (
+            FactImportError,
+            iter_ndjson_records,
+            iter_parquet_records,
+        )
+
+        metrics = get_metrics_collector()
+        parquet_path = None
+        try:
+            if format == "parquet":
+                # Parquet keeps its metadata in the footer, so the body is spooled to disk first
+                f = await asyncio.to_thread(tempfile.NamedTemporaryFile, suffix=".parquet", delete=False)
+                parquet_path = f.name
+                try:
+                    async for chunk in request.stream():
+                        await asyncio.to_thread(f.write, chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
+                records = iter_parquet_records(parquet_path)
+            else:
+                records = iter_ndjson_records(request.stream())
+
+            with metrics.record_operation("import", bank_id=bank_id, source="api"):
+                result = await app.state.memory.import_facts_async(
+                    bank_id, records, request_context=request_context, import_id=import_id
+                )
+            return ImportMemoriesResponse(
+                success=True,
+                bank_id=bank_id,
+                import_id=result.import_id,
+                records_committed=result.records_committed,
+                records_skipped=result.records_skipped,
+                units_imported=result.units_imported,
+            )
+        except (FactImportError, ImportError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except OperationValidationError as e:
+            raise HTTPException(status_code=e.status_code, detail=e.reason)
+        except (AuthenticationError, HTTPException):
+            raise
+        except Exception as e:
+            import traceback
+
+            error_detail = f"{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+            logger.error(f"Error in POST /v1/default/banks/{bank_id}/memories/import: {error_detail}")
+            raise HTTPException(status_code=500, detail=str(e))
+        finally:
+            if parquet_path:
+                await asyncio.to_thread(os.unlink, parquet_path)
+
     @app.post(
         "/v1/default/banks/{bank_id}/files/retain",
         response_model=FileRetainResponse,
@@ -4443,6 +4643,8 @@ def _register_routes(app: FastAPI):
         request_context: RequestContext = Depends(get_request_context),
     ):
         """Upload and convert files to memories."""
+        import os
+
         from hindsight_api.config import get_config
 
         config = get_config()
@@ -4501,28 +4703,16 @@ def _register_routes(app: FastAPI):
             if request_data.parser is not None:
                 _validate_parsers(_resolve_parser(request_data.parser), "request-level parser")
 
-            # Prepare file items and calculate total batch size
-            import io
-
+            # Prepare file items and calculate total batch size.
+            # Uploads stay in Starlette's spooled temporary files and are streamed to
+            # storage, so request memory does not grow with file size.
             file_items = []
             total_batch_size = 0
 
             for i, file in enumerate(files):
-                # Read file content to check size
-                file_content = await file.read()
-                total_batch_size += len(file_content)
-
-                # Create a mock UploadFile with the necessary attributes
-                class FileWrapper:
-                    def __init__(self, content, filename, content_type):
-                        self._content = content
-                        self.filename = filename
-                        self.content_type = content_type
-
-                    async def read(self):
-                        return self._content
-
-                wrapped_file = FileWrapper(file_content, file.filename, file.content_type)
+                if file.size is None:
+                    file.size = await asyncio.to_thread(file.file.seek, 0, os.SEEK_END)
+                total_batch_size += file.size
 
                 # Get per-file metadata
                 file_meta = request_data.files_metadata[i] if request_data.files_metadata else FileRetainMetadata()
@@ -4535,7 +4725,7 @@ def _register_routes(app: FastAPI):
                 _validate_parsers(parser_chain, f"file '{file.filename}'")
 
                 item = {
-                    "file": wrapped_file,
+                    "file": file,
                     "document_id": doc_id,
                     "context": file_meta.context,
                     "metadata": file_meta.metadata or {},
@@ -124,6 +124,11 @@ ENV_LLM_API_KEY = "HINDSIGHT_API_LLM_API_KEY"
 ENV_LLM_MODEL = "HINDSIGHT_API_LLM_MODEL"
 ENV_LLM_BASE_URL = "HINDSIGHT_API_LLM_BASE_URL"
 ENV_LLM_MAX_CONCURRENT = "HINDSIGHT_API_LLM_MAX_CONCURRENT"
+ENV_LLM_MIN_CONCURRENT = "HINDSIGHT_API_LLM_MIN_CONCURRENT"
+ENV_LLM_ADAPTIVE_CONCURRENCY = "HINDSIGHT_API_LLM_ADAPTIVE_CONCURRENCY"
+ENV_LLM_TOKENS_PER_MINUTE = "HINDSIGHT_API_LLM_TOKENS_PER_MINUTE"
+ENV_LLM_INTERACTIVE_RESERVED_FRACTION = "HINDSIGHT_API_LLM_INTERACTIVE_RESERVED_FRACTION"
+ENV_LLM_PROMPT_CACHING = "HINDSIGHT_API_LLM_PROMPT_CACHING"
 ENV_LLM_MAX_RETRIES = "HINDSIGHT_API_LLM_MAX_RETRIES"
 ENV_LLM_INITIAL_BACKOFF = "HINDSIGHT_API_LLM_INITIAL_BACKOFF"
 ENV_LLM_MAX_BACKOFF = "HINDSIGHT_API_LLM_MAX_BACKOFF"
@@ -175,6 +180,9 @@ ENV_EMBEDDINGS_TEI_URL = "HINDSIGHT_API_EMBEDDINGS_TEI_URL"
 ENV_EMBEDDINGS_OPENAI_API_KEY = "HINDSIGHT_API_EMBEDDINGS_OPENAI_API_KEY"
 ENV_EMBEDDINGS_OPENAI_MODEL = "HINDSIGHT_API_EMBEDDINGS_OPENAI_MODEL"
 ENV_EMBEDDINGS_OPENAI_BASE_URL = "HINDSIGHT_API_EMBEDDINGS_OPENAI_BASE_URL"
+ENV_EMBEDDINGS_MAX_CONCURRENT = "HINDSIGHT_API_EMBEDDINGS_MAX_CONCURRENT"
+ENV_EMBEDDINGS_CACHE_ENABLED = "HINDSIGHT_API_EMBEDDINGS_CACHE_ENABLED"
+ENV_EMBEDDINGS_CACHE_MAX_AGE_DAYS = "HINDSIGHT_API_EMBEDDINGS_CACHE_MAX_AGE_DAYS"
 
 # Cohere configuration (separate for embeddings and reranker)
 ENV_EMBEDDINGS_COHERE_API_KEY = "HINDSIGHT_API_EMBEDDINGS_COHERE_API_KEY"
@@ -240,6 +248,7 @@ ENV_MPFP_TOP_K_NEIGHBORS = "HINDSIGHT_API_MPFP_TOP_K_NEIGHBORS"
 ENV_RECALL_MAX_CONCURRENT = "HINDSIGHT_API_RECALL_MAX_CONCURRENT"
 ENV_RECALL_CONNECTION_BUDGET = "HINDSIGHT_API_RECALL_CONNECTION_BUDGET"
 ENV_MENTAL_MODEL_REFRESH_CONCURRENCY = "HINDSIGHT_API_MENTAL_MODEL_REFRESH_CONCURRENCY"
+ENV_MENTAL_MODEL_REFRESH_MIN_SIMILARITY = "HINDSIGHT_API_MENTAL_MODEL_REFRESH_MIN_SIMILARITY"
 
 # OpenTelemetry tracing configuration
 ENV_OTEL_TRACES_ENABLED = "HINDSIGHT_API_OTEL_TRACES_ENABLED"
@@ -265,8 +274,14 @@ ENV_RETAIN_MISSION = "HINDSIGHT_API_RETAIN_MISSION"
 ENV_RETAIN_CUSTOM_INSTRUCTIONS = "HINDSIGHT_API_RETAIN_CUSTOM_INSTRUCTIONS"
 ENV_RETAIN_BATCH_TOKENS = "HINDSIGHT_API_RETAIN_BATCH_TOKENS"
 ENV_RETAIN_ENTITY_LOOKUP = "HINDSIGHT_API_RETAIN_ENTITY_LOOKUP"
+ENV_RETAIN_ENTITY_INDEX_MAX_BANKS = "HINDSIGHT_API_RETAIN_ENTITY_INDEX_MAX_BANKS"
 ENV_RETAIN_BATCH_ENABLED = "HINDSIGHT_API_RETAIN_BATCH_ENABLED"
 ENV_RETAIN_BATCH_POLL_INTERVAL_SECONDS = "HINDSIGHT_API_RETAIN_BATCH_POLL_INTERVAL_SECONDS"
+ENV_RETAIN_EMBEDDING_MICRO_BATCH_SIZE = "HINDSIGHT_API_RETAIN_EMBEDDING_MICRO_BATCH_SIZE"
+ENV_RETAIN_STAGED_COMMIT = "HINDSIGHT_API_RETAIN_STAGED_COMMIT"
+ENV_RETAIN_SUB_BATCH_CONCURRENCY = "HINDSIGHT_API_RETAIN_SUB_BATCH_CONCURRENCY"
+ENV_RETAIN_DEDUP_ENABLED = "HINDSIGHT_API_RETAIN_DEDUP_ENABLED"
+ENV_RETAIN_DEDUP_SIMILARITY = "HINDSIGHT_API_RETAIN_DEDUP_SIMILARITY"
 
 # File storage configuration
 ENV_FILE_STORAGE_TYPE = "HINDSIGHT_API_FILE_STORAGE_TYPE"
@@ -284,6 +299,9 @@ ENV_FILE_PARSER = "HINDSIGHT_API_FILE_PARSER"
 ENV_FILE_PARSER_ALLOWLIST = "HINDSIGHT_API_FILE_PARSER_ALLOWLIST"
 ENV_FILE_PARSER_IRIS_TOKEN = "HINDSIGHT_API_FILE_PARSER_IRIS_TOKEN"
 ENV_FILE_PARSER_IRIS_ORG_ID = "HINDSIGHT_API_FILE_PARSER_IRIS_ORG_ID"
+ENV_FILE_PARSER_PROCESS_WORKERS = "HINDSIGHT_API_FILE_PARSER_PROCESS_WORKERS"
+ENV_FILE_PARSER_TIMEOUT_SECONDS = "HINDSIGHT_API_FILE_PARSER_TIMEOUT_SECONDS"
+ENV_FILE_PARSER_MEMORY_LIMIT_MB = "HINDSIGHT_API_FILE_PARSER_MEMORY_LIMIT_MB"
 ENV_FILE_CONVERSION_MAX_BATCH_SIZE_MB = "HINDSIGHT_API_FILE_CONVERSION_MAX_BATCH_SIZE_MB"
 ENV_FILE_CONVERSION_MAX_BATCH_SIZE = "HINDSIGHT_API_FILE_CONVERSION_MAX_BATCH_SIZE"
 ENV_ENABLE_FILE_UPLOAD_API = "HINDSIGHT_API_ENABLE_FILE_UPLOAD_API"
@@ -293,6 +311,7 @@ ENV_FILE_DELETE_AFTER_RETAIN = "HINDSIGHT_API_FILE_DELETE_AFTER_RETAIN"
 ENV_ENABLE_OBSERVATIONS = "HINDSIGHT_API_ENABLE_OBSERVATIONS"
 ENV_CONSOLIDATION_BATCH_SIZE = "HINDSIGHT_API_CONSOLIDATION_BATCH_SIZE"
 ENV_CONSOLIDATION_LLM_BATCH_SIZE = "HINDSIGHT_API_CONSOLIDATION_LLM_BATCH_SIZE"
+ENV_CONSOLIDATION_TAG_GROUP_CONCURRENCY = "HINDSIGHT_API_CONSOLIDATION_TAG_GROUP_CONCURRENCY"
 ENV_CONSOLIDATION_MAX_TOKENS = "HINDSIGHT_API_CONSOLIDATION_MAX_TOKENS"
 ENV_CONSOLIDATION_SOURCE_FACTS_MAX_TOKENS = "HINDSIGHT_API_CONSOLIDATION_SOURCE_FACTS_MAX_TOKENS"
 ENV_CONSOLIDATION_SOURCE_FACTS_MAX_TOKENS_PER_OBSERVATION = (
@@ -320,20 +339,28 @@ ENV_DB_POOL_MIN_SIZE = "HINDSIGHT_API_DB_POOL_MIN_SIZE"
 ENV_DB_POOL_MAX_SIZE = "HINDSIGHT_API_DB_POOL_MAX_SIZE"
 ENV_DB_COMMAND_TIMEOUT = "HINDSIGHT_API_DB_COMMAND_TIMEOUT"
 ENV_DB_ACQUIRE_TIMEOUT = "HINDSIGHT_API_DB_ACQUIRE_TIMEOUT"
+ENV_BANK_SNAPSHOT_CACHE_ENABLED = "HINDSIGHT_API_BANK_SNAPSHOT_CACHE_ENABLED"
+ENV_BANK_SNAPSHOT_CACHE_MAX_AGE_SECONDS = "HINDSIGHT_API_BANK_SNAPSHOT_CACHE_MAX_AGE_SECONDS"
 
 # Worker configuration (distributed task processing)
 ENV_WORKER_ENABLED = "HINDSIGHT_API_WORKER_ENABLED"
 ENV_WORKER_ID = "HINDSIGHT_API_WORKER_ID"
 ENV_WORKER_POLL_INTERVAL_MS = "HINDSIGHT_API_WORKER_POLL_INTERVAL_MS"
+ENV_WORKER_NOTIFY_ENABLED = "HINDSIGHT_API_WORKER_NOTIFY_ENABLED"
+ENV_WORKER_NOTIFY_POLL_INTERVAL_MS = "HINDSIGHT_API_WORKER_NOTIFY_POLL_INTERVAL_MS"
 ENV_WORKER_MAX_RETRIES = "HINDSIGHT_API_WORKER_MAX_RETRIES"
 ENV_WORKER_HTTP_PORT = "HINDSIGHT_API_WORKER_HTTP_PORT"
 ENV_WORKER_MAX_SLOTS = "HINDSIGHT_API_WORKER_MAX_SLOTS"
 ENV_WORKER_CONSOLIDATION_MAX_SLOTS = "HINDSIGHT_API_WORKER_CONSOLIDATION_MAX_SLOTS"
+ENV_WORKER_COUNTERS_RECONCILE_INTERVAL_SECONDS = "HINDSIGHT_API_WORKER_COUNTERS_RECONCILE_INTERVAL_SECONDS"
 
 # Reflect agent settings
 ENV_REFLECT_MAX_ITERATIONS = "HINDSIGHT_API_REFLECT_MAX_ITERATIONS"
 ENV_REFLECT_MAX_CONTEXT_TOKENS = "HINDSIGHT_API_REFLECT_MAX_CONTEXT_TOKENS"
 ENV_REFLECT_MISSION = "HINDSIGHT_API_REFLECT_MISSION"
+ENV_REFLECT_CACHE_ENABLED = "HINDSIGHT_API_REFLECT_CACHE_ENABLED"
+ENV_REFLECT_CACHE_MIN_SIMILARITY = "HINDSIGHT_API_REFLECT_CACHE_MIN_SIMILARITY"
+ENV_REFLECT_CACHE_MAX_AGE_SECONDS = "HINDSIGHT_API_REFLECT_CACHE_MAX_AGE_SECONDS"
 
 # Disposition settings
 ENV_DISPOSITION_SKEPTICISM = "HINDSIGHT_API_DISPOSITION_SKEPTICISM"
@@ -360,6 +387,11 @@ PROVIDER_DEFAULT_MODELS = {
 }
 DEFAULT_LLM_MODEL = "gpt-4o-mini"  # Fallback if provider not in table
 DEFAULT_LLM_MAX_CONCURRENT = 32
+DEFAULT_LLM_MIN_CONCURRENT = 1  # Floor for the adaptive concurrency limit
+DEFAULT_LLM_ADAPTIVE_CONCURRENCY = True  # AIMD limit per provider/model/key, capped at LLM_MAX_CONCURRENT
+DEFAULT_LLM_TOKENS_PER_MINUTE = 0  # Token budget per provider/model/key per minute (0 = unlimited)
+DEFAULT_LLM_INTERACTIVE_RESERVED_FRACTION = 0.25  # Share of LLM slots background work cannot take
+DEFAULT_LLM_PROMPT_CACHING = True  # Mark static system prompts as cacheable (Anthropic, OpenAI)
 DEFAULT_LLM_MAX_RETRIES = 10  # Max retry attempts for LLM API calls
 DEFAULT_LLM_INITIAL_BACKOFF = 1.0  # Initial backoff in seconds for retry exponential backoff
 DEFAULT_LLM_MAX_BACKOFF = 60.0  # Max backoff cap in seconds for retry exponential backoff
@@ -379,6 +411,9 @@ DEFAULT_EMBEDDINGS_LOCAL_MODEL = "BAAI/bge-small-en-v1.5"
 DEFAULT_EMBEDDINGS_LOCAL_FORCE_CPU = False  # Force CPU mode for local embeddings (avoids MPS/XPC issues on macOS)
 DEFAULT_EMBEDDINGS_LOCAL_TRUST_REMOTE_CODE = False  # Security: disabled by default, required for some models
 DEFAULT_EMBEDDINGS_OPENAI_MODEL = "text-embedding-3-small"
+DEFAULT_EMBEDDINGS_MAX_CONCURRENT = 8  # Max concurrent batch requests per remote embeddings provider
+DEFAULT_EMBEDDINGS_CACHE_ENABLED = False  # Reuse stored vectors for texts embedded before (opt-in)
+DEFAULT_EMBEDDINGS_CACHE_MAX_AGE_DAYS = 30  # Cached vectors older than this are evicted
 DEFAULT_EMBEDDING_DIMENSION = 384
 
 DEFAULT_RERANKER_PROVIDER = "local"
@@ -428,6 +463,7 @@ DEFAULT_MPFP_TOP_K_NEIGHBORS = 20  # Fan-out limit per node in MPFP graph traver
 DEFAULT_RECALL_MAX_CONCURRENT = 32  # Max concurrent recall operations per worker
 DEFAULT_RECALL_CONNECTION_BUDGET = 4  # Max concurrent DB connections per recall operation
 DEFAULT_MENTAL_MODEL_REFRESH_CONCURRENCY = 8  # Max concurrent mental model refreshes
+DEFAULT_MENTAL_MODEL_REFRESH_MIN_SIMILARITY = 0.5  # New observations this similar to a mental model refresh it
 
 # Retain settings
 DEFAULT_RETAIN_MAX_COMPLETION_TOKENS = 64000  # Max tokens for fact extraction LLM call
@@ -439,13 +475,22 @@ DEFAULT_RETAIN_MISSION = None  # Declarative spec of what to retain (injected in
 DEFAULT_RETAIN_CUSTOM_INSTRUCTIONS = None  # Custom extraction guidelines (only used when mode="custom")
 DEFAULT_RETAIN_BATCH_TOKENS = 10_000  # ~40KB of text  # Max chars per sub-batch for async retain auto-splitting
 DEFAULT_RETAIN_ENTITY_LOOKUP = "trigram"  # "full" or "trigram"
+DEFAULT_RETAIN_ENTITY_INDEX_MAX_BANKS = 100  # Bank entity indexes kept in memory with "full" lookup
 DEFAULT_RETAIN_BATCH_ENABLED = False  # Use LLM Batch API for fact extraction (only when async=True)
 DEFAULT_RETAIN_BATCH_POLL_INTERVAL_SECONDS = 60  # Batch API polling interval in seconds
+DEFAULT_RETAIN_EMBEDDING_MICRO_BATCH_SIZE = 32  # Facts per embedding micro-batch during extraction (0 = disabled)
+DEFAULT_RETAIN_STAGED_COMMIT = False  # Commit units before linking; links are created in follow-up transactions
+DEFAULT_RETAIN_SUB_BATCH_CONCURRENCY = 3  # Sub-batches of large retains processed concurrently per bank
+DEFAULT_RETAIN_DEDUP_ENABLED = False  # Merge near-duplicate facts into existing units instead of inserting them
+DEFAULT_RETAIN_DEDUP_SIMILARITY = 0.95  # Minimum cosine similarity for a fact to count as a near-duplicate
 
 # File storage defaults
 DEFAULT_FILE_STORAGE_TYPE = "native"  # PostgreSQL BYTEA storage
 DEFAULT_FILE_PARSER = "markitdown"  # Default parser fallback chain (comma-separated, e.g. "iris,markitdown")
 DEFAULT_FILE_PARSER_ALLOWLIST = None  # Allowlist of parsers clients may request (None = all registered parsers)
+DEFAULT_FILE_PARSER_PROCESS_WORKERS = 0  # Worker processes for CPU-bound parsers (0 = convert in a thread)
+DEFAULT_FILE_PARSER_TIMEOUT_SECONDS = 300  # Max seconds per file conversion in a worker process
+DEFAULT_FILE_PARSER_MEMORY_LIMIT_MB = 2048  # Address space limit per parser worker process (0 = unlimited)
 DEFAULT_FILE_CONVERSION_MAX_BATCH_SIZE_MB = 100  # Max total batch size in MB (all files combined)
 DEFAULT_FILE_CONVERSION_MAX_BATCH_SIZE = 10  # Max files per batch upload
 DEFAULT_ENABLE_FILE_UPLOAD_API = True  # Enable file upload endpoint
@@ -457,6 +502,7 @@ DEFAULT_ENABLE_OBSERVATION_HISTORY = True  # Observation history tracking enable
 DEFAULT_ENABLE_MENTAL_MODEL_HISTORY = True  # Mental model history tracking enabled by default
 DEFAULT_CONSOLIDATION_BATCH_SIZE = 50  # Memories to load per batch (internal memory optimization)
 DEFAULT_CONSOLIDATION_LLM_BATCH_SIZE = 8  # Facts per LLM call (1 = no batching; >1 = batch mode)
+DEFAULT_CONSOLIDATION_TAG_GROUP_CONCURRENCY = 4  # Independent tag groups consolidated concurrently per bank
 DEFAULT_CONSOLIDATION_MAX_TOKENS = 512  # Max tokens for recall when finding related observations
 DEFAULT_CONSOLIDATION_SOURCE_FACTS_MAX_TOKENS = (
     -1
@@ -474,19 +520,27 @@ DEFAULT_DB_POOL_MIN_SIZE = 5
 DEFAULT_DB_POOL_MAX_SIZE = 100
 DEFAULT_DB_COMMAND_TIMEOUT = 60  # seconds
 DEFAULT_DB_ACQUIRE_TIMEOUT = 30  # seconds
+DEFAULT_BANK_SNAPSHOT_CACHE_ENABLED = True  # Keep bank profiles and directives in memory, invalidated via LISTEN/NOTIFY
+DEFAULT_BANK_SNAPSHOT_CACHE_MAX_AGE_SECONDS = 300  # Re-read cached bank rows at least this often
 
 # Worker configuration (distributed task processing)
 DEFAULT_WORKER_ENABLED = True  # API runs worker by default (standalone mode)
 DEFAULT_WORKER_ID = None  # Will use hostname if not specified
 DEFAULT_WORKER_POLL_INTERVAL_MS = 500  # Poll database every 500ms
+DEFAULT_WORKER_NOTIFY_ENABLED = True  # Wake workers on task submission via LISTEN/NOTIFY
+DEFAULT_WORKER_NOTIFY_POLL_INTERVAL_MS = 30000  # Safety-net poll every 30s while listening
 DEFAULT_WORKER_MAX_RETRIES = 3  # Max retries before marking task failed
 DEFAULT_WORKER_HTTP_PORT = 8889  # HTTP port for worker metrics/health
 DEFAULT_WORKER_MAX_SLOTS = 10  # Total concurrent tasks per worker
 DEFAULT_WORKER_CONSOLIDATION_MAX_SLOTS = 2  # Max concurrent consolidation tasks per worker
+DEFAULT_WORKER_COUNTERS_RECONCILE_INTERVAL_SECONDS = 3600  # Recompute per-bank unit counters hourly (0 = off)
 
 # Reflect agent settings
 DEFAULT_REFLECT_MAX_ITERATIONS = 10  # Max tool call iterations before forcing response
 DEFAULT_REFLECT_MAX_CONTEXT_TOKENS = 100_000  # Max accumulated context tokens before forcing final prompt
+DEFAULT_REFLECT_CACHE_ENABLED = False  # Answer paraphrased questions from earlier answers while the bank is unchanged
+DEFAULT_REFLECT_CACHE_MIN_SIMILARITY = 0.95  # Query embedding similarity required to reuse a cached answer
+DEFAULT_REFLECT_CACHE_MAX_AGE_SECONDS = 86400  # Cached answers older than this are evicted
 
 # Disposition defaults (None = not set, fall back to bank DB value or 3)
 DEFAULT_DISPOSITION_SKEPTICISM = None
@@ -596,6 +650,11 @@ class HindsightConfig:
     llm_model: str
     llm_base_url: str | None
     llm_max_concurrent: int
+    llm_min_concurrent: int
+    llm_adaptive_concurrency: bool
+    llm_tokens_per_minute: int
+    llm_interactive_reserved_fraction: float
+    llm_prompt_caching: bool
     llm_max_retries: int
     llm_initial_backoff: float
     llm_max_backoff: float
@@ -658,6 +717,9 @@ class HindsightConfig:
     embeddings_litellm_sdk_api_key: str | None
     embeddings_litellm_sdk_model: str
     embeddings_litellm_sdk_api_base: str | None
+    embeddings_max_concurrent: int  # Max concurrent batch requests for remote providers
+    embeddings_cache_enabled: bool  # Content-addressed cache of computed embeddings
+    embeddings_cache_max_age_days: int
 
     # Reranker
     reranker_provider: str
@@ -697,6 +759,7 @@ class HindsightConfig:
     recall_max_concurrent: int
     recall_connection_budget: int
     mental_model_refresh_concurrency: int
+    mental_model_refresh_min_similarity: float
 
     # Retain settings
     retain_max_completion_tokens: int
@@ -709,6 +772,12 @@ class HindsightConfig:
     retain_batch_enabled: bool
     retain_batch_poll_interval_seconds: int
     retain_entity_lookup: str  # "full" or "trigram"
+    retain_entity_index_max_banks: int
+    retain_embedding_micro_batch_size: int  # 0 disables streaming embeddings during extraction
+    retain_staged_commit: bool  # Commit units first and create links in short follow-up transactions
+    retain_sub_batch_concurrency: int  # Concurrent sub-batches per bank when a large retain is split
+    retain_dedup_enabled: bool  # Merge near-duplicate facts into the units they repeat
+    retain_dedup_similarity: float  # Similarity threshold for near-duplicate facts
 
     # File storage (static - server-level only)
     file_storage_type: str  # "native" (PostgreSQL) or "s3" (S3-compatible)
@@ -726,6 +795,9 @@ class HindsightConfig:
     file_parser_allowlist: list[str] | None  # Parsers clients may request (None = all registered)
     file_parser_iris_token: str | None  # Vectorize API token for iris parser (VECTORIZE_TOKEN)
     file_parser_iris_org_id: str | None  # Vectorize org ID for iris parser (VECTORIZE_ORG_ID)
+    file_parser_process_workers: int  # Worker processes for CPU-bound parsers (0 = thread pool)
+    file_parser_timeout_seconds: float  # Max seconds per file conversion in a worker process
+    file_parser_memory_limit_mb: int  # Memory limit per parser worker process (0 = unlimited)
     file_conversion_max_batch_size_mb: int  # Max total batch size in MB (all files combined)
     file_conversion_max_batch_size: int  # Max files per request
     enable_file_upload_api: bool
@@ -737,6 +809,7 @@ class HindsightConfig:
     enable_mental_model_history: bool
     consolidation_batch_size: int
     consolidation_llm_batch_size: int
+    consolidation_tag_group_concurrency: int
     consolidation_max_tokens: int
     consolidation_source_facts_max_tokens: int
     consolidation_source_facts_max_tokens_per_observation: int
@@ -769,19 +842,27 @@ class HindsightConfig:
     db_pool_max_size: int
     db_command_timeout: int
     db_acquire_timeout: int
+    bank_snapshot_cache_enabled: bool  # In-process bank profile/directive snapshots
+    bank_snapshot_cache_max_age_seconds: float
 
     # Worker configuration (distributed task processing)
     worker_enabled: bool
     worker_id: str | None
     worker_poll_interval_ms: int
+    worker_notify_enabled: bool
+    worker_notify_poll_interval_ms: int
     worker_max_retries: int
     worker_http_port: int
     worker_max_slots: int
     worker_consolidation_max_slots: int
+    worker_counters_reconcile_interval_seconds: float
 
     # Reflect agent settings
     reflect_max_iterations: int
     reflect_max_context_tokens: int
+    reflect_cache_enabled: bool  # Semantic cache of reflect answers per bank generation
+    reflect_cache_min_similarity: float
+    reflect_cache_max_age_seconds: int
 
     # OpenTelemetry tracing configuration
     otel_traces_enabled: bool
@@ -961,6 +1042,16 @@ class HindsightConfig:
             llm_model=llm_model,
             llm_base_url=os.getenv(ENV_LLM_BASE_URL) or None,
             llm_max_concurrent=int(os.getenv(ENV_LLM_MAX_CONCURRENT, str(DEFAULT_LLM_MAX_CONCURRENT))),
+            llm_min_concurrent=int(os.getenv(ENV_LLM_MIN_CONCURRENT, str(DEFAULT_LLM_MIN_CONCURRENT))),
+            llm_adaptive_concurrency=os.getenv(
+                ENV_LLM_ADAPTIVE_CONCURRENCY, str(DEFAULT_LLM_ADAPTIVE_CONCURRENCY)
+            ).lower()
+            == "true",
+            llm_tokens_per_minute=int(os.getenv(ENV_LLM_TOKENS_PER_MINUTE, str(DEFAULT_LLM_TOKENS_PER_MINUTE))),
+            llm_interactive_reserved_fraction=float(
+                os.getenv(ENV_LLM_INTERACTIVE_RESERVED_FRACTION, str(DEFAULT_LLM_INTERACTIVE_RESERVED_FRACTION))
+            ),
+            llm_prompt_caching=os.getenv(ENV_LLM_PROMPT_CACHING, str(DEFAULT_LLM_PROMPT_CACHING)).lower() == "true",
             llm_max_retries=int(os.getenv(ENV_LLM_MAX_RETRIES, str(DEFAULT_LLM_MAX_RETRIES))),
             llm_initial_backoff=float(os.getenv(ENV_LLM_INITIAL_BACKOFF, str(DEFAULT_LLM_INITIAL_BACKOFF))),
             llm_max_backoff=float(os.getenv(ENV_LLM_MAX_BACKOFF, str(DEFAULT_LLM_MAX_BACKOFF))),
@@ -1073,6 +1164,16 @@ class HindsightConfig:
                 ENV_EMBEDDINGS_LITELLM_SDK_MODEL, DEFAULT_EMBEDDINGS_LITELLM_SDK_MODEL
             ),
             embeddings_litellm_sdk_api_base=os.getenv(ENV_EMBEDDINGS_LITELLM_SDK_API_BASE) or None,
+            embeddings_max_concurrent=int(
+                os.getenv(ENV_EMBEDDINGS_MAX_CONCURRENT, str(DEFAULT_EMBEDDINGS_MAX_CONCURRENT))
+            ),
+            embeddings_cache_enabled=os.getenv(
+                ENV_EMBEDDINGS_CACHE_ENABLED, str(DEFAULT_EMBEDDINGS_CACHE_ENABLED)
+            ).lower()
+            == "true",
+            embeddings_cache_max_age_days=int(
+                os.getenv(ENV_EMBEDDINGS_CACHE_MAX_AGE_DAYS, str(DEFAULT_EMBEDDINGS_CACHE_MAX_AGE_DAYS))
+            ),
             # Reranker
             reranker_provider=os.getenv(ENV_RERANKER_PROVIDER, DEFAULT_RERANKER_PROVIDER),
             reranker_local_model=os.getenv(ENV_RERANKER_LOCAL_MODEL, DEFAULT_RERANKER_LOCAL_MODEL),
@@ -1131,6 +1232,9 @@ class HindsightConfig:
             mental_model_refresh_concurrency=int(
                 os.getenv(ENV_MENTAL_MODEL_REFRESH_CONCURRENCY, str(DEFAULT_MENTAL_MODEL_REFRESH_CONCURRENCY))
             ),
+            mental_model_refresh_min_similarity=float(
+                os.getenv(ENV_MENTAL_MODEL_REFRESH_MIN_SIMILARITY, str(DEFAULT_MENTAL_MODEL_REFRESH_MIN_SIMILARITY))
+            ),
             # Optimization flags
             skip_llm_verification=os.getenv(ENV_SKIP_LLM_VERIFICATION, "false").lower() == "true",
             lazy_reranker=os.getenv(ENV_LAZY_RERANKER, "false").lower() == "true",
@@ -1150,11 +1254,25 @@ class HindsightConfig:
             retain_custom_instructions=os.getenv(ENV_RETAIN_CUSTOM_INSTRUCTIONS) or DEFAULT_RETAIN_CUSTOM_INSTRUCTIONS,
             retain_batch_tokens=int(os.getenv(ENV_RETAIN_BATCH_TOKENS, str(DEFAULT_RETAIN_BATCH_TOKENS))),
             retain_entity_lookup=os.getenv(ENV_RETAIN_ENTITY_LOOKUP, DEFAULT_RETAIN_ENTITY_LOOKUP),
+            retain_entity_index_max_banks=int(
+                os.getenv(ENV_RETAIN_ENTITY_INDEX_MAX_BANKS, str(DEFAULT_RETAIN_ENTITY_INDEX_MAX_BANKS))
+            ),
             retain_batch_enabled=os.getenv(ENV_RETAIN_BATCH_ENABLED, str(DEFAULT_RETAIN_BATCH_ENABLED)).lower()
             == "true",
             retain_batch_poll_interval_seconds=int(
                 os.getenv(ENV_RETAIN_BATCH_POLL_INTERVAL_SECONDS, str(DEFAULT_RETAIN_BATCH_POLL_INTERVAL_SECONDS))
             ),
+            retain_embedding_micro_batch_size=int(
+                os.getenv(ENV_RETAIN_EMBEDDING_MICRO_BATCH_SIZE, str(DEFAULT_RETAIN_EMBEDDING_MICRO_BATCH_SIZE))
+            ),
+            retain_staged_commit=os.getenv(ENV_RETAIN_STAGED_COMMIT, str(DEFAULT_RETAIN_STAGED_COMMIT)).lower()
+            == "true",
+            retain_sub_batch_concurrency=int(
+                os.getenv(ENV_RETAIN_SUB_BATCH_CONCURRENCY, str(DEFAULT_RETAIN_SUB_BATCH_CONCURRENCY))
+            ),
+            retain_dedup_enabled=os.getenv(ENV_RETAIN_DEDUP_ENABLED, str(DEFAULT_RETAIN_DEDUP_ENABLED)).lower()
+            == "true",
+            retain_dedup_similarity=float(os.getenv(ENV_RETAIN_DEDUP_SIMILARITY, str(DEFAULT_RETAIN_DEDUP_SIMILARITY))),
             # File storage
             file_storage_type=os.getenv(ENV_FILE_STORAGE_TYPE, DEFAULT_FILE_STORAGE_TYPE),
             file_storage_s3_bucket=os.getenv(ENV_FILE_STORAGE_S3_BUCKET) or None,
@@ -1173,6 +1291,15 @@ class HindsightConfig:
             else None,
             file_parser_iris_token=os.getenv(ENV_FILE_PARSER_IRIS_TOKEN) or None,
             file_parser_iris_org_id=os.getenv(ENV_FILE_PARSER_IRIS_ORG_ID) or None,
+            file_parser_process_workers=int(
+                os.getenv(ENV_FILE_PARSER_PROCESS_WORKERS, str(DEFAULT_FILE_PARSER_PROCESS_WORKERS))
+            ),
+            file_parser_timeout_seconds=float(
+                os.getenv(ENV_FILE_PARSER_TIMEOUT_SECONDS, str(DEFAULT_FILE_PARSER_TIMEOUT_SECONDS))
+            ),
+            file_parser_memory_limit_mb=int(
+                os.getenv(ENV_FILE_PARSER_MEMORY_LIMIT_MB, str(DEFAULT_FILE_PARSER_MEMORY_LIMIT_MB))
+            ),
             file_conversion_max_batch_size_mb=int(
                 os.getenv(ENV_FILE_CONVERSION_MAX_BATCH_SIZE_MB, str(DEFAULT_FILE_CONVERSION_MAX_BATCH_SIZE_MB))
             ),
@@ -1201,6 +1328,9 @@ class HindsightConfig:
             consolidation_llm_batch_size=int(
                 os.getenv(ENV_CONSOLIDATION_LLM_BATCH_SIZE, str(DEFAULT_CONSOLIDATION_LLM_BATCH_SIZE))
             ),
+            consolidation_tag_group_concurrency=int(
+                os.getenv(ENV_CONSOLIDATION_TAG_GROUP_CONCURRENCY, str(DEFAULT_CONSOLIDATION_TAG_GROUP_CONCURRENCY))
+            ),
             consolidation_max_tokens=int(
                 os.getenv(ENV_CONSOLIDATION_MAX_TOKENS, str(DEFAULT_CONSOLIDATION_MAX_TOKENS))
             ),
@@ -1223,22 +1353,48 @@ class HindsightConfig:
             db_pool_max_size=int(os.getenv(ENV_DB_POOL_MAX_SIZE, str(DEFAULT_DB_POOL_MAX_SIZE))),
             db_command_timeout=int(os.getenv(ENV_DB_COMMAND_TIMEOUT, str(DEFAULT_DB_COMMAND_TIMEOUT))),
             db_acquire_timeout=int(os.getenv(ENV_DB_ACQUIRE_TIMEOUT, str(DEFAULT_DB_ACQUIRE_TIMEOUT))),
+            bank_snapshot_cache_enabled=os.getenv(
+                ENV_BANK_SNAPSHOT_CACHE_ENABLED, str(DEFAULT_BANK_SNAPSHOT_CACHE_ENABLED)
+            ).lower()
+            == "true",
+            bank_snapshot_cache_max_age_seconds=float(
+                os.getenv(ENV_BANK_SNAPSHOT_CACHE_MAX_AGE_SECONDS, str(DEFAULT_BANK_SNAPSHOT_CACHE_MAX_AGE_SECONDS))
+            ),
             # Worker configuration
             worker_enabled=os.getenv(ENV_WORKER_ENABLED, str(DEFAULT_WORKER_ENABLED)).lower() == "true",
             worker_id=os.getenv(ENV_WORKER_ID) or DEFAULT_WORKER_ID,
             worker_poll_interval_ms=int(os.getenv(ENV_WORKER_POLL_INTERVAL_MS, str(DEFAULT_WORKER_POLL_INTERVAL_MS))),
+            worker_notify_enabled=os.getenv(ENV_WORKER_NOTIFY_ENABLED, str(DEFAULT_WORKER_NOTIFY_ENABLED)).lower()
+            == "true",
+            worker_notify_poll_interval_ms=int(
+                os.getenv(ENV_WORKER_NOTIFY_POLL_INTERVAL_MS, str(DEFAULT_WORKER_NOTIFY_POLL_INTERVAL_MS))
+            ),
             worker_max_retries=int(os.getenv(ENV_WORKER_MAX_RETRIES, str(DEFAULT_WORKER_MAX_RETRIES))),
             worker_http_port=int(os.getenv(ENV_WORKER_HTTP_PORT, str(DEFAULT_WORKER_HTTP_PORT))),
             worker_max_slots=int(os.getenv(ENV_WORKER_MAX_SLOTS, str(DEFAULT_WORKER_MAX_SLOTS))),
             worker_consolidation_max_slots=int(
                 os.getenv(ENV_WORKER_CONSOLIDATION_MAX_SLOTS, str(DEFAULT_WORKER_CONSOLIDATION_MAX_SLOTS))
             ),
+            worker_counters_reconcile_interval_seconds=float(
+                os.getenv(
+                    ENV_WORKER_COUNTERS_RECONCILE_INTERVAL_SECONDS,
+                    str(DEFAULT_WORKER_COUNTERS_RECONCILE_INTERVAL_SECONDS),
+                )
+            ),
             # Reflect agent settings
             reflect_max_iterations=int(os.getenv(ENV_REFLECT_MAX_ITERATIONS, str(DEFAULT_REFLECT_MAX_ITERATIONS))),
             reflect_max_context_tokens=int(
                 os.getenv(ENV_REFLECT_MAX_CONTEXT_TOKENS, str(DEFAULT_REFLECT_MAX_CONTEXT_TOKENS))
             ),
             reflect_mission=os.getenv(ENV_REFLECT_MISSION) or None,
+            reflect_cache_enabled=os.getenv(ENV_REFLECT_CACHE_ENABLED, str(DEFAULT_REFLECT_CACHE_ENABLED)).lower()
+            == "true",
+            reflect_cache_min_similarity=float(
+                os.getenv(ENV_REFLECT_CACHE_MIN_SIMILARITY, str(DEFAULT_REFLECT_CACHE_MIN_SIMILARITY))
+            ),
+            reflect_cache_max_age_seconds=int(
+                os.getenv(ENV_REFLECT_CACHE_MAX_AGE_SECONDS, str(DEFAULT_REFLECT_CACHE_MAX_AGE_SECONDS))
+            ),
             # Disposition settings (None = fall back to DB value)
             disposition_skepticism=int(os.getenv(ENV_DISPOSITION_SKEPTICISM))
             if os.getenv(ENV_DISPOSITION_SKEPTICISM)
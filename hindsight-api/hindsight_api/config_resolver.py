@@ -5,7 +5,9 @@ Resolves config values through the hierarchy:
   Global (env vars) → Tenant config (via extension) → Bank config (database)
 
 Config values are resolved on every request to ensure consistency across
-multiple API servers.
+multiple API servers. Bank overrides are served from the bank snapshot cache
+when one is given; it is invalidated on every change to a bank's config, in
+any process (see engine/bank_snapshot.py).
 """
 
 import json
@@ -16,6 +18,7 @@ from typing import Any
 import asyncpg
 
 from hindsight_api.config import HindsightConfig, _get_raw_config, normalize_config_dict
+from hindsight_api.engine.bank_snapshot import BankSnapshotCache
 from hindsight_api.engine.memory_engine import fq_table
 from hindsight_api.extensions.tenant import TenantExtension
 from hindsight_api.models import RequestContext
@@ -26,16 +29,23 @@ logger = logging.getLogger(__name__)
 class ConfigResolver:
     """Resolves hierarchical configuration with tenant/bank overrides."""
 
-    def __init__(self, pool: asyncpg.Pool, tenant_extension: TenantExtension | None = None):
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        tenant_extension: TenantExtension | None = None,
+        bank_snapshots: BankSnapshotCache | None = None,
+    ):
         """
         Initialize config resolver.
 
         Args:
             pool: Database connection pool
             tenant_extension: Optional tenant extension for tenant-level config and permissions
+            bank_snapshots: Optional cache serving bank config overrides without a query
         """
         self.pool = pool
         self.tenant_extension = tenant_extension
+        self._bank_snapshots = bank_snapshots
         self._global_config = _get_raw_config()
         self._configurable_fields = HindsightConfig.get_configurable_fields()
         self._credential_fields = HindsightConfig.get_credential_fields()
@@ -148,28 +158,36 @@ class ConfigResolver:
             Dict of config overrides (only configurable fields, normalized keys)
         """
         try:
-            async with self.pool.acquire() as conn:
-                row = await conn.fetchrow(
-                    f"""
-                    SELECT config FROM {fq_table("banks")} WHERE bank_id = $1
-                    """,
-                    bank_id,
-                )
+            if self._bank_snapshots is not None:
+                return await self._bank_snapshots.get(bank_id, "config", lambda: self._fetch_bank_config(bank_id))
+            return await self._fetch_bank_config(bank_id)
+        except Exception as e:
+            logger.error(f"Failed to load bank config for {bank_id}: {e}")
 
-                if row and row["config"]:
-                    config_data = row["config"]
+        return {}
 
-                    # Handle case where JSONB is returned as JSON string
-                    if isinstance(config_data, str):
-                        config_data = json.loads(config_data)
+    async def _fetch_bank_config(self, bank_id: str) -> dict[str, Any]:
+        """Read the bank config overrides from the database."""
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"""
+                SELECT config FROM {fq_table("banks")} WHERE bank_id = $1
+                """,
+                bank_id,
+            )
 
-                    # Normalize keys (handle both env var format and Python field format)
-                    normalized = normalize_config_dict(config_data)
+            if row and row["config"]:
+                config_data = row["config"]
 
-                    # Only return overrides for configurable fields
-                    return {k: v for k, v in normalized.items() if k in self._configurable_fields}
-        except Exception as e:
-            logger.error(f"Failed to load bank config for {bank_id}: {e}")
+                # Handle case where JSONB is returned as JSON string
+                if isinstance(config_data, str):
+                    config_data = json.loads(config_data)
+
+                # Normalize keys (handle both env var format and Python field format)
+                normalized = normalize_config_dict(config_data)
+
+                # Only return overrides for configurable fields
+                return {k: v for k, v in normalized.items() if k in self._configurable_fields}
 
         return {}
 
@@ -251,6 +269,8 @@ class ConfigResolver:
                 json.dumps(normalized_updates),
                 bank_id,
             )
+        if self._bank_snapshots is not None:
+            self._bank_snapshots.invalidate(bank_id)
 
         logger.info(f"Updated bank config for {bank_id}: {list(normalized_updates.keys())}")
 
@@ -271,5 +291,7 @@ class ConfigResolver:
                 """,
                 bank_id,
             )
+        if self._bank_snapshots is not None:
+            self._bank_snapshots.invalidate(bank_id)
 
         logger.info(f"Reset bank config for {bank_id} to defaults")
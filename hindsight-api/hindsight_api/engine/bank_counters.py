@@ -0,0 +1,263 @@
+"""
+Per-bank memory unit counters.
+
+A bank's counters are the number of units per fact type, the number of
+experience/world units waiting for consolidation and the latest
+consolidated_at. Triggers on memory_units append the deltas of every insert,
+update and delete to bank_unit_counter_deltas in the same transaction (see
+migrations h8i9j0k1l2m3 and m3n4o5p6q7r8); the table is insert-only, so
+concurrent writers to a bank never wait on each other. Readers add a bank's
+deltas to its bank_unit_counters rows, a handful of index lookups instead of
+a scan of its units.
+
+Deltas are folded into bank_unit_counters in one DELETE ... RETURNING
+statement: by a reader that finds FOLD_THRESHOLD or more of them for its
+bank, so reads stay bounded, and for every bank by the worker every minute
+(fold_all_bank_counter_deltas).
+
+The trigger never moves last_consolidated_at backwards, and counters can drift
+if memory_units is modified with triggers disabled (e.g. restored from a data
+dump). reconcile_bank_counters recomputes a bank's rows from memory_units and
+folds its deltas into them; the worker runs it for every bank periodically.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import asyncpg
+
+from ..config import DEFAULT_DATABASE_SCHEMA
+
+logger = logging.getLogger(__name__)
+
+# Fact types that are consolidated into observations
+SOURCE_FACT_TYPES = ("experience", "world")
+
+# Unfolded delta rows of a bank at which a reader folds them first
+FOLD_THRESHOLD = 64
+
+
+def _table(name: str, schema: str | None) -> str:
+    return f'"{schema}".{name}' if schema else name
+
+
+def _lock_key(schema: str | None) -> str:
+    """
+    Advisory lock of a schema's counters: held exclusively while reconciling or folding
+    every bank, and shared while folding one bank, so the folds never wait on each other.
+    """
+    # The worker passes None for the default schema, the engine its name
+    return f"bank_unit_counters:{schema or DEFAULT_DATABASE_SCHEMA}"
+
+
+def _fold_sql(schema: str | None, bank_filter: str = "") -> str:
+    """Move deltas (of the banks matching bank_filter) into bank_unit_counters in one statement."""
+    counters_table = _table("bank_unit_counters", schema)
+    return f"""
+        WITH folded AS (
+            DELETE FROM {_table("bank_unit_counter_deltas", schema)} {bank_filter}
+            RETURNING bank_id, fact_type, total, pending_consolidation, last_consolidated_at
+        )
+        INSERT INTO {counters_table} AS c
+            (bank_id, fact_type, total, pending_consolidation, last_consolidated_at)
+        SELECT bank_id, fact_type, SUM(total), SUM(pending_consolidation), MAX(last_consolidated_at)
+        FROM folded
+        GROUP BY bank_id, fact_type
+        ORDER BY bank_id, fact_type
+        ON CONFLICT (bank_id, fact_type) DO UPDATE SET
+            total = c.total + EXCLUDED.total,
+            pending_consolidation = c.pending_consolidation + EXCLUDED.pending_consolidation,
+            last_consolidated_at = GREATEST(c.last_consolidated_at, EXCLUDED.last_consolidated_at)
+    """
+
+
+def _stored_counters_sql(schema: str | None) -> str:
+    """Counters of bank $1 per fact type: its bank_unit_counters rows plus its deltas."""
+    return f"""
+        SELECT fact_type,
+               SUM(total)::bigint AS total,
+               SUM(pending_consolidation)::bigint AS pending_consolidation,
+               MAX(last_consolidated_at) AS last_consolidated_at
+        FROM (
+            SELECT fact_type, total, pending_consolidation, last_consolidated_at
+            FROM {_table("bank_unit_counters", schema)}
+            WHERE bank_id = $1
+            UNION ALL
+            SELECT fact_type, total, pending_consolidation, last_consolidated_at
+            FROM {_table("bank_unit_counter_deltas", schema)}
+            WHERE bank_id = $1
+        ) c
+        GROUP BY fact_type
+    """
+
+
+@dataclass
+class BankCounters:
+    """Maintained unit counts of one bank."""
+
+    node_counts: dict[str, int] = field(default_factory=dict)
+    pending_consolidation: int = 0
+    last_consolidated_at: datetime | None = None
+
+    @property
+    def total(self) -> int:
+        return sum(self.node_counts.values())
+
+
+async def fetch_bank_counters(conn, bank_id: str, schema: str | None) -> BankCounters:
+    """
+    Read the maintained counters of a bank.
+
+    Args:
+        conn: Database connection
+        bank_id: Bank identifier
+        schema: Schema of the bank's tables (None for the unqualified default schema)
+    """
+    unfolded = await conn.fetchval(
+        f"SELECT COUNT(*) FROM (SELECT 1 FROM {_table('bank_unit_counter_deltas', schema)} "
+        f"WHERE bank_id = $1 LIMIT $2) d",
+        bank_id,
+        FOLD_THRESHOLD,
+    )
+    if unfolded >= FOLD_THRESHOLD:
+        await fold_bank_counter_deltas(conn, bank_id, schema)
+    rows = await conn.fetch(_stored_counters_sql(schema), bank_id)
+    counters = BankCounters()
+    for row in rows:
+        if row["total"] > 0:
+            counters.node_counts[row["fact_type"]] = row["total"]
+        counters.pending_consolidation += row["pending_consolidation"]
+        if row["last_consolidated_at"] is not None and (
+            counters.last_consolidated_at is None or row["last_consolidated_at"] > counters.last_consolidated_at
+        ):
+            counters.last_consolidated_at = row["last_consolidated_at"]
+    return counters
+
+
+async def fold_bank_counter_deltas(conn, bank_id: str, schema: str | None) -> bool:
+    """
+    Fold the deltas of a bank into its bank_unit_counters rows.
+
+    Skipped while another process reconciles or folds the whole schema, which
+    folds this bank's deltas too.
+
+    Returns:
+        Whether the deltas were folded
+    """
+    async with conn.transaction():
+        if not await conn.fetchval("SELECT pg_try_advisory_xact_lock_shared(hashtext($1))", _lock_key(schema)):
+            return False
+        await conn.execute(_fold_sql(schema, "WHERE bank_id = $1"), bank_id)
+    return True
+
+
+async def fold_all_bank_counter_deltas(conn, schema: str | None) -> bool:
+    """
+    Fold the deltas of every bank in a schema into bank_unit_counters.
+
+    Much cheaper than reconcile_all_bank_counters, which counts every bank's
+    units; the worker runs it often so the deltas stay few.
+
+    Returns:
+        Whether the deltas were folded (False if another process holds the schema's lock)
+    """
+    async with conn.transaction():
+        if not await conn.fetchval("SELECT pg_try_advisory_xact_lock(hashtext($1))", _lock_key(schema)):
+            return False
+        await conn.execute(_fold_sql(schema))
+    return True
+
+
+async def reconcile_bank_counters(conn, bank_id: str, schema: str | None) -> int:
+    """
+    Recompute the counters of a bank from memory_units, fix any drift and fold its deltas.
+
+    Runs in a REPEATABLE READ transaction, so the units counted and the deltas
+    folded into the new bank_unit_counters rows come from the same snapshot;
+    deltas committed by concurrent transactions after it are kept and add up on
+    top of the new rows.
+
+    Returns:
+        Number of counter rows that were corrected
+    """
+    counters_table = _table("bank_unit_counters", schema)
+    async with conn.transaction(isolation="repeatable_read"):
+        stored_rows = await conn.fetch(_stored_counters_sql(schema), bank_id)
+        actual_rows = await conn.fetch(
+            f"""
+            SELECT fact_type,
+                   COUNT(*) AS total,
+                   COUNT(*) FILTER (
+                       WHERE consolidated_at IS NULL AND fact_type = ANY($2::text[])
+                   ) AS pending_consolidation,
+                   MAX(consolidated_at) AS last_consolidated_at
+            FROM {_table("memory_units", schema)}
+            WHERE bank_id = $1
+            GROUP BY fact_type
+            """,
+            bank_id,
+            list(SOURCE_FACT_TYPES),
+        )
+
+        stored = {row["fact_type"]: tuple(row.values())[1:] for row in stored_rows}
+        actual = {row["fact_type"]: tuple(row.values())[1:] for row in actual_rows}
+        corrected = 0
+        for fact_type in stored.keys() - actual.keys():
+            # Rows left at zero by deletes are removed without counting them as drift
+            total, pending, _ = stored[fact_type]
+            if total or pending:
+                corrected += 1
+        corrected += sum(1 for fact_type, values in actual.items() if stored.get(fact_type) != values)
+
+        await conn.execute(
+            f"DELETE FROM {_table('bank_unit_counter_deltas', schema)} WHERE bank_id = $1",
+            bank_id,
+        )
+        await conn.execute(f"DELETE FROM {counters_table} WHERE bank_id = $1", bank_id)
+        await conn.executemany(
+            f"""
+            INSERT INTO {counters_table}
+                (bank_id, fact_type, total, pending_consolidation, last_consolidated_at)
+            VALUES ($1, $2, $3, $4, $5)
+            """,
+            [(bank_id, fact_type, *values) for fact_type, values in actual.items()],
+        )
+
+    if corrected:
+        logger.warning(f"Reconciled {corrected} drifted unit counter rows for bank {bank_id}")
+    return corrected
+
+
+async def reconcile_all_bank_counters(conn, schema: str | None) -> int | None:
+    """
+    Reconcile the counters of every bank in a schema, one bank per transaction.
+
+    Only one process reconciles a schema at a time; others return None immediately.
+
+    Returns:
+        Number of counter rows that were corrected, or None if another process holds the lock
+    """
+    lock_key = _lock_key(schema)
+    if not await conn.fetchval("SELECT pg_try_advisory_lock(hashtext($1))", lock_key):
+        return None
+    try:
+        bank_rows = await conn.fetch(
+            f"""
+            SELECT bank_id FROM {_table("banks", schema)}
+            UNION
+            SELECT DISTINCT bank_id FROM {_table("bank_unit_counters", schema)}
+            UNION
+            SELECT DISTINCT bank_id FROM {_table("bank_unit_counter_deltas", schema)}
+            """
+        )
+        corrected = 0
+        for row in bank_rows:
+            try:
+                corrected += await reconcile_bank_counters(conn, row["bank_id"], schema)
+            except asyncpg.SerializationError:
+                # The bank was deleted or its consolidation reset meanwhile; retry on the next run
+                logger.debug(f"Skipped reconciling unit counters of bank {row['bank_id']}: concurrent update")
+        return corrected
+    finally:
+        await conn.execute("SELECT pg_advisory_unlock(hashtext($1))", lock_key)
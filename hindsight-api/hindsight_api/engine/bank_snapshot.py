@@ -0,0 +1,199 @@
+"""
+In-process snapshot cache of bank profiles and directives.
+
+Reflect, retain and consolidation read the bank row (name, disposition,
+mission, config overrides) and the bank's directives on every operation.
+These rows are tiny and rarely change, so BankSnapshotCache keeps what was
+read per (schema, bank) and serves later reads from memory.
+
+A bank's snapshot is dropped when this process changes the bank or its
+directives, and when any process does: triggers on ``banks`` and
+``directives`` send a NOTIFY on the ``hindsight_bank_changed`` channel (see
+migration k1l2m3n4o5p6), which the cache LISTENs to on a dedicated
+connection. Snapshots are only served while that connection is up, and never
+for longer than ``max_age_seconds``, so a lost notification cannot leave a
+bank stale for long.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+import asyncpg
+
+from .memory_engine import get_current_schema
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "hindsight_bank_changed"
+
+# Banks whose snapshots are kept; the least recently used are dropped beyond this
+MAX_BANKS = 10_000
+
+# Delay between attempts to re-establish a lost listener connection
+RECONNECT_INTERVAL_SECONDS = 5.0
+
+T = TypeVar("T")
+
+
+class _Snapshot:
+    __slots__ = ("loaded_at", "parts")
+
+    def __init__(self, loaded_at: float):
+        self.loaded_at = loaded_at
+        self.parts: dict[Hashable, Any] = {}
+
+
+class _Loads:
+    __slots__ = ("in_flight", "invalidations")
+
+    def __init__(self):
+        self.in_flight = 0
+        self.invalidations = 0
+
+
+class BankSnapshotCache:
+    """Per-bank snapshots of profile, config and directive reads, invalidated via LISTEN/NOTIFY."""
+
+    def __init__(self, max_age_seconds: float, max_banks: int = MAX_BANKS):
+        self._max_age_seconds = max_age_seconds
+        self._max_banks = max(1, max_banks)
+        self._snapshots: OrderedDict[tuple[str, str], _Snapshot] = OrderedDict()
+        # Banks with a read in flight; invalidations are counted so a read that raced with a change is not stored
+        self._loads: dict[tuple[str, str], _Loads] = {}
+        self._dsn: str | None = None
+        self._listener: asyncpg.Connection | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._closed = False
+
+    @property
+    def listening(self) -> bool:
+        """Whether change notifications are received, i.e. whether snapshots are served."""
+        return self._listener is not None and not self._listener.is_closed()
+
+    async def start(self, dsn: str) -> None:
+        """Connect the listener; if that fails, keep retrying in the background."""
+        self._dsn = dsn
+        self._closed = False
+        if not await self._connect():
+            self._schedule_reconnect()
+
+    async def close(self) -> None:
+        """Stop listening and drop all snapshots."""
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        listener, self._listener = self._listener, None
+        self.clear()
+        if listener is not None and not listener.is_closed():
+            try:
+                await listener.close(timeout=5)
+            except Exception:
+                listener.terminate()
+
+    async def get(self, bank_id: str, part: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return a part of the bank's snapshot, running ``load`` if it is not cached.
+
+        Args:
+            bank_id: Bank identifier
+            part: What is read, e.g. "profile" or a directives filter; keys the cached value
+            load: Reads the value from the database
+
+        Returns:
+            A copy of the cached value, so callers may modify it
+        """
+        if not self.listening:
+            return await load()
+
+        key = (get_current_schema(), bank_id)
+        now = time.monotonic()
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and now - snapshot.loaded_at > self._max_age_seconds:
+            del self._snapshots[key]
+            snapshot = None
+        if snapshot is not None and part in snapshot.parts:
+            self._snapshots.move_to_end(key)
+            return copy.deepcopy(snapshot.parts[part])
+
+        loads = self._loads.get(key)
+        if loads is None:
+            loads = self._loads[key] = _Loads()
+        invalidations = loads.invalidations
+        loads.in_flight += 1
+        try:
+            value = await load()
+        finally:
+            loads.in_flight -= 1
+            if loads.in_flight == 0:
+                del self._loads[key]
+        if self.listening and loads.invalidations == invalidations:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                snapshot = self._snapshots[key] = _Snapshot(now)
+                while len(self._snapshots) > self._max_banks:
+                    self._snapshots.popitem(last=False)
+            snapshot.parts[part] = copy.deepcopy(value)
+        return value
+
+    def invalidate(self, bank_id: str, schema: str | None = None) -> None:
+        """Drop the snapshot of a bank (of the current schema unless ``schema`` is given)."""
+        key = (schema or get_current_schema(), bank_id)
+        loads = self._loads.get(key)
+        if loads is not None:
+            loads.invalidations += 1
+        self._snapshots.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every snapshot."""
+        for loads in self._loads.values():
+            loads.invalidations += 1
+        self._snapshots.clear()
+
+    async def _connect(self) -> bool:
+        try:
+            listener = await asyncpg.connect(self._dsn)
+            await listener.add_listener(NOTIFY_CHANNEL, self._on_notification)
+        except Exception as e:
+            logger.warning(f"Bank snapshot cache: could not listen for bank changes, not caching: {e}")
+            return False
+        listener.add_termination_listener(self._on_listener_terminated)
+        # Changes made while nobody was listening were missed
+        self.clear()
+        self._listener = listener
+        logger.info(f"Bank snapshot cache: listening on {NOTIFY_CHANNEL}")
+        return True
+
+    def _schedule_reconnect(self) -> None:
+        if self._closed or (self._reconnect_task is not None and not self._reconnect_task.done()):
+            return
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(RECONNECT_INTERVAL_SECONDS)
+            if await self._connect():
+                return
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            change = json.loads(payload)
+            self.invalidate(change["bank_id"], change["schema"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Bank snapshot cache: unexpected notification payload {payload!r}, dropping all snapshots")
+            self.clear()
+
+    def _on_listener_terminated(self, connection) -> None:
+        if connection is not self._listener:
+            return
+        self._listener = None
+        self.clear()
+        if not self._closed:
+            logger.warning("Bank snapshot cache: listener connection lost, not caching until it is re-established")
+            self._schedule_reconnect()
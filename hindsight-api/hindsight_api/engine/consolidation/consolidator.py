@@ -15,6 +15,7 @@ NOTE: Observations are distinct from mental models (pinned reflections).
 - Mental models: user-defined queries stored in the mental_models table, refreshed on demand via reflect
 """
 
+import asyncio
 import json
 import logging
 import time
@@ -27,19 +28,32 @@ from typing import TYPE_CHECKING, Any
 from pydantic import BaseModel
 
 from ...config import get_config
-from ..memory_engine import fq_table
-from ..retain import embedding_utils
-from .prompts import build_batch_consolidation_prompt
+from ...utils import cancel_tasks, gather_or_cancel
+from ..bank_counters import fetch_bank_counters
+from ..memory_engine import (
+    _get_tiktoken_encoding,
+    fq_table,
+    get_current_schema,
+    mental_model_source_fingerprint_sql,
+)
+from ..retain import bank_utils
+from .prompts import build_batch_consolidation_input, build_batch_consolidation_prompt
 
 if TYPE_CHECKING:
     from asyncpg import Connection
 
     from ...api.http import RequestContext
     from ..memory_engine import MemoryEngine
-    from ..response_models import MemoryFact, RecallResult
+    from ..response_models import MemoryFact
 
 logger = logging.getLogger(__name__)
 
+# Nearest observations fetched per new fact before reranking
+_OBSERVATION_CANDIDATES_PER_FACT = 30
+
+# Minimum cosine similarity for an observation candidate (same floor as recall's semantic retrieval)
+_OBSERVATION_MIN_SIMILARITY = 0.3
+
 
 class _CreateAction(BaseModel):
     text: str
@@ -107,6 +121,53 @@ def _aggregate_source_fields(source_mems: list[dict[str, Any]], tags: list[str]
     )
 
 
+def _scope_tags(memories: list[dict[str, Any]]) -> set[str]:
+    """Tags whose observations consolidating these memories can read or write."""
+    tags: set[str] = set()
+    for m in memories:
+        tags.update(m.get("tags") or [])
+        scopes = m.get("observation_scopes")
+        scopes = json.loads(scopes) if isinstance(scopes, str) else scopes
+        if isinstance(scopes, list):
+            for scope in scopes:
+                tags.update(scope)
+    return tags
+
+
+def _schedule_tag_groups(
+    tag_groups: dict[tuple[str, ...], list[dict[str, Any]]],
+) -> tuple[list[tuple[str, ...]], list[list[tuple[str, ...]]]]:
+    """Split tag groups into those that must run on their own and independent components.
+
+    Observation lookups are strict on tags, but an observation matched through a shared
+    tag (e.g. ["user-a"] for memories tagged ["user-a", "session-1"] and ["user-a",
+    "session-2"]) is visible to both groups. Groups are therefore joined into one
+    component when their scope tags overlap, and components run concurrently. Untagged
+    groups look up observations without a tag filter, so they run before everything else.
+
+    Returns:
+        Tuple of (tag keys to run first, one at a time; components of tag keys to run
+        concurrently, each component serially)
+    """
+    serial: list[tuple[str, ...]] = []
+    components: list[tuple[set[str], list[tuple[str, ...]]]] = []
+    for tag_key, memories in tag_groups.items():
+        tags = _scope_tags(memories)
+        if not tags:
+            serial.append(tag_key)
+            continue
+        keys = [tag_key]
+        remaining = []
+        for component_tags, component_keys in components:
+            if component_tags & tags:
+                tags |= component_tags
+                keys = component_keys + keys
+            else:
+                remaining.append((component_tags, component_keys))
+        components = remaining + [(tags, keys)]
+    return serial, [keys for _, keys in components]
+
+
 class ConsolidationPerfLog:
     """Performance logging for consolidation operations."""
 
@@ -136,6 +197,15 @@ class ConsolidationPerfLog:
         self.total_obs_in_context += obs_count
         self.total_prompt_chars += prompt_chars
 
+    def merge(self, other: "ConsolidationPerfLog") -> None:
+        """Add the timings and LLM stats of another log (e.g. of one LLM batch) to this one."""
+        for key, duration in other.timings.items():
+            self.record_timing(key, duration)
+        self.llm_calls += other.llm_calls
+        self.total_obs_in_context += other.total_obs_in_context
+        self.total_prompt_chars += other.total_prompt_chars
+        self.lines.extend(other.lines)
+
     def flush(self) -> None:
         """Flush all log lines to the logger."""
         total_time = time.time() - self.start_time
@@ -182,35 +252,17 @@ async def run_consolidation_job(
 
     pool = memory_engine._pool
 
-    # Get bank profile
-    async with pool.acquire() as conn:
-        t0 = time.time()
-        bank_row = await conn.fetchrow(
-            f"""
-            SELECT bank_id, name
-            FROM {fq_table("banks")}
-            WHERE bank_id = $1
-            """,
-            bank_id,
-        )
-
-        if not bank_row:
-            logger.warning(f"Bank {bank_id} not found for consolidation")
-            return {"status": "bank_not_found", "bank_id": bank_id}
+    # Check the bank exists
+    t0 = time.time()
+    if not await bank_utils.bank_exists(pool, bank_id, memory_engine._bank_snapshots):
+        logger.warning(f"Bank {bank_id} not found for consolidation")
+        return {"status": "bank_not_found", "bank_id": bank_id}
 
-        perf.record_timing("fetch_bank", time.time() - t0)
+    perf.record_timing("fetch_bank", time.time() - t0)
 
-        # Count total unconsolidated memories for progress logging
-        total_count = await conn.fetchval(
-            f"""
-            SELECT COUNT(*)
-            FROM {fq_table("memory_units")}
-            WHERE bank_id = $1
-              AND consolidated_at IS NULL
-              AND fact_type IN ('experience', 'world')
-            """,
-            bank_id,
-        )
+    async with pool.acquire() as conn:
+        # Unconsolidated memories for progress logging, from the maintained counters
+        total_count = (await fetch_bank_counters(conn, bank_id, get_current_schema())).pending_consolidation
 
     if total_count == 0:
         logger.debug(f"No new memories to consolidate for bank {bank_id}")
@@ -232,8 +284,133 @@ async def run_consolidation_job(
 
     # Track all unique tags from consolidated memories for mental model refresh filtering
     consolidated_tags: set[str] = set()
+    # Observations changed (updated/deleted) and created, to find the mental models they affect
+    changed_observation_ids: set[str] = set()
+    created_observation_ids: set[str] = set()
 
     llm_batch_num = 0
+    semaphore = asyncio.Semaphore(max(1, config.consolidation_tag_group_concurrency))
+
+    async def plan_pass(batch: _PendingLLMBatch, obs_tags: list[str] | None) -> _BatchPlan:
+        if batch.started_at is None:
+            batch.started_at = time.time()
+        async with pool.acquire() as conn:
+            return await _plan_memory_batch(
+                conn=conn,
+                memory_engine=memory_engine,
+                llm_config=llm_config,
+                bank_id=bank_id,
+                memories=batch.memories,
+                perf=batch.perf,
+                config=config,
+                obs_tags_override=obs_tags,
+            )
+
+    def finish_llm_batch(batch: _PendingLLMBatch) -> None:
+        nonlocal llm_batch_num
+        llm_batch_num += 1
+        llm_batch = batch.memories
+
+        # Batches of different tag groups run concurrently, so each keeps its own perf log
+        # and stats until it is done
+        batch_perf = batch.perf
+        batch_stats = dict.fromkeys(stats, 0)
+        batch_stats["observations_deleted"] += batch.deleted
+
+        for result in batch.results:
+            batch_stats["memories_processed"] += 1
+            action = result.get("action")
+            if action == "created":
+                batch_stats["observations_created"] += 1
+                batch_stats["actions_executed"] += 1
+            elif action == "updated":
+                batch_stats["observations_updated"] += 1
+                batch_stats["actions_executed"] += 1
+            elif action == "merged":
+                batch_stats["observations_merged"] += 1
+                batch_stats["actions_executed"] += 1
+            elif action == "multiple":
+                batch_stats["observations_created"] += result.get("created", 0)
+                batch_stats["observations_updated"] += result.get("updated", 0)
+                batch_stats["observations_merged"] += result.get("merged", 0)
+                batch_stats["actions_executed"] += result.get("total_actions", 0)
+            elif action == "skipped":
+                batch_stats["skipped"] += 1
+
+        # Per-LLM-batch log
+        llm_batch_time = time.time() - (batch.started_at or time.time())
+        perf.merge(batch_perf)
+        for key, value in batch_stats.items():
+            stats[key] += value
+        timing_parts = [
+            f"{key}={batch_perf.timings[key]:.3f}s"
+            for key in ["recall", "llm", "embedding", "db_write"]
+            if key in batch_perf.timings
+        ]
+        input_tokens = int(batch_perf.total_prompt_chars / 4)
+        logger.info(
+            f"[CONSOLIDATION] bank={bank_id} llm_batch #{llm_batch_num}"
+            f" ({len(llm_batch)} memories, {batch_perf.llm_calls} llm calls)"
+            f" | {stats['memories_processed']}/{total_count} processed"
+            f" | {', '.join(timing_parts)}"
+            f" | created={batch_stats['observations_created']} updated={batch_stats['observations_updated']}"
+            f" skipped={batch_stats['skipped']}"
+            f" | input_tokens=~{input_tokens}"
+            f" | avg={llm_batch_time / len(llm_batch):.3f}s/memory"
+        )
+
+    async def consolidate_llm_batches(llm_batches: list[list[dict[str, Any]]]) -> None:
+        """
+        Consolidate LLM batches in order as a two-stage pipeline.
+
+        The observation lookup and LLM call of the next pass run while the actions of
+        the current pass are written. If the current pass updated or deleted an
+        observation the next plan was made against, or created one the next plan's
+        lookup would have found, that plan is made again.
+        """
+        passes: list[tuple[_PendingLLMBatch, list[str] | None, bool]] = []
+        for llm_batch in llm_batches:
+            # Track tags for mental model refresh filtering
+            for memory in llm_batch:
+                consolidated_tags.update(memory.get("tags") or [])
+            batch = _PendingLLMBatch(memories=llm_batch, perf=ConsolidationPerfLog(bank_id))
+            obs_passes = _observation_passes(llm_batch)
+            passes.extend((batch, obs_tags, i == len(obs_passes) - 1) for i, obs_tags in enumerate(obs_passes))
+        if not passes:
+            return
+
+        next_plan = asyncio.create_task(plan_pass(passes[0][0], passes[0][1]))
+        previous: _BatchPlan | None = None
+        try:
+            for i, (batch, obs_tags, is_last_pass) in enumerate(passes):
+                plan = await next_plan
+                if previous is not None and plan.is_stale_after(previous):
+                    logger.debug(
+                        f"[CONSOLIDATION] bank={bank_id} re-planning pass: the previous pass changed "
+                        f"or created observations in its scope"
+                    )
+                    plan = await plan_pass(batch, obs_tags)
+                if i + 1 < len(passes):
+                    next_plan = asyncio.create_task(plan_pass(passes[i + 1][0], passes[i + 1][1]))
+
+                async with pool.acquire() as conn:
+                    pass_results, pass_deleted = await _apply_memory_batch_plan(
+                        conn=conn, memory_engine=memory_engine, bank_id=bank_id, plan=plan, perf=batch.perf
+                    )
+                    batch.add_pass(pass_results, pass_deleted)
+                    if is_last_pass:
+                        await conn.execute(
+                            f"UPDATE {fq_table('memory_units')} SET consolidated_at = NOW() WHERE id = ANY($1::uuid[])",
+                            [m["id"] for m in batch.memories],
+                        )
+                if is_last_pass:
+                    finish_llm_batch(batch)
+                previous = plan
+                changed_observation_ids.update(plan.touched_observation_ids)
+                created_observation_ids.update(plan.created_observation_ids)
+        finally:
+            await cancel_tasks([next_plan])
+
     while True:
         # Fetch next batch of unconsolidated memories
         async with pool.acquire() as conn:
@@ -264,158 +441,27 @@ async def run_consolidation_job(
             tag_key = tuple(sorted(m.get("tags") or []))
             tag_groups.setdefault(tag_key, []).append(dict(m))
 
-        # Flatten into LLM batches respecting both tag groups and llm_batch_size
-        llm_batches: list[list[dict[str, Any]]] = []
-        for group in tag_groups.values():
-            for i in range(0, len(group), llm_batch_size):
-                llm_batches.append(group[i : i + llm_batch_size])
+        # Flatten each tag group into LLM batches of at most llm_batch_size memories
+        group_batches: dict[tuple[str, ...], list[list[dict[str, Any]]]] = {
+            tag_key: [group[i : i + llm_batch_size] for i in range(0, len(group), llm_batch_size)]
+            for tag_key, group in tag_groups.items()
+        }
 
-        for llm_batch in llm_batches:
-            llm_batch_num += 1
-            llm_batch_start = time.time()
+        # Groups that cannot touch each other's observations are consolidated concurrently;
+        # batches of one group, and of groups sharing a tag, stay serial.
+        serial_keys, components = _schedule_tag_groups(tag_groups)
+        await consolidate_llm_batches([llm_batch for tag_key in serial_keys for llm_batch in group_batches[tag_key]])
 
-            # Snapshot perf and stats before this LLM batch
-            snap_timings = perf.timings.copy()
-            snap_llm_calls = perf.llm_calls
-            snap_total_chars = perf.total_prompt_chars
-            snap_stats = stats.copy()
+        async def consolidate_component(component_batches: list[list[dict[str, Any]]]) -> None:
+            async with semaphore:
+                await consolidate_llm_batches(component_batches)
 
-            # Track tags for mental model refresh filtering
-            for memory in llm_batch:
-                memory_tags = memory.get("tags") or []
-                if memory_tags:
-                    consolidated_tags.update(memory_tags)
-
-            async with pool.acquire() as conn:
-                # Determine observation_scopes for this batch. All memories in a batch share
-                # the same tags (enforced by tag_groups), so we only check the first memory.
-                # asyncpg returns JSONB columns as raw JSON strings, so parse if needed.
-                _obs_raw = llm_batch[0].get("observation_scopes") if llm_batch else None
-                _obs_parsed = json.loads(_obs_raw) if isinstance(_obs_raw, str) else _obs_raw
-
-                # Resolve the scope spec into a concrete list[list[str]] (or None for combined).
-                if _obs_parsed == "per_tag":
-                    _memory_tags = llm_batch[0].get("tags") or []
-                    obs_tags_list = [[tag] for tag in _memory_tags] if _memory_tags else None
-                elif _obs_parsed == "all_combinations":
-                    _memory_tags = llm_batch[0].get("tags") or []
-                    obs_tags_list = (
-                        [
-                            list(combo)
-                            for r in range(1, len(_memory_tags) + 1)
-                            for combo in combinations(_memory_tags, r)
-                        ]
-                        if _memory_tags
-                        else None
-                    )
-                elif _obs_parsed == "combined" or _obs_parsed is None:
-                    obs_tags_list = None  # single combined pass (default behaviour)
-                else:
-                    # explicit list[list[str]]
-                    obs_tags_list = _obs_parsed
-
-                batch_deleted: int = 0
-                if obs_tags_list:
-                    # Multi-pass: run one observation consolidation pass per tag set
-                    results = []
-                    for obs_tags in obs_tags_list:
-                        pass_results, pass_deleted = await _process_memory_batch(
-                            conn=conn,
-                            memory_engine=memory_engine,
-                            llm_config=llm_config,
-                            bank_id=bank_id,
-                            memories=llm_batch,
-                            request_context=request_context,
-                            perf=perf,
-                            config=config,
-                            obs_tags_override=obs_tags,
-                        )
-                        batch_deleted += pass_deleted
-                        # Merge results: prefer non-skipped actions
-                        if not results:
-                            results = pass_results
-                        else:
-                            for i, (existing, new) in enumerate(zip(results, pass_results)):
-                                if existing.get("action") == "skipped" and new.get("action") != "skipped":
-                                    results[i] = new
-                                elif existing.get("action") != "skipped" and new.get("action") != "skipped":
-                                    # Both did something — combine into "multiple"
-                                    existing_created = existing.get(
-                                        "created", 1 if existing.get("action") == "created" else 0
-                                    )
-                                    existing_updated = existing.get(
-                                        "updated", 1 if existing.get("action") == "updated" else 0
-                                    )
-                                    new_created = new.get("created", 1 if new.get("action") == "created" else 0)
-                                    new_updated = new.get("updated", 1 if new.get("action") == "updated" else 0)
-                                    total = existing_created + existing_updated + new_created + new_updated
-                                    results[i] = {
-                                        "action": "multiple",
-                                        "created": existing_created + new_created,
-                                        "updated": existing_updated + new_updated,
-                                        "merged": 0,
-                                        "total_actions": total,
-                                    }
-                else:
-                    # Normal single pass using the memory's own tags
-                    results, batch_deleted = await _process_memory_batch(
-                        conn=conn,
-                        memory_engine=memory_engine,
-                        llm_config=llm_config,
-                        bank_id=bank_id,
-                        memories=llm_batch,
-                        request_context=request_context,
-                        perf=perf,
-                        config=config,
-                    )
-                stats["observations_deleted"] += batch_deleted
-
-                await conn.executemany(
-                    f"UPDATE {fq_table('memory_units')} SET consolidated_at = NOW() WHERE id = $1",
-                    [(m["id"],) for m in llm_batch],
-                )
-
-            for result in results:
-                stats["memories_processed"] += 1
-                action = result.get("action")
-                if action == "created":
-                    stats["observations_created"] += 1
-                    stats["actions_executed"] += 1
-                elif action == "updated":
-                    stats["observations_updated"] += 1
-                    stats["actions_executed"] += 1
-                elif action == "merged":
-                    stats["observations_merged"] += 1
-                    stats["actions_executed"] += 1
-                elif action == "multiple":
-                    stats["observations_created"] += result.get("created", 0)
-                    stats["observations_updated"] += result.get("updated", 0)
-                    stats["observations_merged"] += result.get("merged", 0)
-                    stats["actions_executed"] += result.get("total_actions", 0)
-                elif action == "skipped":
-                    stats["skipped"] += 1
-
-            # Per-LLM-batch log
-            llm_batch_time = time.time() - llm_batch_start
-            timing_parts = []
-            for key in ["recall", "llm", "embedding", "db_write"]:
-                if key in perf.timings:
-                    delta = perf.timings[key] - snap_timings.get(key, 0)
-                    timing_parts.append(f"{key}={delta:.3f}s")
-            input_tokens = int((perf.total_prompt_chars - snap_total_chars) / 4)
-            batch_created = stats["observations_created"] - snap_stats["observations_created"]
-            batch_updated = stats["observations_updated"] - snap_stats["observations_updated"]
-            batch_skipped = stats["skipped"] - snap_stats["skipped"]
-            llm_calls_made = perf.llm_calls - snap_llm_calls
-            logger.info(
-                f"[CONSOLIDATION] bank={bank_id} llm_batch #{llm_batch_num}"
-                f" ({len(llm_batch)} memories, {llm_calls_made} llm calls)"
-                f" | {stats['memories_processed']}/{total_count} processed"
-                f" | {', '.join(timing_parts)}"
-                f" | created={batch_created} updated={batch_updated} skipped={batch_skipped}"
-                f" | input_tokens=~{input_tokens}"
-                f" | avg={llm_batch_time / len(llm_batch):.3f}s/memory"
+        await gather_or_cancel(
+            *(
+                consolidate_component([llm_batch for tag_key in tag_keys for llm_batch in group_batches[tag_key]])
+                for tag_keys in components
             )
+        )
 
     # Build summary
     perf.log(
@@ -452,6 +498,8 @@ async def run_consolidation_job(
         bank_id=bank_id,
         request_context=request_context,
         consolidated_tags=list(consolidated_tags) if consolidated_tags else None,
+        changed_observation_ids=changed_observation_ids,
+        created_observation_ids=created_observation_ids,
         perf=perf,
     )
     stats["mental_models_refreshed"] = mental_models_refreshed
@@ -466,6 +514,8 @@ async def _trigger_mental_model_refreshes(
     bank_id: str,
     request_context: "RequestContext",
     consolidated_tags: list[str] | None = None,
+    changed_observation_ids: set[str] | None = None,
+    created_observation_ids: set[str] | None = None,
     perf: ConsolidationPerfLog | None = None,
 ) -> int:
     """
@@ -474,53 +524,74 @@ async def _trigger_mental_model_refreshes(
     SECURITY: Only triggers refresh for mental models whose tags overlap with the
     consolidated memory tags, preventing unnecessary refreshes across security boundaries.
 
+    Of those, only mental models affected by the consolidation are refreshed:
+    - models built from an observation that was updated or deleted, or whose source
+      fingerprint no longer matches their sources (e.g. a source memory was deleted)
+    - models an observation created by this run is semantically close to
+    - models that have no recorded sources yet
+
     Args:
         memory_engine: MemoryEngine instance
         bank_id: Bank identifier
         request_context: Request context for authentication
         consolidated_tags: Tags from memories that were consolidated (None = refresh all)
+        changed_observation_ids: Observations updated or deleted by the consolidation run
+        created_observation_ids: Observations created by the consolidation run
         perf: Performance logging
 
     Returns:
         Number of mental models scheduled for refresh
     """
     pool = memory_engine._pool
+    config = get_config()
+    changed_ids = [uuid.UUID(obs_id) for obs_id in changed_observation_ids or ()]
+    created_ids = [uuid.UUID(obs_id) for obs_id in created_observation_ids or ()]
+
+    params: list[Any] = [bank_id, changed_ids, created_ids, 1.0 - config.mental_model_refresh_min_similarity]
 
-    # Find mental models with refresh_after_consolidation=true
     # SECURITY: Control which mental models get refreshed based on tags
-    async with pool.acquire() as conn:
-        if consolidated_tags:
-            # Tagged memories were consolidated - refresh:
-            # 1. Mental models with overlapping tags (security boundary)
-            # 2. Untagged mental models (they're "global" and available to all contexts)
-            # DO NOT refresh mental models with different tags
-            rows = await conn.fetch(
-                f"""
-                SELECT id, name, tags
-                FROM {fq_table("mental_models")}
-                WHERE bank_id = $1
-                  AND (trigger->>'refresh_after_consolidation')::boolean = true
+    if consolidated_tags:
+        # Tagged memories were consolidated - consider:
+        # 1. Mental models with overlapping tags (security boundary)
+        # 2. Untagged mental models (they're "global" and available to all contexts)
+        # DO NOT refresh mental models with different tags
+        tags_clause = """
                   AND (
-                    (tags IS NOT NULL AND tags != '{{}}' AND tags && $2::varchar[])
-                    OR (tags IS NULL OR tags = '{{}}')
-                  )
-                """,
-                bank_id,
-                consolidated_tags,
-            )
-        else:
-            # Untagged memories were consolidated - only refresh untagged mental models
-            # SECURITY: Tagged mental models are NOT refreshed when untagged memories are consolidated
-            rows = await conn.fetch(
-                f"""
-                SELECT id, name, tags
-                FROM {fq_table("mental_models")}
-                WHERE bank_id = $1
-                  AND (trigger->>'refresh_after_consolidation')::boolean = true
-                  AND (tags IS NULL OR tags = '{{}}')
-                """,
-                bank_id,
-            )
+                    (mm.tags IS NOT NULL AND mm.tags != '{}' AND mm.tags && $5::varchar[])
+                    OR (mm.tags IS NULL OR mm.tags = '{}')
+                  )"""
+        params.append(consolidated_tags)
+    else:
+        # Untagged memories were consolidated - only consider untagged mental models
+        # SECURITY: Tagged mental models are NOT refreshed when untagged memories are consolidated
+        tags_clause = "AND (mm.tags IS NULL OR mm.tags = '{}')"
+
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            f"""
+            SELECT id, name, tags
+            FROM (
+                SELECT mm.id, mm.name, mm.tags,
+                       mm.source_unit_ids IS NULL
+                       OR mm.source_unit_ids && $2::uuid[]
+                       OR mm.source_fingerprint IS DISTINCT FROM
+                          {mental_model_source_fingerprint_sql("mm.source_unit_ids")} AS sources_changed,
+                       (cardinality(mm.source_unit_ids) = 0 AND cardinality($3::uuid[]) > 0)
+                       OR EXISTS (
+                           SELECT 1
+                           FROM {fq_table("memory_units")} o
+                           WHERE o.id = ANY($3::uuid[])
+                             AND o.embedding <=> mm.embedding <= $4
+                       ) AS near_new_observation
+                FROM {fq_table("mental_models")} mm
+                WHERE mm.bank_id = $1
+                  AND (mm.trigger->>'refresh_after_consolidation')::boolean = true
+                  {tags_clause}
+            ) candidates
+            WHERE sources_changed OR near_new_observation
+            """,
+            *params,
+        )
 
     if not rows:
         return 0
@@ -528,11 +599,13 @@ async def _trigger_mental_model_refreshes(
     if perf:
         if consolidated_tags:
             perf.log(
-                f"[5] Triggering refresh for {len(rows)} mental models with refresh_after_consolidation=true "
+                f"[5] Triggering refresh for {len(rows)} affected mental models with refresh_after_consolidation=true "
                 f"(filtered by tags: {consolidated_tags})"
             )
         else:
-            perf.log(f"[5] Triggering refresh for {len(rows)} mental models with refresh_after_consolidation=true")
+            perf.log(
+                f"[5] Triggering refresh for {len(rows)} affected mental models with refresh_after_consolidation=true"
+            )
 
     # Submit refresh tasks for each mental model
     refreshed_count = 0
@@ -555,30 +628,132 @@ async def _trigger_mental_model_refreshes(
     return refreshed_count
 
 
-async def _process_memory_batch(
+def _observation_passes(memories: list[dict[str, Any]]) -> list[list[str] | None]:
+    """
+    Resolve the observation scopes of a batch into one tag set per consolidation pass.
+
+    All memories in a batch share the same tags (enforced by tag groups), so only the
+    first memory is checked. None stands for a single pass with the memories' own tags.
+    """
+    # asyncpg returns JSONB columns as raw JSON strings, so parse if needed.
+    obs_raw = memories[0].get("observation_scopes") if memories else None
+    obs_parsed = json.loads(obs_raw) if isinstance(obs_raw, str) else obs_raw
+    memory_tags = memories[0].get("tags") or [] if memories else []
+
+    if obs_parsed == "per_tag":
+        obs_tags_list = [[tag] for tag in memory_tags]
+    elif obs_parsed == "all_combinations":
+        obs_tags_list = [list(combo) for r in range(1, len(memory_tags) + 1) for combo in combinations(memory_tags, r)]
+    elif obs_parsed == "combined" or obs_parsed is None:
+        obs_tags_list = []  # single combined pass (default behaviour)
+    else:
+        # explicit list[list[str]]
+        obs_tags_list = obs_parsed
+    return list(obs_tags_list) or [None]
+
+
+def _merge_pass_results(results: list[dict[str, Any]], pass_results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Combine per-memory results of two passes over the same batch, preferring non-skipped actions."""
+    if not results:
+        return pass_results
+    merged = list(results)
+    for i, (existing, new) in enumerate(zip(results, pass_results)):
+        if existing.get("action") == "skipped" and new.get("action") != "skipped":
+            merged[i] = new
+        elif existing.get("action") != "skipped" and new.get("action") != "skipped":
+            # Both did something — combine into "multiple"
+            existing_created = existing.get("created", 1 if existing.get("action") == "created" else 0)
+            existing_updated = existing.get("updated", 1 if existing.get("action") == "updated" else 0)
+            new_created = new.get("created", 1 if new.get("action") == "created" else 0)
+            new_updated = new.get("updated", 1 if new.get("action") == "updated" else 0)
+            total = existing_created + existing_updated + new_created + new_updated
+            merged[i] = {
+                "action": "multiple",
+                "created": existing_created + new_created,
+                "updated": existing_updated + new_updated,
+                "merged": 0,
+                "total_actions": total,
+            }
+    return merged
+
+
+@dataclass
+class _BatchPlan:
+    """Observation lookup and LLM decisions for one consolidation pass over a batch, not yet applied."""
+
+    memories: list[dict[str, Any]]
+    fact_tags: list[str]
+    per_fact_obs_ids: dict[str, set[str]]
+    union_observations: "list[MemoryFact]"
+    llm_result: _BatchLLMResult
+    # Embeddings of the memories' texts, used for the observation lookup
+    fact_embeddings: list[list[float]] = field(default_factory=list)
+    # Observations updated or deleted when the plan was applied
+    touched_observation_ids: set[str] = field(default_factory=set)
+    # Observations created when the plan was applied, and their (tags, embedding)
+    created_observation_ids: set[str] = field(default_factory=set)
+    created_observations: list[tuple[list[str], list[float]]] = field(default_factory=list)
+
+    @property
+    def observation_ids(self) -> set[str]:
+        """IDs of the observations the LLM decisions were made against."""
+        return {str(obs.id) for obs in self.union_observations}
+
+    def is_stale_after(self, previous: "_BatchPlan") -> bool:
+        """
+        Whether applying previous invalidated this plan: it changed an observation this plan
+        was made against, or created one this plan's lookup would have found.
+        """
+        if self.observation_ids & previous.touched_observation_ids:
+            return True
+        if not self.fact_embeddings:
+            return False
+        import numpy as np
+
+        # The lookup matches observations carrying all scope tags (any observation when unscoped)
+        # and at least _OBSERVATION_MIN_SIMILARITY similar to one of the facts
+        scope = set(self.fact_tags)
+        fact_embeddings = np.array(self.fact_embeddings)
+        return any(
+            scope <= set(tags) and float(np.max(fact_embeddings @ np.array(embedding))) >= _OBSERVATION_MIN_SIMILARITY
+            for tags, embedding in previous.created_observations
+        )
+
+
+@dataclass
+class _PendingLLMBatch:
+    """An LLM batch being consolidated, possibly over several observation-scope passes."""
+
+    memories: list[dict[str, Any]]
+    perf: ConsolidationPerfLog
+    started_at: float | None = None
+    results: list[dict[str, Any]] = field(default_factory=list)
+    deleted: int = 0
+
+    def add_pass(self, pass_results: list[dict[str, Any]], pass_deleted: int) -> None:
+        self.results = _merge_pass_results(self.results, pass_results)
+        self.deleted += pass_deleted
+
+
+async def _plan_memory_batch(
     conn: "Connection",
     memory_engine: "MemoryEngine",
     llm_config: Any,
     bank_id: str,
     memories: list[dict[str, Any]],
-    request_context: "RequestContext",
     perf: ConsolidationPerfLog | None = None,
     config: Any = None,
     obs_tags_override: list[str] | None = None,
-) -> tuple[list[dict[str, Any]], int]:
+) -> _BatchPlan:
     """
-    Process a batch of memories in a single LLM call.
+    Decide how a batch of memories changes the observations, in a single LLM call.
 
     Steps:
-    1. Parallel recalls — one per fact (read-only; safe to parallelise)
+    1. Batched observation lookup — one embedding call, one SQL query and one rerank for all facts
     2. Union of retrieved observations across the batch (deduped by id)
     3. Single LLM call with all N facts + unioned observations
-    4. Sequential action execution (writes remain serial for consistency)
-    5. Returns one result dict per memory, in the same order as `memories`
 
-    Per-fact security: action execution validates each learning_id against the
-    observations that were recalled specifically for that fact, so cross-tag
-    updates cannot occur.
+    Only reads the database; the returned plan is applied by _apply_memory_batch_plan.
 
     Args:
         obs_tags_override: When set, use these tags for observation recall and
@@ -586,43 +761,42 @@ async def _process_memory_batch(
             consolidation where a single memory can contribute to observations
             scoped at different tag levels (e.g., user-level vs session-level).
     """
-    import asyncio
+    # Determine effective tag scope for observations.
+    # When obs_tags_override is set, use it; otherwise use the memory's own tags.
+    # All memories in the batch share the same tag set (enforced by batching).
+    fact_tags = obs_tags_override if obs_tags_override is not None else (memories[0].get("tags") or [])
 
-    # 1. Parallel recalls — one per fact
-    # When obs_tags_override is set, use it as the observation scope for all facts.
+    # 1. Batched observation lookup for all facts
     t0 = time.time()
-    observation_scope_tags = obs_tags_override if obs_tags_override is not None else None
-    recall_tasks = [
-        _find_related_observations(
-            memory_engine=memory_engine,
-            bank_id=bank_id,
-            query=m["text"],
-            request_context=request_context,
-            tags=observation_scope_tags if observation_scope_tags is not None else (m.get("tags") or []),
-        )
-        for m in memories
-    ]
-    per_fact_recalls = await asyncio.gather(*recall_tasks)
+    queries = [m["text"] for m in memories]
+    fact_embeddings = await memory_engine._generate_embeddings(queries)
+    per_fact_observations, union_source_facts = await _find_related_observations_batch(
+        conn=conn,
+        memory_engine=memory_engine,
+        bank_id=bank_id,
+        queries=queries,
+        tags=fact_tags,
+        config=config,
+        embeddings=fact_embeddings,
+    )
     if perf:
         perf.record_timing("recall", time.time() - t0)
 
     # 2. Build per-fact observation sets (keyed by memory ID string) for secure action validation
     per_fact_obs_ids: dict[str, set[str]] = {
-        str(memories[i]["id"]): {str(obs.id) for obs in r.results} for i, r in enumerate(per_fact_recalls)
+        str(memories[i]["id"]): {str(obs.id) for obs in observations}
+        for i, observations in enumerate(per_fact_observations)
     }
 
     # Union all observations (deduped by id)
     seen_ids: set[str] = set()
     union_observations: list["MemoryFact"] = []
-    union_source_facts: dict[str, "MemoryFact"] = {}
-    for recall_result in per_fact_recalls:
-        for obs in recall_result.results:
+    for observations in per_fact_observations:
+        for obs in observations:
             obs_id = str(obs.id)
             if obs_id not in seen_ids:
                 seen_ids.add(obs_id)
                 union_observations.append(obs)
-        if recall_result.source_facts:
-            union_source_facts.update(recall_result.source_facts)
 
     # 3. Single LLM call
     t0 = time.time()
@@ -637,19 +811,42 @@ async def _process_memory_batch(
         perf.record_timing("llm", time.time() - t0)
         perf.record_llm_call(llm_result.obs_count, llm_result.prompt_chars)
 
-    # 4. Sequential execution of creates / updates / deletes
+    return _BatchPlan(
+        memories=memories,
+        fact_tags=fact_tags,
+        per_fact_obs_ids=per_fact_obs_ids,
+        union_observations=union_observations,
+        llm_result=llm_result,
+        fact_embeddings=fact_embeddings,
+    )
+
+
+async def _apply_memory_batch_plan(
+    conn: "Connection",
+    memory_engine: "MemoryEngine",
+    bank_id: str,
+    plan: _BatchPlan,
+    perf: ConsolidationPerfLog | None = None,
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Execute the creates / updates / deletes of a plan sequentially.
+
+    Per-fact security: action execution validates each learning_id against the
+    observations that were recalled specifically for that fact, so cross-tag
+    updates cannot occur.
+
+    Returns:
+        Tuple of (one result dict per memory, in the same order as plan.memories;
+        number of deleted observations)
+    """
+    memories = plan.memories
+    llm_result = plan.llm_result
+    fact_tags = plan.fact_tags
+
     # Track which memory indices participated so we can build per-memory results for stats
     per_memory_created: set[str] = set()
     per_memory_updated: set[str] = set()
 
-    # Determine effective tag scope for observations.
-    # When obs_tags_override is set, use it; otherwise use the memory's own tags.
-    if obs_tags_override is not None:
-        fact_tags = obs_tags_override
-    else:
-        # All memories in the batch share the same tag set (enforced by batching)
-        fact_tags = memories[0].get("tags") or [] if memories else []
-
     mem_by_id = {str(m["id"]): m for m in memories}
 
     for create in llm_result.creates:
@@ -657,7 +854,7 @@ async def _process_memory_batch(
         if not source_mems:
             continue
         agg = _aggregate_source_fields(source_mems, tags=fact_tags)
-        await _execute_create_action(
+        created = await _execute_create_action(
             conn=conn,
             memory_engine=memory_engine,
             bank_id=bank_id,
@@ -670,6 +867,9 @@ async def _process_memory_batch(
             mentioned_at=agg.mentioned_at,
             perf=perf,
         )
+        plan.created_observation_ids.add(created["observation_id"])
+        if created["embedding"] is not None:
+            plan.created_observations.append((created["tags"], created["embedding"]))
         for m in source_mems:
             per_memory_created.add(str(m["id"]))
 
@@ -678,7 +878,7 @@ async def _process_memory_batch(
         if not source_mems:
             continue
         # Security: the observation must have been recalled for at least one of the source facts
-        if not any(update.observation_id in per_fact_obs_ids.get(str(m["id"]), set()) for m in source_mems):
+        if not any(update.observation_id in plan.per_fact_obs_ids.get(str(m["id"]), set()) for m in source_mems):
             logger.debug(
                 f"Batch consolidation: rejected update — observation {update.observation_id} "
                 f"not in any source fact's recall"
@@ -692,25 +892,27 @@ async def _process_memory_batch(
             source_memory_ids=[m["id"] for m in source_mems],
             observation_id=update.observation_id,
             new_text=update.text,
-            observations=union_observations,
+            observations=plan.union_observations,
             source_fact_tags=agg.tags,
             source_occurred_start=agg.occurred_start,
             source_occurred_end=agg.occurred_end,
             source_mentioned_at=agg.mentioned_at,
             perf=perf,
         )
+        plan.touched_observation_ids.add(update.observation_id)
         for m in source_mems:
             per_memory_updated.add(str(m["id"]))
 
     deleted_count = 0
     for delete in llm_result.deletes:
         # Security: the observation must be present in the unioned recall
-        if not any(str(obs.id) == delete.observation_id for obs in union_observations):
+        if delete.observation_id not in plan.observation_ids:
             logger.debug(
                 f"Batch consolidation: rejected delete — observation {delete.observation_id} not in unioned recall"
             )
             continue
         await _execute_delete_action(conn=conn, bank_id=bank_id, observation_id=delete.observation_id)
+        plan.touched_observation_ids.add(delete.observation_id)
         deleted_count += 1
 
     # Build per-memory result dicts for the stats tracker in the outer loop
@@ -786,7 +988,7 @@ async def _execute_update_action(
     merged_tags = list(existing_tags | source_tags)
 
     t0 = time.time()
-    embeddings = await embedding_utils.generate_embeddings_batch(memory_engine.embeddings, [new_text])
+    embeddings = await memory_engine._generate_embeddings([new_text])
     embedding_str = str(embeddings[0]) if embeddings else None
     if perf:
         perf.record_timing("embedding", time.time() - t0)
@@ -841,14 +1043,17 @@ async def _execute_create_action(
     occurred_end: datetime | None = None,
     mentioned_at: datetime | None = None,
     perf: ConsolidationPerfLog | None = None,
-) -> None:
+) -> dict[str, Any]:
     """
     Create a new observation from one or more source memories.
 
     Tags are inherited from the source facts (determined algorithmically, not by LLM)
     to maintain visibility scope.
+
+    Returns:
+        Dict with the created observation's observation_id, tags and embedding
     """
-    await _create_observation_directly(
+    result = await _create_observation_directly(
         conn=conn,
         memory_engine=memory_engine,
         bank_id=bank_id,
@@ -862,6 +1067,7 @@ async def _execute_create_action(
         perf=perf,
     )
     logger.debug(f"Created observation from {len(source_memory_ids)} source memories")
+    return result
 
 
 async def _execute_delete_action(
@@ -902,66 +1108,221 @@ async def _create_memory_links(
     pass
 
 
-async def _find_related_observations(
+async def _find_related_observations_batch(
+    conn: "Connection",
     memory_engine: "MemoryEngine",
     bank_id: str,
-    query: str,
-    request_context: "RequestContext",
+    queries: list[str],
     tags: list[str] | None = None,
-) -> "RecallResult":
+    config: Any = None,
+    embeddings: list[list[float]] | None = None,
+) -> tuple[list[list["MemoryFact"]], dict[str, "MemoryFact"]]:
     """
-    Find observations related to the given query using optimized recall.
+    Find the observations related to each of a batch of new facts.
+
+    A lightweight alternative to one full recall per fact: all fact texts are embedded
+    in one call, observation candidates for every fact come from a single multi-vector
+    query, the candidates of all facts are reranked in one cross-encoder call, and
+    source facts are fetched once for the whole batch.
 
     SECURITY: Filters by tags using all_strict matching to prevent cross-tenant/cross-user
     information leakage. Observations are only consolidated within the same tag scope.
 
-    Uses max_tokens to naturally limit observations (no artificial count limit).
-    Includes source memories with dates for LLM context.
-
     Args:
-        tags: Optional tags to filter observations (uses all_strict matching for security)
+        conn: Database connection
+        memory_engine: MemoryEngine instance (embeddings and reranker)
+        bank_id: Bank identifier
+        queries: Fact texts, one per new memory
+        tags: Observation tag scope (uses all_strict matching for security)
+        config: Resolved bank config (token budgets); defaults to the global config
+        embeddings: Embeddings of the queries, if already computed
 
     Returns:
-        List of related observations with their tags, source memories, and dates
+        Tuple of (observations per query, ranked and limited to consolidation_max_tokens;
+        source facts of those observations keyed by ID, within the source fact budgets)
     """
-    # Use recall to find related observations with token budget
-    # max_tokens naturally limits how many observations are returned
     from ...tracing import get_tracer, is_tracing_enabled
+    from ..response_models import MemoryFact
+    from ..search.reranking import apply_combined_scoring
+    from ..search.tags import build_tags_where_clause_simple
+    from ..search.types import MergedCandidate, RetrievalResult
 
-    config = await memory_engine._config_resolver.resolve_full_config(bank_id, request_context)
+    if not queries:
+        return [], {}
+    config = config or get_config()
 
     # SECURITY: Use all_strict matching if tags provided to prevent cross-scope consolidation
-    tags_match = "all_strict" if tags else "any"
+    tags_clause = build_tags_where_clause_simple(tags, 5, table_alias="o.", match="all_strict" if tags else "any")
 
-    # Create span for recall operation within consolidation
     tracer = get_tracer()
     if is_tracing_enabled():
         recall_span = tracer.start_span("hindsight.consolidation_recall")
         recall_span.set_attribute("hindsight.bank_id", bank_id)
-        recall_span.set_attribute("hindsight.query", query[:100])  # Truncate for brevity
+        recall_span.set_attribute("hindsight.query_count", len(queries))
         recall_span.set_attribute("hindsight.fact_type", "observation")
     else:
         recall_span = None
 
     try:
-        recall_result = await memory_engine.recall_async(
-            bank_id=bank_id,
-            query=query,
-            max_tokens=config.consolidation_max_tokens,  # Token budget for observations (configurable)
-            fact_type=["observation"],  # Only retrieve observations
-            request_context=request_context,
-            tags=tags,  # Filter by source memory's tags
-            tags_match=tags_match,  # Use strict matching for security
-            include_source_facts=True,  # Embed source facts so we avoid a separate DB fetch
-            max_source_facts_tokens=config.consolidation_source_facts_max_tokens,
-            max_source_facts_tokens_per_observation=config.consolidation_source_facts_max_tokens_per_observation,
-            _quiet=True,  # Suppress logging
+        if embeddings is None:
+            embeddings = await memory_engine._generate_embeddings(queries)
+        params: list[Any] = [
+            bank_id,
+            [str(embedding) for embedding in embeddings],
+            _OBSERVATION_CANDIDATES_PER_FACT,
+            _OBSERVATION_MIN_SIMILARITY,
+        ]
+        if tags:
+            params.append(tags)
+        rows = await conn.fetch(
+            f"""
+            SELECT q.idx, c.*
+            FROM unnest($2::text[]) WITH ORDINALITY AS q(embedding, idx)
+            CROSS JOIN LATERAL (
+                SELECT o.id, o.text, o.context, o.event_date, o.occurred_start, o.occurred_end, o.mentioned_at,
+                       o.fact_type, o.document_id, o.chunk_id, o.tags, o.source_memory_ids,
+                       1 - (o.embedding <=> q.embedding::vector) AS similarity
+                FROM {fq_table("memory_units")} o
+                WHERE o.bank_id = $1
+                  AND o.fact_type = 'observation'
+                  AND o.embedding IS NOT NULL
+                  AND (1 - (o.embedding <=> q.embedding::vector)) >= $4
+                  {tags_clause}
+                ORDER BY o.embedding <=> q.embedding::vector
+                LIMIT $3
+            ) c
+            """,
+            *params,
+        )
+
+        candidates_per_query: list[list[MergedCandidate]] = [[] for _ in queries]
+        source_ids_by_obs: dict[str, list[str]] = {}
+        for row in rows:
+            row_dict = dict(row)
+            retrieval = RetrievalResult.from_db_row(row_dict)
+            source_ids_by_obs[retrieval.id] = [str(sid) for sid in row_dict["source_memory_ids"] or []]
+            candidates_per_query[row_dict["idx"] - 1].append(
+                MergedCandidate(retrieval=retrieval, rrf_score=retrieval.similarity or 0.0)
+            )
+
+        # Rerank every fact's candidates in one cross-encoder call
+        reranker = memory_engine._cross_encoder_reranker
+        if rows:
+            await reranker.ensure_initialized()
+        scored_per_query = await reranker.rerank_batch(list(zip(queries, candidates_per_query)))
+
+        now = datetime.now(timezone.utc)
+        per_query_scored = []
+        for scored in scored_per_query:
+            apply_combined_scoring(scored, now=now)
+            scored.sort(key=lambda sr: sr.weight, reverse=True)
+            filtered, _ = memory_engine._filter_by_token_budget(
+                [{"id": sr.id, "text": sr.retrieval.text} for sr in scored], config.consolidation_max_tokens
+            )
+            per_query_scored.append(scored[: len(filtered)])
+
+        def _iso(value: datetime | None) -> str | None:
+            return value.isoformat() if value else None
+
+        per_query_observations: list[list[MemoryFact]] = [
+            [
+                MemoryFact(
+                    id=sr.id,
+                    text=sr.retrieval.text,
+                    fact_type=sr.retrieval.fact_type,
+                    context=sr.retrieval.context,
+                    occurred_start=_iso(sr.retrieval.occurred_start),
+                    occurred_end=_iso(sr.retrieval.occurred_end),
+                    mentioned_at=_iso(sr.retrieval.mentioned_at),
+                    document_id=sr.retrieval.document_id,
+                    chunk_id=sr.retrieval.chunk_id,
+                    tags=sr.retrieval.tags,
+                    source_fact_ids=source_ids_by_obs.get(sr.id),
+                )
+                for sr in scored
+            ]
+            for scored in per_query_scored
+        ]
+
+        # Hydrate the source facts of all selected observations in one query
+        source_ids = list(
+            dict.fromkeys(
+                sid
+                for observations in per_query_observations
+                for obs in observations
+                for sid in obs.source_fact_ids or []
+            )
         )
+        source_rows = []
+        if source_ids:
+            source_rows = await conn.fetch(
+                f"""
+                SELECT id, text, fact_type, context, occurred_start, occurred_end,
+                       mentioned_at, document_id, chunk_id, tags
+                FROM {fq_table("memory_units")}
+                WHERE id = ANY($1::uuid[])
+                """,
+                [uuid.UUID(sid) for sid in source_ids],
+            )
     finally:
         if recall_span:
             recall_span.end()
 
-    return recall_result
+    source_row_by_id = {str(r["id"]): r for r in source_rows}
+    encoding = _get_tiktoken_encoding()
+    token_counts: dict[str, int] = {}
+
+    def _tokens(sid: str) -> int:
+        if sid not in token_counts:
+            token_counts[sid] = len(encoding.encode(source_row_by_id[sid]["text"]))
+        return token_counts[sid]
+
+    # Apply the source fact budgets per query, as a recall for that fact alone would
+    per_obs_budget = config.consolidation_source_facts_max_tokens_per_observation
+    total_budget = config.consolidation_source_facts_max_tokens
+    selected: set[str] = set()
+    for observations in per_query_observations:
+        if per_obs_budget >= 0:
+            # Per-observation capping: each observation selects source facts up to its budget
+            for obs in observations:
+                obs_tokens = 0
+                for sid in obs.source_fact_ids or []:
+                    if sid not in source_row_by_id:
+                        continue
+                    if obs_tokens + _tokens(sid) > per_obs_budget:
+                        break
+                    obs_tokens += _tokens(sid)
+                    selected.add(sid)
+        else:
+            # Global budget: fill in order of first appearance until exhausted
+            query_tokens = 0
+            for sid in dict.fromkeys(sid for obs in observations for sid in obs.source_fact_ids or []):
+                if sid not in source_row_by_id:
+                    continue
+                if total_budget >= 0 and query_tokens + _tokens(sid) > total_budget:
+                    break
+                query_tokens += _tokens(sid)
+                selected.add(sid)
+
+    source_facts: dict[str, MemoryFact] = {}
+    for sid in source_ids:
+        if sid not in selected:
+            continue
+        r = source_row_by_id[sid]
+        source_facts[sid] = MemoryFact(
+            id=sid,
+            text=r["text"],
+            fact_type=r["fact_type"],
+            context=r["context"],
+            occurred_start=_iso(r["occurred_start"]),
+            occurred_end=_iso(r["occurred_end"]),
+            mentioned_at=_iso(r["mentioned_at"]),
+            document_id=r["document_id"],
+            chunk_id=str(r["chunk_id"]) if r["chunk_id"] else None,
+            tags=r["tags"] or None,
+        )
+
+    return per_query_observations, source_facts
 
 
 def _build_observations_for_llm(
@@ -1033,18 +1394,17 @@ async def _consolidate_batch_with_llm(
     facts_lines = "\n".join(_fact_line(m) for m in memories)
 
     observations_mission = config.observations_mission if config is not None else None
-    prompt_template = build_batch_consolidation_prompt(observations_mission)
-    prompt = prompt_template.format(
-        facts_text=facts_lines,
-        observations_text=observations_text,
-    )
+    # Static instructions first so providers can serve them from their prompt cache
+    system_prompt = build_batch_consolidation_prompt(observations_mission)
+    user_message = build_batch_consolidation_input(facts_lines, observations_text)
+    prompt_chars = len(system_prompt) + len(user_message)
 
     max_attempts = 3
     last_exc: Exception | None = None
     for attempt in range(1, max_attempts + 1):
         try:
             response: _ConsolidationBatchResponse = await llm_config.call(
-                messages=[{"role": "user", "content": prompt}],
+                messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_message}],
                 response_format=_ConsolidationBatchResponse,
                 scope="consolidation",
             )
@@ -1053,7 +1413,7 @@ async def _consolidate_batch_with_llm(
                 updates=response.updates,
                 deletes=response.deletes,
                 obs_count=len(union_observations),
-                prompt_chars=len(prompt),
+                prompt_chars=prompt_chars,
             )
         except Exception as exc:
             last_exc = exc
@@ -1062,7 +1422,7 @@ async def _consolidate_batch_with_llm(
     logger.error(
         f"[CONSOLIDATION] LLM batch call failed after {max_attempts} attempts, skipping batch. Last error: {last_exc}"
     )
-    return _BatchLLMResult(obs_count=len(union_observations), prompt_chars=len(prompt))
+    return _BatchLLMResult(obs_count=len(union_observations), prompt_chars=prompt_chars)
 
 
 async def _create_observation_directly(
@@ -1081,7 +1441,7 @@ async def _create_observation_directly(
     """Create an observation from one or more source memories with pre-processed text."""
     # Generate embedding for the observation (convert to string for pgvector)
     t0 = time.time()
-    embeddings = await embedding_utils.generate_embeddings_batch(memory_engine.embeddings, [observation_text])
+    embeddings = await memory_engine._generate_embeddings([observation_text])
     embedding_str = str(embeddings[0]) if embeddings else None
     if perf:
         perf.record_timing("embedding", time.time() - t0)
@@ -1141,4 +1501,9 @@ async def _create_observation_directly(
 
     logger.debug(f"Created observation {observation_id} from {len(source_memory_ids)} memories (tags: {obs_tags})")
 
-    return {"action": "created", "observation_id": str(row["id"]), "tags": obs_tags}
+    return {
+        "action": "created",
+        "observation_id": str(row["id"]),
+        "tags": obs_tags,
+        "embedding": embeddings[0] if embeddings else None,
+    }
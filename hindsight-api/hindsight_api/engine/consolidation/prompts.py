@@ -1,4 +1,11 @@
-"""Prompts for the consolidation engine."""
+"""
+Prompts for the consolidation engine.
+
+Everything that does not change between calls (instructions, mission, output
+format) goes in the system prompt and the facts and observations of a batch go
+in the user message, so providers can serve the system prompt from their
+prompt cache.
+"""
 
 # Default mission when no bank-specific mission is set
 _DEFAULT_MISSION = "Track every detail: names, numbers, dates, places, and relationships. Prefer specifics over abstractions, never generalise."
@@ -10,13 +17,9 @@ _PROCESSING_RULES = """Processing rules (always apply):
 - RESOLVE REFERENCES: when a new fact provides a concrete value resolving a vague placeholder in an existing observation (e.g. "home country", "hometown", "birthplace", "native language", "her ex", "that city"), UPDATE the observation to embed the resolved value explicitly. Example: new fact says "grandma in Sweden" + existing observation says "moved from her home country" → update to "home country is Sweden".
 - NEVER merge observations about different people or unrelated topics."""
 
-# Data section — format placeholders {facts_text} and {observations_text} are substituted at call time
-_BATCH_DATA_SECTION = """
-NEW FACTS:
-{facts_text}
-
-EXISTING OBSERVATIONS (JSON array, pooled from recalls across all facts above):
-{observations_text}
+# How to read the input — the data itself is sent in the user message
+_BATCH_INPUT_SECTION = """
+The user message lists NEW FACTS, then EXISTING OBSERVATIONS (JSON array, pooled from recalls across all facts).
 
 Each observation includes:
 - id: unique identifier for updating
@@ -31,7 +34,7 @@ Compare the facts against existing observations:
 - Cross-reference facts within the batch: a later fact may resolve a vague reference in an earlier one
 - Purely ephemeral facts → omit them (no create/update needed)"""
 
-# Output format — JSON braces escaped as {{ }} so .format() leaves them literal
+# Output format
 _BATCH_OUTPUT_FORMAT = """
 Output a JSON object with three arrays.
 
@@ -53,9 +56,9 @@ Observation text rules:
 - Parenthesized metadata like (occurred_start=...) and pipe-separated labels like "| Involving: ..." are fact formatting — strip them entirely from observation text.
 - How many observations to create and how much to aggregate is driven by the MISSION above.
 
-{{"creates": [{{"text": "Alice works long hours, often past midnight.", "source_fact_ids": ["a1b2c3d4-e5f6-7890-abcd-ef1234567890"]}}, {{"text": "Alice feels exhausted from project deadlines.", "source_fact_ids": ["b2c3d4e5-f6a7-8901-bcde-f12345678901"]}}],
-  "updates": [{{"text": "Alice works at Acme Corp as a senior engineer", "observation_id": "c3d4e5f6-a7b8-9012-cdef-123456789012", "source_fact_ids": ["d4e5f6a7-b8c9-0123-defa-234567890123"]}}],
-  "deletes": [{{"observation_id": "e5f6a7b8-c9d0-1234-efab-345678901234"}}]}}
+{"creates": [{"text": "Alice works long hours, often past midnight.", "source_fact_ids": ["a1b2c3d4-e5f6-7890-abcd-ef1234567890"]}, {"text": "Alice feels exhausted from project deadlines.", "source_fact_ids": ["b2c3d4e5-f6a7-8901-bcde-f12345678901"]}],
+  "updates": [{"text": "Alice works at Acme Corp as a senior engineer", "observation_id": "c3d4e5f6-a7b8-9012-cdef-123456789012", "source_fact_ids": ["d4e5f6a7-b8c9-0123-defa-234567890123"]}],
+  "deletes": [{"observation_id": "e5f6a7b8-c9d0-1234-efab-345678901234"}]}
 
 Rules:
 - "source_fact_ids": copy the EXACT UUID strings shown in brackets [uuid] from NEW FACTS — never use integers or positions.
@@ -63,15 +66,17 @@ Rules:
 - One create/update may reference multiple facts when they jointly support the observation.
 - "deletes": only when an observation is directly superseded or contradicted by new facts.
 - Do NOT include "tags" — handled automatically.
-- Return {{"creates": [], "updates": [], "deletes": []}} if nothing durable is found."""
+- Return {"creates": [], "updates": [], "deletes": []} if nothing durable is found."""
 
 
 def build_batch_consolidation_prompt(observations_mission: str | None = None) -> str:
     """
-    Build the consolidation prompt for batch mode (multiple facts per LLM call).
+    Build the consolidation system prompt for batch mode (multiple facts per LLM call).
 
     The mission defines *what* to track (customisable per bank).
     Processing rules and output format are always present regardless of mission.
+    The prompt is identical for every batch of a bank; the batch itself goes in
+    build_batch_consolidation_input().
     """
     mission = observations_mission or _DEFAULT_MISSION
 
@@ -79,5 +84,10 @@ def build_batch_consolidation_prompt(observations_mission: str | None = None) ->
         "You are a memory consolidation system. Synthesize facts into observations "
         "and merge with existing observations when appropriate.\n\n"
         f"## MISSION\n{mission}\n\n"
-        f"{_PROCESSING_RULES}" + _BATCH_DATA_SECTION + _BATCH_OUTPUT_FORMAT
+        f"{_PROCESSING_RULES}" + _BATCH_INPUT_SECTION + _BATCH_OUTPUT_FORMAT
     )
+
+
+def build_batch_consolidation_input(facts_text: str, observations_text: str) -> str:
+    """Build the user message carrying one batch's new facts and candidate observations."""
+    return f"NEW FACTS:\n{facts_text}\n\nEXISTING OBSERVATIONS:\n{observations_text}"
@@ -0,0 +1,175 @@
+"""
+Content-addressed embedding cache.
+
+Computed embeddings are stored in the ``embedding_cache`` table keyed by the
+embeddings model, the vector dimension and the SHA-256 of the input text.
+Re-retained documents, recurring observation text and repeated recall queries
+then resolve from a single batched lookup instead of calling the embeddings
+provider again. Only the misses are sent to the provider, in one batch, and
+written back in bulk.
+
+Single recall queries skip the cache: one provider call is cheaper than a
+lookup plus a write-back.
+"""
+
+import hashlib
+import logging
+import time
+
+from .db_utils import acquire_with_retry
+
+logger = logging.getLogger(__name__)
+
+# Expired rows are deleted at most this often per schema, piggybacking on writes
+EVICTION_INTERVAL_SECONDS = 3600
+
+_last_eviction: dict[str, float] = {}
+
+
+def _cache_table(schema: str) -> str:
+    return f"{schema}.embedding_cache"
+
+
+def text_hash(text: str) -> bytes:
+    """Return the SHA-256 digest used as the cache key for a text."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def cache_model_key(embeddings_backend) -> str:
+    """Identify the model producing the vectors, e.g. ``openai:text-embedding-3-small``."""
+    return f"{embeddings_backend.provider_name}:{embeddings_backend.model_id}"
+
+
+async def lookup_embeddings(
+    conn, schema: str, model_key: str, dimension: int, hashes: list[bytes], max_age_days: int
+) -> dict[bytes, list[float]]:
+    """
+    Fetch cached embeddings for the given text hashes in one query.
+
+    Rows older than ``max_age_days`` are ignored even if they have not been evicted yet.
+
+    Returns:
+        Mapping of text hash to embedding for the hashes found
+    """
+    if not hashes:
+        return {}
+    rows = await conn.fetch(
+        f"""
+        SELECT text_hash, embedding
+        FROM {_cache_table(schema)}
+        WHERE model_key = $1
+          AND dimension = $2
+          AND text_hash = ANY($3::bytea[])
+          AND created_at > NOW() - make_interval(days => $4)
+        """,
+        model_key,
+        dimension,
+        hashes,
+        max_age_days,
+    )
+    return {bytes(row["text_hash"]): list(row["embedding"]) for row in rows}
+
+
+async def store_embeddings(
+    conn, schema: str, model_key: str, dimension: int, entries: dict[bytes, list[float]]
+) -> None:
+    """Insert or refresh cached embeddings."""
+    if not entries:
+        return
+    await conn.executemany(
+        f"""
+        INSERT INTO {_cache_table(schema)} (model_key, dimension, text_hash, embedding)
+        VALUES ($1, $2, $3, $4)
+        ON CONFLICT (model_key, dimension, text_hash)
+        DO UPDATE SET embedding = EXCLUDED.embedding, created_at = NOW()
+        """,
+        [(model_key, dimension, digest, embedding) for digest, embedding in entries.items()],
+    )
+
+
+async def evict_expired_embeddings(conn, schema: str, max_age_days: int) -> int:
+    """
+    Delete cached embeddings older than ``max_age_days``.
+
+    Returns:
+        Number of rows deleted
+    """
+    result = await conn.execute(
+        f"DELETE FROM {_cache_table(schema)} WHERE created_at <= NOW() - make_interval(days => $1)",
+        max_age_days,
+    )
+    return int(result.split()[-1])
+
+
+class EmbeddingCache:
+    """
+    Database-backed cache in front of an embeddings backend.
+
+    Cache errors never fail the caller: if the lookup or write-back fails the
+    texts are embedded by the backend as if the cache were disabled.
+    """
+
+    def __init__(self, pool, max_age_days: int, schema: str):
+        """
+        Args:
+            pool: asyncpg connection pool
+            max_age_days: Cached vectors older than this are ignored and evicted
+            schema: Database schema holding the embedding_cache table
+        """
+        self._pool = pool
+        self._max_age_days = max_age_days
+        self._schema = schema
+
+    async def encode(self, embeddings_backend, texts: list[str]) -> list[list[float]]:
+        """
+        Return embeddings for ``texts``, in order, computing only the texts not already cached.
+
+        Args:
+            embeddings_backend: Embeddings instance used for cache misses
+            texts: List of texts to embed
+
+        Returns:
+            List of embeddings in same order as input texts
+        """
+        if not texts:
+            return []
+
+        model_key = cache_model_key(embeddings_backend)
+        dimension = embeddings_backend.dimension
+        hashes = [text_hash(text) for text in texts]
+        unique = dict(zip(hashes, texts))
+
+        try:
+            async with acquire_with_retry(self._pool) as conn:
+                vectors = await lookup_embeddings(
+                    conn, self._schema, model_key, dimension, list(unique), self._max_age_days
+                )
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed, embedding all texts: {e}")
+            vectors = {}
+
+        missing = [digest for digest in unique if digest not in vectors]
+        if missing:
+            computed = await embeddings_backend.aencode([unique[digest] for digest in missing])
+            new_entries = dict(zip(missing, computed))
+            vectors.update(new_entries)
+            await self._write_back(model_key, dimension, new_entries)
+
+        logger.debug(f"Embedding cache: {len(unique) - len(missing)} hits, {len(missing)} misses")
+        return [vectors[digest] for digest in hashes]
+
+    async def _write_back(self, model_key: str, dimension: int, entries: dict[bytes, list[float]]) -> None:
+        schema = self._schema
+        now = time.monotonic()
+        last_eviction = _last_eviction.get(schema)
+        evict = last_eviction is None or now - last_eviction >= EVICTION_INTERVAL_SECONDS
+        try:
+            async with acquire_with_retry(self._pool) as conn:
+                await store_embeddings(conn, schema, model_key, dimension, entries)
+                if evict:
+                    _last_eviction[schema] = now
+                    deleted = await evict_expired_embeddings(conn, schema, self._max_age_days)
+                    if deleted:
+                        logger.info(f"Embedding cache: evicted {deleted} entries older than {self._max_age_days} days")
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e}")
@@ -9,10 +9,12 @@ The database schema is automatically adjusted to match the model's dimension.
 Configuration via environment variables - see hindsight_api.config for all env var names.
 """
 
+import asyncio
 import logging
 import os
 import warnings
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 
 import httpx
 
@@ -23,6 +25,7 @@ from ..config import (
     DEFAULT_EMBEDDINGS_LOCAL_FORCE_CPU,
     DEFAULT_EMBEDDINGS_LOCAL_MODEL,
     DEFAULT_EMBEDDINGS_LOCAL_TRUST_REMOTE_CODE,
+    DEFAULT_EMBEDDINGS_MAX_CONCURRENT,
     DEFAULT_EMBEDDINGS_OPENAI_MODEL,
     DEFAULT_EMBEDDINGS_PROVIDER,
     DEFAULT_LITELLM_API_BASE,
@@ -42,6 +45,56 @@ from ..config import (
 logger = logging.getLogger(__name__)
 
 
+def _is_retryable_error(error: Exception) -> bool:
+    """Whether an embedding request error is transient (connection issue, rate limit or 5xx)."""
+    if isinstance(error, (httpx.ConnectError, httpx.ReadTimeout, httpx.WriteTimeout)):
+        return True
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """Extract a Retry-After delay (in seconds) from an HTTP or SDK error, if present."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or getattr(error, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+async def _call_with_retry(
+    call: Callable[[], Awaitable[list[list[float]]]],
+    max_retries: int,
+    retry_delay: float,
+    provider_name: str,
+) -> list[list[float]]:
+    """
+    Run an async embedding request, retrying transient errors with exponential backoff.
+
+    Rate-limit responses (429) wait for the server's Retry-After when provided.
+    """
+    delay = retry_delay
+    for attempt in range(max_retries + 1):
+        try:
+            return await call()
+        except Exception as e:
+            if attempt >= max_retries or not _is_retryable_error(e):
+                raise
+            wait = _retry_after_seconds(e) or delay
+            logger.warning(
+                f"{provider_name} embedding request failed (attempt {attempt + 1}/{max_retries + 1}): {e}. "
+                f"Retrying in {wait}s..."
+            )
+            await asyncio.sleep(wait)
+            delay *= 2  # Exponential backoff
+    raise RuntimeError("unreachable")
+
+
 class Embeddings(ABC):
     """
     Abstract base class for embedding generation.
@@ -62,6 +115,16 @@ class Embeddings(ABC):
         """Return the embedding dimension produced by this model."""
         pass
 
+    @property
+    def model_id(self) -> str:
+        """
+        Return an identifier for the model producing the vectors.
+
+        Used together with the provider name and dimension to key persisted
+        embeddings, so vectors from different models are never mixed.
+        """
+        return self.provider_name
+
     @abstractmethod
     async def initialize(self) -> None:
         """
@@ -85,6 +148,43 @@ class Embeddings(ABC):
         """
         pass
 
+    async def aencode(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for a list of texts without blocking the event loop.
+
+        The default implementation runs encode() in a thread pool. Remote providers
+        override this with native async clients that send batches concurrently.
+
+        Args:
+            texts: List of text strings to encode
+
+        Returns:
+            List of embedding vectors, in the same order as texts
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.encode, texts)
+
+    async def close(self) -> None:
+        """Release clients opened by initialize(). The default has nothing to release."""
+        pass
+
+    async def _aencode_batches(
+        self,
+        texts: list[str],
+        batch_size: int,
+        semaphore: asyncio.Semaphore,
+        encode_batch: Callable[[list[str]], Awaitable[list[list[float]]]],
+    ) -> list[list[float]]:
+        """Split texts into batch_size slices and encode them concurrently, bounded by semaphore."""
+
+        async def _encode(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await encode_batch(batch)
+
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        results = await asyncio.gather(*(_encode(batch) for batch in batches))
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+
 
 class LocalSTEmbeddings(Embeddings):
     """
@@ -117,6 +217,10 @@ class LocalSTEmbeddings(Embeddings):
     def provider_name(self) -> str:
         return "local"
 
+    @property
+    def model_id(self) -> str:
+        return self.model_name
+
     @property
     def dimension(self) -> int:
         if self._dimension is None:
@@ -222,6 +326,7 @@ class RemoteTEIEmbeddings(Embeddings):
         batch_size: int = 32,
         max_retries: int = 3,
         retry_delay: float = 0.5,
+        max_concurrent: int = DEFAULT_EMBEDDINGS_MAX_CONCURRENT,
     ):
         """
         Initialize remote TEI embeddings client.
@@ -232,13 +337,17 @@ class RemoteTEIEmbeddings(Embeddings):
             batch_size: Maximum batch size for embedding requests (default: 32)
             max_retries: Maximum number of retries for failed requests (default: 3)
             retry_delay: Initial delay between retries in seconds, doubles each retry (default: 0.5)
+            max_concurrent: Maximum concurrent batch requests in aencode() (default: 8)
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.batch_size = batch_size
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_concurrent = max_concurrent
         self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrent)
         self._model_id: str | None = None
         self._dimension: int | None = None
 
@@ -246,6 +355,10 @@ class RemoteTEIEmbeddings(Embeddings):
     def provider_name(self) -> str:
         return "tei"
 
+    @property
+    def model_id(self) -> str:
+        return self._model_id or self.base_url
+
     @property
     def dimension(self) -> int:
         if self._dimension is None:
@@ -296,6 +409,9 @@ class RemoteTEIEmbeddings(Embeddings):
 
         logger.info(f"Embeddings: initializing TEI provider at {self.base_url}")
         self._client = httpx.Client(timeout=self.timeout)
+        self._async_client = httpx.AsyncClient(
+            timeout=self.timeout, limits=httpx.Limits(max_connections=self.max_concurrent)
+        )
 
         # Verify server is reachable and get model info
         try:
@@ -358,6 +474,44 @@ class RemoteTEIEmbeddings(Embeddings):
 
         return all_embeddings
 
+    async def aencode(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings using the remote TEI server, sending batches concurrently.
+
+        Args:
+            texts: List of text strings to encode
+
+        Returns:
+            List of embedding vectors
+        """
+        if self._async_client is None:
+            raise RuntimeError("Embeddings not initialized. Call initialize() first.")
+
+        if not texts:
+            return []
+
+        async def _embed_batch(batch: list[str]) -> list[list[float]]:
+            async def _post() -> list[list[float]]:
+                response = await self._async_client.post(f"{self.base_url}/embed", json={"inputs": batch})
+                response.raise_for_status()
+                return response.json()
+
+            return await _call_with_retry(_post, self.max_retries, self.retry_delay, "TEI")
+
+        try:
+            return await self._aencode_batches(texts, self.batch_size, self._semaphore, _embed_batch)
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"TEI embedding request failed: {e}")
+
+    async def close(self) -> None:
+        """Close the HTTP clients; initialize() opens new ones."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
 
 class OpenAIEmbeddings(Embeddings):
     """
@@ -383,6 +537,7 @@ class OpenAIEmbeddings(Embeddings):
         base_url: str | None = None,
         batch_size: int = 100,
         max_retries: int = 3,
+        max_concurrent: int = DEFAULT_EMBEDDINGS_MAX_CONCURRENT,
     ):
         """
         Initialize OpenAI embeddings client.
@@ -392,20 +547,29 @@ class OpenAIEmbeddings(Embeddings):
             model: OpenAI embedding model name (default: text-embedding-3-small)
             base_url: Custom base URL for OpenAI-compatible API (e.g., Azure OpenAI endpoint)
             batch_size: Maximum batch size for embedding requests (default: 100)
-            max_retries: Maximum number of retries for failed requests (default: 3)
+            max_retries: Maximum number of retries for failed requests (default: 3).
+                        The OpenAI SDK retries rate limits and 5xx errors, honoring Retry-After.
+            max_concurrent: Maximum concurrent batch requests in aencode() (default: 8)
         """
         self.api_key = api_key
         self.model = model
         self.base_url = base_url
         self.batch_size = batch_size
         self.max_retries = max_retries
+        self.max_concurrent = max_concurrent
         self._client = None
+        self._async_client = None
+        self._semaphore = asyncio.Semaphore(max_concurrent)
         self._dimension: int | None = None
 
     @property
     def provider_name(self) -> str:
         return "openai"
 
+    @property
+    def model_id(self) -> str:
+        return self.model
+
     @property
     def dimension(self) -> int:
         if self._dimension is None:
@@ -418,7 +582,7 @@ class OpenAIEmbeddings(Embeddings):
             return
 
         try:
-            from openai import OpenAI
+            from openai import AsyncOpenAI, OpenAI
         except ImportError:
             raise ImportError("openai is required for OpenAIEmbeddings. Install it with: pip install openai")
 
@@ -430,6 +594,7 @@ class OpenAIEmbeddings(Embeddings):
         if self.base_url:
             client_kwargs["base_url"] = self.base_url
         self._client = OpenAI(**client_kwargs)
+        self._async_client = AsyncOpenAI(**client_kwargs)
 
         # Try to get dimension from known models, otherwise do a test embedding
         if self.model in self.MODEL_DIMENSIONS:
@@ -478,6 +643,38 @@ class OpenAIEmbeddings(Embeddings):
 
         return all_embeddings
 
+    async def aencode(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings using the OpenAI API, sending batches concurrently.
+
+        Args:
+            texts: List of text strings to encode
+
+        Returns:
+            List of embedding vectors
+        """
+        if self._async_client is None:
+            raise RuntimeError("Embeddings not initialized. Call initialize() first.")
+
+        if not texts:
+            return []
+
+        async def _embed_batch(batch: list[str]) -> list[list[float]]:
+            # Retries (including 429 with Retry-After) are handled by the SDK client
+            response = await self._async_client.embeddings.create(model=self.model, input=batch)
+            return [e.embedding for e in sorted(response.data, key=lambda x: x.index)]
+
+        return await self._aencode_batches(texts, self.batch_size, self._semaphore, _embed_batch)
+
+    async def close(self) -> None:
+        """Close the OpenAI clients; initialize() opens new ones."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
 
 class CohereEmbeddings(Embeddings):
     """
@@ -506,6 +703,9 @@ class CohereEmbeddings(Embeddings):
         batch_size: int = 96,
         timeout: float = 60.0,
         input_type: str = "search_document",
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+        max_concurrent: int = DEFAULT_EMBEDDINGS_MAX_CONCURRENT,
     ):
         """
         Initialize Cohere embeddings client.
@@ -518,6 +718,9 @@ class CohereEmbeddings(Embeddings):
             timeout: Request timeout in seconds (default: 60.0)
             input_type: Input type for embeddings (default: search_document).
                        Options: search_document, search_query, classification, clustering
+            max_retries: Maximum number of retries for failed requests in aencode() (default: 3)
+            retry_delay: Initial delay between retries in seconds, doubles each retry (default: 0.5)
+            max_concurrent: Maximum concurrent batch requests in aencode() (default: 8)
         """
         self.api_key = api_key
         self.model = model
@@ -525,13 +728,23 @@ class CohereEmbeddings(Embeddings):
         self.batch_size = batch_size
         self.timeout = timeout
         self.input_type = input_type
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_concurrent = max_concurrent
         self._client = None
+        self._async_client = None
+        self._async_http_client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrent)
         self._dimension: int | None = None
 
     @property
     def provider_name(self) -> str:
         return "cohere"
 
+    @property
+    def model_id(self) -> str:
+        return f"{self.model}:{self.input_type}"
+
     @property
     def dimension(self) -> int:
         if self._dimension is None:
@@ -556,6 +769,9 @@ class CohereEmbeddings(Embeddings):
         if self.base_url:
             client_kwargs["base_url"] = self.base_url
         self._client = cohere.Client(**client_kwargs)
+        # Own the async transport so close() can release it
+        self._async_http_client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+        self._async_client = cohere.AsyncClient(**client_kwargs, httpx_client=self._async_http_client)
 
         # Try to get dimension from known models, otherwise do a test embedding
         if self.model in self.MODEL_DIMENSIONS:
@@ -604,6 +820,39 @@ class CohereEmbeddings(Embeddings):
 
         return all_embeddings
 
+    async def aencode(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings using the Cohere API, sending batches concurrently.
+
+        Args:
+            texts: List of text strings to encode
+
+        Returns:
+            List of embedding vectors
+        """
+        if self._async_client is None:
+            raise RuntimeError("Embeddings not initialized. Call initialize() first.")
+
+        if not texts:
+            return []
+
+        async def _embed_batch(batch: list[str]) -> list[list[float]]:
+            async def _embed() -> list[list[float]]:
+                response = await self._async_client.embed(texts=batch, model=self.model, input_type=self.input_type)
+                return response.embeddings
+
+            return await _call_with_retry(_embed, self.max_retries, self.retry_delay, "Cohere")
+
+        return await self._aencode_batches(texts, self.batch_size, self._semaphore, _embed_batch)
+
+    async def close(self) -> None:
+        """Close the async Cohere client's HTTP transport; initialize() opens new clients."""
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+            self._async_http_client = None
+        self._async_client = None
+        self._client = None
+
 
 class LiteLLMEmbeddings(Embeddings):
     """
@@ -629,6 +878,9 @@ class LiteLLMEmbeddings(Embeddings):
         model: str = DEFAULT_EMBEDDINGS_LITELLM_MODEL,
         batch_size: int = 100,
         timeout: float = 60.0,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+        max_concurrent: int = DEFAULT_EMBEDDINGS_MAX_CONCURRENT,
     ):
         """
         Initialize LiteLLM embeddings client.
@@ -640,19 +892,31 @@ class LiteLLMEmbeddings(Embeddings):
                    Use provider prefix for non-OpenAI models (e.g., cohere/embed-english-v3.0)
             batch_size: Maximum batch size for embedding requests (default: 100)
             timeout: Request timeout in seconds (default: 60.0)
+            max_retries: Maximum number of retries for failed requests in aencode() (default: 3)
+            retry_delay: Initial delay between retries in seconds, doubles each retry (default: 0.5)
+            max_concurrent: Maximum concurrent batch requests in aencode() (default: 8)
         """
         self.api_base = api_base.rstrip("/")
         self.api_key = api_key
         self.model = model
         self.batch_size = batch_size
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_concurrent = max_concurrent
         self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrent)
         self._dimension: int | None = None
 
     @property
     def provider_name(self) -> str:
         return "litellm"
 
+    @property
+    def model_id(self) -> str:
+        return self.model
+
     @property
     def dimension(self) -> int:
         if self._dimension is None:
@@ -671,6 +935,9 @@ class LiteLLMEmbeddings(Embeddings):
             headers["Authorization"] = f"Bearer {self.api_key}"
 
         self._client = httpx.Client(timeout=self.timeout, headers=headers)
+        self._async_client = httpx.AsyncClient(
+            timeout=self.timeout, headers=headers, limits=httpx.Limits(max_connections=self.max_concurrent)
+        )
 
         # Do a test embedding to detect dimension
         try:
@@ -721,6 +988,44 @@ class LiteLLMEmbeddings(Embeddings):
 
         return all_embeddings
 
+    async def aencode(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings using the LiteLLM proxy, sending batches concurrently.
+
+        Args:
+            texts: List of text strings to encode
+
+        Returns:
+            List of embedding vectors
+        """
+        if self._async_client is None:
+            raise RuntimeError("Embeddings not initialized. Call initialize() first.")
+
+        if not texts:
+            return []
+
+        async def _embed_batch(batch: list[str]) -> list[list[float]]:
+            async def _post() -> list[list[float]]:
+                response = await self._async_client.post(
+                    f"{self.api_base}/embeddings",
+                    json={"model": self.model, "input": batch},
+                )
+                response.raise_for_status()
+                return [e["embedding"] for e in sorted(response.json()["data"], key=lambda x: x["index"])]
+
+            return await _call_with_retry(_post, self.max_retries, self.retry_delay, "LiteLLM")
+
+        return await self._aencode_batches(texts, self.batch_size, self._semaphore, _embed_batch)
+
+    async def close(self) -> None:
+        """Close the HTTP clients; initialize() opens new ones."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
 
 class LiteLLMSDKEmbeddings(Embeddings):
     """
@@ -743,6 +1048,9 @@ class LiteLLMSDKEmbeddings(Embeddings):
         api_base: str | None = None,
         batch_size: int = 100,
         timeout: float = 60.0,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+        max_concurrent: int = DEFAULT_EMBEDDINGS_MAX_CONCURRENT,
     ):
         """
         Initialize LiteLLM SDK embeddings client.
@@ -753,12 +1061,19 @@ class LiteLLMSDKEmbeddings(Embeddings):
             api_base: Custom base URL for API (optional)
             batch_size: Maximum batch size for embedding requests (default: 100)
             timeout: Request timeout in seconds (default: 60.0)
+            max_retries: Maximum number of retries for failed requests in aencode() (default: 3)
+            retry_delay: Initial delay between retries in seconds, doubles each retry (default: 0.5)
+            max_concurrent: Maximum concurrent batch requests in aencode() (default: 8)
         """
         self.api_key = api_key
         self.model = model
         self.api_base = api_base
         self.batch_size = batch_size
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
         self._litellm = None  # Will be set during initialization
         self._dimension: int | None = None
 
@@ -766,6 +1081,10 @@ class LiteLLMSDKEmbeddings(Embeddings):
     def provider_name(self) -> str:
         return "litellm-sdk"
 
+    @property
+    def model_id(self) -> str:
+        return self.model
+
     @property
     def dimension(self) -> int:
         if self._dimension is None:
@@ -865,6 +1184,40 @@ class LiteLLMSDKEmbeddings(Embeddings):
 
         return all_embeddings
 
+    async def aencode(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings using the LiteLLM SDK's async API, sending batches concurrently.
+
+        Args:
+            texts: List of text strings to encode
+
+        Returns:
+            List of embedding vectors (one per input text)
+        """
+        if self._litellm is None:
+            raise RuntimeError("Embeddings not initialized. Call initialize() first.")
+
+        if not texts:
+            return []
+
+        async def _embed_batch(batch: list[str]) -> list[list[float]]:
+            embed_kwargs = {
+                "model": self.model,
+                "input": batch,
+                "api_key": self.api_key,
+                "encoding_format": "float",
+            }
+            if self.api_base:
+                embed_kwargs["api_base"] = self.api_base
+
+            async def _embed() -> list[list[float]]:
+                response = await self._litellm.aembedding(**embed_kwargs)
+                return [e["embedding"] for e in sorted(response.data, key=lambda x: x.get("index", 0))]
+
+            return await _call_with_retry(_embed, self.max_retries, self.retry_delay, "LiteLLM SDK")
+
+        return await self._aencode_batches(texts, self.batch_size, self._semaphore, _embed_batch)
+
 
 def create_embeddings_from_env() -> Embeddings:
     """
@@ -884,7 +1237,7 @@ def create_embeddings_from_env() -> Embeddings:
         url = config.embeddings_tei_url
         if not url:
             raise ValueError(f"{ENV_EMBEDDINGS_TEI_URL} is required when {ENV_EMBEDDINGS_PROVIDER} is 'tei'")
-        return RemoteTEIEmbeddings(base_url=url)
+        return RemoteTEIEmbeddings(base_url=url, max_concurrent=config.embeddings_max_concurrent)
     elif provider == "local":
         return LocalSTEmbeddings(
             model_name=config.embeddings_local_model,
@@ -901,7 +1254,9 @@ def create_embeddings_from_env() -> Embeddings:
             )
         model = os.environ.get(ENV_EMBEDDINGS_OPENAI_MODEL, DEFAULT_EMBEDDINGS_OPENAI_MODEL)
         base_url = os.environ.get(ENV_EMBEDDINGS_OPENAI_BASE_URL) or None
-        return OpenAIEmbeddings(api_key=api_key, model=model, base_url=base_url)
+        return OpenAIEmbeddings(
+            api_key=api_key, model=model, base_url=base_url, max_concurrent=config.embeddings_max_concurrent
+        )
     elif provider == "cohere":
         api_key = config.embeddings_cohere_api_key
         if not api_key:
@@ -910,12 +1265,14 @@ def create_embeddings_from_env() -> Embeddings:
             api_key=api_key,
             model=config.embeddings_cohere_model,
             base_url=config.embeddings_cohere_base_url,
+            max_concurrent=config.embeddings_max_concurrent,
         )
     elif provider == "litellm":
         return LiteLLMEmbeddings(
             api_base=config.embeddings_litellm_api_base,
             api_key=config.embeddings_litellm_api_key,
             model=config.embeddings_litellm_model,
+            max_concurrent=config.embeddings_max_concurrent,
         )
     elif provider == "litellm-sdk":
         api_key = config.embeddings_litellm_sdk_api_key
@@ -927,6 +1284,7 @@ def create_embeddings_from_env() -> Embeddings:
             api_key=api_key,
             model=config.embeddings_litellm_sdk_model,
             api_base=config.embeddings_litellm_sdk_api_base,
+            max_concurrent=config.embeddings_max_concurrent,
         )
     else:
         raise ValueError(
@@ -0,0 +1,160 @@
+"""
+In-memory per-bank entity index for entity resolution.
+
+The "full" entity lookup strategy used to load every entity and every
+co-occurrence row of a bank on each retain batch and then compare each new
+name against all of them. BankEntityIndex keeps that data resident and answers
+the same candidate query (exact, "new name inside canonical name" and
+"canonical name inside new name") from hash lookups:
+
+- a lowercase name -> entity map (names are unique per bank, case-insensitively)
+- a trigram -> entity ids posting index for substring candidates
+- a co-occurrence adjacency set per entity
+
+Indexes are tagged with the bank's entity generation (its
+``entity_index_generations`` row plus its ``entity_index_generation_deltas``).
+Writers bump the generation after committing entity changes, so an index whose
+generation no longer matches the database was modified by another worker and
+is reloaded.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+NGRAM_SIZE = 3
+
+
+@dataclass(slots=True)
+class IndexedEntity:
+    """An entity row held in a BankEntityIndex."""
+
+    id: str
+    canonical_name: str
+    metadata: dict | None
+    last_seen: datetime | None
+    mention_count: int
+    cooccurring: set = field(default_factory=set)
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class BankEntityIndex:
+    """Entities and co-occurrences of one bank, indexed for candidate lookup."""
+
+    def __init__(self, generation: int):
+        self.generation = generation
+        self._entities: dict[str, IndexedEntity] = {}
+        self._by_name: dict[str, str] = {}
+        self._ngrams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def add_entity(
+        self,
+        entity_id: str,
+        canonical_name: str,
+        last_seen: datetime | None,
+        mention_count: int = 1,
+        metadata: dict | None = None,
+    ) -> None:
+        """Add an entity; no-op if it is already indexed."""
+        if entity_id in self._entities:
+            return
+        name_lower = canonical_name.lower()
+        self._entities[entity_id] = IndexedEntity(entity_id, canonical_name, metadata, last_seen, mention_count)
+        self._by_name[name_lower] = entity_id
+        for gram in _ngrams(name_lower):
+            self._ngrams.setdefault(gram, set()).add(entity_id)
+
+    def record_mentions(self, entity_id: str, count: int, last_seen: datetime | None) -> None:
+        """Apply a mention_count / last_seen update, mirroring the stats flush in the database."""
+        entity = self._entities.get(entity_id)
+        if entity is None:
+            return
+        entity.mention_count += count
+        if last_seen is not None:
+            if entity.last_seen is None:
+                entity.last_seen = last_seen
+            else:
+                entity.last_seen = max(_as_utc(entity.last_seen), _as_utc(last_seen))
+
+    def add_cooccurrence(self, entity_id_1: str, entity_id_2: str) -> None:
+        """Record that two entities appeared in the same memory unit."""
+        entity_1 = self._entities.get(entity_id_1)
+        entity_2 = self._entities.get(entity_id_2)
+        if entity_1 is not None:
+            entity_1.cooccurring.add(entity_id_2)
+        if entity_2 is not None:
+            entity_2.cooccurring.add(entity_id_1)
+
+    def candidates(self, entity_text: str) -> list[tuple]:
+        """
+        Return entities whose name equals, contains, or is contained in ``entity_text`` (case-insensitive).
+
+        Returns:
+            List of (id, canonical_name, metadata, last_seen, mention_count) tuples
+        """
+        text_lower = entity_text.lower()
+        matched: set[str] = set()
+
+        # Canonical name inside the new name (including exact match): look up every substring
+        for start in range(len(text_lower)):
+            for end in range(start + 1, len(text_lower) + 1):
+                entity_id = self._by_name.get(text_lower[start:end])
+                if entity_id is not None:
+                    matched.add(entity_id)
+
+        # New name inside the canonical name: intersect trigram postings, then verify
+        grams = _ngrams(text_lower)
+        if grams:
+            postings = sorted((self._ngrams.get(gram, set()) for gram in grams), key=len)
+            pool = set(postings[0]).intersection(*postings[1:])
+        else:
+            # Names shorter than a trigram have no postings to narrow the search
+            pool = set(self._entities)
+        for entity_id in pool - matched:
+            if text_lower in self._entities[entity_id].canonical_name.lower():
+                matched.add(entity_id)
+
+        return [
+            (e.id, e.canonical_name, e.metadata, e.last_seen, e.mention_count)
+            for e in (self._entities[entity_id] for entity_id in matched)
+        ]
+
+    def cooccurring_names(self, entity_id: str) -> set[str]:
+        """Lowercase names of entities that co-occurred with ``entity_id``."""
+        entity = self._entities.get(entity_id)
+        if entity is None:
+            return set()
+        return {self._entities[other].canonical_name.lower() for other in entity.cooccurring if other in self._entities}
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+class EntityIndexCache:
+    """Least-recently-used set of BankEntityIndex objects, keyed by (schema, bank_id)."""
+
+    def __init__(self, max_banks: int):
+        self._max_banks = max(1, max_banks)
+        self._indexes: OrderedDict[tuple[str, str], BankEntityIndex] = OrderedDict()
+
+    def get(self, key: tuple[str, str]) -> BankEntityIndex | None:
+        index = self._indexes.get(key)
+        if index is not None:
+            self._indexes.move_to_end(key)
+        return index
+
+    def put(self, key: tuple[str, str], index: BankEntityIndex) -> None:
+        self._indexes[key] = index
+        self._indexes.move_to_end(key)
+        while len(self._indexes) > self._max_banks:
+            self._indexes.popitem(last=False)
+
+    def discard(self, key: tuple[str, str]) -> None:
+        self._indexes.pop(key, None)
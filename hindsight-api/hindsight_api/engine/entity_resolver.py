@@ -10,16 +10,21 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from difflib import SequenceMatcher
 
 import asyncpg
 
+from ..config import DEFAULT_DATABASE_SCHEMA
 from .db_utils import acquire_with_retry
-from .memory_engine import fq_table
+from .entity_index import BankEntityIndex, EntityIndexCache
+from .entity_scoring import MATCH_THRESHOLD, EntityMention, best_candidates
+from .memory_engine import fq_table, get_current_schema
 from .retain.entity_labels import build_labels_lookup as _build_labels_lookup_from_config
 
 logger = logging.getLogger(__name__)
 
+# Unfolded entity generation deltas of a bank at which a lookup folds them first
+GENERATION_FOLD_THRESHOLD = 64
+
 
 @dataclass
 class _EntityToCreate:
@@ -46,6 +51,15 @@ class _EntityStatAgg:
     max_date: datetime | None = None
 
 
+@dataclass
+class _NewEntity:
+    """An entity inserted in a retain batch, added to the bank's entity index after commit."""
+
+    entity_id: str
+    name: str
+    event_date: datetime | None
+
+
 @dataclass
 class _CooccurrencePair:
     """A (entity_id_1, entity_id_2) pair observed in a retain batch (for post-txn flush)."""
@@ -54,6 +68,93 @@ class _CooccurrencePair:
     entity_id_2: str
 
 
+async def bump_entity_generation(conn, bank_id: str) -> None:
+    """Bump a bank's entity generation so every worker reloads its entity index."""
+    # Insert-only: concurrent writers of a bank never wait on each other's row lock
+    await conn.execute(f"INSERT INTO {fq_table('entity_index_generation_deltas')} (bank_id) VALUES ($1)", bank_id)
+
+
+def _generation_lock_key(schema: str | None) -> str:
+    """
+    Advisory lock of a schema's entity generations: held exclusively while folding every
+    bank and shared while folding one bank, so the folds never wait on each other's rows.
+    """
+    # The worker passes None for the default schema, the engine its name
+    return f"entity_index_generations:{schema or DEFAULT_DATABASE_SCHEMA}"
+
+
+def _fold_generations_sql(generations_table: str, deltas_table: str, bank_filter: str = "") -> str:
+    """Move deltas (of the banks matching bank_filter) into entity_index_generations in one statement."""
+    return f"""
+        WITH folded AS (
+            DELETE FROM {deltas_table} {bank_filter} RETURNING bank_id, changes
+        )
+        INSERT INTO {generations_table} AS g (bank_id, generation)
+        SELECT bank_id, SUM(changes) FROM folded GROUP BY bank_id
+        ORDER BY bank_id
+        ON CONFLICT (bank_id) DO UPDATE SET generation = g.generation + EXCLUDED.generation
+    """
+
+
+async def fetch_entity_generation(conn, bank_id: str) -> int:
+    """Return the current entity generation of a bank (0 if its entities never changed)."""
+    row = await conn.fetchrow(
+        f"""
+        SELECT COALESCE((SELECT generation FROM {fq_table("entity_index_generations")} WHERE bank_id = $1), 0) AS generation,
+               d.unfolded, COALESCE(d.changes, 0) AS changes
+        FROM (
+            SELECT COUNT(*) AS unfolded, SUM(changes) AS changes
+            FROM (SELECT changes FROM {fq_table("entity_index_generation_deltas")} WHERE bank_id = $1 LIMIT $2) l
+        ) d
+        """,
+        bank_id,
+        GENERATION_FOLD_THRESHOLD,
+    )
+    if row["unfolded"] < GENERATION_FOLD_THRESHOLD:
+        return row["generation"] + row["changes"]
+
+    # Too many deltas to read them all on every lookup
+    async with conn.transaction():
+        # Waits for a fold of the whole schema, which takes an instant
+        await conn.execute(
+            "SELECT pg_advisory_xact_lock_shared(hashtext($1))", _generation_lock_key(get_current_schema())
+        )
+        await conn.execute(
+            _fold_generations_sql(
+                fq_table("entity_index_generations"), fq_table("entity_index_generation_deltas"), "WHERE bank_id = $1"
+            ),
+            bank_id,
+        )
+    return await conn.fetchval(
+        f"""
+        SELECT COALESCE((SELECT generation FROM {fq_table("entity_index_generations")} WHERE bank_id = $1), 0)
+             + COALESCE((SELECT SUM(changes) FROM {fq_table("entity_index_generation_deltas")} WHERE bank_id = $1), 0)
+        """,
+        bank_id,
+    )
+
+
+async def fold_entity_generation_deltas(conn, schema: str | None) -> bool:
+    """
+    Fold the entity generation deltas of every bank in a schema into entity_index_generations.
+
+    Args:
+        conn: Database connection
+        schema: Schema to compact (None for the unqualified default schema)
+
+    Returns:
+        Whether the deltas were folded (False while a lookup folds a bank's deltas)
+    """
+    prefix = f'"{schema}".' if schema else ""
+    async with conn.transaction():
+        if not await conn.fetchval("SELECT pg_try_advisory_xact_lock(hashtext($1))", _generation_lock_key(schema)):
+            return False
+        await conn.execute(
+            _fold_generations_sql(f"{prefix}entity_index_generations", f"{prefix}entity_index_generation_deltas")
+        )
+    return True
+
+
 # Load spaCy model (singleton)
 _nlp = None
 
@@ -63,15 +164,16 @@ class EntityResolver:
     Resolves entities to canonical IDs with disambiguation.
     """
 
-    def __init__(self, pool: asyncpg.Pool, entity_lookup: str = "full"):
+    def __init__(self, pool: asyncpg.Pool, entity_lookup: str = "full", index_max_banks: int = 100):
         """
         Initialize entity resolver.
 
         Args:
             pool: asyncpg connection pool
-            entity_lookup: Lookup strategy — "full" loads all bank entities then
-                matches in Python; "trigram" uses pg_trgm GIN index to fetch only
-                similar candidates per entity name (much faster for large banks).
+            entity_lookup: Lookup strategy — "full" matches against an in-memory
+                index of all bank entities, kept warm across batches; "trigram" uses
+                pg_trgm GIN index to fetch only similar candidates per entity name.
+            index_max_banks: Max number of bank entity indexes kept in memory ("full" only)
         """
         self.pool = pool
         self.entity_lookup = entity_lookup
@@ -79,6 +181,9 @@ class EntityResolver:
         # pending updates.  flush_pending_stats() pops only the calling task's items.
         self._pending_stats: dict[int, list[_EntityStat]] = {}
         self._pending_cooccurrences: dict[int, list[_CooccurrencePair]] = {}
+        self._pending_new_entities: dict[int, list[_NewEntity]] = {}
+        self._pending_banks: dict[int, tuple[str, str]] = {}
+        self._indexes = EntityIndexCache(index_max_banks)
 
     def _task_key(self) -> int:
         """Return a unique key for the current asyncio task (or 0 for non-task context)."""
@@ -99,14 +204,17 @@ class EntityResolver:
         key = self._task_key()
         stats = self._pending_stats.pop(key, [])
         cooccurrences = self._pending_cooccurrences.pop(key, [])
+        new_entities = self._pending_new_entities.pop(key, [])
+        index_key = self._pending_banks.pop(key, None)
 
         if not stats and not cooccurrences:
             return
 
+        agg: dict[str, _EntityStatAgg] = defaultdict(_EntityStatAgg)
+        coo_agg: dict[tuple[str, str], int] = {}
         async with acquire_with_retry(self.pool) as conn:
             if stats:
                 # Aggregate: sum counts and find max date per entity_id.
-                agg: dict[str, _EntityStatAgg] = defaultdict(_EntityStatAgg)
                 for s in stats:
                     entry = agg[s.entity_id]
                     entry.count += 1
@@ -128,7 +236,6 @@ class EntityResolver:
 
             if cooccurrences:
                 # Aggregate: count occurrences per (entity_id_1, entity_id_2) pair.
-                coo_agg: dict[tuple[str, str], int] = {}
                 for c in cooccurrences:
                     pair = (c.entity_id_1, c.entity_id_2)
                     coo_agg[pair] = coo_agg.get(pair, 0) + 1
@@ -148,6 +255,45 @@ class EntityResolver:
                     sorted((e1, e2, count, now) for (e1, e2), count in coo_agg.items()),
                 )
 
+            if index_key is not None and self.entity_lookup == "full":
+                # Bump the bank's entity generation so other workers reload their index,
+                # then apply this batch to our own index if nobody else wrote in between.
+                await bump_entity_generation(conn, index_key[1])
+                generation = await fetch_entity_generation(conn, index_key[1])
+                self._apply_to_index(index_key, generation, new_entities, agg, coo_agg)
+
+    def _apply_to_index(
+        self,
+        index_key: tuple[str, str],
+        generation: int,
+        new_entities: list[_NewEntity],
+        stats: dict[str, _EntityStatAgg],
+        cooccurrences: dict[tuple[str, str], int],
+    ) -> None:
+        """Apply a committed batch to the in-memory index, or drop the index if it missed other writes."""
+        index = self._indexes.get(index_key)
+        if index is None:
+            return
+        if index.generation != generation - 1:
+            self._indexes.discard(index_key)
+            return
+        for entity in new_entities:
+            index.add_entity(entity.entity_id, entity.name, entity.event_date or datetime.now(UTC))
+        for entity_id, entry in stats.items():
+            index.record_mentions(entity_id, entry.count, entry.max_date)
+        for entity_id_1, entity_id_2 in cooccurrences:
+            index.add_cooccurrence(entity_id_1, entity_id_2)
+        index.generation = generation
+
+    async def invalidate_bank_index(self, conn, bank_id: str) -> None:
+        """
+        Invalidate entity indexes for a bank after entities were changed outside retain.
+
+        Bumps the bank's entity generation (so every worker reloads) and drops the local index.
+        """
+        await bump_entity_generation(conn, bank_id)
+        self._indexes.discard((get_current_schema(), bank_id))
+
     @staticmethod
     def _build_labels_lookup(entity_labels: list | None) -> set[str]:
         """Build a set of valid 'key:value' entity label strings for fast lookup."""
@@ -181,6 +327,18 @@ class EntityResolver:
         if not entities_data:
             return []
 
+        # Anything still pending for this task belongs to a batch whose transaction
+        # rolled back before flush_pending_stats() ran; it must not reach the index.
+        key = self._task_key()
+        for pending in (
+            self._pending_stats,
+            self._pending_cooccurrences,
+            self._pending_new_entities,
+            self._pending_banks,
+        ):
+            pending.pop(key, None)
+        self._pending_banks[key] = (get_current_schema(), bank_id)
+
         taxonomy_lookup = self._build_labels_lookup(entity_labels)
         if conn is None:
             async with acquire_with_retry(self.pool) as conn:
@@ -208,8 +366,40 @@ class EntityResolver:
     async def _resolve_entities_batch_full(
         self, conn, bank_id: str, entities_data: list[dict], unit_event_date
     ) -> list[str]:
-        """Original strategy: load all bank entities then match in Python."""
-        # Query ALL candidates for this bank
+        """Match against the bank's in-memory entity index (loaded on first use or after other writers)."""
+        index = await self._get_bank_index(conn, bank_id)
+
+        all_candidates = {text: index.candidates(text) for text in set(e["text"] for e in entities_data)}
+
+        # Co-occurrence names are only needed for the candidates being scored
+        cooccurrence_map: dict[str, set[str]] = {}
+        for candidates in all_candidates.values():
+            for candidate in candidates:
+                if candidate[0] not in cooccurrence_map:
+                    cooccurrence_map[candidate[0]] = index.cooccurring_names(candidate[0])
+
+        return await self._resolve_from_candidates(
+            conn, bank_id, entities_data, unit_event_date, all_candidates, cooccurrence_map
+        )
+
+    async def _get_bank_index(self, conn, bank_id: str) -> BankEntityIndex:
+        """Return the bank's entity index, reloading it if the database generation moved on."""
+        index_key = (get_current_schema(), bank_id)
+        generation = await fetch_entity_generation(conn, bank_id)
+
+        index = self._indexes.get(index_key)
+        if index is not None and index.generation == generation:
+            return index
+
+        # The generation is read before loading: a write landing in between makes the
+        # next check miss and reload again, never the other way around.
+        index = await self._load_bank_index(conn, bank_id, generation)
+        self._indexes.put(index_key, index)
+        return index
+
+    async def _load_bank_index(self, conn, bank_id: str, generation: int) -> BankEntityIndex:
+        """Load all entities and co-occurrences of a bank into a new index."""
+        index = BankEntityIndex(generation)
         all_entities = await conn.fetch(
             f"""
             SELECT canonical_name, id, metadata, last_seen, mention_count
@@ -218,63 +408,26 @@ class EntityResolver:
             """,
             bank_id,
         )
+        for row in all_entities:
+            index.add_entity(row["id"], row["canonical_name"], row["last_seen"], row["mention_count"], row["metadata"])
 
-        # Build entity ID to name mapping for co-occurrence lookups
-        entity_id_to_name = {row["id"]: row["canonical_name"].lower() for row in all_entities}
-
-        # Query ALL co-occurrences for this bank's entities in one query
-        # This builds a map of entity_id -> set of co-occurring entity names
         all_cooccurrences = await conn.fetch(
             f"""
-            SELECT ec.entity_id_1, ec.entity_id_2, ec.cooccurrence_count
+            SELECT ec.entity_id_1, ec.entity_id_2
             FROM {fq_table("entity_cooccurrences")} ec
             WHERE ec.entity_id_1 IN (SELECT id FROM {fq_table("entities")} WHERE bank_id = $1)
                OR ec.entity_id_2 IN (SELECT id FROM {fq_table("entities")} WHERE bank_id = $1)
             """,
             bank_id,
         )
-
-        # Build co-occurrence map: entity_id -> set of co-occurring entity names (lowercase)
-        cooccurrence_map: dict[str, set[str]] = {}
         for row in all_cooccurrences:
-            eid1, eid2 = row["entity_id_1"], row["entity_id_2"]
-            # Add both directions
-            if eid1 not in cooccurrence_map:
-                cooccurrence_map[eid1] = set()
-            if eid2 not in cooccurrence_map:
-                cooccurrence_map[eid2] = set()
-            # Map to canonical names for comparison with nearby_entities
-            if eid2 in entity_id_to_name:
-                cooccurrence_map[eid1].add(entity_id_to_name[eid2])
-            if eid1 in entity_id_to_name:
-                cooccurrence_map[eid2].add(entity_id_to_name[eid1])
-
-        # Build candidate map for each entity text
-        all_candidates = {}  # Maps entity_text -> list of candidates
-        entity_texts = list(set(e["text"] for e in entities_data))
+            index.add_cooccurrence(row["entity_id_1"], row["entity_id_2"])
 
-        for entity_text in entity_texts:
-            matching = []
-            entity_text_lower = entity_text.lower()
-            for row in all_entities:
-                canonical_name = row["canonical_name"]
-                ent_id = row["id"]
-                metadata = row["metadata"]
-                last_seen = row["last_seen"]
-                mention_count = row["mention_count"]
-                canonical_lower = canonical_name.lower()
-                # Match if exact or substring match
-                if (
-                    entity_text_lower == canonical_lower
-                    or entity_text_lower in canonical_lower
-                    or canonical_lower in entity_text_lower
-                ):
-                    matching.append((ent_id, canonical_name, metadata, last_seen, mention_count))
-            all_candidates[entity_text] = matching
-
-        return await self._resolve_from_candidates(
-            conn, bank_id, entities_data, unit_event_date, all_candidates, cooccurrence_map
+        logger.debug(
+            f"Loaded entity index for bank {bank_id}: {len(index)} entities, "
+            f"{len(all_cooccurrences)} co-occurrences (generation {generation})"
         )
+        return index
 
     async def _resolve_entities_batch_trigram(
         self, conn, bank_id: str, entities_data: list[dict], unit_event_date
@@ -370,65 +523,28 @@ class EntityResolver:
         entities_to_update: list[_EntityStat] = []
         entities_to_create: list[_EntityToCreate] = []
 
-        for idx, entity_data in enumerate(entities_data):
+        mentions = []
+        for entity_data in entities_data:
             entity_text = entity_data["text"]
-            nearby_entities = entity_data.get("nearby_entities", [])
             # Use per-entity date if available, otherwise fall back to batch-level date
-            entity_event_date = entity_data.get("event_date", unit_event_date)
-
-            candidates = all_candidates.get(entity_text, [])
+            mentions.append(
+                EntityMention(
+                    text=entity_text,
+                    nearby=frozenset(
+                        e["text"].lower() for e in entity_data.get("nearby_entities", []) if e["text"] != entity_text
+                    ),
+                    event_date=entity_data.get("event_date", unit_event_date),
+                )
+            )
+        best = best_candidates(mentions, [all_candidates.get(m.text, []) for m in mentions], cooccurrence_map)
 
-            if not candidates:
-                # Will create new entity
-                entities_to_create.append(_EntityToCreate(idx=idx, name=entity_text, event_date=entity_event_date))
-                continue
-
-            # Score candidates
-            best_candidate = None
-            best_score = 0.0
-
-            nearby_entity_set = {e["text"].lower() for e in nearby_entities if e["text"] != entity_text}
-
-            for candidate_id, canonical_name, metadata, last_seen, mention_count in candidates:
-                score = 0.0
-
-                # 1. Name similarity (0-0.5)
-                name_similarity = SequenceMatcher(None, entity_text.lower(), canonical_name.lower()).ratio()
-                score += name_similarity * 0.5
-
-                # 2. Co-occurring entities (0-0.3)
-                if nearby_entity_set:
-                    co_entities = cooccurrence_map.get(candidate_id, set())
-                    overlap = len(nearby_entity_set & co_entities)
-                    co_entity_score = overlap / len(nearby_entity_set)
-                    score += co_entity_score * 0.3
-
-                # 3. Temporal proximity (0-0.2)
-                if last_seen and entity_event_date:
-                    # Normalize timezone awareness for comparison
-                    event_date_utc = (
-                        entity_event_date if entity_event_date.tzinfo else entity_event_date.replace(tzinfo=UTC)
-                    )
-                    last_seen_utc = last_seen if last_seen.tzinfo else last_seen.replace(tzinfo=UTC)
-                    days_diff = abs((event_date_utc - last_seen_utc).total_seconds() / 86400)
-                    if days_diff < 7:
-                        temporal_score = max(0, 1.0 - (days_diff / 7))
-                        score += temporal_score * 0.2
-
-                if score > best_score:
-                    best_score = score
-                    best_candidate = candidate_id
-
-            # Apply unified threshold
-            threshold = 0.6
-
-            if best_score > threshold:
+        for idx, (mention, (best_candidate, best_score)) in enumerate(zip(mentions, best)):
+            if best_score > MATCH_THRESHOLD:
                 entity_ids[idx] = best_candidate
-                entities_to_update.append(_EntityStat(entity_id=best_candidate, event_date=entity_event_date))
+                entities_to_update.append(_EntityStat(entity_id=best_candidate, event_date=mention.event_date))
             else:
-                entities_to_create.append(
-                    _EntityToCreate(idx=idx, name=entity_data["text"], event_date=entity_event_date)
-                )
+                # No candidate, or not confident - create new entity
+                entities_to_create.append(_EntityToCreate(idx=idx, name=mention.text, event_date=mention.event_date))
 
         # Existing entities: IDs already known from the candidate SELECT above.
         # No in-transaction UPDATE — mention_count/last_seen are stats deferred to
@@ -490,12 +606,15 @@ class EntityResolver:
                     id_by_name[row["name_lower"]] = row["id"]
 
             # Assign entity IDs back and queue for post-txn stats flush.
+            new_entities: list[_NewEntity] = []
             for name_lower, g in sorted_groups:
                 entity_id = id_by_name.get(name_lower)
                 if entity_id:
                     for original_idx in g.indices:
                         entity_ids[original_idx] = entity_id
                     pending.append(_EntityStat(entity_id=entity_id, event_date=g.event_date))
+                    new_entities.append(_NewEntity(entity_id=entity_id, name=g.name, event_date=g.event_date))
+            self._pending_new_entities.setdefault(self._task_key(), []).extend(new_entities)
 
         # Accumulate into the resolver's pending list; the orchestrator flushes
         # these with await entity_resolver.flush_pending_stats() after the txn.
@@ -548,70 +667,36 @@ class EntityResolver:
                 # New entity - create it
                 return await self._create_entity(conn, bank_id, entity_text, unit_event_date)
 
-            # Score candidates based on:
-            # 1. Name similarity
-            # 2. Context overlap (TODO: could use embeddings)
-            # 3. Co-occurring entities
-            # 4. Temporal proximity
-
-            best_candidate = None
-            best_score = 0.0
-            best_name_similarity = 0.0
-
-            nearby_entity_set = {e["text"].lower() for e in nearby_entities if e["text"] != entity_text}
-
-            for row in candidates:
-                candidate_id = row["id"]
-                canonical_name = row["canonical_name"]
-                metadata = row["metadata"]
-                last_seen = row["last_seen"]
-                score = 0.0
-
-                # 1. Name similarity (0-1)
-                name_similarity = SequenceMatcher(None, entity_text.lower(), canonical_name.lower()).ratio()
-                score += name_similarity * 0.5
-
-                # 2. Co-occurring entities (0-0.5)
-                # Get entities that co-occurred with this candidate before
-                # Use the materialized co-occurrence cache for fast lookup
-                co_entity_rows = await conn.fetch(
-                    f"""
-                    SELECT e.canonical_name, ec.cooccurrence_count
-                    FROM {fq_table("entity_cooccurrences")} ec
-                    JOIN {fq_table("entities")} e ON (
-                        CASE
-                            WHEN ec.entity_id_1 = $1 THEN ec.entity_id_2
-                            WHEN ec.entity_id_2 = $1 THEN ec.entity_id_1
-                        END = e.id
-                    )
-                    WHERE ec.entity_id_1 = $1 OR ec.entity_id_2 = $1
-                    """,
-                    candidate_id,
-                )
-                co_entities = {r["canonical_name"].lower() for r in co_entity_rows}
-
-                # Check overlap with nearby entities
-                overlap = len(nearby_entity_set & co_entities)
-                if nearby_entity_set:
-                    co_entity_score = overlap / len(nearby_entity_set)
-                    score += co_entity_score * 0.3
-
-                # 3. Temporal proximity (0-0.2)
-                if last_seen:
-                    days_diff = abs((unit_event_date - last_seen).total_seconds() / 86400)
-                    if days_diff < 7:  # Within a week
-                        temporal_score = max(0, 1.0 - (days_diff / 7))
-                        score += temporal_score * 0.2
-
-                if score > best_score:
-                    best_score = score
-                    best_candidate = candidate_id
-                    best_name_similarity = name_similarity
-
-            # Threshold for considering it the same entity
-            threshold = 0.6
-
-            if best_score > threshold:
+            # Score candidates on name similarity, co-occurring entities and temporal
+            # proximity, fetching co-occurrences for all candidates in one query
+            candidate_ids = [row["id"] for row in candidates]
+            co_entity_rows = await conn.fetch(
+                f"""
+                SELECT ec.entity_id_1, ec.entity_id_2, e1.canonical_name AS name_1, e2.canonical_name AS name_2
+                FROM {fq_table("entity_cooccurrences")} ec
+                JOIN {fq_table("entities")} e1 ON e1.id = ec.entity_id_1
+                JOIN {fq_table("entities")} e2 ON e2.id = ec.entity_id_2
+                WHERE ec.entity_id_1 = ANY($1::uuid[]) OR ec.entity_id_2 = ANY($1::uuid[])
+                """,
+                candidate_ids,
+            )
+            cooccurrence_map: dict[str, set[str]] = defaultdict(set)
+            for r in co_entity_rows:
+                cooccurrence_map[r["entity_id_1"]].add(r["name_2"].lower())
+                cooccurrence_map[r["entity_id_2"]].add(r["name_1"].lower())
+
+            mention = EntityMention(
+                text=entity_text,
+                nearby=frozenset(e["text"].lower() for e in nearby_entities if e["text"] != entity_text),
+                event_date=unit_event_date,
+            )
+            [(best_candidate, best_score)] = best_candidates(
+                [mention],
+                [[(row["id"], row["canonical_name"], row["metadata"], row["last_seen"]) for row in candidates]],
+                cooccurrence_map,
+            )
+
+            if best_score > MATCH_THRESHOLD:
                 # Update entity
                 await conn.execute(
                     f"""
@@ -665,6 +750,17 @@ class EntityResolver:
             event_date,
             event_date,
         )
+        if self.entity_lookup == "full":
+            # Make the entity visible to later resolutions: other workers reload, our index adds it
+            await bump_entity_generation(conn, bank_id)
+            generation = await fetch_entity_generation(conn, bank_id)
+            self._apply_to_index(
+                (get_current_schema(), bank_id),
+                generation,
+                [_NewEntity(entity_id=entity_id, name=entity_text, event_date=event_date)],
+                {},
+                {},
+            )
         return entity_id
 
     async def link_unit_to_entity(self, unit_id: str, entity_id: str):
@@ -0,0 +1,166 @@
+"""
+Batched candidate scoring for entity resolution.
+
+A candidate's score combines three components:
+
+1. Name similarity (weight 0.5)
+2. Overlap between the entity's nearby entities and the candidate's
+   co-occurring entities (weight 0.3)
+3. Temporal proximity between the mention and the candidate's last_seen,
+   linear over a 7 day window (weight 0.2)
+
+Name similarity is the normalized Indel similarity 2 * LCS / (len(a) + len(b)),
+computed with a bit-parallel LCS over masks precomputed once per name. It is
+identical to difflib's SequenceMatcher ratio when one name contains the other
+(how the candidate lookups select candidates) and never lower otherwise. All
+(name, candidate) pairs of a batch are scored together; the weighted sum and
+the per-name best candidate are array operations.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import numpy as np
+
+NAME_WEIGHT = 0.5
+COOCCURRENCE_WEIGHT = 0.3
+TEMPORAL_WEIGHT = 0.2
+TEMPORAL_WINDOW_DAYS = 7
+MATCH_THRESHOLD = 0.6
+
+
+class NameMatcher:
+    """A normalized name with precomputed LCS bit masks, reused against many candidates."""
+
+    __slots__ = ("name", "_masks", "_length")
+
+    def __init__(self, name: str):
+        self.name = name.lower()
+        self._length = len(self.name)
+        masks: dict[str, int] = {}
+        for position, char in enumerate(self.name):
+            masks[char] = masks.get(char, 0) | (1 << position)
+        self._masks = masks
+
+    def similarity(self, other: str) -> float:
+        """Similarity in [0, 1] between this name and an already-lowercased name."""
+        total = self._length + len(other)
+        if total == 0:
+            return 1.0
+        if self.name == other:
+            return 1.0
+        # Hyyrö's bit-parallel LCS: zero bits of `row` mark matched positions of self.name
+        all_ones = (1 << self._length) - 1
+        row = all_ones
+        for char in other:
+            matches = row & self._masks.get(char, 0)
+            row = ((row + matches) | (row - matches)) & all_ones
+        lcs = self._length - row.bit_count()
+        return 2.0 * lcs / total
+
+
+def name_similarity(a: str, b: str) -> float:
+    """Case-insensitive similarity between two names."""
+    return NameMatcher(a).similarity(b.lower())
+
+
+@dataclass
+class EntityMention:
+    """An entity name to resolve, with the context used for scoring."""
+
+    text: str
+    nearby: frozenset[str]  # lowercase names of other entities in the same memory unit
+    event_date: datetime | None
+
+
+def _timestamp(value: datetime | None) -> float:
+    if value is None:
+        return np.nan
+    return (value if value.tzinfo else value.replace(tzinfo=UTC)).timestamp()
+
+
+def score_candidates(name_similarity: np.ndarray, cooccurrence_ratio: np.ndarray, days_apart: np.ndarray) -> np.ndarray:
+    """
+    Combine per-pair components into scores.
+
+    Args:
+        name_similarity: Name similarity per pair, in [0, 1]
+        cooccurrence_ratio: Fraction of nearby entities that co-occurred with the candidate
+        days_apart: Absolute days between mention and last_seen (NaN when either is unknown)
+
+    Returns:
+        Score per pair
+    """
+    with np.errstate(invalid="ignore"):
+        temporal = np.where(days_apart < TEMPORAL_WINDOW_DAYS, 1.0 - days_apart / TEMPORAL_WINDOW_DAYS, 0.0)
+    return name_similarity * NAME_WEIGHT + cooccurrence_ratio * COOCCURRENCE_WEIGHT + temporal * TEMPORAL_WEIGHT
+
+
+def best_candidates(
+    mentions: Sequence[EntityMention],
+    candidates: Sequence[Sequence[tuple]],
+    cooccurrence_map: dict,
+) -> list[tuple[object | None, float]]:
+    """
+    Pick the best-scoring candidate for each mention.
+
+    Args:
+        mentions: Entity mentions to resolve
+        candidates: Per mention, (id, canonical_name, metadata, last_seen, ...) candidate tuples
+        cooccurrence_map: Candidate id -> set of lowercase names of co-occurring entities
+
+    Returns:
+        Per mention, (best candidate id, score); (None, 0.0) when there are no candidates
+        or every candidate scores 0. Ties keep the first candidate.
+    """
+    offsets = [0]
+    for mention_candidates in candidates:
+        offsets.append(offsets[-1] + len(mention_candidates))
+    pair_count = offsets[-1]
+    results: list[tuple[object | None, float]] = [(None, 0.0)] * len(mentions)
+    if pair_count == 0:
+        return results
+
+    similarities = np.empty(pair_count)
+    cooccurrence = np.zeros(pair_count)
+    last_seen = np.empty(pair_count)
+    event_dates = np.empty(pair_count)
+
+    matchers: dict[str, NameMatcher] = {}
+    similarity_memo: dict[tuple[str, str], float] = {}
+    lowered: dict[str, str] = {}
+    pair = 0
+    for mention, mention_candidates in zip(mentions, candidates):
+        matcher = matchers.get(mention.text)
+        if matcher is None:
+            matcher = matchers[mention.text] = NameMatcher(mention.text)
+        event_ts = _timestamp(mention.event_date)
+        for candidate in mention_candidates:
+            candidate_id, canonical_name, _metadata, candidate_last_seen = candidate[:4]
+            canonical_lower = lowered.get(canonical_name)
+            if canonical_lower is None:
+                canonical_lower = lowered[canonical_name] = canonical_name.lower()
+            memo_key = (matcher.name, canonical_lower)
+            similarity = similarity_memo.get(memo_key)
+            if similarity is None:
+                similarity = similarity_memo[memo_key] = matcher.similarity(canonical_lower)
+            similarities[pair] = similarity
+            if mention.nearby:
+                co_entities = cooccurrence_map.get(candidate_id)
+                if co_entities:
+                    cooccurrence[pair] = len(mention.nearby & co_entities) / len(mention.nearby)
+            last_seen[pair] = _timestamp(candidate_last_seen)
+            event_dates[pair] = event_ts
+            pair += 1
+
+    scores = score_candidates(similarities, cooccurrence, np.abs(event_dates - last_seen) / 86400)
+
+    for idx, mention_candidates in enumerate(candidates):
+        start, end = offsets[idx], offsets[idx + 1]
+        if start == end:
+            continue
+        best = start + int(np.argmax(scores[start:end]))
+        if scores[best] > 0:
+            results[idx] = (mention_candidates[best - start][0], float(scores[best]))
+    return results
@@ -0,0 +1,444 @@
+"""
+Adaptive concurrency control for LLM calls.
+
+Each (provider, model, API key) gets its own limiter. The concurrency limit
+follows AIMD: it grows by roughly one slot per limit's worth of successful
+calls and is halved when the provider signals overload (429, 503, 529 or a
+timeout), at most once per cooldown so a burst of rejections from the same
+window counts once. A Retry-After hint pauses new admissions until it expires,
+and an optional tokens-per-minute budget holds calls back while the trailing
+minute's usage is exhausted.
+
+Calls are scheduled by work class. Queued calls are admitted in proportion to
+their class weight (weighted fair queuing over virtual start times) and
+round-robin across banks within a class, so one bank's import cannot starve
+another bank's work of the same class. A share of every limit is reserved for
+interactive calls: background classes never fill the last slots, so a reflect
+arriving during a large import waits behind other reflects only. Callers tag
+their work with llm_work(); calls made outside it are classified by scope.
+
+Providers report overload through report_overload(); the limiter of the call
+in progress is tracked in a context variable, so providers need no reference
+to it.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+
+from ..config import (
+    DEFAULT_LLM_ADAPTIVE_CONCURRENCY,
+    DEFAULT_LLM_INTERACTIVE_RESERVED_FRACTION,
+    DEFAULT_LLM_MAX_CONCURRENT,
+    DEFAULT_LLM_MIN_CONCURRENT,
+    DEFAULT_LLM_TOKENS_PER_MINUTE,
+    ENV_LLM_ADAPTIVE_CONCURRENCY,
+    ENV_LLM_INTERACTIVE_RESERVED_FRACTION,
+    ENV_LLM_MAX_CONCURRENT,
+    ENV_LLM_MIN_CONCURRENT,
+    ENV_LLM_TOKENS_PER_MINUTE,
+)
+from ..metrics import get_metrics_collector
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses that mean "slow down" rather than "this request is wrong"
+OVERLOAD_STATUS_CODES = frozenset({429, 503, 529})
+
+_DECREASE_FACTOR = 0.5
+_DECREASE_COOLDOWN_SECONDS = 2.0
+_TOKEN_WINDOW_SECONDS = 60.0
+_MAX_RETRY_AFTER_SECONDS = 300.0
+
+# Work classes, from most to least latency-sensitive
+LLM_PRIORITY_INTERACTIVE = "interactive"
+LLM_PRIORITY_MENTAL_MODEL = "mental_model"
+LLM_PRIORITY_CONSOLIDATION = "consolidation"
+LLM_PRIORITY_RETAIN = "retain"
+
+# Relative share of admissions each class gets while several are queued
+LLM_PRIORITY_WEIGHTS = {
+    LLM_PRIORITY_INTERACTIVE: 8,
+    LLM_PRIORITY_MENTAL_MODEL: 4,
+    LLM_PRIORITY_CONSOLIDATION: 2,
+    LLM_PRIORITY_RETAIN: 1,
+}
+
+# Class of calls made outside any llm_work() context, by call scope
+_SCOPE_PRIORITIES = {
+    "consolidation": LLM_PRIORITY_CONSOLIDATION,
+    "retain_extract_facts": LLM_PRIORITY_RETAIN,
+    "bank_mission": LLM_PRIORITY_RETAIN,
+}
+
+_current_limiter: ContextVar["AdaptiveConcurrencyLimiter | None"] = ContextVar("llm_limiter", default=None)
+_current_work: ContextVar[tuple[str, str | None] | None] = ContextVar("llm_work", default=None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter with Retry-After and tokens-per-minute awareness."""
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        key_id: str,
+        max_limit: int,
+        min_limit: int = 1,
+        tokens_per_minute: int = 0,
+        adaptive: bool = True,
+        reserved_fraction: float = 0.0,
+    ):
+        """
+        Args:
+            provider: Provider name
+            model: Model name
+            key_id: Short, non-reversible identifier of the API key
+            max_limit: Upper bound (and starting value) of the concurrency limit
+            min_limit: Lower bound the limit is never cut below
+            tokens_per_minute: Token budget per trailing minute (0 = unlimited)
+            adaptive: If False the limit stays at max_limit
+            reserved_fraction: Share of the limit only interactive calls may use
+        """
+        self.provider = provider
+        self.model = model
+        self.key_id = key_id
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self.adaptive = adaptive
+        self.reserved_fraction = min(max(0.0, reserved_fraction), 1.0)
+
+        self._limit = float(self.max_limit)
+        self.in_flight = 0
+        self._in_flight_by_priority = dict.fromkeys(LLM_PRIORITY_WEIGHTS, 0)
+        # priority -> bank_id -> FIFO of (future, estimated tokens); banks rotate round-robin
+        self._queues: dict[str, OrderedDict[str | None, deque[tuple[asyncio.Future, int]]]] = {
+            priority: OrderedDict() for priority in LLM_PRIORITY_WEIGHTS
+        }
+        self._virtual_start = dict.fromkeys(LLM_PRIORITY_WEIGHTS, 0.0)
+        self._virtual_clock = 0.0
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._token_log: deque[tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def reserved(self) -> int:
+        """Slots background classes cannot take (always leaves them at least one)."""
+        return min(int(self.limit * self.reserved_fraction), self.limit - 1)
+
+    @property
+    def waiting(self) -> int:
+        """Number of calls queued for a slot."""
+        return sum(
+            1
+            for bank_queues in self._queues.values()
+            for queue in bank_queues.values()
+            for future, _ in queue
+            if not future.done()
+        )
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        estimated_tokens: int = 0,
+        priority: str = LLM_PRIORITY_INTERACTIVE,
+        bank_id: str | None = None,
+    ) -> AsyncIterator["AdaptiveConcurrencyLimiter"]:
+        """
+        Hold a concurrency slot for one LLM call (including the provider's own retries).
+
+        Args:
+            estimated_tokens: Tokens to reserve against the per-minute budget until
+                the call reports its actual usage via on_success()
+            priority: Work class of the call
+            bank_id: Bank the call works for (fair queuing key within the class)
+        """
+        if priority not in LLM_PRIORITY_WEIGHTS:
+            priority = LLM_PRIORITY_INTERACTIVE
+        start = time.monotonic()
+        await self.acquire(estimated_tokens, priority, bank_id)
+        get_metrics_collector().record_llm_queue_wait(self.provider, self.model, priority, time.monotonic() - start)
+        token = _current_limiter.set(self)
+        try:
+            yield self
+        finally:
+            _current_limiter.reset(token)
+            self.release(priority)
+
+    async def acquire(
+        self,
+        estimated_tokens: int = 0,
+        priority: str = LLM_PRIORITY_INTERACTIVE,
+        bank_id: str | None = None,
+    ) -> None:
+        """Wait for a slot; queued calls are admitted by class weight, then round-robin across banks."""
+        bank_queues = self._queues[priority]
+        if not self._has_waiters(priority):
+            # A class that was idle starts at the current virtual time instead of
+            # catching up on the share it did not use
+            self._virtual_start[priority] = max(self._virtual_start[priority], self._virtual_clock)
+        future = asyncio.get_running_loop().create_future()
+        bank_queues.setdefault(bank_id, deque()).append((future, estimated_tokens))
+        self._wake()
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Admitted just as the caller was cancelled: hand the slot back
+                self.release(priority)
+            else:
+                future.cancel()
+                self._wake()
+            raise
+
+    def release(self, priority: str = LLM_PRIORITY_INTERACTIVE) -> None:
+        """Return a slot and admit waiters that now fit."""
+        self.in_flight = max(0, self.in_flight - 1)
+        self._in_flight_by_priority[priority] = max(0, self._in_flight_by_priority[priority] - 1)
+        self._wake()
+
+    def on_success(self, tokens: int = 0, estimated_tokens: int = 0) -> None:
+        """
+        Record a successful call.
+
+        Args:
+            tokens: Tokens the call actually used (0 if unknown)
+            estimated_tokens: Tokens reserved when the slot was acquired
+        """
+        if self.tokens_per_minute and tokens:
+            self._record_tokens(tokens - estimated_tokens)
+        if self.adaptive and self._limit < self.max_limit:
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+        self._wake()
+
+    def on_overload(self, retry_after: float | None = None) -> None:
+        """
+        Record an overload signal from the provider.
+
+        Args:
+            retry_after: Seconds the provider asked callers to wait, if given
+        """
+        now = time.monotonic()
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + min(retry_after, _MAX_RETRY_AFTER_SECONDS))
+        if self.adaptive and now - self._last_decrease >= _DECREASE_COOLDOWN_SECONDS:
+            previous = self.limit
+            self._limit = max(float(self.min_limit), self._limit * _DECREASE_FACTOR)
+            self._last_decrease = now
+            if self.limit == previous and not retry_after:
+                return
+            logger.warning(
+                f"LLM overload from {self.provider}/{self.model}: concurrency limit {previous} -> {self.limit}"
+                + (f", pausing {retry_after:.1f}s (Retry-After)" if retry_after else "")
+            )
+
+    def _can_admit(self, tokens: int, priority: str) -> bool:
+        now = time.monotonic()
+        if now < self._blocked_until or self.in_flight >= self.limit:
+            return False
+        if priority != LLM_PRIORITY_INTERACTIVE:
+            background = self.in_flight - self._in_flight_by_priority[LLM_PRIORITY_INTERACTIVE]
+            if background >= self.limit - self.reserved:
+                return False
+        if self.tokens_per_minute:
+            self._prune_tokens(now)
+            # An empty window always admits, so one oversized call cannot block forever
+            if self._token_log and self._tokens_in_window + tokens > self.tokens_per_minute:
+                return False
+        return True
+
+    def _admit(self, tokens: int, priority: str) -> None:
+        self.in_flight += 1
+        self._in_flight_by_priority[priority] += 1
+        if self.tokens_per_minute and tokens:
+            self._record_tokens(tokens)
+
+    def _record_tokens(self, tokens: int) -> None:
+        self._token_log.append((time.monotonic(), tokens))
+        self._tokens_in_window += tokens
+
+    def _prune_tokens(self, now: float) -> None:
+        while self._token_log and now - self._token_log[0][0] >= _TOKEN_WINDOW_SECONDS:
+            self._tokens_in_window -= self._token_log.popleft()[1]
+
+    def _has_waiters(self, priority: str) -> bool:
+        """Whether a class has queued calls, dropping cancelled ones from the queue heads."""
+        bank_queues = self._queues[priority]
+        for bank_id in list(bank_queues):
+            queue = bank_queues[bank_id]
+            while queue and queue[0][0].done():
+                queue.popleft()
+            if not queue:
+                del bank_queues[bank_id]
+        return bool(bank_queues)
+
+    def _admit_next(self) -> bool:
+        """Admit the head call of the class with the earliest virtual start that fits."""
+        active = [priority for priority in LLM_PRIORITY_WEIGHTS if self._has_waiters(priority)]
+        for priority in sorted(active, key=self._virtual_start.__getitem__):
+            bank_queues = self._queues[priority]
+            bank_id, queue = next(iter(bank_queues.items()))
+            future, tokens = queue[0]
+            if not self._can_admit(tokens, priority):
+                continue
+            queue.popleft()
+            bank_queues.move_to_end(bank_id)
+            self._admit(tokens, priority)
+            self._virtual_clock = self._virtual_start[priority]
+            self._virtual_start[priority] += 1.0 / LLM_PRIORITY_WEIGHTS[priority]
+            future.set_result(None)
+            return True
+        return False
+
+    def _wake(self) -> None:
+        while self._admit_next():
+            pass
+        self._schedule_timer()
+
+    def _schedule_timer(self) -> None:
+        """Re-run admission when a time-based block (Retry-After, token window) expires."""
+        if not self.waiting or self.in_flight >= self.limit:
+            return
+        now = time.monotonic()
+        if now < self._blocked_until:
+            wake_at = self._blocked_until
+        elif self._token_log:
+            wake_at = self._token_log[0][0] + _TOKEN_WINDOW_SECONDS
+        else:
+            return
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, wake_at - now)
+        if self._timer is not None and not self._timer.cancelled() and self._timer.when() <= deadline:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = loop.call_at(deadline, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._wake()
+
+
+_limiters: dict[tuple[str, str, str], AdaptiveConcurrencyLimiter] = {}
+
+
+def get_llm_limiter(provider: str, model: str, api_key: str | None) -> AdaptiveConcurrencyLimiter:
+    """Get (or create) the limiter for a provider, model and API key."""
+    key_id = hashlib.sha256(api_key.encode()).hexdigest()[:8] if api_key else "none"
+    key = (provider, model, key_id)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = AdaptiveConcurrencyLimiter(
+            provider,
+            model,
+            key_id,
+            max_limit=int(os.getenv(ENV_LLM_MAX_CONCURRENT, str(DEFAULT_LLM_MAX_CONCURRENT))),
+            min_limit=int(os.getenv(ENV_LLM_MIN_CONCURRENT, str(DEFAULT_LLM_MIN_CONCURRENT))),
+            tokens_per_minute=int(os.getenv(ENV_LLM_TOKENS_PER_MINUTE, str(DEFAULT_LLM_TOKENS_PER_MINUTE))),
+            adaptive=os.getenv(ENV_LLM_ADAPTIVE_CONCURRENCY, str(DEFAULT_LLM_ADAPTIVE_CONCURRENCY)).lower() == "true",
+            reserved_fraction=float(
+                os.getenv(ENV_LLM_INTERACTIVE_RESERVED_FRACTION, str(DEFAULT_LLM_INTERACTIVE_RESERVED_FRACTION))
+            ),
+        )
+        _limiters[key] = limiter
+    return limiter
+
+
+def iter_llm_limiters() -> list[AdaptiveConcurrencyLimiter]:
+    """All limiters created in this process (for metrics)."""
+    return list(_limiters.values())
+
+
+@contextmanager
+def llm_work(priority: str | None, bank_id: str | None = None) -> Iterator[None]:
+    """
+    Tag the LLM calls made in this context with a work class and bank for scheduling.
+
+    Args:
+        priority: Work class (one of the LLM_PRIORITY_* constants), or None to keep
+            the enclosing context's class (interactive if there is none)
+        bank_id: Bank the work belongs to
+    """
+    outer = _current_work.get()
+    if priority is None:
+        priority = outer[0] if outer else LLM_PRIORITY_INTERACTIVE
+    token = _current_work.set((priority, bank_id))
+    try:
+        yield
+    finally:
+        _current_work.reset(token)
+
+
+def current_llm_work(scope: str) -> tuple[str, str | None]:
+    """Work class and bank of an LLM call made in the current context with the given scope."""
+    work = _current_work.get()
+    if work is not None:
+        return work
+    return _SCOPE_PRIORITIES.get(scope, LLM_PRIORITY_INTERACTIVE), None
+
+
+def estimate_tokens(messages: list[dict]) -> int:
+    """Rough prompt token estimate (~4 characters per token) used for budget reservations."""
+    return sum(len(str(message.get("content") or "")) for message in messages) // 4
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """
+    Parse Retry-After (seconds or HTTP date) or retry-after-ms from response headers.
+
+    Returns:
+        Seconds to wait, or None if the headers carry no usable hint
+    """
+    if not headers:
+        return None
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms:
+            return max(0.0, float(retry_after_ms) / 1000.0)
+        retry_after = headers.get("retry-after")
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def report_overload(retry_after: float | None = None) -> None:
+    """Report an overload signal for the LLM call running in the current context."""
+    limiter = _current_limiter.get()
+    if limiter is not None:
+        limiter.on_overload(retry_after)
+
+
+def report_overload_status(status_code: int | None, headers: Mapping[str, str] | None = None) -> float:
+    """
+    Report an HTTP error response if its status signals overload.
+
+    Returns:
+        Seconds the provider asked to wait (0.0 if none or not an overload status),
+        for use as a lower bound on the caller's retry backoff
+    """
+    if status_code not in OVERLOAD_STATUS_CODES:
+        return 0.0
+    retry_after = parse_retry_after(headers)
+    report_overload(retry_after)
+    return retry_after or 0.0
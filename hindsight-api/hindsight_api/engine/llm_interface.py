@@ -5,11 +5,19 @@ This module defines the interface that all LLM providers must implement,
 enabling support for multiple LLM backends (OpenAI, Anthropic, Gemini, Codex, etc.)
 """
 
+import hashlib
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from itertools import takewhile
 from typing import Any
 
+from ..config import DEFAULT_LLM_PROMPT_CACHING, ENV_LLM_PROMPT_CACHING
 from .response_models import LLMToolCallResult, TokenUsage
 
+# Receives each chunk of a streamed text response, in order
+TextDeltaCallback = Callable[[str], Awaitable[None]]
+
 
 class LLMInterface(ABC):
     """
@@ -44,6 +52,8 @@ class LLMInterface(ABC):
         self.base_url = base_url
         self.model = model
         self.reasoning_effort = reasoning_effort
+        # Mark static prompt prefixes as cacheable where the provider supports it
+        self.prompt_caching = os.getenv(ENV_LLM_PROMPT_CACHING, str(DEFAULT_LLM_PROMPT_CACHING)).lower() == "true"
 
     @abstractmethod
     async def verify_connection(self) -> None:
@@ -69,6 +79,7 @@ class LLMInterface(ABC):
         skip_validation: bool = False,
         strict_schema: bool = False,
         return_usage: bool = False,
+        on_text_delta: TextDeltaCallback | None = None,
     ) -> Any:
         """
         Make an LLM API call with retry logic.
@@ -85,6 +96,9 @@ class LLMInterface(ABC):
             skip_validation: Return raw JSON without Pydantic validation.
             strict_schema: Use strict JSON schema enforcement (OpenAI only).
             return_usage: If True, return tuple (result, TokenUsage) instead of just result.
+            on_text_delta: Optional callback for text responses (no response_format). Providers
+                that support streaming pass each chunk as it is generated; others pass the
+                whole text once. The complete text is returned either way.
 
         Returns:
             If return_usage=False: Parsed response if response_format is provided, otherwise text content.
@@ -92,6 +106,7 @@ class LLMInterface(ABC):
 
         Raises:
             OutputTooLongError: If output exceeds token limits.
+            StreamInterruptedError: If a streamed response failed after text was passed to on_text_delta.
             Exception: Re-raises API errors after retries exhausted.
         """
         pass
@@ -195,6 +210,33 @@ class LLMInterface(ABC):
         pass
 
 
+def prompt_cache_key(messages: list[dict[str, Any]]) -> str | None:
+    """
+    Identify the static prefix of a prompt: its leading system messages.
+
+    Call sites put instructions, schema and examples in the system message and
+    per-call data after it, so calls with the same key share a cacheable prefix.
+
+    Returns:
+        Hex digest of the leading system messages, or None if there are none
+    """
+    system = [str(m.get("content") or "") for m in takewhile(lambda m: m.get("role") == "system", messages)]
+    if not system:
+        return None
+    return hashlib.sha256("\n\n".join(system).encode()).hexdigest()[:32]
+
+
+class StreamInterruptedError(Exception):
+    """
+    Raised when a streamed response fails after part of its text was delivered.
+
+    Retrying would deliver the beginning of the text a second time, so these
+    failures are raised to the caller instead of being retried.
+    """
+
+    pass
+
+
 class OutputTooLongError(Exception):
     """
     Bridge exception raised when LLM output exceeds token limits.
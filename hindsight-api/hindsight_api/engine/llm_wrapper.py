@@ -25,13 +25,13 @@ except ImportError:
     VERTEXAI_AVAILABLE = False
 
 from ..config import (
-    DEFAULT_LLM_MAX_CONCURRENT,
     DEFAULT_LLM_TIMEOUT,
     ENV_LLM_GROQ_SERVICE_TIER,
-    ENV_LLM_MAX_CONCURRENT,
     ENV_LLM_TIMEOUT,
 )
 from ..metrics import get_metrics_collector
+from .llm_concurrency import current_llm_work, estimate_tokens, get_llm_limiter
+from .llm_interface import TextDeltaCallback
 from .response_models import TokenUsage
 
 # Seed applied to every Groq request for deterministic behavior.
@@ -42,11 +42,6 @@ logger = logging.getLogger(__name__)
 # Disable httpx logging
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
-# Global semaphore to limit concurrent LLM requests across all instances
-# Set HINDSIGHT_API_LLM_MAX_CONCURRENT=1 for local LLMs (LM Studio, Ollama)
-_llm_max_concurrent = int(os.getenv(ENV_LLM_MAX_CONCURRENT, str(DEFAULT_LLM_MAX_CONCURRENT)))
-_global_llm_semaphore = asyncio.Semaphore(_llm_max_concurrent)
-
 
 class OutputTooLongError(Exception):
     """
@@ -416,6 +411,7 @@ class LLMProvider:
         skip_validation: bool = False,
         strict_schema: bool = False,
         return_usage: bool = False,
+        on_text_delta: TextDeltaCallback | None = None,
     ) -> Any:
         """
         Make an LLM API call with retry logic.
@@ -432,6 +428,7 @@ class LLMProvider:
             skip_validation: Return raw JSON without Pydantic validation.
             strict_schema: Use strict JSON schema enforcement (OpenAI only). Guarantees all required fields.
             return_usage: If True, return tuple (result, TokenUsage) instead of just result.
+            on_text_delta: Stream a text response, passing each chunk to this callback.
 
         Returns:
             If return_usage=False: Parsed response if response_format is provided, otherwise text content.
@@ -439,9 +436,15 @@ class LLMProvider:
 
         Raises:
             OutputTooLongError: If output exceeds token limits.
+            StreamInterruptedError: If a stream fails after text was passed to on_text_delta.
             Exception: Re-raises API errors after retries exhausted.
         """
-        async with _global_llm_semaphore:
+        # Adaptive per provider/model/key limit; set HINDSIGHT_API_LLM_MAX_CONCURRENT=1 for local LLMs.
+        # Queued calls are scheduled by the work class and bank of the calling context.
+        limiter = get_llm_limiter(self.provider, self.model, self.api_key)
+        estimated_tokens = estimate_tokens(messages)
+        priority, bank_id = current_llm_work(scope)
+        async with limiter.slot(estimated_tokens, priority, bank_id):
             # Delegate to provider implementation
             result = await self._provider_impl.call(
                 messages=messages,
@@ -455,7 +458,10 @@ class LLMProvider:
                 skip_validation=skip_validation,
                 strict_schema=strict_schema,
                 return_usage=return_usage,
+                on_text_delta=on_text_delta,
             )
+            usage = result[1] if return_usage and isinstance(result, tuple) else None
+            limiter.on_success(usage.total_tokens if usage else estimated_tokens, estimated_tokens)
 
             # Backward compatibility: Update mock call tracking for mock provider
             # This allows existing tests using LLMProvider._mock_calls to continue working
@@ -497,7 +503,10 @@ class LLMProvider:
         Returns:
             LLMToolCallResult with content and/or tool_calls.
         """
-        async with _global_llm_semaphore:
+        limiter = get_llm_limiter(self.provider, self.model, self.api_key)
+        estimated_tokens = estimate_tokens(messages)
+        priority, bank_id = current_llm_work(scope)
+        async with limiter.slot(estimated_tokens, priority, bank_id):
             # Delegate to provider implementation
             result = await self._provider_impl.call_with_tools(
                 messages=messages,
@@ -510,6 +519,8 @@ class LLMProvider:
                 max_backoff=max_backoff,
                 tool_choice=tool_choice,
             )
+            used_tokens = getattr(result, "input_tokens", 0) + getattr(result, "output_tokens", 0)
+            limiter.on_success(used_tokens or estimated_tokens, estimated_tokens)
 
             # Backward compatibility: Update mock call tracking for mock provider
             # This allows existing tests using LLMProvider._mock_calls to continue working
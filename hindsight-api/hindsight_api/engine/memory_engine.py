@@ -10,13 +10,17 @@ This implements a sophisticated memory architecture that combines:
 """
 
 import asyncio
+import contextlib
 import contextvars
 import json
 import logging
+import tempfile
 import time
 import uuid
-from collections.abc import Awaitable, Callable
+import weakref
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
 from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import asyncpg
@@ -26,7 +30,7 @@ import tiktoken
 from ..config import get_config
 from ..metrics import get_metrics_collector
 from ..tracing import create_operation_span
-from ..utils import mask_network_location
+from ..utils import gather_or_cancel, mask_network_location
 from ..worker.exceptions import RetryTaskAt
 from .db_budget import budgeted_operation
 from .operation_metadata import (
@@ -71,6 +75,37 @@ def fq_table(table_name: str) -> str:
     return f"{get_current_schema()}.{table_name}"
 
 
+# based_on keys of a reflect response that do not hold memory units
+_NON_UNIT_BASED_ON_KEYS = frozenset(["mental-models", "directives"])
+
+
+def mental_model_source_unit_ids(reflect_response: dict[str, Any]) -> list[uuid.UUID]:
+    """IDs of the memories and observations a reflect response was based on."""
+    unit_ids: list[uuid.UUID] = []
+    for fact_type, facts in (reflect_response.get("based_on") or {}).items():
+        if fact_type in _NON_UNIT_BASED_ON_KEYS:
+            continue
+        for fact in facts:
+            try:
+                unit_ids.append(uuid.UUID(str(fact["id"])))
+            except (KeyError, ValueError):
+                continue
+    return unit_ids
+
+
+def mental_model_source_fingerprint_sql(unit_ids_sql: str) -> str:
+    """
+    SQL expression for the fingerprint of a mental model's source units.
+
+    The digest covers the ids and current texts of the units that still exist, so it
+    changes when a source is updated or deleted.
+    """
+    return (
+        f"(SELECT md5(string_agg(u.id::text || ':' || u.text, '|' ORDER BY u.id)) "
+        f"FROM {fq_table('memory_units')} u WHERE u.id = ANY({unit_ids_sql}))"
+    )
+
+
 # Tables that must be schema-qualified (for runtime validation)
 _PROTECTED_TABLES = frozenset(
     [
@@ -84,6 +119,16 @@ _PROTECTED_TABLES = frozenset(
         "chunks",
         "async_operations",
         "file_storage",
+        "embedding_cache",
+        "entity_index_generations",
+        "entity_index_generation_deltas",
+        "fact_imports",
+        "pending_links",
+        "bank_unit_counters",
+        "bank_unit_counter_deltas",
+        "bank_generations",
+        "bank_generation_deltas",
+        "reflect_cache",
     ]
 )
 
@@ -154,6 +199,7 @@ import asyncpg
 import numpy as np
 from pydantic import BaseModel, Field
 
+from .bank_counters import fetch_bank_counters
 from .cross_encoder import CrossEncoderModel
 from .embeddings import Embeddings, create_embeddings_from_env
 from .interface import MemoryEngineInterface
@@ -168,9 +214,16 @@ from enum import Enum
 from ..metrics import get_metrics_collector
 from ..pg0 import EmbeddedPostgres, parse_pg0_url
 from .entity_resolver import EntityResolver
+from .llm_concurrency import (
+    LLM_PRIORITY_CONSOLIDATION,
+    LLM_PRIORITY_MENTAL_MODEL,
+    LLM_PRIORITY_RETAIN,
+    llm_work,
+)
 from .llm_wrapper import LLMConfig, requires_api_key
 from .query_analyzer import QueryAnalyzer
-from .reflect import run_reflect_agent
+from .reflect import ReflectEventCallback, run_reflect_agent
+from .reflect.retrieval_context import ReflectRetrievalContext
 from .reflect.tools import tool_expand, tool_recall, tool_search_mental_models, tool_search_observations
 from .response_models import (
     VALID_RECALL_FACT_TYPES,
@@ -184,7 +237,7 @@ from .response_models import (
     ToolCallTrace,
 )
 from .response_models import RecallResult as RecallResultModel
-from .retain import bank_utils, embedding_utils
+from .retain import bank_utils, embedding_processing, embedding_utils
 from .retain.types import RetainContentDict
 from .search import think_utils
 from .search.reranking import CrossEncoderReranker, apply_combined_scoring
@@ -210,7 +263,10 @@ logger = logging.getLogger(__name__)
 
 import tiktoken
 
+from .bank_snapshot import BankSnapshotCache
 from .db_utils import acquire_with_retry
+from .embedding_cache import EmbeddingCache, cache_model_key
+from .reflect_cache import ReflectCache, reflect_scope_key
 
 # Cache tiktoken encoding for token budget filtering (module-level singleton)
 _TIKTOKEN_ENCODING = None
@@ -224,6 +280,43 @@ def _get_tiktoken_encoding():
     return _TIKTOKEN_ENCODING
 
 
+def _chain_sub_batches(sub_batches: list[list[dict]], document_id: str | None = None) -> list[list[int]]:
+    """
+    Group sub-batch indices into chains that must run in order.
+
+    Sub-batches that write the same document share a chain, since only the first
+    of them may replace the document's previous version. A batch-level document_id
+    puts every sub-batch on one chain. Chains are ordered by their first index.
+    """
+    chains: list[list[int]] = []
+    chain_by_doc: dict[str, list[int]] = {}
+    for index, sub_batch in enumerate(sub_batches):
+        doc_ids = {item["document_id"] for item in sub_batch if item.get("document_id")}
+        if document_id:
+            doc_ids.add(document_id)
+        linked = []
+        for doc_id in doc_ids:
+            chain = chain_by_doc.get(doc_id)
+            if chain is not None and not any(chain is c for c in linked):
+                linked.append(chain)
+        if not linked:
+            chain = []
+            chains.append(chain)
+        else:
+            chain = linked[0]
+            for other in linked[1:]:
+                chain.extend(other)
+                chain.sort()
+                chains.remove(other)
+                for doc_id, c in chain_by_doc.items():
+                    if c is other:
+                        chain_by_doc[doc_id] = chain
+        chain.append(index)
+        for doc_id in doc_ids:
+            chain_by_doc[doc_id] = chain
+    return chains
+
+
 class MemoryEngine(MemoryEngineInterface):
     """
     Advanced memory system using temporal and semantic linking with PostgreSQL.
@@ -356,12 +449,15 @@ class MemoryEngine(MemoryEngineInterface):
         # Connection pool (will be created in initialize())
         self._pool = None
         self._initialized = False
+        # In-process bank profile/config/directive snapshots (created in initialize() when enabled)
+        self._bank_snapshots: BankSnapshotCache | None = None
         self._pool_min_size = pool_min_size if pool_min_size is not None else config.db_pool_min_size
         self._pool_max_size = pool_max_size if pool_max_size is not None else config.db_pool_max_size
         self._db_command_timeout = db_command_timeout if db_command_timeout is not None else config.db_command_timeout
         self._db_acquire_timeout = db_acquire_timeout if db_acquire_timeout is not None else config.db_acquire_timeout
         self._run_migrations = run_migrations
         self._retain_entity_lookup = config.retain_entity_lookup
+        self._retain_entity_index_max_banks = config.retain_entity_index_max_banks
 
         # Webhook manager (will be created in initialize() after pool is ready)
         self._webhook_manager = None
@@ -479,6 +575,13 @@ class MemoryEngine(MemoryEngineInterface):
         # Each put_batch holds a connection for the entire transaction, so we limit to 5
         # concurrent puts to avoid connection pool exhaustion and reduce write contention
         self._put_semaphore = asyncio.Semaphore(5)
+        # Per-bank limit on concurrent sub-batches of one large retain; entries go away with their last user
+        self._bank_retain_semaphores: weakref.WeakValueDictionary[str, asyncio.Semaphore] = (
+            weakref.WeakValueDictionary()
+        )
+
+        # Worker processes for CPU-bound file conversion, started in initialize()
+        self._parser_pool = None
 
         # initialize encoding eagerly to avoid delaying the first time
         _get_tiktoken_encoding()
@@ -650,20 +753,23 @@ class MemoryEngine(MemoryEngineInterface):
         logger.info(f"[FILE_CONVERT_RETAIN] Starting for bank_id={bank_id}, document_id={document_id}, file={filename}")
 
         try:
-            # Retrieve file from storage
-            file_data = await self._file_storage.retrieve(storage_key)
-
             # Convert to markdown using the ordered fallback chain stored in the task payload.
             # task_dict["parser"] is always a list[str] set at submission time.
             parser_chain: list[str] = task_dict.get("parser") or []
             if not parser_chain:
                 raise ValueError("No parser chain defined for file_convert_retain task")
-            convert_result = await self._parser_registry.convert_with_fallback(
-                parsers=parser_chain,
-                file_data=file_data,
-                filename=filename,
-                content_type=task_dict.get("content_type"),
-            )
+
+            # Download the file to local disk in chunks so memory use does not grow with file size
+            with tempfile.TemporaryDirectory(prefix="hindsight-convert-") as tmp_dir:
+                file_path = Path(tmp_dir) / (Path(filename).name or "upload")
+                await self._file_storage.retrieve_to_file(storage_key, file_path)
+                convert_result = await self._parser_registry.convert_with_fallback(
+                    parsers=parser_chain,
+                    file_data=None,
+                    filename=filename,
+                    content_type=task_dict.get("content_type"),
+                    file_path=file_path,
+                )
             markdown_content = convert_result.content
             winning_parser = convert_result.parser_name
         except Exception as e:
@@ -816,15 +922,52 @@ class MemoryEngine(MemoryEngineInterface):
             tenant_id=task_dict.get("_tenant_id"),
             api_key_id=task_dict.get("_api_key_id"),
         )
-        result = await run_consolidation_job(
-            memory_engine=self,
-            bank_id=bank_id,
-            request_context=internal_context,
-        )
+        with llm_work(LLM_PRIORITY_CONSOLIDATION, bank_id):
+            result = await run_consolidation_job(
+                memory_engine=self,
+                bank_id=bank_id,
+                request_context=internal_context,
+            )
 
         logger.info(f"[CONSOLIDATION] bank={bank_id} completed: {result.get('memories_processed', 0)} processed")
         return result
 
+    async def _handle_retain_links(self, task_dict: dict[str, Any]):
+        """
+        Handler for retain_links tasks.
+
+        Finishes linking units that a staged-commit retain stored but did not link,
+        e.g. because the process died between the unit and link transactions.
+
+        Args:
+            task_dict: Dict with 'bank_id', 'operation_id' (the staged batch id), 'entity_labels'
+
+        Raises:
+            ValueError: If required fields are missing
+            RetryTaskAt: If some units are still locked by a concurrent linking pass
+        """
+        from .retain import staged_linking
+
+        bank_id = task_dict.get("bank_id")
+        operation_id = task_dict.get("operation_id")
+        if not bank_id or not operation_id:
+            raise ValueError("bank_id and operation_id are required for retain_links task")
+
+        pool = await self._get_pool()
+        remaining = await staged_linking.link_pending_units(
+            pool,
+            self.entity_resolver,
+            bank_id,
+            uuid.UUID(operation_id),
+            entity_labels=task_dict.get("entity_labels"),
+        )
+        if remaining:
+            raise RetryTaskAt(
+                retry_at=staged_linking.recovery_retry_at(),
+                message=f"{remaining} unit(s) still being linked by another pass",
+            )
+        logger.info(f"[RETAIN_LINKS] bank={bank_id} batch={operation_id} linked")
+
     async def _handle_refresh_mental_model(self, task_dict: dict[str, Any]):
         """
         Handler for refresh_mental_model tasks.
@@ -870,14 +1013,15 @@ class MemoryEngine(MemoryEngineInterface):
         tags_match = "all_strict" if tags else "any"
 
         # Run reflect to generate new content, excluding the mental model being refreshed
-        reflect_result = await self.reflect_async(
-            bank_id=bank_id,
-            query=source_query,
-            request_context=internal_context,
-            tags=tags,
-            tags_match=tags_match,
-            exclude_mental_model_ids=[mental_model_id],
-        )
+        with llm_work(LLM_PRIORITY_MENTAL_MODEL, bank_id):
+            reflect_result = await self.reflect_async(
+                bank_id=bank_id,
+                query=source_query,
+                request_context=internal_context,
+                tags=tags,
+                tags_match=tags_match,
+                exclude_mental_model_ids=[mental_model_id],
+            )
 
         generated_content = reflect_result.text or "No content generated"
 
@@ -1005,6 +1149,8 @@ class MemoryEngine(MemoryEngineInterface):
                 consolidation_result = await self._handle_consolidation(task_dict)
             elif task_type == "refresh_mental_model":
                 await self._handle_refresh_mental_model(task_dict)
+            elif task_type == "retain_links":
+                await self._handle_retain_links(task_dict)
             elif task_type == "webhook_delivery":
                 await self._handle_webhook_delivery(task_dict)
             else:
@@ -1642,12 +1788,21 @@ class MemoryEngine(MemoryEngineInterface):
         self.entity_resolver = EntityResolver(
             self._pool,
             entity_lookup=self._retain_entity_lookup,
+            index_max_banks=self._retain_entity_index_max_banks,
         )
 
+        # Bank rows and directives are read on every operation; keep them in memory and
+        # drop them on change notifications from any process
+        if get_config().bank_snapshot_cache_enabled:
+            self._bank_snapshots = BankSnapshotCache(get_config().bank_snapshot_cache_max_age_seconds)
+            await self._bank_snapshots.start(self.db_url)
+
         # Initialize config resolver for hierarchical configuration
         from ..config_resolver import ConfigResolver
 
-        self._config_resolver = ConfigResolver(pool=self._pool, tenant_extension=self._tenant_extension)
+        self._config_resolver = ConfigResolver(
+            pool=self._pool, tenant_extension=self._tenant_extension, bank_snapshots=self._bank_snapshots
+        )
         logger.debug("Config resolver initialized for hierarchical configuration")
 
         # Initialize file storage
@@ -1662,12 +1817,23 @@ class MemoryEngine(MemoryEngineInterface):
         logger.debug(f"File storage initialized ({config.file_storage_type})")
 
         # Initialize parser registry
-        from .parsers import FileParserRegistry, IrisParser, MarkitdownParser
-
-        self._parser_registry = FileParserRegistry()
+        from .parsers import FileParserRegistry, IrisParser, MarkitdownParser, ParserProcessPool
+        from .parsers.markitdown import warm_worker
+
+        if config.file_parser_process_workers > 0 and self._parser_pool is None:
+            self._parser_pool = ParserProcessPool(
+                max_workers=config.file_parser_process_workers,
+                timeout=config.file_parser_timeout_seconds,
+                memory_limit_mb=config.file_parser_memory_limit_mb,
+                warmup=warm_worker,
+            )
+        self._parser_registry = FileParserRegistry(process_pool=self._parser_pool)
         try:
             self._parser_registry.register(MarkitdownParser())
             logger.debug("Registered markitdown parser")
+            if self._parser_pool is not None:
+                self._parser_pool.start()
+                logger.debug(f"Started {config.file_parser_process_workers} file parser worker processes")
         except ImportError:
             logger.warning("markitdown not available - file parsing disabled")
         iris_token = config.file_parser_iris_token
@@ -1717,6 +1883,24 @@ class MemoryEngine(MemoryEngineInterface):
             await self.initialize()
         return self._pool
 
+    async def _generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed texts, serving previously embedded texts from the embedding cache when enabled.
+
+        Returns:
+            List of embeddings in same order as input texts
+        """
+        config = get_config()
+        if not config.embeddings_cache_enabled:
+            return await embedding_utils.generate_embeddings_batch(self.embeddings, texts)
+        cache = EmbeddingCache(await self._get_pool(), config.embeddings_cache_max_age_days, get_current_schema())
+        return await cache.encode(self.embeddings, texts)
+
+    def _invalidate_bank_snapshot(self, bank_id: str) -> None:
+        """Drop the cached profile, config and directives of a bank after changing them."""
+        if self._bank_snapshots is not None:
+            self._bank_snapshots.invalidate(bank_id)
+
     async def _acquire_connection(self):
         """
         Acquire a connection from the pool with retry logic.
@@ -1768,6 +1952,18 @@ class MemoryEngine(MemoryEngineInterface):
             await self._http_client.aclose()
             self._http_client = None
 
+        # Close the embedding provider's async clients
+        await self.embeddings.close()
+
+        # Stop file parser worker processes
+        if self._parser_pool is not None:
+            self._parser_pool.shutdown()
+            self._parser_pool = None
+
+        if self._bank_snapshots is not None:
+            await self._bank_snapshots.close()
+            self._bank_snapshots = None
+
         # Close pool
         if self._pool is not None:
             self._pool.terminate()
@@ -1808,14 +2004,9 @@ class MemoryEngine(MemoryEngineInterface):
         Returns:
             Readable date string
         """
-        # Format as "Month Year" for most cases
-        # Could be extended to include day for very specific dates if needed
-        month_name = dt.strftime("%B")  # Full month name (e.g., "June")
-        year = dt.strftime("%Y")  # Year (e.g., "2024")
-
         # For now, use "Month Year" format
         # Could check if day is significant (not 1st or 15th) and include it
-        return f"{month_name} {year}"
+        return embedding_processing.format_readable_date(dt)
 
     def retain(
         self,
@@ -2039,29 +2230,49 @@ class MemoryEngine(MemoryEngineInterface):
 
             logger.info(f"Split into {len(sub_batches)} sub-batches: {[len(b) for b in sub_batches]} items each")
 
-            # Process each sub-batch
-            all_results = []
-            for i, sub_batch in enumerate(sub_batches, 1):
-                sub_batch_tokens = sum(count_tokens(item.get("content", "")) for item in sub_batch)
-                logger.info(
-                    f"Processing sub-batch {i}/{len(sub_batches)}: {len(sub_batch)} items, {sub_batch_tokens:,} tokens"
-                )
+            # Sub-batches of different documents run concurrently; parts of the same
+            # document run in order so only the first one replaces the old version.
+            sub_results: list[list[list[str]] | None] = [None] * len(sub_batches)
+            sub_usages = [TokenUsage() for _ in sub_batches]
+            bank_semaphore = self._bank_retain_semaphore(bank_id, config.retain_sub_batch_concurrency)
+            last = len(sub_batches) - 1
+
+            async def process_sub_batch(index: int, is_first_batch: bool, outbox=None) -> None:
+                sub_batch = sub_batches[index]
+                async with bank_semaphore:
+                    sub_batch_tokens = sum(count_tokens(item.get("content", "")) for item in sub_batch)
+                    logger.info(
+                        f"Processing sub-batch {index + 1}/{len(sub_batches)}: {len(sub_batch)} items, {sub_batch_tokens:,} tokens"
+                    )
+                    sub_results[index], sub_usages[index] = await self._retain_batch_async_internal(
+                        bank_id=bank_id,
+                        contents=sub_batch,
+                        request_context=request_context,
+                        document_id=document_id,
+                        is_first_batch=is_first_batch,
+                        fact_type_override=fact_type_override,
+                        confidence_score=confidence_score,
+                        document_tags=document_tags,
+                        operation_id=operation_id,
+                        outbox_callback=outbox,
+                    )
 
-                sub_results, sub_usage = await self._retain_batch_async_internal(
-                    bank_id=bank_id,
-                    contents=sub_batch,
-                    request_context=request_context,
-                    document_id=document_id,
-                    is_first_batch=i == 1,  # Only upsert on first batch
-                    fact_type_override=fact_type_override,
-                    confidence_score=confidence_score,
-                    document_tags=document_tags,
-                    operation_id=operation_id,
-                    # Outbox callback runs inside the last sub-batch's transaction so the
-                    # webhook delivery row is committed atomically with the final retain data.
-                    outbox_callback=outbox_callback if i == len(sub_batches) else None,
-                )
-                all_results.extend(sub_results)
+            async def process_chain(chain: list[int]) -> None:
+                for position, index in enumerate(chain):
+                    if index != last:
+                        await process_sub_batch(index, is_first_batch=position == 0)
+
+            chains = _chain_sub_batches(sub_batches, document_id)
+            await gather_or_cancel(*(process_chain(chain) for chain in chains))
+
+            # Outbox callback runs inside the last sub-batch's transaction so the webhook
+            # delivery row is committed atomically with the final retain data; that
+            # sub-batch therefore waits until every other one has been committed.
+            last_chain = next(chain for chain in chains if chain[-1] == last)
+            await process_sub_batch(last, is_first_batch=len(last_chain) == 1, outbox=outbox_callback)
+
+            all_results = [unit_ids for results in sub_results for unit_ids in results]
+            for sub_usage in sub_usages:
                 total_usage = total_usage + sub_usage
 
             total_time = time.time() - start_time
@@ -2121,6 +2332,107 @@ class MemoryEngine(MemoryEngineInterface):
             return result, total_usage
         return result
 
+    def _bank_retain_semaphore(self, bank_id: str, limit: int) -> asyncio.Semaphore:
+        """Semaphore limiting concurrent retain sub-batches for one bank."""
+        semaphore = self._bank_retain_semaphores.get(bank_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, limit))
+            self._bank_retain_semaphores[bank_id] = semaphore
+        return semaphore
+
+    async def import_facts_async(
+        self,
+        bank_id: str,
+        records: AsyncIterable[Any],
+        *,
+        request_context: "RequestContext",
+        import_id: str | None = None,
+    ):
+        """
+        Import pre-extracted facts without LLM extraction.
+
+        Records are streamed into memory units in batched transactions with a
+        checkpoint per batch; see ``retain.fact_import`` for the record format.
+
+        Args:
+            bank_id: Unique identifier for the bank
+            records: Decoded fact records
+            import_id: Identifier of the import. Reuse the identifier of an interrupted
+                import to resume it; a new one is generated when omitted.
+
+        Returns:
+            ImportResult with the import's progress
+
+        Raises:
+            OperationValidationError: If the operation validator rejects a batch.
+                Batches before it stay committed.
+        """
+        from .retain import fact_import
+
+        await self._authenticate_tenant(request_context)
+        import_id = import_id or str(uuid.uuid4())
+
+        def batch_contents(batch: list["fact_import.ImportRecord"]) -> list[dict]:
+            return [
+                {
+                    "content": record.text,
+                    "context": record.context,
+                    "event_date": record.occurred_start,
+                    "document_id": record.document_id,
+                    "tags": record.tags,
+                }
+                for record in batch
+            ]
+
+        # Records are streamed, so the validator sees the import one batch at a time
+        async def validate_batch(batch: list["fact_import.ImportRecord"]) -> None:
+            from hindsight_api.extensions import RetainContext
+
+            ctx = RetainContext(bank_id=bank_id, contents=batch_contents(batch), request_context=request_context)
+            await self._validate_operation(self._operation_validator.validate_retain(ctx))
+
+        async def on_batch_committed(batch: list["fact_import.ImportRecord"]) -> None:
+            from hindsight_api.extensions import RetainResult
+
+            result_ctx = RetainResult(
+                bank_id=bank_id,
+                contents=batch_contents(batch),
+                request_context=request_context,
+                document_id=None,
+                fact_type_override=None,
+                confidence_score=None,
+                unit_ids=[[str(fact_import.unit_id_for(import_id, record.position))] for record in batch],
+                success=True,
+                error=None,
+                llm_input_tokens=0,
+                llm_output_tokens=0,
+                llm_total_tokens=0,
+            )
+            try:
+                await self._operation_validator.on_retain_complete(result_ctx)
+            except Exception as e:
+                logger.warning(f"Post-retain hook error (non-fatal): {e}")
+
+        result = await fact_import.import_facts(
+            await self._get_pool(),
+            bank_id,
+            records,
+            import_id=import_id,
+            embed=self._generate_embeddings,
+            validate_batch=validate_batch if self._operation_validator else None,
+            on_batch_committed=on_batch_committed if self._operation_validator else None,
+        )
+
+        # Imported facts are consolidated like retained ones
+        config = await self._config_resolver.resolve_full_config(bank_id, request_context)
+        if config.enable_observations and result.records_skipped < result.records_committed:
+            try:
+                await self.submit_async_consolidation(bank_id=bank_id, request_context=request_context)
+            except Exception as e:
+                logger.warning(f"Failed to submit consolidation task for bank {bank_id}: {e}")
+
+        return result
+
     async def _retain_batch_async_internal(
         self,
         bank_id: str,
@@ -2166,7 +2478,7 @@ class MemoryEngine(MemoryEngineInterface):
             resolved_config = await self._config_resolver.resolve_full_config(bank_id, request_context)
 
             # Create parent span for retain operation
-            with create_operation_span("retain", bank_id):
+            with create_operation_span("retain", bank_id), llm_work(LLM_PRIORITY_RETAIN, bank_id):
                 return await orchestrator.retain_batch(
                     pool=pool,
                     embeddings_model=self.embeddings,
@@ -2184,6 +2496,8 @@ class MemoryEngine(MemoryEngineInterface):
                     operation_id=operation_id,
                     schema=request_context.tenant_id if request_context else None,
                     outbox_callback=outbox_callback,
+                    bank_snapshots=self._bank_snapshots,
+                    task_backend=self._task_backend,
                 )
 
     def recall(
@@ -2249,6 +2563,7 @@ class MemoryEngine(MemoryEngineInterface):
         tags_match: TagsMatch = "any",
         _connection_budget: int | None = None,
         _quiet: bool = False,
+        _retrieval_context: ReflectRetrievalContext | None = None,
     ) -> RecallResultModel:
         """
         Recall memories using N*4-way parallel retrieval (N fact types × 4 retrieval methods).
@@ -2386,6 +2701,7 @@ class MemoryEngine(MemoryEngineInterface):
                             include_source_facts=include_source_facts,
                             max_source_facts_tokens=max_source_facts_tokens,
                             max_source_facts_tokens_per_observation=max_source_facts_tokens_per_observation,
+                            retrieval_context=_retrieval_context,
                         )
                         break  # Success - exit retry loop
                     except Exception as e:
@@ -2513,6 +2829,7 @@ class MemoryEngine(MemoryEngineInterface):
         include_source_facts: bool = False,
         max_source_facts_tokens: int = 4096,
         max_source_facts_tokens_per_observation: int = -1,
+        retrieval_context: ReflectRetrievalContext | None = None,
     ) -> RecallResultModel:
         """
         Search implementation with modular retrieval and reranking.
@@ -2536,6 +2853,7 @@ class MemoryEngine(MemoryEngineInterface):
             max_entity_tokens: Maximum tokens for entity observations
             include_chunks: Whether to include raw chunks (fetched before max_tokens filtering)
             max_chunk_tokens: Maximum tokens for chunks
+            retrieval_context: Reflect run whose memoized query embeddings and candidate sets to reuse
 
         Returns:
             RecallResultModel with results, trace, optional entities, and optional chunks
@@ -2574,7 +2892,11 @@ class MemoryEngine(MemoryEngineInterface):
             embedding_span.set_attribute("hindsight.query", query[:100])
 
             try:
-                query_embedding = embedding_utils.generate_embedding(self.embeddings, query)
+                if retrieval_context is not None:
+                    query_embedding = await retrieval_context.embed(query)
+                else:
+                    # A single query skips the embedding cache, a lookup would cost as much as embedding it
+                    query_embedding = (await embedding_utils.generate_embeddings_batch(self.embeddings, [query]))[0]
                 step_duration = time.time() - step_start
                 log_buffer.append(f"  [1] Generate query embedding: {step_duration:.3f}s")
             finally:
@@ -2616,18 +2938,34 @@ class MemoryEngine(MemoryEngineInterface):
                 ) as op:
                     budgeted_pool = op.wrap_pool(pool)
                     parallel_start = time.time()
-                    multi_result = await retrieve_all_fact_types_parallel(
-                        budgeted_pool,
-                        query,
-                        query_embedding_str,
-                        bank_id,
-                        fact_type,  # Pass all fact types at once
-                        thinking_budget,
-                        question_date,
-                        self.query_analyzer,
-                        tags=tags,
-                        tags_match=tags_match,
-                    )
+
+                    async def retrieve():
+                        return await retrieve_all_fact_types_parallel(
+                            budgeted_pool,
+                            query,
+                            query_embedding_str,
+                            bank_id,
+                            fact_type,  # Pass all fact types at once
+                            thinking_budget,
+                            question_date,
+                            self.query_analyzer,
+                            tags=tags,
+                            tags_match=tags_match,
+                        )
+
+                    if retrieval_context is not None:
+                        # Candidates depend only on these inputs, not on max_tokens or includes
+                        candidates_key = (
+                            query,
+                            tuple(fact_type),
+                            thinking_budget,
+                            question_date,
+                            tuple(tags) if tags else None,
+                            tags_match,
+                        )
+                        multi_result = await retrieval_context.candidates(candidates_key, retrieve)
+                    else:
+                        multi_result = await retrieve()
                     parallel_duration = time.time() - parallel_start
             finally:
                 retrieval_span.end()
@@ -3429,6 +3767,9 @@ class MemoryEngine(MemoryEngineInterface):
                     document_id,
                     bank_id,
                 )
+                if deleted:
+                    # The cascade removed entity links of the document's units
+                    await self.entity_resolver.invalidate_bank_index(conn, bank_id)
 
                 result = {
                     "document_deleted": 1 if deleted else 0,
@@ -3488,6 +3829,9 @@ class MemoryEngine(MemoryEngineInterface):
                 deleted = await conn.fetchval(
                     f"DELETE FROM {fq_table('memory_units')} WHERE id = $1 RETURNING id", unit_id
                 )
+                if deleted:
+                    # The cascade removed the unit's entity links
+                    await self.entity_resolver.invalidate_bank_index(conn, bank_id)
 
                 result = {
                     "success": deleted is not None,
@@ -3567,6 +3911,7 @@ class MemoryEngine(MemoryEngineInterface):
                             bank_id,
                             fact_type,
                         )
+                        await self.entity_resolver.invalidate_bank_index(conn, bank_id)
 
                         # Note: We don't delete entities when fact_type is specified,
                         # as they may be referenced by other memory units
@@ -3591,9 +3936,23 @@ class MemoryEngine(MemoryEngineInterface):
 
                         # Delete entities (cascades to unit_entities, entity_cooccurrences, memory_links with entity_id)
                         await conn.execute(f"DELETE FROM {fq_table('entities')} WHERE bank_id = $1", bank_id)
+                        await self.entity_resolver.invalidate_bank_index(conn, bank_id)
+
+                        # Forget import checkpoints so a re-import starts from the first record
+                        await conn.execute(f"DELETE FROM {fq_table('fact_imports')} WHERE bank_id = $1", bank_id)
 
-                        # Delete the bank profile itself
+                        # Delete the bank profile itself, its (now zero) unit counters, its generation
+                        # and cached reflect answers
                         await conn.execute(f"DELETE FROM {fq_table('banks')} WHERE bank_id = $1", bank_id)
+                        await conn.execute(f"DELETE FROM {fq_table('bank_unit_counters')} WHERE bank_id = $1", bank_id)
+                        await conn.execute(
+                            f"DELETE FROM {fq_table('bank_unit_counter_deltas')} WHERE bank_id = $1", bank_id
+                        )
+                        await conn.execute(f"DELETE FROM {fq_table('bank_generations')} WHERE bank_id = $1", bank_id)
+                        await conn.execute(
+                            f"DELETE FROM {fq_table('bank_generation_deltas')} WHERE bank_id = $1", bank_id
+                        )
+                        await conn.execute(f"DELETE FROM {fq_table('reflect_cache')} WHERE bank_id = $1", bank_id)
 
                         result = {
                             "memory_units_deleted": units_count,
@@ -3604,6 +3963,8 @@ class MemoryEngine(MemoryEngineInterface):
 
                 except Exception as e:
                     raise Exception(f"Failed to delete agent data: {str(e)}")
+        if not fact_type:
+            self._invalidate_bank_snapshot(bank_id)
 
         if invalidated_obs > 0:
             await self.submit_async_consolidation(bank_id=bank_id, request_context=request_context)
@@ -3653,11 +4014,16 @@ class MemoryEngine(MemoryEngineInterface):
                     bank_id,
                 )
 
-                # Reset consolidation timestamp
+                # Reset consolidation timestamp (the counters trigger never moves it backwards)
                 await conn.execute(
                     f"UPDATE {fq_table('banks')} SET last_consolidated_at = NULL WHERE bank_id = $1",
                     bank_id,
                 )
+                for counters_table in ("bank_unit_counters", "bank_unit_counter_deltas"):
+                    await conn.execute(
+                        f"UPDATE {fq_table(counters_table)} SET last_consolidated_at = NULL WHERE bank_id = $1",
+                        bank_id,
+                    )
 
                 return {"deleted_count": count or 0}
 
@@ -3747,7 +4113,7 @@ class MemoryEngine(MemoryEngineInterface):
         from .consolidation import run_consolidation_job
 
         # Create parent span for consolidation operation
-        with create_operation_span("consolidation", bank_id):
+        with create_operation_span("consolidation", bank_id), llm_work(LLM_PRIORITY_CONSOLIDATION, bank_id):
             result = await run_consolidation_job(
                 memory_engine=self,
                 bank_id=bank_id,
@@ -4695,7 +5061,7 @@ class MemoryEngine(MemoryEngineInterface):
             ctx = BankReadContext(bank_id=bank_id, operation="get_bank_profile", request_context=request_context)
             await self._validate_operation(self._operation_validator.validate_bank_read(ctx))
         pool = await self._get_pool()
-        profile = await bank_utils.get_bank_profile(pool, bank_id)
+        profile = await bank_utils.get_bank_profile(pool, bank_id, self._bank_snapshots)
 
         # reflect_mission and disposition in config take precedence over the legacy DB columns
         config_dict = await self._config_resolver.get_bank_config(bank_id, request_context)
@@ -4745,6 +5111,7 @@ class MemoryEngine(MemoryEngineInterface):
             await self._validate_operation(self._operation_validator.validate_bank_write(ctx))
         pool = await self._get_pool()
         await bank_utils.update_bank_disposition(pool, bank_id, disposition)
+        self._invalidate_bank_snapshot(bank_id)
 
     async def set_bank_mission(
         self,
@@ -4772,6 +5139,7 @@ class MemoryEngine(MemoryEngineInterface):
             await self._validate_operation(self._operation_validator.validate_bank_write(ctx))
         pool = await self._get_pool()
         await bank_utils.set_bank_mission(pool, bank_id, mission)
+        self._invalidate_bank_snapshot(bank_id)
         return {"bank_id": bank_id, "mission": mission}
 
     async def merge_bank_mission(
@@ -4800,7 +5168,9 @@ class MemoryEngine(MemoryEngineInterface):
             ctx = BankWriteContext(bank_id=bank_id, operation="merge_bank_mission", request_context=request_context)
             await self._validate_operation(self._operation_validator.validate_bank_write(ctx))
         pool = await self._get_pool()
-        return await bank_utils.merge_bank_mission(pool, self._reflect_llm_config, bank_id, new_info)
+        result = await bank_utils.merge_bank_mission(pool, self._reflect_llm_config, bank_id, new_info)
+        self._invalidate_bank_snapshot(bank_id)
+        return result
 
     async def list_banks(
         self,
@@ -4843,6 +5213,7 @@ class MemoryEngine(MemoryEngineInterface):
         tags: list[str] | None = None,
         tags_match: TagsMatch = "any",
         exclude_mental_model_ids: list[str] | None = None,
+        on_event: ReflectEventCallback | None = None,
         _skip_span: bool = False,
     ) -> ReflectResult:
         """
@@ -4869,6 +5240,8 @@ class MemoryEngine(MemoryEngineInterface):
             tags_match: How to match tags - "any" (OR), "all" (AND)
             exclude_mental_model_ids: Optional list of mental model IDs to exclude from search
                 (used when refreshing a mental model to avoid circular reference)
+            on_event: Optional callback for progress events: "started" once the request is authenticated
+                and validated, then the tool_call and answer_delta events of run_reflect_agent
 
         Returns:
             ReflectResult containing:
@@ -4896,6 +5269,9 @@ class MemoryEngine(MemoryEngineInterface):
             )
             await self._validate_operation(self._operation_validator.validate_reflect(ctx))
 
+        if on_event is not None:
+            await on_event({"type": "started"})
+
         reflect_start = time.time()
         reflect_id = f"{bank_id[:8]}-{int(time.time() * 1000) % 100000}"
         tags_info = f", tags={tags} ({tags_match})" if tags else ""
@@ -4923,18 +5299,18 @@ class MemoryEngine(MemoryEngineInterface):
         # (not held during LLM calls which can be slow)
         pool = await self._get_pool()
 
-        # Get bank stats for freshness info
-        bank_stats = await self.get_bank_stats(bank_id, request_context=request_context)
-        last_consolidated_at = bank_stats.last_consolidated_at if hasattr(bank_stats, "last_consolidated_at") else None
-        pending_consolidation = bank_stats.pending_consolidation if hasattr(bank_stats, "pending_consolidation") else 0
+        # Freshness info for the staleness signals of the search tools
+        async with acquire_with_retry(pool) as conn:
+            counters = await fetch_bank_counters(conn, bank_id, get_current_schema())
+        last_consolidated_at = counters.last_consolidated_at
+        pending_consolidation = counters.pending_consolidation
 
-        # Create tool callbacks that acquire connections only when needed
-        from .retain import embedding_utils
+        # Tools share query embeddings and retrieval candidates for the whole run
+        retrieval_context = ReflectRetrievalContext(self._generate_embeddings)
 
+        # Create tool callbacks that acquire connections only when needed
         async def search_mental_models_fn(q: str, max_results: int = 5) -> dict[str, Any]:
-            # Generate embedding for the query
-            embeddings = await embedding_utils.generate_embeddings_batch(self.embeddings, [q])
-            query_embedding = embeddings[0]
+            query_embedding = await retrieval_context.embed(q)
             async with pool.acquire() as conn:
                 return await tool_search_mental_models(
                     conn,
@@ -4959,6 +5335,7 @@ class MemoryEngine(MemoryEngineInterface):
                 tags_match=tags_match,
                 last_consolidated_at=last_consolidated_at,
                 pending_consolidation=pending_consolidation,
+                retrieval_context=retrieval_context,
             )
 
         async def recall_fn(q: str, max_tokens: int = 4096, max_chunk_tokens: int = 1000) -> dict[str, Any]:
@@ -4971,6 +5348,7 @@ class MemoryEngine(MemoryEngineInterface):
                 tags=tags,
                 tags_match=tags_match,
                 max_chunk_tokens=max_chunk_tokens,
+                retrieval_context=retrieval_context,
             )
 
         async def expand_fn(memory_ids: list[str], depth: str) -> dict[str, Any]:
@@ -4993,6 +5371,46 @@ class MemoryEngine(MemoryEngineInterface):
         if directives:
             logger.info(f"[REFLECT {reflect_id}] Loaded {len(directives)} directives")
 
+        # Reuse the answer to a similar question asked while the bank was unchanged. Mental model
+        # refreshes bypass the cache since they must re-read the bank without the model itself.
+        reflect_cache: ReflectCache | None = None
+        cache_lookup = None
+        if config.reflect_cache_enabled and not exclude_mental_model_ids:
+            reflect_cache = ReflectCache(
+                pool, config.reflect_cache_min_similarity, config.reflect_cache_max_age_seconds
+            )
+            cache_scope_key = reflect_scope_key(
+                {
+                    "tags": sorted(tags) if tags else None,
+                    "tags_match": tags_match,
+                    "context": context,
+                    "budget": effective_budget.value,
+                    "max_tokens": max_tokens,
+                    "response_schema": response_schema,
+                    "directives": [[d["id"], d["content"]] for d in directives_raw],
+                    "disposition": profile["disposition"],
+                    "mission": profile["mission"],
+                    "llm": f"{self._reflect_llm_config.provider}:{self._reflect_llm_config.model}",
+                    "embeddings": f"{cache_model_key(self.embeddings)}:{self.embeddings.dimension}",
+                }
+            )
+            query_embedding = await retrieval_context.embed(query)
+            cache_lookup = await reflect_cache.lookup(bank_id, cache_scope_key, query_embedding)
+            if cache_lookup is not None:
+                cached_result = cache_lookup.result
+                get_metrics_collector().record_reflect_cache(
+                    bank_id, cached_result is not None, cached_result.cache_similarity if cached_result else None
+                )
+                if cached_result is not None:
+                    logger.info(
+                        f"[REFLECT {reflect_id}] Cache hit (similarity {cached_result.cache_similarity:.3f}) "
+                        f"| {time.time() - reflect_start:.3f}s"
+                    )
+                    if on_event is not None:
+                        await on_event({"type": "answer_delta", "text": cached_result.text})
+                    await self._on_reflect_complete(bank_id, query, request_context, budget, context, cached_result)
+                    return cached_result
+
         # Check if the bank has any mental models
         async with pool.acquire() as conn:
             mental_model_count = await conn.fetchval(
@@ -5011,29 +5429,36 @@ class MemoryEngine(MemoryEngineInterface):
             span_context = None
 
         try:
-            agent_result = await run_reflect_agent(
-                llm_config=self._reflect_llm_config.with_config(resolved_reflect_config),
-                bank_id=bank_id,
-                query=query,
-                bank_profile=profile,
-                search_mental_models_fn=search_mental_models_fn,
-                search_observations_fn=search_observations_fn,
-                recall_fn=recall_fn,
-                expand_fn=expand_fn,
-                context=context,
-                max_iterations=max_iterations,
-                max_tokens=max_tokens,
-                response_schema=response_schema,
-                directives=directives,
-                has_mental_models=has_mental_models,
-                budget=effective_budget,
-                max_context_tokens=max_context_tokens,
-            )
+            # Interactive unless an enclosing operation (e.g. mental model refresh) set the class
+            with llm_work(None, bank_id):
+                agent_result = await run_reflect_agent(
+                    llm_config=self._reflect_llm_config.with_config(resolved_reflect_config),
+                    bank_id=bank_id,
+                    query=query,
+                    bank_profile=profile,
+                    search_mental_models_fn=search_mental_models_fn,
+                    search_observations_fn=search_observations_fn,
+                    recall_fn=recall_fn,
+                    expand_fn=expand_fn,
+                    context=context,
+                    max_iterations=max_iterations,
+                    max_tokens=max_tokens,
+                    response_schema=response_schema,
+                    directives=directives,
+                    has_mental_models=has_mental_models,
+                    budget=effective_budget,
+                    max_context_tokens=max_context_tokens,
+                    on_event=on_event,
+                    prefetch_queries_fn=retrieval_context.prefetch_embeddings,
+                )
 
             total_time = time.time() - reflect_start
             logger.info(
                 f"[REFLECT {reflect_id}] Complete: {len(agent_result.text)} chars, "
-                f"{agent_result.iterations} iterations, {agent_result.tools_called} tool calls | {total_time:.3f}s"
+                f"{agent_result.iterations} iterations, {agent_result.tools_called} tool calls | "
+                f"embeddings={retrieval_context.embeddings_computed} (+{retrieval_context.embedding_hits} reused), "
+                f"candidate_sets={retrieval_context.candidate_sets_computed} "
+                f"(+{retrieval_context.candidate_hits} reused) | {total_time:.3f}s"
             )
 
             # Convert agent tool trace to ToolCallTrace objects
@@ -5193,30 +5618,97 @@ class MemoryEngine(MemoryEngineInterface):
                 directives_applied=directives_applied_result,
             )
 
-            # Call post-operation hook if validator is configured
-            if self._operation_validator:
-                from hindsight_api.extensions.operation_validator import ReflectResultContext
-
-                result_ctx = ReflectResultContext(
-                    bank_id=bank_id,
-                    query=query,
-                    request_context=request_context,
-                    budget=budget,
-                    context=context,
-                    result=result,
-                    success=True,
-                    error=None,
+            # Cache under the generation read before the agent ran, so memories
+            # retained meanwhile invalidate the answer
+            if reflect_cache is not None and cache_lookup is not None:
+                await reflect_cache.store(
+                    bank_id, cache_scope_key, cache_lookup.generation, query, query_embedding, result
                 )
-                try:
-                    await self._operation_validator.on_reflect_complete(result_ctx)
-                except Exception as e:
-                    logger.warning(f"Post-reflect hook error (non-fatal): {e}")
 
+            await self._on_reflect_complete(bank_id, query, request_context, budget, context, result)
             return result
         finally:
             if span_context:
                 span_context.__exit__(None, None, None)
 
+    async def reflect_stream(
+        self,
+        bank_id: str,
+        query: str,
+        *,
+        request_context: "RequestContext",
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Run reflect_async and yield its progress events as they happen.
+
+        Yields the started, tool_call and answer_delta events of the run, then a final
+        ``{"type": "done", "result": ReflectResult}``. Errors of the run are raised
+        from the iterator; authentication and validation errors are raised before
+        the started event. Closing the iterator early cancels the run.
+
+        Args:
+            bank_id: bank identifier
+            query: Question to answer
+            request_context: Request context for authentication
+            **kwargs: Other reflect_async arguments
+        """
+        events: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+        async def run() -> None:
+            try:
+                result = await self.reflect_async(
+                    bank_id, query, request_context=request_context, on_event=events.put, **kwargs
+                )
+            except Exception as e:
+                await events.put({"type": "error", "error": e})
+            else:
+                await events.put({"type": "done", "result": result})
+
+        task = asyncio.create_task(run())
+        try:
+            while True:
+                event = await events.get()
+                if event["type"] == "error":
+                    raise event["error"]
+                yield event
+                if event["type"] == "done":
+                    return
+        finally:
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    async def _on_reflect_complete(
+        self,
+        bank_id: str,
+        query: str,
+        request_context: "RequestContext",
+        budget: Budget | None,
+        context: str | None,
+        result: ReflectResult,
+    ) -> None:
+        """Call the post-reflect hook if a validator is configured; hook errors are logged, not raised."""
+        if not self._operation_validator:
+            return
+        from hindsight_api.extensions.operation_validator import ReflectResultContext
+
+        result_ctx = ReflectResultContext(
+            bank_id=bank_id,
+            query=query,
+            request_context=request_context,
+            budget=budget,
+            context=context,
+            result=result,
+            success=True,
+            error=None,
+        )
+        try:
+            await self._operation_validator.on_reflect_complete(result_ctx)
+        except Exception as e:
+            logger.warning(f"Post-reflect hook error (non-fatal): {e}")
+
     async def list_entities(
         self,
         bank_id: str,
@@ -5438,16 +5930,8 @@ class MemoryEngine(MemoryEngineInterface):
         pool = await self._get_pool()
 
         async with acquire_with_retry(pool) as conn:
-            # Get node counts by fact_type
-            node_stats = await conn.fetch(
-                f"""
-                SELECT fact_type, COUNT(*) as count
-                FROM {fq_table("memory_units")}
-                WHERE bank_id = $1
-                GROUP BY fact_type
-                """,
-                bank_id,
-            )
+            # Node counts and consolidation state come from the maintained per-bank counters
+            counters = await fetch_bank_counters(conn, bank_id, get_current_schema())
 
             # Single query for all link stats — avoids triple join on memory_links (can be 21M+ rows).
             # link_counts and link_counts_by_fact_type are derived in Python from the breakdown.
@@ -5483,20 +5967,10 @@ class MemoryEngine(MemoryEngineInterface):
                 f"SELECT COUNT(*) as count FROM {fq_table('documents')} WHERE bank_id = $1",
                 bank_id,
             )
-            consolidation_row = await conn.fetchrow(
-                f"""
-                SELECT
-                    MAX(consolidated_at) as last_consolidated_at,
-                    COUNT(*) FILTER (WHERE consolidated_at IS NULL AND fact_type IN ('experience', 'world')) as pending
-                FROM {fq_table("memory_units")}
-                WHERE bank_id = $1
-                """,
-                bank_id,
-            )
 
-            node_counts = {row["fact_type"]: row["count"] for row in node_stats}
+            node_counts = counters.node_counts
             ops_by_status = {row["status"]: row["count"] for row in ops_stats}
-            last_consolidated_at = consolidation_row["last_consolidated_at"] if consolidation_row else None
+            last_consolidated_at = counters.last_consolidated_at
 
             return {
                 "bank_id": bank_id,
@@ -5510,7 +5984,7 @@ class MemoryEngine(MemoryEngineInterface):
                 "operations": ops_by_status,
                 "total_documents": doc_count_row["count"] if doc_count_row else 0,
                 "last_consolidated_at": last_consolidated_at.isoformat() if last_consolidated_at else None,
-                "pending_consolidation": consolidation_row["pending"] if consolidation_row else 0,
+                "pending_consolidation": counters.pending_consolidation,
                 "total_observations": node_counts.get("observation", 0),
             }
 
@@ -5628,12 +6102,8 @@ class MemoryEngine(MemoryEngineInterface):
                     )
                     return count or 0
 
-            # No timestamp or invalid, return total count
-            count = await conn.fetchval(
-                f"SELECT COUNT(*) FROM {fq_table('memory_units')} WHERE bank_id = $1",
-                bank_id,
-            )
-            return count or 0
+            # No timestamp or invalid, return total count from the maintained counters
+            return (await fetch_bank_counters(conn, bank_id, get_current_schema())).total
 
     async def _delete_stale_observations_for_memories(
         self,
@@ -6071,7 +6541,7 @@ class MemoryEngine(MemoryEngineInterface):
 
         # Generate embedding for the content
         embedding_text = f"{name} {content}"
-        embedding = await embedding_utils.generate_embeddings_batch(self.embeddings, [embedding_text])
+        embedding = await self._generate_embeddings([embedding_text])
         # Convert embedding to string for asyncpg vector type
         embedding_str = str(embedding[0]) if embedding else None
 
@@ -6150,7 +6620,7 @@ class MemoryEngine(MemoryEngineInterface):
             return None
 
         # Create parent span for mental model refresh operation
-        with create_operation_span("mental_model_refresh", bank_id):
+        with create_operation_span("mental_model_refresh", bank_id), llm_work(LLM_PRIORITY_MENTAL_MODEL, bank_id):
             # SECURITY: If the mental model has tags, pass them to reflect with "all_strict" matching
             # to ensure it can only access other mental models/memories with the SAME tags.
             # This prevents cross-tenant/cross-user information leakage by excluding untagged content.
@@ -6288,7 +6758,7 @@ class MemoryEngine(MemoryEngineInterface):
                     param_idx += 1
                 # Also update embedding (convert to string for asyncpg vector type)
                 embedding_text = f"{name or ''} {content}"
-                embedding = await embedding_utils.generate_embeddings_batch(self.embeddings, [embedding_text])
+                embedding = await self._generate_embeddings([embedding_text])
                 if embedding:
                     updates.append(f"embedding = ${param_idx}")
                     params.append(str(embedding[0]))
@@ -6298,6 +6768,11 @@ class MemoryEngine(MemoryEngineInterface):
                 updates.append(f"reflect_response = ${param_idx}")
                 params.append(json.dumps(reflect_response))
                 param_idx += 1
+                # Record what the content was built from, so consolidation can tell whether it is stale
+                updates.append(f"source_unit_ids = ${param_idx}::uuid[]")
+                updates.append(f"source_fingerprint = {mental_model_source_fingerprint_sql(f'${param_idx}::uuid[]')}")
+                params.append(mental_model_source_unit_ids(reflect_response))
+                param_idx += 1
 
             if source_query is not None:
                 updates.append(f"source_query = ${param_idx}")
@@ -6439,49 +6914,55 @@ class MemoryEngine(MemoryEngineInterface):
             await self._validate_operation(self._operation_validator.validate_bank_read(ctx))
         pool = await self._get_pool()
 
-        async with acquire_with_retry(pool) as conn:
-            # Build filters
-            filters = ["bank_id = $1"]
-            params: list[Any] = [bank_id]
-            param_idx = 2
-
-            if active_only:
-                filters.append("is_active = TRUE")
-
-            # Apply tags filter for directives:
-            # Directives have special scoping rules:
-            #   - Untagged directives (tags=[] or null) always apply regardless of reflect tags
-            #   - Tagged directives only apply when the reflect operation includes matching tags
-            #   - If tags=None and isolation_mode=True: only untagged directives (no leakage)
-            #   - If tags=None and isolation_mode=False: all directives (normal API behavior)
-            if tags:
-                tags_clause, tags_params, param_idx = build_tags_where_clause(
-                    tags=tags, param_offset=param_idx, table_alias="", match=tags_match
+        async def load() -> list[dict[str, Any]]:
+            async with acquire_with_retry(pool) as conn:
+                # Build filters
+                filters = ["bank_id = $1"]
+                params: list[Any] = [bank_id]
+                param_idx = 2
+
+                if active_only:
+                    filters.append("is_active = TRUE")
+
+                # Apply tags filter for directives:
+                # Directives have special scoping rules:
+                #   - Untagged directives (tags=[] or null) always apply regardless of reflect tags
+                #   - Tagged directives only apply when the reflect operation includes matching tags
+                #   - If tags=None and isolation_mode=True: only untagged directives (no leakage)
+                #   - If tags=None and isolation_mode=False: all directives (normal API behavior)
+                if tags:
+                    tags_clause, tags_params, param_idx = build_tags_where_clause(
+                        tags=tags, param_offset=param_idx, table_alias="", match=tags_match
+                    )
+                    if tags_clause:
+                        # Always include untagged directives; tagged ones must match the reflect tags
+                        scoped_clause = tags_clause.replace("AND ", "", 1)
+                        filters.append(f"((tags IS NULL OR tags = '{{}}') OR ({scoped_clause}))")
+                        params.extend(tags_params)
+                elif isolation_mode:
+                    # Isolation mode: only include directives with empty/null tags
+                    # This ensures tag-scoped directives don't apply to untagged operations
+                    filters.append("(tags IS NULL OR tags = '{}')")
+
+                params.extend([limit, offset])
+
+                rows = await conn.fetch(
+                    f"""
+                    SELECT id, bank_id, name, content, priority, is_active, tags, created_at, updated_at
+                    FROM {fq_table("directives")}
+                    WHERE {" AND ".join(filters)}
+                    ORDER BY priority DESC, created_at DESC
+                    LIMIT ${param_idx} OFFSET ${param_idx + 1}
+                    """,
+                    *params,
                 )
-                if tags_clause:
-                    # Always include untagged directives; tagged ones must match the reflect tags
-                    scoped_clause = tags_clause.replace("AND ", "", 1)
-                    filters.append(f"((tags IS NULL OR tags = '{{}}') OR ({scoped_clause}))")
-                    params.extend(tags_params)
-            elif isolation_mode:
-                # Isolation mode: only include directives with empty/null tags
-                # This ensures tag-scoped directives don't apply to untagged operations
-                filters.append("(tags IS NULL OR tags = '{}')")
 
-            params.extend([limit, offset])
-
-            rows = await conn.fetch(
-                f"""
-                SELECT id, bank_id, name, content, priority, is_active, tags, created_at, updated_at
-                FROM {fq_table("directives")}
-                WHERE {" AND ".join(filters)}
-                ORDER BY priority DESC, created_at DESC
-                LIMIT ${param_idx} OFFSET ${param_idx + 1}
-                """,
-                *params,
-            )
+                return [self._row_to_directive(row) for row in rows]
 
-            return [self._row_to_directive(row) for row in rows]
+        if self._bank_snapshots is None:
+            return await load()
+        part = ("directives", tuple(tags) if tags else None, tags_match, active_only, limit, offset, isolation_mode)
+        return await self._bank_snapshots.get(bank_id, part, load)
 
     async def get_directive(
         self,
@@ -6570,6 +7051,7 @@ class MemoryEngine(MemoryEngineInterface):
                 tags or [],
             )
 
+        self._invalidate_bank_snapshot(bank_id)
         logger.info(f"[DIRECTIVES] Created directive '{name}' for bank {bank_id}")
         return self._row_to_directive(row)
 
@@ -6650,8 +7132,9 @@ class MemoryEngine(MemoryEngineInterface):
                 """,
                 *params,
             )
+        self._invalidate_bank_snapshot(bank_id)
 
-            return self._row_to_directive(row) if row else None
+        return self._row_to_directive(row) if row else None
 
     async def delete_directive(
         self,
@@ -6684,6 +7167,7 @@ class MemoryEngine(MemoryEngineInterface):
                 bank_id,
                 directive_id,
             )
+        self._invalidate_bank_snapshot(bank_id)
 
         return result == "DELETE 1"
 
@@ -7012,6 +7496,7 @@ class MemoryEngine(MemoryEngineInterface):
                     bank_id,
                     mission,
                 )
+        self._invalidate_bank_snapshot(bank_id)
 
         # Return updated profile
         return await self.get_bank_profile(bank_id, request_context=request_context)
@@ -7256,7 +7741,7 @@ class MemoryEngine(MemoryEngineInterface):
         Args:
             bank_id: Bank ID
             file_items: List of file items, each containing:
-                - file: UploadFile object (FastAPI)
+                - file: UploadFile object (FastAPI); spooled uploads are streamed to storage
                 - document_id: Document ID
                 - context: Optional context
                 - metadata: Optional metadata dict
@@ -7277,14 +7762,21 @@ class MemoryEngine(MemoryEngineInterface):
         if len(file_items) > config.file_conversion_max_batch_size:
             raise ValueError(f"Too many files. Maximum {config.file_conversion_max_batch_size} files per request.")
 
-        # Read all files and validate total batch size
+        # Validate total batch size. Uploads expose their size without being read;
+        # other file objects are read into memory.
         files_data = []
         total_batch_size = 0
 
         for item in file_items:
             file = item["file"]
-            file_data = await file.read()
-            total_batch_size += len(file_data)
+            stream = getattr(file, "file", None)
+            file_size = getattr(file, "size", None)
+            if stream is not None and file_size is not None:
+                file_data = None
+            else:
+                file_data = await file.read()
+                file_size = len(file_data)
+            total_batch_size += file_size
             files_data.append((item, file, file_data))
 
         # Validate total batch size
@@ -7294,23 +7786,24 @@ class MemoryEngine(MemoryEngineInterface):
                 f"Total batch size ({total_mb:.1f}MB) exceeds maximum of {config.file_conversion_max_batch_size_mb}MB"
             )
 
-        # Submit individual operation for each file
-        operation_ids = []
-        for item, file, file_data in files_data:
+        # Store and submit each file concurrently. With the synchronous task backend
+        # the conversion runs on submit, so files also convert in parallel.
+        async def submit_file(item: dict[str, Any], file: Any, file_data: bytes | None) -> str:
             # Generate storage key
             storage_key = f"banks/{bank_id}/files/{item['document_id']}/{file.filename}"
 
-            # Store file in object storage
-            await self._file_storage.store(
-                file_data=file_data,
-                key=storage_key,
-                metadata={
-                    "content_type": file.content_type or "application/octet-stream",
-                    "original_filename": file.filename,
-                    "bank_id": bank_id,
-                    "document_id": item["document_id"],
-                },
-            )
+            # Store file in object storage, streaming spooled uploads in chunks
+            storage_metadata = {
+                "content_type": file.content_type or "application/octet-stream",
+                "original_filename": file.filename,
+                "bank_id": bank_id,
+                "document_id": item["document_id"],
+            }
+            if file_data is None:
+                await file.seek(0)
+                await self._file_storage.store_stream(file.file, key=storage_key, metadata=storage_metadata)
+            else:
+                await self._file_storage.store(file_data=file_data, key=storage_key, metadata=storage_metadata)
 
             # Create individual operation and submit task
             task_payload: dict[str, Any] = {
@@ -7342,7 +7835,11 @@ class MemoryEngine(MemoryEngineInterface):
                 },
                 dedupe_by_bank=False,
             )
-            operation_ids.append(result["operation_id"])
+            return result["operation_id"]
+
+        operation_ids = await gather_or_cancel(
+            *(submit_file(item, file, file_data) for item, file, file_data in files_data)
+        )
 
         return {
             "operation_ids": operation_ids,
@@ -2,10 +2,12 @@
 
 import logging
 from dataclasses import dataclass
+from pathlib import Path
 
 from .base import FileParser, UnsupportedFileTypeError
 from .iris import IrisParser
 from .markitdown import MarkitdownParser
+from .process_pool import ParserProcessPool
 
 __all__ = [
     "FileParser",
@@ -14,6 +16,7 @@ __all__ = [
     "MarkitdownParser",
     "FileParserRegistry",
     "ConvertResult",
+    "ParserProcessPool",
 ]
 
 
@@ -31,9 +34,15 @@ logger = logging.getLogger(__name__)
 class FileParserRegistry:
     """Registry for file parsers with auto-detection."""
 
-    def __init__(self):
-        """Initialize empty parser registry."""
+    def __init__(self, process_pool: ParserProcessPool | None = None):
+        """
+        Initialize empty parser registry.
+
+        Args:
+            process_pool: Pool that runs CPU-bound parsers out of process (None = convert in-process)
+        """
         self._parsers: dict[str, FileParser] = {}
+        self._process_pool = process_pool
 
     def register(self, parser: FileParser):
         """
@@ -81,9 +90,10 @@ class FileParserRegistry:
     async def convert_with_fallback(
         self,
         parsers: list[str],
-        file_data: bytes,
+        file_data: bytes | None,
         filename: str,
         content_type: str | None = None,
+        file_path: Path | None = None,
     ) -> ConvertResult:
         """
         Try each parser in order, falling back on failure or empty content.
@@ -92,11 +102,15 @@ class FileParserRegistry:
         or returns empty content. Any other exception (RuntimeError, network error,
         etc.) also triggers a fallback so the chain is exhausted before failing.
 
+        Files given by path are converted in the process pool by parsers that
+        provide a process_function(); other parsers convert in-process.
+
         Args:
             parsers: Ordered list of parser names to try
-            file_data: Raw file bytes
+            file_data: Raw file bytes (None when file_path is given)
             filename: Original filename
             content_type: MIME type (optional)
+            file_path: Local file to convert instead of file_data, so large files are not read into memory
 
         Returns:
             ConvertResult with the parsed content and the name of the parser that succeeded
@@ -109,7 +123,13 @@ class FileParserRegistry:
         for name in parsers:
             parser = self.get_parser(name, filename, content_type)
             try:
-                content = await parser.convert(file_data, filename)
+                process_function = parser.process_function() if self._process_pool else None
+                if file_path is not None and process_function is not None:
+                    content = await self._process_pool.run(process_function, str(file_path), filename)
+                elif file_path is not None:
+                    content = await parser.convert_file(file_path, filename)
+                else:
+                    content = await parser.convert(file_data, filename)
                 if content and content.strip():
                     return ConvertResult(content=content, parser_name=name)
                 logger.warning(f"Parser '{name}' returned empty content for '{filename}', trying next")
@@ -1,6 +1,9 @@
 """Abstract base class for file parsers."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from pathlib import Path
 
 
 class UnsupportedFileTypeError(Exception):
@@ -30,6 +33,32 @@ class FileParser(ABC):
         """
         pass
 
+    async def convert_file(self, path: Path, filename: str) -> str:
+        """
+        Parse a file on local disk to markdown.
+
+        The default reads the file and calls convert(); parsers that can work
+        from a path or stream override this so large files are never held in memory.
+
+        Args:
+            path: Local path of the file
+            filename: Original filename (used for format detection)
+
+        Returns:
+            Markdown content as string
+        """
+        return await self.convert(await asyncio.to_thread(Path(path).read_bytes), filename)
+
+    def process_function(self) -> Callable[[str, str], str] | None:
+        """
+        Get a function that converts a file in a separate process.
+
+        CPU-bound parsers return a picklable module-level function taking
+        (path, filename) and returning markdown, which the registry runs in its
+        parser process pool. The default, None, converts in-process with convert_file().
+        """
+        return None
+
     def supports(self, filename: str, content_type: str | None = None) -> bool:
         """
         Check if parser supports this file type.
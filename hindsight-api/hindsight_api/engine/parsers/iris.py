@@ -3,7 +3,10 @@
 import asyncio
 import logging
 import mimetypes
+import os
 import time
+from collections.abc import AsyncIterator
+from pathlib import Path
 
 import httpx
 
@@ -14,6 +17,7 @@ logger = logging.getLogger(__name__)
 _IRIS_BASE_URL = "https://api.vectorize.io/v1"
 _DEFAULT_POLL_INTERVAL = 2.0  # seconds
 _DEFAULT_TIMEOUT = 300.0  # seconds
+_UPLOAD_CHUNK_SIZE = 1024 * 1024  # bytes read per upload chunk
 
 
 class IrisParser(FileParser):
@@ -60,6 +64,17 @@ class IrisParser(FileParser):
             UnsupportedFileTypeError: If the Iris API rejects the file type (4xx)
             RuntimeError: If extraction fails for another reason
         """
+        # Ensure file_data is plain bytes (GCS storage may return obstore.Bytes)
+        file_data = bytes(file_data)
+        return await self._extract(filename, file_data, len(file_data))
+
+    async def convert_file(self, path: Path, filename: str) -> str:
+        """Parse a file on disk, streaming it to the Iris upload URL."""
+        size = (await asyncio.to_thread(os.stat, path)).st_size
+        return await self._extract(filename, _read_chunks(path), size)
+
+    async def _extract(self, filename: str, content: bytes | AsyncIterator[bytes], size: int) -> str:
+        """Upload file content and run an Iris extraction job on it."""
         content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
 
         async with httpx.AsyncClient() as client:
@@ -74,12 +89,13 @@ class IrisParser(FileParser):
             file_id: str = init_data["fileId"]
             upload_url: str = init_data["uploadUrl"]
 
-            # Step 2: Upload the file bytes to the presigned URL (no auth header)
-            # Ensure file_data is plain bytes (GCS storage may return obstore.Bytes)
+            # Step 2: Upload the file bytes to the presigned URL (no auth header).
+            # An explicit Content-Length keeps streamed uploads out of chunked encoding,
+            # which presigned URLs do not accept.
             upload_resp = await client.put(
                 upload_url,
-                content=bytes(file_data),
-                headers={"Content-Type": content_type},
+                content=content,
+                headers={"Content-Type": content_type, "Content-Length": str(size)},
             )
             _raise_for_status(upload_resp, filename, "file upload")
 
@@ -122,6 +138,13 @@ class IrisParser(FileParser):
         return "iris"
 
 
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    """Read a local file in chunks without blocking the event loop."""
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, _UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+
 def _raise_for_status(response: httpx.Response, filename: str, step: str) -> None:
     """
     Raise an appropriate error including the response body on HTTP errors.
@@ -9,6 +9,39 @@ from .base import FileParser
 
 logger = logging.getLogger(__name__)
 
+# MarkItDown instance of a parser worker process, created by warm_worker()
+_worker_markitdown = None
+
+
+def warm_worker() -> None:
+    """Load markitdown in a parser worker process before its first conversion."""
+    global _worker_markitdown
+    if _worker_markitdown is None:
+        from markitdown import MarkItDown
+
+        _worker_markitdown = MarkItDown()
+
+
+def convert_in_worker(path: str, filename: str) -> str:
+    """Convert a file to markdown inside a parser worker process."""
+    warm_worker()
+    return _convert_path(_worker_markitdown, path, filename)
+
+
+def _convert_path(markitdown, path: Path | str, filename: str) -> str:
+    """Convert a file on disk with the given MarkItDown instance."""
+    try:
+        result = markitdown.convert(str(path))
+
+        if not result or not result.text_content:
+            raise RuntimeError(f"No content extracted from '{filename}'")
+
+        return result.text_content
+
+    except Exception as e:
+        logger.error(f"Markitdown parsing failed for {filename}: {e}")
+        raise RuntimeError(f"Failed to parse '{filename}': {e}") from e
+
 
 class MarkitdownParser(FileParser):
     """
@@ -46,6 +79,11 @@ class MarkitdownParser(FileParser):
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self._convert_sync, file_data, filename)
 
+    async def convert_file(self, path: Path, filename: str) -> str:
+        """Parse a file on disk to markdown without reading it into memory first."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._convert_path_sync, path, filename)
+
     def _convert_sync(self, file_data: bytes, filename: str) -> str:
         """Synchronous parsing (runs in thread pool)."""
         # Write to temp file (markitdown requires file path)
@@ -54,18 +92,7 @@ class MarkitdownParser(FileParser):
             tmp_path = tmp.name
 
         try:
-            # Parse using markitdown
-            result = self._markitdown.convert(tmp_path)
-
-            if not result or not result.text_content:
-                raise RuntimeError(f"No content extracted from '{filename}'")
-
-            return result.text_content
-
-        except Exception as e:
-            logger.error(f"Markitdown parsing failed for {filename}: {e}")
-            raise RuntimeError(f"Failed to parse '{filename}': {e}") from e
-
+            return self._convert_path_sync(tmp_path, filename)
         finally:
             # Clean up temp file
             try:
@@ -73,6 +100,14 @@ class MarkitdownParser(FileParser):
             except Exception:
                 pass
 
+    def _convert_path_sync(self, path: Path | str, filename: str) -> str:
+        """Synchronous parsing of a file on disk (runs in thread pool)."""
+        return _convert_path(self._markitdown, path, filename)
+
+    def process_function(self):
+        """Conversion is CPU-bound pure Python, so it runs in the parser process pool when one is configured."""
+        return convert_in_worker
+
     def supports(self, filename: str, content_type: str | None = None) -> bool:
         """Check if markitdown supports this file type."""
         # Supported extensions (from markitdown docs)
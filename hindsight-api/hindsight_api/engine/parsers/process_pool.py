@@ -0,0 +1,173 @@
+"""
+Process pool for CPU-bound file conversion.
+
+PDF, Office and spreadsheet conversion is pure Python that holds the GIL, so
+running it in the default thread pool stalls the event loop of the API or
+worker process while files convert. Parsers that can run out of process
+expose a picklable conversion function (see FileParser.process_function) that
+the registry runs here instead.
+
+Each worker process runs one conversion at a time under an address-space
+limit. The timeout starts when a worker picks up the conversion, not when it
+is queued, and a conversion that exceeds it is killed with its own worker
+only; a replacement is started for the next conversion.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# spawn: forking a process that runs an event loop and DB pool is unsafe
+_mp_context = multiprocessing.get_context("spawn")
+
+
+def _init_worker(memory_limit_bytes: int, warmup: Callable[[], None] | None) -> None:
+    """Apply the memory limit and load parser libraries in a new worker process."""
+    if memory_limit_bytes > 0:
+        try:
+            import resource
+
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+        except (ImportError, ValueError, OSError) as e:
+            logger.warning(f"Could not limit parser worker memory: {e}")
+    if warmup is not None:
+        warmup()
+
+
+def _worker_main(conn: Connection, memory_limit_bytes: int, warmup: Callable[[], None] | None) -> None:
+    """Run (fn, args) jobs received on conn and send back (ok, result or exception) until it closes."""
+    _init_worker(memory_limit_bytes, warmup)
+    conn.send(None)  # Ready
+    while True:
+        try:
+            fn, args = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            reply = (True, fn(*args))
+        except Exception as e:
+            reply = (False, e)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # Unpicklable result or exception
+            conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+class _Worker:
+    """One worker process and the parent's end of its pipe."""
+
+    def __init__(self, memory_limit_bytes: int, warmup: Callable[[], None] | None):
+        self.conn, child_conn = _mp_context.Pipe()
+        self.process = _mp_context.Process(
+            target=_worker_main, args=(child_conn, memory_limit_bytes, warmup), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+
+    def wait_ready(self) -> None:
+        """Block until the worker has finished starting up (run in a thread)."""
+        if not self.ready:
+            self.conn.recv()
+            self.ready = True
+
+    def call(self, fn: Callable[..., Any], args: tuple) -> tuple[bool, Any]:
+        """Send one job and block until its reply (run in a thread)."""
+        self.conn.send((fn, args))
+        return self.conn.recv()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ParserProcessPool:
+    """Size-limited pool of pre-started processes for file conversion."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        timeout: float,
+        memory_limit_mb: int = 0,
+        warmup: Callable[[], None] | None = None,
+    ):
+        """
+        Initialize the pool. Processes are started by start() or the first conversion.
+
+        Args:
+            max_workers: Number of worker processes
+            timeout: Maximum seconds per conversion, from the moment a worker picks it up
+            memory_limit_mb: Address-space limit per worker (0 = unlimited)
+            warmup: Picklable function run once in each worker to load parser libraries
+        """
+        self._max_workers = max(1, max_workers)
+        self._timeout = timeout
+        self._memory_limit_bytes = max(0, memory_limit_mb) * 1024 * 1024
+        self._warmup = warmup
+        self._slots = asyncio.Semaphore(self._max_workers)
+        self._idle: list[_Worker] = []
+        self._busy: set[_Worker] = set()
+
+    def _new_worker(self) -> _Worker:
+        return _Worker(self._memory_limit_bytes, self._warmup)
+
+    def start(self) -> None:
+        """Start all worker processes in the background so the first conversions do not pay for it."""
+        while len(self._idle) + len(self._busy) < self._max_workers:
+            self._idle.append(self._new_worker())
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run fn(*args) in a worker process.
+
+        Raises:
+            RuntimeError: If the conversion times out or its worker process dies
+                (e.g. by exceeding the memory limit)
+        """
+        async with self._slots:
+            worker = None
+            while self._idle and worker is None:
+                worker = self._idle.pop()
+                if not worker.process.is_alive():
+                    worker.kill()
+                    worker = None
+            if worker is None:
+                worker = await asyncio.to_thread(self._new_worker)
+
+            self._busy.add(worker)
+            try:
+                # Start-up and library warm-up do not count against the timeout
+                await asyncio.to_thread(worker.wait_ready)
+                ok, result = await asyncio.wait_for(asyncio.to_thread(worker.call, fn, args), self._timeout)
+            except TimeoutError as e:
+                logger.warning(f"Killing file parser worker {worker.process.pid} after {self._timeout}s")
+                await asyncio.to_thread(worker.kill)
+                raise RuntimeError(f"File conversion timed out after {self._timeout}s") from e
+            except (EOFError, OSError) as e:
+                await asyncio.to_thread(worker.kill)
+                raise RuntimeError(f"File conversion worker process died (exit code {worker.process.exitcode})") from e
+            except asyncio.CancelledError:
+                # The worker is still busy with the abandoned job
+                await asyncio.shield(asyncio.to_thread(worker.kill))
+                raise
+            finally:
+                self._busy.discard(worker)
+
+            self._idle.append(worker)
+            if not ok:
+                raise result
+            return result
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        for worker in [*self._idle, *self._busy]:
+            worker.kill()
+        self._idle = []
+        self._busy = set()
@@ -14,13 +14,46 @@ import logging
 import time
 from typing import Any
 
-from hindsight_api.engine.llm_interface import LLMInterface, OutputTooLongError
+from hindsight_api.engine.llm_concurrency import report_overload, report_overload_status
+from hindsight_api.engine.llm_interface import (
+    LLMInterface,
+    OutputTooLongError,
+    StreamInterruptedError,
+    TextDeltaCallback,
+)
 from hindsight_api.engine.response_models import LLMToolCall, LLMToolCallResult, TokenUsage
 from hindsight_api.metrics import get_metrics_collector
 
 logger = logging.getLogger(__name__)
 
 
+def _usage_tokens(usage: Any) -> tuple[int, int, int]:
+    """
+    Token counts from an Anthropic usage block.
+
+    Anthropic reports cache reads and writes separately from input_tokens; they are
+    folded back in so input_tokens counts the whole prompt, as for other providers.
+
+    Returns:
+        Tuple of (input_tokens, output_tokens, cached_input_tokens)
+    """
+    if usage is None:
+        return 0, 0, 0
+    cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+    cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+    return (usage.input_tokens or 0) + cache_read + cache_write, usage.output_tokens or 0, cache_read
+
+
+def _report_overload(e: Exception, status_error: type, timeout_error: type) -> float:
+    """Report overload for a failed attempt; returns the Retry-After delay (0.0 if none)."""
+    if isinstance(e, timeout_error):
+        report_overload()
+        return 0.0
+    if isinstance(e, status_error):
+        return report_overload_status(e.status_code, e.response.headers)
+    return 0.0
+
+
 class AnthropicLLM(LLMInterface):
     """
     LLM provider using Anthropic's Claude models.
@@ -71,6 +104,18 @@ class AnthropicLLM(LLMInterface):
         except ImportError as e:
             raise RuntimeError("Anthropic SDK not installed. Run: uv add anthropic or pip install anthropic") from e
 
+    def _system_param(self, system_prompt: str) -> str | list[dict[str, Any]]:
+        """
+        System prompt parameter, ending in a cache breakpoint when prompt caching is enabled.
+
+        Tools and the system prompt precede the messages in Anthropic's cache prefix,
+        so the breakpoint covers all static content. Prompts below the model's minimum
+        cacheable length are simply not cached.
+        """
+        if not self.prompt_caching:
+            return system_prompt
+        return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
     async def verify_connection(self) -> None:
         """
         Verify that the Anthropic provider is configured correctly by making a simple test call.
@@ -92,6 +137,26 @@ class AnthropicLLM(LLMInterface):
             logger.error(f"Anthropic connection verification failed: {e}")
             raise RuntimeError(f"Failed to verify Anthropic connection: {e}") from e
 
+    async def _stream_message(self, call_params: dict[str, Any], on_text_delta: TextDeltaCallback) -> Any:
+        """
+        Stream a message, passing each text delta to ``on_text_delta``.
+
+        Returns:
+            The final message, with the same content and usage as ``messages.create()``
+        """
+        delivered = False
+        try:
+            async with self._client.messages.stream(**call_params) as stream:
+                async for text in stream.text_stream:
+                    if text:
+                        await on_text_delta(text)
+                        delivered = True
+                return await stream.get_final_message()
+        except Exception as e:
+            if delivered:
+                raise StreamInterruptedError(f"Stream from {self.provider}/{self.model} failed: {e}") from e
+            raise
+
     async def call(
         self,
         messages: list[dict[str, str]],
@@ -105,6 +170,7 @@ class AnthropicLLM(LLMInterface):
         skip_validation: bool = False,
         strict_schema: bool = False,
         return_usage: bool = False,
+        on_text_delta: TextDeltaCallback | None = None,
     ) -> Any:
         """
         Make an LLM API call with retry logic.
@@ -121,6 +187,7 @@ class AnthropicLLM(LLMInterface):
             skip_validation: Return raw JSON without Pydantic validation.
             strict_schema: Use strict JSON schema enforcement (not supported by Anthropic).
             return_usage: If True, return tuple (result, TokenUsage) instead of just result.
+            on_text_delta: Stream a text response, passing each delta to this callback.
 
         Returns:
             If return_usage=False: Parsed response if response_format is provided, otherwise text content.
@@ -128,9 +195,10 @@ class AnthropicLLM(LLMInterface):
 
         Raises:
             OutputTooLongError: If output exceeds token limits.
+            StreamInterruptedError: If a streamed response failed after text was delivered.
             Exception: Re-raises API errors after retries exhausted.
         """
-        from anthropic import APIConnectionError, APIStatusError, RateLimitError
+        from anthropic import APIConnectionError, APIStatusError, APITimeoutError, RateLimitError
 
         start_time = time.time()
 
@@ -167,7 +235,7 @@ class AnthropicLLM(LLMInterface):
         }
 
         if system_prompt:
-            call_params["system"] = system_prompt
+            call_params["system"] = self._system_param(system_prompt)
 
         if temperature is not None:
             call_params["temperature"] = temperature
@@ -176,7 +244,10 @@ class AnthropicLLM(LLMInterface):
 
         for attempt in range(max_retries + 1):
             try:
-                response = await self._client.messages.create(**call_params)
+                if on_text_delta is not None and response_format is None:
+                    response = await self._stream_message(call_params, on_text_delta)
+                else:
+                    response = await self._client.messages.create(**call_params)
 
                 # Anthropic response content is a list of blocks
                 content = ""
@@ -207,8 +278,7 @@ class AnthropicLLM(LLMInterface):
 
                 # Record metrics and log slow calls
                 duration = time.time() - start_time
-                input_tokens = response.usage.input_tokens or 0 if response.usage else 0
-                output_tokens = response.usage.output_tokens or 0 if response.usage else 0
+                input_tokens, output_tokens, cached_tokens = _usage_tokens(response.usage)
                 total_tokens = input_tokens + output_tokens
 
                 # Record LLM metrics
@@ -221,6 +291,7 @@ class AnthropicLLM(LLMInterface):
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     success=True,
+                    cached_input_tokens=cached_tokens,
                 )
 
                 # Record trace span
@@ -254,6 +325,7 @@ class AnthropicLLM(LLMInterface):
                         input_tokens=input_tokens,
                         output_tokens=output_tokens,
                         total_tokens=total_tokens,
+                        cached_input_tokens=cached_tokens,
                     )
                     return result, token_usage
                 return result
@@ -276,6 +348,7 @@ class AnthropicLLM(LLMInterface):
                     raise
 
                 last_exception = e
+                retry_after = _report_overload(e, APIStatusError, APITimeoutError)
                 if attempt < max_retries:
                     # Check if it's a rate limit or server error
                     should_retry = isinstance(e, (APIConnectionError, RateLimitError)) or (
@@ -285,7 +358,7 @@ class AnthropicLLM(LLMInterface):
                     if should_retry:
                         backoff = min(initial_backoff * (2**attempt), max_backoff)
                         jitter = backoff * 0.2 * (2 * (time.time() % 1) - 1)
-                        await asyncio.sleep(backoff + jitter)
+                        await asyncio.sleep(max(backoff + jitter, retry_after))
                         continue
 
                 logger.error(f"Anthropic API error after {max_retries + 1} attempts: {str(e)}")
@@ -328,7 +401,7 @@ class AnthropicLLM(LLMInterface):
         Returns:
             LLMToolCallResult with content and/or tool_calls.
         """
-        from anthropic import APIConnectionError, APIStatusError
+        from anthropic import APIConnectionError, APIStatusError, APITimeoutError
 
         start_time = time.time()
 
@@ -386,7 +459,7 @@ class AnthropicLLM(LLMInterface):
             "max_tokens": max_completion_tokens or 4096,
         }
         if system_prompt:
-            call_params["system"] = system_prompt
+            call_params["system"] = self._system_param(system_prompt)
 
         if temperature is not None:
             call_params["temperature"] = temperature
@@ -410,8 +483,7 @@ class AnthropicLLM(LLMInterface):
                 finish_reason = "tool_calls" if tool_calls else "stop"
 
                 # Extract token usage
-                input_tokens = response.usage.input_tokens or 0
-                output_tokens = response.usage.output_tokens or 0
+                input_tokens, output_tokens, cached_tokens = _usage_tokens(response.usage)
 
                 # Record metrics
                 metrics = get_metrics_collector()
@@ -424,6 +496,7 @@ class AnthropicLLM(LLMInterface):
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     success=True,
+                    cached_input_tokens=cached_tokens,
                 )
 
                 # Record OpenTelemetry span
@@ -462,8 +535,9 @@ class AnthropicLLM(LLMInterface):
                 if isinstance(e, APIStatusError) and e.status_code in (401, 403):
                     raise
                 last_exception = e
+                retry_after = _report_overload(e, APIStatusError, APITimeoutError)
                 if attempt < max_retries:
-                    await asyncio.sleep(min(initial_backoff * (2**attempt), max_backoff))
+                    await asyncio.sleep(max(min(initial_backoff * (2**attempt), max_backoff), retry_after))
                     continue
                 raise
 
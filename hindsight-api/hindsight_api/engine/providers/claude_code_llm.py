@@ -12,7 +12,7 @@ import logging
 import time
 from typing import Any
 
-from hindsight_api.engine.llm_interface import LLMInterface, OutputTooLongError
+from hindsight_api.engine.llm_interface import LLMInterface, OutputTooLongError, TextDeltaCallback
 from hindsight_api.engine.response_models import LLMToolCall, LLMToolCallResult, TokenUsage
 from hindsight_api.metrics import get_metrics_collector
 
@@ -116,6 +116,7 @@ class ClaudeCodeLLM(LLMInterface):
         skip_validation: bool = False,
         strict_schema: bool = False,
         return_usage: bool = False,
+        on_text_delta: TextDeltaCallback | None = None,
     ) -> Any:
         """
         Make an LLM API call with retry logic.
@@ -132,6 +133,7 @@ class ClaudeCodeLLM(LLMInterface):
             skip_validation: Return raw JSON without Pydantic validation.
             strict_schema: Use strict JSON schema enforcement (not supported).
             return_usage: If True, return tuple (result, TokenUsage) instead of just result.
+            on_text_delta: Receives a text response once it is complete.
 
         Returns:
             If return_usage=False: Parsed response if response_format is provided, otherwise text content.
@@ -217,6 +219,8 @@ class ClaudeCodeLLM(LLMInterface):
                         result = response_format.model_validate(json_data)
                 else:
                     result = full_text
+                    if on_text_delta is not None and full_text:
+                        await on_text_delta(full_text)
 
                 # Record metrics
                 duration = time.time() - start_time
@@ -17,7 +17,7 @@ from typing import Any
 
 import httpx
 
-from hindsight_api.engine.llm_interface import LLMInterface, OutputTooLongError
+from hindsight_api.engine.llm_interface import LLMInterface, OutputTooLongError, TextDeltaCallback
 from hindsight_api.engine.response_models import LLMToolCall, LLMToolCallResult, TokenUsage
 from hindsight_api.metrics import get_metrics_collector
 
@@ -155,8 +155,14 @@ class CodexLLM(LLMInterface):
         skip_validation: bool = False,
         strict_schema: bool = False,
         return_usage: bool = False,
+        on_text_delta: TextDeltaCallback | None = None,
     ) -> Any:
-        """Make API call to Codex backend with SSE streaming."""
+        """
+        Make API call to Codex backend with SSE streaming.
+
+        ``on_text_delta`` receives a text response once it is complete, so a failed
+        attempt can still be retried.
+        """
         start_time = time.time()
 
         # Prepare system instructions
@@ -248,6 +254,8 @@ class CodexLLM(LLMInterface):
                         result = response_format.model_validate(json_data)
                 else:
                     result = content
+                    if on_text_delta is not None and content:
+                        await on_text_delta(content)
 
                 # Record metrics
                 duration = time.time() - start_time
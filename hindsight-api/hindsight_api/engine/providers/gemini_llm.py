@@ -18,7 +18,13 @@ from google import genai
 from google.genai import errors as genai_errors
 from google.genai import types as genai_types
 
-from hindsight_api.engine.llm_interface import LLMInterface, OutputTooLongError
+from hindsight_api.engine.llm_concurrency import report_overload_status
+from hindsight_api.engine.llm_interface import (
+    LLMInterface,
+    OutputTooLongError,
+    StreamInterruptedError,
+    TextDeltaCallback,
+)
 from hindsight_api.engine.llm_wrapper import parse_llm_json
 from hindsight_api.engine.response_models import LLMToolCall, LLMToolCallResult, TokenUsage
 from hindsight_api.metrics import get_metrics_collector
@@ -153,6 +159,34 @@ class GeminiLLM(LLMInterface):
         except Exception as e:
             raise RuntimeError(f"Failed to verify {self.provider.upper()} connection: {e}") from e
 
+    async def _generate_content_streamed(
+        self, contents: list[Any], config: Any, on_text_delta: TextDeltaCallback
+    ) -> tuple[str | None, Any]:
+        """
+        Stream a generation, passing each text chunk to ``on_text_delta``.
+
+        Returns:
+            Tuple of (text, last chunk); the last chunk carries the usage metadata and
+            finish reason. Text is None if nothing was generated.
+        """
+        parts: list[str] = []
+        last_chunk = None
+        try:
+            stream = await self._client.aio.models.generate_content_stream(
+                model=self.model, contents=contents, config=config
+            )
+            async for chunk in stream:
+                last_chunk = chunk
+                text = chunk.text
+                if text:
+                    parts.append(text)
+                    await on_text_delta(text)
+        except Exception as e:
+            if parts:
+                raise StreamInterruptedError(f"Stream from {self.provider}/{self.model} failed: {e}") from e
+            raise
+        return ("".join(parts) if parts else None), last_chunk
+
     async def call(
         self,
         messages: list[dict[str, str]],
@@ -166,6 +200,7 @@ class GeminiLLM(LLMInterface):
         skip_validation: bool = False,
         strict_schema: bool = False,
         return_usage: bool = False,
+        on_text_delta: TextDeltaCallback | None = None,
     ) -> Any:
         """
         Make a Gemini/VertexAI API call with retry logic.
@@ -182,6 +217,7 @@ class GeminiLLM(LLMInterface):
             skip_validation: Return raw JSON without Pydantic validation.
             strict_schema: Use strict JSON schema enforcement (not supported by Gemini).
             return_usage: If True, return tuple (result, TokenUsage).
+            on_text_delta: Stream a text response, passing each chunk to this callback.
 
         Returns:
             If return_usage=False: Parsed response if response_format provided, else text.
@@ -242,16 +278,21 @@ class GeminiLLM(LLMInterface):
 
         for attempt in range(max_retries + 1):
             try:
-                response = await asyncio.wait_for(
-                    self._client.aio.models.generate_content(
-                        model=self.model,
-                        contents=gemini_contents,
-                        config=generation_config,
-                    ),
-                    timeout=90.0,  # Safety net for network hangs; valid slow responses are <90s
-                )
-
-                content = response.text
+                if on_text_delta is not None and response_format is None:
+                    content, response = await asyncio.wait_for(
+                        self._generate_content_streamed(gemini_contents, generation_config, on_text_delta),
+                        timeout=90.0,
+                    )
+                else:
+                    response = await asyncio.wait_for(
+                        self._client.aio.models.generate_content(
+                            model=self.model,
+                            contents=gemini_contents,
+                            config=generation_config,
+                        ),
+                        timeout=90.0,  # Safety net for network hangs; valid slow responses are <90s
+                    )
+                    content = response.text
 
                 # Handle empty response
                 if content is None:
@@ -280,12 +321,16 @@ class GeminiLLM(LLMInterface):
                     result = content
 
                 # Extract token usage
+                # Gemini caches shared prompt prefixes implicitly; the system instruction
+                # (prompt, schema) leads every request, so only per-call data varies
                 input_tokens = 0
                 output_tokens = 0
+                cached_tokens = 0
                 if hasattr(response, "usage_metadata") and response.usage_metadata:
                     usage = response.usage_metadata
                     input_tokens = usage.prompt_token_count or 0
                     output_tokens = usage.candidates_token_count or 0
+                    cached_tokens = getattr(usage, "cached_content_token_count", None) or 0
 
                 # Record metrics
                 duration = time.time() - start_time
@@ -298,6 +343,7 @@ class GeminiLLM(LLMInterface):
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     success=True,
+                    cached_input_tokens=cached_tokens,
                 )
 
                 # Record trace span
@@ -336,6 +382,7 @@ class GeminiLLM(LLMInterface):
                         input_tokens=input_tokens,
                         output_tokens=output_tokens,
                         total_tokens=input_tokens + output_tokens,
+                        cached_input_tokens=cached_tokens,
                     )
                     return result, token_usage
                 return result
@@ -360,10 +407,11 @@ class GeminiLLM(LLMInterface):
                 # Retry on retryable errors (rate limits, server errors, client errors)
                 if e.code in (400, 429, 500, 502, 503, 504) or (e.code and e.code >= 500):
                     last_exception = e
+                    retry_after = report_overload_status(e.code, getattr(e.response, "headers", None))
                     if attempt < max_retries:
                         backoff = min(initial_backoff * (2**attempt), max_backoff)
                         jitter = backoff * 0.2 * (2 * (time.time() % 1) - 1)
-                        await asyncio.sleep(backoff + jitter)
+                        await asyncio.sleep(max(backoff + jitter, retry_after))
                     else:
                         logger.error(f"Gemini API error after {max_retries + 1} attempts: {str(e)}")
                         raise
@@ -558,9 +606,11 @@ class GeminiLLM(LLMInterface):
                 # Extract token usage
                 input_tokens = 0
                 output_tokens = 0
+                cached_tokens = 0
                 if response.usage_metadata:
                     input_tokens = response.usage_metadata.prompt_token_count or 0
                     output_tokens = response.usage_metadata.candidates_token_count or 0
+                    cached_tokens = getattr(response.usage_metadata, "cached_content_token_count", None) or 0
 
                 # Record metrics
                 duration = time.time() - start_time
@@ -573,6 +623,7 @@ class GeminiLLM(LLMInterface):
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     success=True,
+                    cached_input_tokens=cached_tokens,
                 )
 
                 # Record OpenTelemetry span
@@ -615,9 +666,10 @@ class GeminiLLM(LLMInterface):
 
                 # Retry on retryable errors
                 last_exception = e
+                retry_after = report_overload_status(e.code, getattr(e.response, "headers", None))
                 if attempt < max_retries:
                     backoff = min(initial_backoff * (2**attempt), max_backoff)
-                    await asyncio.sleep(backoff)
+                    await asyncio.sleep(max(backoff, retry_after))
                     continue
                 raise
 
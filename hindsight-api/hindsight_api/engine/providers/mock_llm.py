@@ -6,14 +6,18 @@ without making actual API calls to external LLM services.
 """
 
 import logging
+import re
 from collections.abc import Callable
 from typing import Any
 
-from ..llm_interface import LLMInterface
+from ..llm_interface import LLMInterface, TextDeltaCallback, prompt_cache_key
 from ..response_models import LLMToolCall, LLMToolCallResult, TokenUsage
 
 logger = logging.getLogger(__name__)
 
+# Input tokens reported as served from cache when a call repeats a seen static prefix
+MOCK_CACHED_PREFIX_TOKENS = 8
+
 
 class MockLLM(LLMInterface):
     """
@@ -68,6 +72,8 @@ class MockLLM(LLMInterface):
         self._mock_response: Any = None
         self._mock_exception: Exception | None = None
         self._response_callback: Callable[[list[dict], str], Any] | None = None
+        # Static prompt prefixes seen so far, to simulate provider prompt caching
+        self._cached_prefixes: set[str] = set()
 
     async def verify_connection(self) -> None:
         """
@@ -91,6 +97,7 @@ class MockLLM(LLMInterface):
         skip_validation: bool = False,
         strict_schema: bool = False,
         return_usage: bool = False,
+        on_text_delta: TextDeltaCallback | None = None,
     ) -> Any:
         """
         Make a mock LLM API call.
@@ -109,12 +116,17 @@ class MockLLM(LLMInterface):
             skip_validation: Return raw JSON without Pydantic validation.
             strict_schema: Not used in mock.
             return_usage: If True, return tuple (result, TokenUsage) instead of just result.
+            on_text_delta: Receives a text response word by word, like a streaming provider.
 
         Returns:
             If return_usage=False: Parsed response if response_format is provided, otherwise text content.
             If return_usage=True: Tuple of (result, TokenUsage) with mock token counts.
         """
         # Record the call for test verification
+        cache_key = prompt_cache_key(messages) if self.prompt_caching else None
+        cache_hit = cache_key is not None and cache_key in self._cached_prefixes
+        if cache_key is not None:
+            self._cached_prefixes.add(cache_key)
         call_record = {
             "provider": self.provider,
             "model": self.model,
@@ -123,6 +135,7 @@ class MockLLM(LLMInterface):
             if response_format and hasattr(response_format, "__name__")
             else str(response_format),
             "scope": scope,
+            "prompt_cache_key": cache_key,
         }
         self._mock_calls.append(call_record)
         logger.debug(f"Mock LLM call recorded: scope={scope}, model={self.model}")
@@ -163,8 +176,18 @@ class MockLLM(LLMInterface):
         else:
             result = "mock response"
 
+        if on_text_delta is not None and response_format is None and isinstance(result, str):
+            for chunk in re.findall(r"\S+\s*|\s+", result):
+                await on_text_delta(chunk)
+
         if return_usage:
-            token_usage = TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15)
+            # A repeated static prefix is reported as a cache hit, like real providers do
+            token_usage = TokenUsage(
+                input_tokens=10,
+                output_tokens=5,
+                total_tokens=15,
+                cached_input_tokens=MOCK_CACHED_PREFIX_TOKENS if cache_hit else 0,
+            )
             return result, token_usage
         return result
 
@@ -25,10 +25,17 @@ import time
 from typing import Any
 
 import httpx
-from openai import APIConnectionError, APIStatusError, AsyncOpenAI, LengthFinishReasonError
+from openai import APIConnectionError, APIStatusError, APITimeoutError, AsyncOpenAI, LengthFinishReasonError
 
 from hindsight_api.config import DEFAULT_LLM_TIMEOUT, ENV_LLM_TIMEOUT
-from hindsight_api.engine.llm_interface import LLMInterface, OutputTooLongError
+from hindsight_api.engine.llm_concurrency import report_overload, report_overload_status
+from hindsight_api.engine.llm_interface import (
+    LLMInterface,
+    OutputTooLongError,
+    StreamInterruptedError,
+    TextDeltaCallback,
+    prompt_cache_key,
+)
 from hindsight_api.engine.response_models import LLMToolCall, LLMToolCallResult, TokenUsage
 from hindsight_api.metrics import get_metrics_collector
 
@@ -38,6 +45,12 @@ logger = logging.getLogger(__name__)
 DEFAULT_LLM_SEED = 4242
 
 
+def _cached_tokens(usage: Any) -> int:
+    """Prompt tokens served from the provider's prefix cache (0 if not reported)."""
+    details = getattr(usage, "prompt_tokens_details", None) if usage else None
+    return (getattr(details, "cached_tokens", None) or 0) if details else 0
+
+
 class OpenAICompatibleLLM(LLMInterface):
     """
     LLM provider for OpenAI-compatible APIs.
@@ -112,6 +125,8 @@ class OpenAICompatibleLLM(LLMInterface):
             client_kwargs["timeout"] = self.timeout
 
         self._client = AsyncOpenAI(**client_kwargs)
+        # Cleared when the server rejects stream_options, which not every OpenAI-compatible server accepts
+        self._stream_usage_supported = True
         logger.info(
             f"OpenAI-compatible client initialized: provider={self.provider}, model={self.model}, "
             f"base_url={self.base_url or 'default'}"
@@ -155,6 +170,68 @@ class OpenAICompatibleLLM(LLMInterface):
 
         return None
 
+    def _apply_prompt_cache_key(self, call_params: dict[str, Any]) -> None:
+        """
+        Tag an OpenAI request with the key of its static prompt prefix.
+
+        OpenAI caches prompt prefixes automatically; requests sharing a
+        prompt_cache_key are routed to the same cache, which raises the hit rate.
+        Sent via extra_body so older SDK versions pass it through unchanged.
+        """
+        if self.provider != "openai" or not self.prompt_caching:
+            return
+        key = prompt_cache_key(call_params["messages"])
+        if key:
+            call_params.setdefault("extra_body", {})["prompt_cache_key"] = key
+
+    async def _stream_text(
+        self, call_params: dict[str, Any], on_text_delta: TextDeltaCallback
+    ) -> tuple[str, Any, str | None]:
+        """
+        Stream a text completion, passing each content delta to ``on_text_delta``.
+
+        Usage is requested with ``stream_options``. Servers that reject it with a
+        400 are retried once without it, and later streams skip it.
+
+        Returns:
+            Tuple of (text, usage, finish_reason); usage is None if the server does not report it
+        """
+        parts: list[str] = []
+        usage = None
+        finish_reason = None
+        try:
+            if self._stream_usage_supported:
+                try:
+                    stream = await self._client.chat.completions.create(
+                        **call_params, stream=True, stream_options={"include_usage": True}
+                    )
+                except APIStatusError as e:
+                    if e.status_code != 400:
+                        raise
+                    stream = await self._client.chat.completions.create(**call_params, stream=True)
+                    # Only a request that succeeds without it shows the 400 was about stream_options
+                    self._stream_usage_supported = False
+                    logger.info(f"{self.provider}/{self.model} rejected stream_options, streaming without usage")
+            else:
+                stream = await self._client.chat.completions.create(**call_params, stream=True)
+            async for chunk in stream:
+                if chunk.usage:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+                text = choice.delta.content if choice.delta else None
+                if text:
+                    parts.append(text)
+                    await on_text_delta(text)
+        except Exception as e:
+            if parts:
+                raise StreamInterruptedError(f"Stream from {self.provider}/{self.model} failed: {e}") from e
+            raise
+        return "".join(parts), usage, finish_reason
+
     async def call(
         self,
         messages: list[dict[str, str]],
@@ -168,6 +245,7 @@ class OpenAICompatibleLLM(LLMInterface):
         skip_validation: bool = False,
         strict_schema: bool = False,
         return_usage: bool = False,
+        on_text_delta: TextDeltaCallback | None = None,
     ) -> Any:
         """
         Make an LLM API call with retry logic.
@@ -184,6 +262,7 @@ class OpenAICompatibleLLM(LLMInterface):
             skip_validation: Return raw JSON without Pydantic validation.
             strict_schema: Use strict JSON schema enforcement (OpenAI only).
             return_usage: If True, return tuple (result, TokenUsage) instead of just result.
+            on_text_delta: Stream a text response, passing each delta to this callback.
 
         Returns:
             If return_usage=False: Parsed response if response_format is provided, otherwise text content.
@@ -191,6 +270,7 @@ class OpenAICompatibleLLM(LLMInterface):
 
         Raises:
             OutputTooLongError: If output exceeds token limits.
+            StreamInterruptedError: If a streamed response failed after text was delivered.
             Exception: Re-raises API errors after retries exhausted.
         """
         # Handle Ollama with native API for structured output (better schema enforcement)
@@ -285,6 +365,8 @@ class OpenAICompatibleLLM(LLMInterface):
                     # LM Studio and Ollama don't support json_object response format reliably
                     call_params["response_format"] = {"type": "json_object"}
 
+        self._apply_prompt_cache_key(call_params)
+
         last_exception = None
 
         for attempt in range(max_retries + 1):
@@ -348,16 +430,22 @@ class OpenAICompatibleLLM(LLMInterface):
                         result = json_data
                     else:
                         result = response_format.model_validate(json_data)
+                    usage = response.usage
+                    finish_reason = response.choices[0].finish_reason if response.choices else None
+                elif on_text_delta is not None:
+                    result, usage, finish_reason = await self._stream_text(call_params, on_text_delta)
                 else:
                     response = await self._client.chat.completions.create(**call_params)
                     result = response.choices[0].message.content
+                    usage = response.usage
+                    finish_reason = response.choices[0].finish_reason if response.choices else None
 
                 # Record token usage metrics
                 duration = time.time() - start_time
-                usage = response.usage
                 input_tokens = usage.prompt_tokens or 0 if usage else 0
                 output_tokens = usage.completion_tokens or 0 if usage else 0
                 total_tokens = usage.total_tokens or 0 if usage else 0
+                cached_tokens = _cached_tokens(usage)
 
                 # Record LLM metrics
                 metrics = get_metrics_collector()
@@ -369,12 +457,12 @@ class OpenAICompatibleLLM(LLMInterface):
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     success=True,
+                    cached_input_tokens=cached_tokens,
                 )
 
                 # Record trace span
                 from hindsight_api.tracing import _serialize_for_span, get_span_recorder
 
-                finish_reason = response.choices[0].finish_reason if response.choices else None
                 span_recorder = get_span_recorder()
                 span_recorder.record_llm_call(
                     provider=self.provider,
@@ -392,9 +480,6 @@ class OpenAICompatibleLLM(LLMInterface):
                 # Log slow calls
                 if duration > 10.0 and usage:
                     ratio = max(1, output_tokens) / max(1, input_tokens)
-                    cached_tokens = 0
-                    if hasattr(usage, "prompt_tokens_details") and usage.prompt_tokens_details:
-                        cached_tokens = getattr(usage.prompt_tokens_details, "cached_tokens", 0) or 0
                     cache_info = f", cached_tokens={cached_tokens}" if cached_tokens > 0 else ""
                     logger.info(
                         f"slow llm call: scope={scope}, model={self.provider}/{self.model}, "
@@ -407,6 +492,7 @@ class OpenAICompatibleLLM(LLMInterface):
                         input_tokens=input_tokens,
                         output_tokens=output_tokens,
                         total_tokens=total_tokens,
+                        cached_input_tokens=cached_tokens,
                     )
                     return result, token_usage
                 return result
@@ -423,6 +509,8 @@ class OpenAICompatibleLLM(LLMInterface):
                     getattr(e, "response", None), "status_code", None
                 )
                 logger.warning(f"APIConnectionError (HTTP {status_code}), attempt {attempt + 1}: {str(e)[:200]}")
+                if isinstance(e, APITimeoutError):
+                    report_overload()
                 if attempt < max_retries:
                     backoff = min(initial_backoff * (2**attempt), max_backoff)
                     await asyncio.sleep(backoff)
@@ -475,10 +563,11 @@ class OpenAICompatibleLLM(LLMInterface):
                         pass  # Failed to parse tool_use_failed, continue with normal retry
 
                 last_exception = e
+                retry_after = report_overload_status(e.status_code, e.response.headers)
                 if attempt < max_retries:
                     backoff = min(initial_backoff * (2**attempt), max_backoff)
                     jitter = backoff * 0.2 * (2 * (time.time() % 1) - 1)
-                    sleep_time = backoff + jitter
+                    sleep_time = max(backoff + jitter, retry_after)
                     await asyncio.sleep(sleep_time)
                 else:
                     logger.error(f"API error after {max_retries + 1} attempts: {str(e)}")
@@ -538,6 +627,7 @@ class OpenAICompatibleLLM(LLMInterface):
         # Provider-specific parameters
         if self.provider == "groq":
             call_params["seed"] = DEFAULT_LLM_SEED
+        self._apply_prompt_cache_key(call_params)
 
         last_exception = None
 
@@ -565,6 +655,7 @@ class OpenAICompatibleLLM(LLMInterface):
                 usage = response.usage
                 input_tokens = usage.prompt_tokens or 0 if usage else 0
                 output_tokens = usage.completion_tokens or 0 if usage else 0
+                cached_tokens = _cached_tokens(usage)
 
                 metrics = get_metrics_collector()
                 metrics.record_llm_call(
@@ -575,6 +666,7 @@ class OpenAICompatibleLLM(LLMInterface):
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     success=True,
+                    cached_input_tokens=cached_tokens,
                 )
 
                 # Record OpenTelemetry span
@@ -611,6 +703,8 @@ class OpenAICompatibleLLM(LLMInterface):
 
             except APIConnectionError as e:
                 last_exception = e
+                if isinstance(e, APITimeoutError):
+                    report_overload()
                 if attempt < max_retries:
                     await asyncio.sleep(min(initial_backoff * (2**attempt), max_backoff))
                     continue
@@ -620,8 +714,9 @@ class OpenAICompatibleLLM(LLMInterface):
                 if e.status_code in (401, 403):
                     raise
                 last_exception = e
+                retry_after = report_overload_status(e.status_code, e.response.headers)
                 if attempt < max_retries:
-                    await asyncio.sleep(min(initial_backoff * (2**attempt), max_backoff))
+                    await asyncio.sleep(max(min(initial_backoff * (2**attempt), max_backoff), retry_after))
                     continue
                 raise
 
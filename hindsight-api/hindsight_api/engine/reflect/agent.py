@@ -44,6 +44,13 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_ITERATIONS = 10
 
+# Tools whose "query" argument is embedded for retrieval
+_SEARCH_TOOLS = frozenset({"search_mental_models", "search_observations", "recall"})
+
+# Receives progress events of a reflect run: {"type": "tool_call", ...} after each tool
+# and {"type": "answer_delta", "text": ...} for each chunk of the final answer
+ReflectEventCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
 
 def _normalize_tool_name(name: str) -> str:
     """Normalize tool name from various LLM output formats.
@@ -264,25 +271,29 @@ OUTPUT:"""
 _TIKTOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
 
 
-def _count_messages_tokens(messages: list[dict[str, Any]]) -> int:
-    """Estimate the token count of the messages list using cl100k_base encoding."""
+def _count_message_tokens(msg: dict[str, Any]) -> int:
+    """Estimate the token count of a single message using cl100k_base encoding."""
     total = 0
-    for msg in messages:
-        content = msg.get("content") or ""
-        if isinstance(content, str):
-            total += len(_TIKTOKEN_ENCODING.encode(content))
-        elif isinstance(content, list):
-            for part in content:
-                if isinstance(part, dict) and isinstance(part.get("text"), str):
-                    total += len(_TIKTOKEN_ENCODING.encode(part["text"]))
-        # Tool call arguments and results also count
-        for tc in msg.get("tool_calls") or []:
-            if isinstance(tc, dict):
-                func = tc.get("function", {})
-                total += len(_TIKTOKEN_ENCODING.encode(func.get("arguments", "")))
+    content = msg.get("content") or ""
+    if isinstance(content, str):
+        total += len(_TIKTOKEN_ENCODING.encode(content))
+    elif isinstance(content, list):
+        for part in content:
+            if isinstance(part, dict) and isinstance(part.get("text"), str):
+                total += len(_TIKTOKEN_ENCODING.encode(part["text"]))
+    # Tool call arguments and results also count
+    for tc in msg.get("tool_calls") or []:
+        if isinstance(tc, dict):
+            func = tc.get("function", {})
+            total += len(_TIKTOKEN_ENCODING.encode(func.get("arguments", "")))
     return total
 
 
+def _count_messages_tokens(messages: list[dict[str, Any]]) -> int:
+    """Estimate the token count of the messages list using cl100k_base encoding."""
+    return sum(_count_message_tokens(msg) for msg in messages)
+
+
 def _is_context_overflow_error(exc: Exception) -> bool:
     """Return True if the exception signals the LLM context window was exceeded."""
     msg = str(exc).lower()
@@ -318,6 +329,8 @@ async def run_reflect_agent(
     has_mental_models: bool = False,
     budget: str | None = None,
     max_context_tokens: int = 100_000,
+    on_event: ReflectEventCallback | None = None,
+    prefetch_queries_fn: Callable[[list[str]], Awaitable[None]] | None = None,
 ) -> ReflectAgentResult:
     """
     Execute the reflect agent loop using native tool calling.
@@ -341,6 +354,11 @@ async def run_reflect_agent(
         max_tokens: Maximum tokens for the final response
         response_schema: Optional JSON Schema for structured output in final response
         directives: Optional list of directive mental models to inject as hard rules
+        on_event: Optional callback for progress events. A synthesized final answer is
+            streamed as it is generated; an answer given through the done tool or as
+            tool-call content arrives as a single delta.
+        prefetch_queries_fn: Optional callback invoked with the queries of the search
+            tool calls of an iteration before they run, so they can be embedded in one batch
 
     Returns:
         ReflectAgentResult with final answer and metadata
@@ -365,6 +383,13 @@ async def run_reflect_agent(
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": query},
     ]
+    # Running token estimate of messages: each message is tokenized once, when it is added
+    messages_tokens = _count_messages_tokens(messages)
+
+    def _add_message(message: dict[str, Any]) -> None:
+        nonlocal messages_tokens
+        messages.append(message)
+        messages_tokens += _count_message_tokens(message)
 
     # Tracking
     total_tools_called = 0
@@ -382,6 +407,11 @@ async def run_reflect_agent(
     available_mental_model_ids: set[str] = set()
     available_observation_ids: set[str] = set()
 
+    async def _emit_answer_delta(text: str) -> None:
+        await on_event({"type": "answer_delta", "text": text})
+
+    on_answer_delta = _emit_answer_delta if on_event is not None else None
+
     def _get_llm_trace() -> list[LLMCall]:
         return [
             LLMCall(
@@ -443,6 +473,7 @@ async def run_reflect_agent(
                 scope="reflect",
                 max_completion_tokens=max_tokens,
                 return_usage=True,
+                on_text_delta=on_answer_delta,
             )
             llm_duration = int((time.time() - llm_start) * 1000)
             total_input_tokens += usage.input_tokens
@@ -480,7 +511,7 @@ async def run_reflect_agent(
 
         # Proactive context-window guard: if accumulated messages would exceed the
         # configured token budget, bail out early and synthesize from what we have.
-        estimated_tokens = _count_messages_tokens(messages)
+        estimated_tokens = messages_tokens
         if estimated_tokens >= max_context_tokens and (
             bool(available_memory_ids) or bool(available_mental_model_ids) or bool(available_observation_ids)
         ):
@@ -500,6 +531,7 @@ async def run_reflect_agent(
                 scope="reflect",
                 max_completion_tokens=max_tokens,
                 return_usage=True,
+                on_text_delta=on_answer_delta,
             )
             llm_duration = int((time.time() - llm_start) * 1000)
             total_input_tokens += usage.input_tokens
@@ -604,6 +636,7 @@ async def run_reflect_agent(
                 scope="reflect",
                 max_completion_tokens=max_tokens,
                 return_usage=True,
+                on_text_delta=on_answer_delta,
             )
             llm_duration = int((time.time() - llm_start) * 1000)
             total_input_tokens += usage.input_tokens
@@ -643,6 +676,8 @@ async def run_reflect_agent(
         if not result.tool_calls:
             if result.content:
                 answer = _clean_answer_text(result.content.strip())
+                if on_answer_delta is not None:
+                    await on_answer_delta(answer)
 
                 # Generate structured output if schema provided
                 structured_output = None
@@ -677,6 +712,7 @@ async def run_reflect_agent(
                 scope="reflect",
                 max_completion_tokens=max_tokens,
                 return_usage=True,
+                on_text_delta=on_answer_delta,
             )
             llm_duration = int((time.time() - llm_start) * 1000)
             total_input_tokens += usage.input_tokens
@@ -721,13 +757,13 @@ async def run_reflect_agent(
             )
             if not has_gathered_evidence and iteration < max_iterations - 1:
                 # Add assistant message and fake tool result asking for evidence
-                messages.append(
+                _add_message(
                     {
                         "role": "assistant",
                         "tool_calls": [_tool_call_to_dict(done_call)],
                     }
                 )
-                messages.append(
+                _add_message(
                     {
                         "role": "tool",
                         "tool_call_id": done_call.id,
@@ -764,19 +800,34 @@ async def run_reflect_agent(
                     directives_applied=directives_applied,
                     llm_config=llm_config,
                     response_schema=response_schema,
+                    on_answer=on_answer_delta,
                 )
 
         # Execute other tools in parallel (exclude done tool in all its format variants)
         other_tools = [tc for tc in result.tool_calls if not _is_done_tool(tc.name)]
         if other_tools:
             # Add assistant message with tool calls
-            messages.append(
+            _add_message(
                 {
                     "role": "assistant",
                     "tool_calls": [_tool_call_to_dict(tc) for tc in other_tools],
                 }
             )
 
+            # Embed the queries of this iteration's searches together rather than one per tool
+            if prefetch_queries_fn is not None:
+                queries = [
+                    tc.arguments["query"]
+                    for tc in other_tools
+                    if _normalize_tool_name(tc.name) in _SEARCH_TOOLS and isinstance(tc.arguments.get("query"), str)
+                ]
+                if queries:
+                    try:
+                        await prefetch_queries_fn(queries)
+                    except Exception as e:
+                        # Each tool embeds its own query (and reports any error) when it runs
+                        logger.warning(f"[REFLECT {reflect_id}] Query embedding prefetch failed: {e}")
+
             # Execute tools in parallel
             tool_tasks = [
                 _execute_tool_with_timing(
@@ -835,7 +886,7 @@ async def run_reflect_agent(
                             available_memory_ids.add(memory["id"])
 
                 # Add tool result message
-                messages.append(
+                _add_message(
                     {
                         "role": "tool",
                         "tool_call_id": tc.id,
@@ -861,6 +912,17 @@ async def run_reflect_agent(
                         iteration=iteration + 1,
                     )
                 )
+                if on_event is not None:
+                    await on_event(
+                        {
+                            "type": "tool_call",
+                            "tool": normalized_tool_name,
+                            "reason": tool_reason,
+                            "input": input_dict,
+                            "duration_ms": duration_ms,
+                            "iteration": iteration + 1,
+                        }
+                    )
 
                 try:
                     output_chars = len(json.dumps(output))
@@ -881,6 +943,8 @@ async def run_reflect_agent(
 
     # Should not reach here
     answer = "I was unable to formulate a complete answer within the iteration limit."
+    if on_answer_delta is not None:
+        await on_answer_delta(answer)
     _log_completion(answer, max_iterations, forced=True)
     return ReflectAgentResult(
         text=answer,
@@ -920,6 +984,7 @@ async def _process_done_tool(
     directives_applied: list[DirectiveInfo],
     llm_config: "LLMProvider | None" = None,
     response_schema: dict | None = None,
+    on_answer: Callable[[str], Awaitable[None]] | None = None,
 ) -> ReflectAgentResult:
     """Process the done tool call and return the result."""
     args = done_call.arguments
@@ -929,6 +994,8 @@ async def _process_done_tool(
     answer = _clean_done_answer(raw_answer) if raw_answer else ""
     if not answer:
         answer = "No answer provided."
+    if on_answer is not None:
+        await on_answer(answer)
 
     # Validate IDs (only include IDs that were actually retrieved)
     used_memory_ids = [mid for mid in (args.get("memory_ids") or []) if mid in available_memory_ids]
@@ -0,0 +1,97 @@
+"""
+Per-reflect retrieval context.
+
+A reflect run makes many tool calls, often with the same or overlapping
+queries: the agent searches mental models, observations and raw facts for the
+same question, and repeats queries across iterations. A ReflectRetrievalContext
+lives for one run and memoizes query embeddings and retrieval candidate sets by
+query, so a repeated query is neither embedded nor retrieved twice. The queries
+of tool calls that run together are embedded in a single batch.
+
+Concurrent requests for the same key share one in-flight computation. Failed
+computations are not memoized, so a later call retries them.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+def _fail(future: asyncio.Future, error: BaseException) -> None:
+    """Propagate an error to the waiters of a future without logging it as unretrieved."""
+    if isinstance(error, asyncio.CancelledError):
+        future.cancel()
+        return
+    future.set_exception(error)
+    # Waiters re-raise the error; the computing caller already has it
+    future.exception()
+
+
+class ReflectRetrievalContext:
+    """Memoized query embeddings and retrieval candidate sets of one reflect run."""
+
+    def __init__(self, embed: Callable[[list[str]], Awaitable[list[list[float]]]]):
+        """
+        Args:
+            embed: Embeds a batch of texts, returning embeddings in input order
+        """
+        self._embed = embed
+        self._embeddings: dict[str, asyncio.Future[list[float]]] = {}
+        self._candidates: dict[Hashable, asyncio.Future[Any]] = {}
+        self.embeddings_computed = 0
+        self.embedding_hits = 0
+        self.candidate_sets_computed = 0
+        self.candidate_hits = 0
+
+    async def prefetch_embeddings(self, queries: list[str]) -> None:
+        """Embed the queries that are not memoized yet in a single batch."""
+        new_queries = list(dict.fromkeys(q for q in queries if q not in self._embeddings))
+        if not new_queries:
+            return
+        loop = asyncio.get_running_loop()
+        futures = {q: loop.create_future() for q in new_queries}
+        self._embeddings.update(futures)
+        try:
+            embeddings = await self._embed(new_queries)
+        except BaseException as e:
+            for query, future in futures.items():
+                del self._embeddings[query]
+                _fail(future, e)
+            raise
+        self.embeddings_computed += len(new_queries)
+        for query, embedding in zip(new_queries, embeddings):
+            futures[query].set_result(embedding)
+
+    async def embed(self, query: str) -> list[float]:
+        """Return the embedding of a query, computing it only on first use."""
+        future = self._embeddings.get(query)
+        if future is None:
+            await self.prefetch_embeddings([query])
+            future = self._embeddings[query]
+        else:
+            self.embedding_hits += 1
+        # Shielded so a cancelled waiter does not cancel the result for the others
+        return await asyncio.shield(future)
+
+    async def candidates(self, key: Hashable, retrieve: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the candidate set memoized under ``key``, running ``retrieve`` on first use.
+
+        The key must capture every input of the retrieval (query, fact types, budget,
+        filters); callers must not mutate the returned candidates.
+        """
+        future = self._candidates.get(key)
+        if future is not None:
+            self.candidate_hits += 1
+            return await asyncio.shield(future)
+        future = asyncio.get_running_loop().create_future()
+        self._candidates[key] = future
+        try:
+            result = await retrieve()
+        except BaseException as e:
+            del self._candidates[key]
+            _fail(future, e)
+            raise
+        self.candidate_sets_computed += 1
+        future.set_result(result)
+        return result
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
 
     from ...api.http import RequestContext
     from ..memory_engine import MemoryEngine
+    from .retrieval_context import ReflectRetrievalContext
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +128,7 @@ async def tool_search_observations(
     tags_match: str = "any",
     last_consolidated_at: datetime | None = None,
     pending_consolidation: int = 0,
+    retrieval_context: "ReflectRetrievalContext | None" = None,
 ) -> dict[str, Any]:
     """
     Search consolidated observations using recall with include_source_facts.
@@ -144,6 +146,7 @@ async def tool_search_observations(
         tags_match: How to match tags - "any" (OR), "all" (AND)
         last_consolidated_at: When consolidation last ran (for staleness check)
         pending_consolidation: Number of memories waiting to be consolidated
+        retrieval_context: Reflect run context that memoizes embeddings and candidates
 
     Returns:
         Dict with matching observations including freshness info and source memories
@@ -161,6 +164,7 @@ async def tool_search_observations(
         max_source_facts_tokens=-1,  # No token limit — include all source facts
         _connection_budget=1,
         _quiet=True,
+        _retrieval_context=retrieval_context,
     )
 
     is_stale = pending_consolidation > 0
@@ -191,6 +195,7 @@ async def tool_recall(
     tags_match: str = "any",
     connection_budget: int = 1,
     max_chunk_tokens: int = 1000,
+    retrieval_context: "ReflectRetrievalContext | None" = None,
 ) -> dict[str, Any]:
     """
     Search memories using TEMPR retrieval.
@@ -208,6 +213,7 @@ async def tool_recall(
         tags_match: How to match tags - "any" (OR), "all" (AND), or "exact"
         connection_budget: Max DB connections for this recall (default 1 for internal ops)
         max_chunk_tokens: Maximum tokens for raw source chunk text (default 1000, always included)
+        retrieval_context: Reflect run context that memoizes embeddings and candidates
 
     Returns:
         Dict with list of matching memories including raw chunk text
@@ -226,6 +232,7 @@ async def tool_recall(
         _quiet=True,  # Suppress logging for internal operations
         include_chunks=include_chunks,
         max_chunk_tokens=max_chunk_tokens,
+        _retrieval_context=retrieval_context,
     )
 
     return {
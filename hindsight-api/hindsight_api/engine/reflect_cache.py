@@ -0,0 +1,312 @@
+"""
+Semantic answer cache for reflect.
+
+Reflect answers are stored in the ``reflect_cache`` table together with the
+embedding of their query, a scope key and the bank generation they were
+computed at. The scope key is a digest of everything besides the query that
+shapes an answer: tags, disposition, mission, directives, response schema,
+budget and models. The bank generation grows with every change to the bank's
+memory units and mental models: triggers append a row per changed bank to the
+insert-only bank_generation_deltas table, and a bank's generation is its
+bank_generations row plus its deltas (see migrations j0k1l2m3n4o5 and
+n4o5p6q7r8s9). Deltas are folded into bank_generations by a lookup that finds
+FOLD_THRESHOLD or more of them for its bank, so lookups read a bounded number
+of rows, and for every bank by the worker every minute.
+
+A reflect whose query embedding is at least ``min_similarity`` close to a
+cached query with the same scope key, at the bank's current generation, is
+answered from the cache without running the agent. Answers of older
+generations are never returned and are deleted on the next write for the bank.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from ..config import DEFAULT_DATABASE_SCHEMA
+from .db_utils import acquire_with_retry
+from .memory_engine import fq_table, get_current_schema
+from .response_models import MemoryFact, ReflectResult, TokenUsage
+
+logger = logging.getLogger(__name__)
+
+# Expired rows are deleted at most this often per schema, piggybacking on writes
+EVICTION_INTERVAL_SECONDS = 3600
+
+# Most recent answers of a scope compared against a query
+MAX_CANDIDATES = 50
+
+# Unfolded generation deltas of a bank at which a lookup folds them first
+FOLD_THRESHOLD = 64
+
+_last_eviction: dict[str, float] = {}
+
+
+def reflect_scope_key(scope: dict[str, Any]) -> bytes:
+    """Return the SHA-256 digest of the JSON-serialized reflect scope."""
+    return hashlib.sha256(json.dumps(scope, sort_keys=True, default=str).encode("utf-8")).digest()
+
+
+def _lock_key(schema: str | None) -> str:
+    """
+    Advisory lock of a schema's generations: held exclusively while folding every bank
+    and shared while folding one bank, so the folds never wait on each other's rows.
+    """
+    # The worker passes None for the default schema, the engine its name
+    return f"bank_generations:{schema or DEFAULT_DATABASE_SCHEMA}"
+
+
+def _fold_sql(generations_table: str, deltas_table: str, bank_filter: str = "") -> str:
+    """Move deltas (of the banks matching bank_filter) into bank_generations in one statement."""
+    return f"""
+        WITH folded AS (
+            DELETE FROM {deltas_table} {bank_filter} RETURNING bank_id, changes
+        )
+        INSERT INTO {generations_table} AS g (bank_id, generation)
+        SELECT bank_id, SUM(changes) FROM folded GROUP BY bank_id
+        ORDER BY bank_id
+        ON CONFLICT (bank_id) DO UPDATE SET generation = g.generation + EXCLUDED.generation
+    """
+
+
+async def fetch_bank_generation(conn, bank_id: str) -> int:
+    """Return the current generation of a bank (0 if its memories never changed)."""
+    row = await conn.fetchrow(
+        f"""
+        SELECT COALESCE((SELECT generation FROM {fq_table("bank_generations")} WHERE bank_id = $1), 0) AS generation,
+               d.unfolded, COALESCE(d.changes, 0) AS changes
+        FROM (
+            SELECT COUNT(*) AS unfolded, SUM(changes) AS changes
+            FROM (SELECT changes FROM {fq_table("bank_generation_deltas")} WHERE bank_id = $1 LIMIT $2) l
+        ) d
+        """,
+        bank_id,
+        FOLD_THRESHOLD,
+    )
+    if row["unfolded"] < FOLD_THRESHOLD:
+        return row["generation"] + row["changes"]
+
+    # Too many deltas to read them all on every lookup
+    async with conn.transaction():
+        # Waits for a fold of the whole schema, which takes an instant
+        await conn.execute("SELECT pg_advisory_xact_lock_shared(hashtext($1))", _lock_key(get_current_schema()))
+        await conn.execute(
+            _fold_sql(fq_table("bank_generations"), fq_table("bank_generation_deltas"), "WHERE bank_id = $1"),
+            bank_id,
+        )
+    return await conn.fetchval(
+        f"""
+        SELECT COALESCE((SELECT generation FROM {fq_table("bank_generations")} WHERE bank_id = $1), 0)
+             + COALESCE((SELECT SUM(changes) FROM {fq_table("bank_generation_deltas")} WHERE bank_id = $1), 0)
+        """,
+        bank_id,
+    )
+
+
+async def fold_bank_generation_deltas(conn, schema: str | None) -> bool:
+    """
+    Fold the generation deltas of every bank in a schema into bank_generations.
+
+    One statement deletes the deltas and adds them to the banks' rows, so readers
+    see the same generation before and after, and deltas committed meanwhile stay.
+
+    Args:
+        conn: Database connection
+        schema: Schema to compact (None for the unqualified default schema)
+
+    Returns:
+        Whether the deltas were folded (False while a lookup folds a bank's deltas)
+    """
+    prefix = f'"{schema}".' if schema else ""
+    async with conn.transaction():
+        if not await conn.fetchval("SELECT pg_try_advisory_xact_lock(hashtext($1))", _lock_key(schema)):
+            return False
+        await conn.execute(_fold_sql(f"{prefix}bank_generations", f"{prefix}bank_generation_deltas"))
+    return True
+
+
+async def lookup_answer(
+    conn,
+    bank_id: str,
+    scope_key: bytes,
+    generation: int,
+    query_embedding: list[float],
+    min_similarity: float,
+    max_age_seconds: int,
+) -> tuple[dict[str, Any], float] | None:
+    """
+    Find the cached answer whose query is most similar to ``query_embedding``.
+
+    Returns:
+        Tuple of (serialized ReflectResult, similarity), or None if no cached
+        query of the scope and generation is at least ``min_similarity`` close
+    """
+    row = await conn.fetchrow(
+        f"""
+        SELECT result, similarity
+        FROM (
+            SELECT result, 1 - (query_embedding::vector <=> $4::vector) AS similarity
+            FROM {fq_table("reflect_cache")}
+            WHERE bank_id = $1
+              AND scope_key = $2
+              AND generation = $3
+              AND created_at > NOW() - make_interval(secs => $6)
+            ORDER BY created_at DESC
+            LIMIT {MAX_CANDIDATES}
+        ) candidates
+        WHERE similarity >= $5
+        ORDER BY similarity DESC
+        LIMIT 1
+        """,
+        bank_id,
+        scope_key,
+        generation,
+        str(query_embedding),
+        min_similarity,
+        float(max_age_seconds),
+    )
+    if row is None:
+        return None
+    return json.loads(row["result"]), float(row["similarity"])
+
+
+async def store_answer(
+    conn,
+    bank_id: str,
+    scope_key: bytes,
+    generation: int,
+    query: str,
+    query_embedding: list[float],
+    result: dict[str, Any],
+) -> None:
+    """Insert an answer and drop the bank's answers from older generations."""
+    await conn.execute(
+        f"DELETE FROM {fq_table('reflect_cache')} WHERE bank_id = $1 AND generation < $2",
+        bank_id,
+        generation,
+    )
+    await conn.execute(
+        f"""
+        INSERT INTO {fq_table("reflect_cache")} (bank_id, scope_key, generation, query, query_embedding, result)
+        VALUES ($1, $2, $3, $4, $5, $6)
+        """,
+        bank_id,
+        scope_key,
+        generation,
+        query,
+        query_embedding,
+        json.dumps(result),
+    )
+
+
+async def evict_expired_answers(conn, max_age_seconds: int) -> int:
+    """
+    Delete cached answers older than ``max_age_seconds``.
+
+    Returns:
+        Number of rows deleted
+    """
+    result = await conn.execute(
+        f"DELETE FROM {fq_table('reflect_cache')} WHERE created_at <= NOW() - make_interval(secs => $1)",
+        float(max_age_seconds),
+    )
+    return int(result.split()[-1])
+
+
+@dataclass
+class ReflectCacheLookup:
+    """Outcome of a cache lookup; ``generation`` is the one a miss must be stored under."""
+
+    generation: int
+    result: ReflectResult | None = None
+
+
+class ReflectCache:
+    """
+    Database-backed cache of reflect answers.
+
+    Cache errors never fail the caller: if the lookup fails reflect runs as if
+    the cache were disabled, and if the write fails the answer is not cached.
+    """
+
+    def __init__(self, pool, min_similarity: float, max_age_seconds: int):
+        self._pool = pool
+        self._min_similarity = min_similarity
+        self._max_age_seconds = max_age_seconds
+
+    async def lookup(self, bank_id: str, scope_key: bytes, query_embedding: list[float]) -> ReflectCacheLookup | None:
+        """
+        Return the cached answer for a query, marked as a cache hit, if there is one.
+
+        Returns:
+            ReflectCacheLookup with the bank generation and the hit (None on a miss),
+            or None if the cache could not be read
+        """
+        try:
+            async with acquire_with_retry(self._pool) as conn:
+                generation = await fetch_bank_generation(conn, bank_id)
+                found = await lookup_answer(
+                    conn,
+                    bank_id,
+                    scope_key,
+                    generation,
+                    query_embedding,
+                    self._min_similarity,
+                    self._max_age_seconds,
+                )
+        except Exception as e:
+            logger.warning(f"Reflect cache lookup failed, running reflect: {e}")
+            return None
+
+        if found is None:
+            return ReflectCacheLookup(generation=generation)
+        cached, similarity = found
+        # based_on holds MemoryFact objects for every type except the raw directive dicts
+        based_on = {
+            fact_type: facts if fact_type == "directives" else [MemoryFact.model_validate(f) for f in facts]
+            for fact_type, facts in cached["based_on"].items()
+        }
+        # No tools or LLM calls were made to serve a hit
+        result = ReflectResult.model_validate(cached).model_copy(
+            update={
+                "based_on": based_on,
+                "usage": TokenUsage(),
+                "tool_trace": [],
+                "llm_trace": [],
+                "cache_hit": True,
+                "cache_similarity": similarity,
+            }
+        )
+        return ReflectCacheLookup(generation=generation, result=result)
+
+    async def store(
+        self,
+        bank_id: str,
+        scope_key: bytes,
+        generation: int,
+        query: str,
+        query_embedding: list[float],
+        result: ReflectResult,
+    ) -> None:
+        """Cache a computed answer under the generation read before it was computed."""
+        schema = get_current_schema()
+        now = time.monotonic()
+        last_eviction = _last_eviction.get(schema)
+        evict = last_eviction is None or now - last_eviction >= EVICTION_INTERVAL_SECONDS
+        try:
+            async with acquire_with_retry(self._pool) as conn:
+                await store_answer(
+                    conn, bank_id, scope_key, generation, query, query_embedding, result.model_dump(mode="json")
+                )
+                if evict:
+                    _last_eviction[schema] = now
+                    deleted = await evict_expired_answers(conn, self._max_age_seconds)
+                    if deleted:
+                        logger.info(
+                            f"Reflect cache: evicted {deleted} answers older than {self._max_age_seconds} seconds"
+                        )
+        except Exception as e:
+            logger.warning(f"Reflect cache write failed: {e}")
@@ -83,6 +83,7 @@ class TokenUsage(BaseModel):
                 "input_tokens": 1500,
                 "output_tokens": 500,
                 "total_tokens": 2000,
+                "cached_input_tokens": 1200,
             }
         }
     )
@@ -90,6 +91,9 @@ class TokenUsage(BaseModel):
     input_tokens: int = Field(default=0, description="Number of input/prompt tokens consumed")
     output_tokens: int = Field(default=0, description="Number of output/completion tokens generated")
     total_tokens: int = Field(default=0, description="Total tokens (input + output)")
+    cached_input_tokens: int = Field(
+        default=0, description="Input tokens served from the provider's prompt cache (included in input_tokens)"
+    )
 
     def __add__(self, other: "TokenUsage") -> "TokenUsage":
         """Allow aggregating token usage from multiple calls."""
@@ -97,6 +101,7 @@ class TokenUsage(BaseModel):
             input_tokens=self.input_tokens + other.input_tokens,
             output_tokens=self.output_tokens + other.output_tokens,
             total_tokens=self.total_tokens + other.total_tokens,
+            cached_input_tokens=self.cached_input_tokens + other.cached_input_tokens,
         )
 
 
@@ -300,6 +305,14 @@ class ReflectResult(BaseModel):
         default_factory=list,
         description="Directive mental models that were applied during this reflection.",
     )
+    cache_hit: bool = Field(
+        default=False,
+        description="Whether the answer was served from the reflect cache instead of running the agent.",
+    )
+    cache_similarity: float | None = Field(
+        default=None,
+        description="Similarity between the query and the cached query that answered it. Only present on a cache hit.",
+    )
 
 
 class EntityObservation(BaseModel):
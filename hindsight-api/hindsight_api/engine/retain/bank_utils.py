@@ -5,7 +5,7 @@ bank profile utilities for disposition and mission management.
 import json
 import logging
 import re
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
 
 from pydantic import BaseModel, Field
 
@@ -13,6 +13,9 @@ from ..db_utils import acquire_with_retry
 from ..memory_engine import fq_table
 from ..response_models import DispositionTraits
 
+if TYPE_CHECKING:
+    from ..bank_snapshot import BankSnapshotCache
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_DISPOSITION = {
@@ -36,7 +39,7 @@ class MissionMergeResponse(BaseModel):
     mission: str = Field(description="Merged mission in first person perspective")
 
 
-async def get_bank_profile(pool, bank_id: str) -> BankProfile:
+async def get_bank_profile(pool, bank_id: str, snapshots: "BankSnapshotCache | None" = None) -> BankProfile:
     """
     Get bank profile (name, disposition + mission).
     Auto-creates bank with default values if not exists.
@@ -44,10 +47,18 @@ async def get_bank_profile(pool, bank_id: str) -> BankProfile:
     Args:
         pool: Database connection pool
         bank_id: bank IDentifier
+        snapshots: Optional cache serving the profile without a query
 
     Returns:
         BankProfile with name, typed DispositionTraits, and mission
     """
+    if snapshots is not None:
+        return await snapshots.get(bank_id, "profile", lambda: _load_bank_profile(pool, bank_id))
+    return await _load_bank_profile(pool, bank_id)
+
+
+async def _load_bank_profile(pool, bank_id: str) -> BankProfile:
+    """Read the bank profile, creating the bank with default values if it does not exist."""
     async with acquire_with_retry(pool) as conn:
         # Try to get existing bank
         row = await conn.fetchrow(
@@ -86,6 +97,25 @@ async def get_bank_profile(pool, bank_id: str) -> BankProfile:
         return BankProfile(name=bank_id, disposition=DispositionTraits(**DEFAULT_DISPOSITION), mission="")
 
 
+async def bank_exists(pool, bank_id: str, snapshots: "BankSnapshotCache | None" = None) -> bool:
+    """
+    Check whether a bank exists, without creating it.
+
+    Args:
+        pool: Database connection pool (only used when the answer is not cached)
+        bank_id: bank IDentifier
+        snapshots: Optional cache serving the answer without a query
+    """
+
+    async def load() -> bool:
+        async with acquire_with_retry(pool) as conn:
+            return await conn.fetchval(f"SELECT 1 FROM {fq_table('banks')} WHERE bank_id = $1", bank_id) is not None
+
+    if snapshots is not None:
+        return await snapshots.get(bank_id, "exists", load)
+    return await load()
+
+
 async def update_bank_disposition(pool, bank_id: str, disposition: dict[str, int]) -> None:
     """
     Update bank disposition traits.
@@ -0,0 +1,171 @@
+"""
+Near-duplicate fact suppression for the retain pipeline.
+
+Conversational content yields many restatements of the same fact ("User likes
+coffee" fifty times). Before insertion, each new fact is compared with its
+nearest existing units (the same ANN neighbors used for semantic linking) and
+with the facts kept earlier in the batch. A fact above the similarity threshold
+whose type, tags, entities and dates match is not inserted; the unit it
+duplicates gets its proof_count bumped and mentioned_at advanced instead.
+Merges stay within one document (or among facts without one), so deleting a
+document never leaves its mentions counted on another document's units.
+
+Entities and dates are compared through text_signals, which holds the entity
+names and day-granularity dates of a unit.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ..memory_engine import fq_table
+from . import link_utils
+from .fact_storage import build_text_signals
+from .types import ProcessedFact
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DedupPlan:
+    """
+    Outcome of the duplicate check for a batch of facts.
+
+    targets holds one entry per fact: None when the fact is inserted, an existing
+    unit ID when it merges into that unit, or the index of an earlier fact of the
+    batch it merges into.
+    """
+
+    targets: list[str | int | None]
+    neighbors: list[list[dict]] = field(default_factory=list)
+
+    @property
+    def kept_indices(self) -> list[int]:
+        return [i for i, target in enumerate(self.targets) if target is None]
+
+    @property
+    def merged_count(self) -> int:
+        return len(self.targets) - len(self.kept_indices)
+
+    @property
+    def ratio(self) -> float:
+        """Fraction of facts merged instead of inserted."""
+        return self.merged_count / len(self.targets) if self.targets else 0.0
+
+    def resolve_unit_ids(self, inserted_unit_ids: list[str]) -> list[str]:
+        """Map every fact to the unit that holds it, given the IDs of the inserted facts."""
+        unit_ids: list[str] = [""] * len(self.targets)
+        for index, unit_id in zip(self.kept_indices, inserted_unit_ids):
+            unit_ids[index] = unit_id
+        for index, target in enumerate(self.targets):
+            if isinstance(target, str):
+                unit_ids[index] = target
+            elif isinstance(target, int):
+                unit_ids[index] = unit_ids[target]
+        return unit_ids
+
+
+def _signal_tokens(fact: ProcessedFact) -> list[str]:
+    signals = build_text_signals([e.name for e in fact.entities or []], fact.occurred_start, fact.occurred_end)
+    return sorted((signals or "").lower().split())
+
+
+def _compatible(fact: ProcessedFact, fact_type: str, tags, signal_tokens: list[str], document_id) -> bool:
+    return (
+        fact.document_id == document_id
+        and fact.fact_type == fact_type
+        and set(fact.tags or []) == set(tags or [])
+        and _signal_tokens(fact) == signal_tokens
+    )
+
+
+async def plan_deduplication(conn, bank_id: str, facts: list[ProcessedFact], threshold: float) -> DedupPlan:
+    """
+    Decide which facts are near-duplicates of existing units or of each other.
+
+    Args:
+        conn: Database connection (inside the retain transaction)
+        bank_id: Bank identifier
+        facts: Processed facts with embeddings, in batch order
+        threshold: Minimum cosine similarity for a fact to count as a duplicate
+
+    Returns:
+        DedupPlan with a merge target per fact and the ANN neighbors looked up for it
+    """
+    if not facts:
+        return DedupPlan(targets=[])
+
+    neighbors = await link_utils.find_semantic_neighbors(conn, bank_id, [fact.embedding for fact in facts])
+    embeddings = np.array([fact.embedding for fact in facts])
+    targets: list[str | int | None] = []
+    kept: list[int] = []
+
+    for i, fact in enumerate(facts):
+        target: str | int | None = None
+        for neighbor in neighbors[i]:
+            if neighbor["similarity"] >= threshold and _compatible(
+                fact,
+                neighbor["fact_type"],
+                neighbor["tags"],
+                sorted((neighbor["text_signals"] or "").lower().split()),
+                neighbor["document_id"],
+            ):
+                target = neighbor["id"]
+                break
+
+        if target is None and kept:
+            similarities = embeddings[kept] @ embeddings[i]
+            for position in np.argsort(-similarities):
+                if similarities[position] < threshold:
+                    break
+                other = facts[kept[position]]
+                if _compatible(fact, other.fact_type, other.tags, _signal_tokens(other), other.document_id):
+                    target = kept[position]
+                    break
+
+        targets.append(target)
+        if target is None:
+            kept.append(i)
+
+    return DedupPlan(targets=targets, neighbors=neighbors)
+
+
+async def record_mentions(conn, plan: DedupPlan, facts: list[ProcessedFact], unit_ids: list[str]) -> None:
+    """
+    Bump the mention metadata of the units that absorbed duplicate facts.
+
+    Args:
+        conn: Database connection (inside the retain transaction)
+        plan: Deduplication plan for the batch
+        facts: The batch's facts, in the order the plan was made for
+        unit_ids: Unit ID per fact, from DedupPlan.resolve_unit_ids
+    """
+    mentions: dict[str, tuple[int, object]] = {}
+    for index, target in enumerate(plan.targets):
+        if target is None:
+            continue
+        unit_id = unit_ids[index]
+        count, latest = mentions.get(unit_id, (0, None))
+        mentioned_at = facts[index].mentioned_at
+        if latest is None or (mentioned_at is not None and mentioned_at > latest):
+            latest = mentioned_at
+        mentions[unit_id] = (count + 1, latest)
+
+    if not mentions:
+        return
+
+    await conn.execute(
+        f"""
+        UPDATE {fq_table("memory_units")} AS u
+        SET proof_count = COALESCE(u.proof_count, 1) + m.mentions,
+            mentioned_at = GREATEST(u.mentioned_at, COALESCE(m.mentioned_at, u.mentioned_at)),
+            updated_at = now()
+        FROM unnest($1::uuid[], $2::int[], $3::timestamptz[]) AS m(id, mentions, mentioned_at)
+        WHERE u.id = m.id
+        """,
+        [uuid.UUID(unit_id) for unit_id in mentions],
+        [count for count, _ in mentions.values()],
+        [latest for _, latest in mentions.values()],
+    )
@@ -4,7 +4,10 @@ Embedding processing for retain pipeline.
 Handles augmenting fact texts with temporal information and generating embeddings.
 """
 
+import asyncio
 import logging
+import time
+from datetime import datetime
 
 from . import embedding_utils
 from .types import ExtractedFact
@@ -12,6 +15,11 @@ from .types import ExtractedFact
 logger = logging.getLogger(__name__)
 
 
+def format_readable_date(dt: datetime) -> str:
+    """Format a datetime as "Month Year" (e.g. "June 2024") for temporal matching."""
+    return f"{dt.strftime('%B')} {dt.strftime('%Y')}"
+
+
 def augment_texts_with_dates(facts: list[ExtractedFact], format_date_fn) -> list[str]:
     """
     Augment fact texts with readable dates for better temporal matching.
@@ -46,13 +54,14 @@ def augment_texts_with_dates(facts: list[ExtractedFact], format_date_fn) -> list
     return augmented_texts
 
 
-async def generate_embeddings_batch(embeddings_model, texts: list[str]) -> list[list[float]]:
+async def generate_embeddings_batch(embeddings_model, texts: list[str], cache=None) -> list[list[float]]:
     """
     Generate embeddings for a batch of texts.
 
     Args:
         embeddings_model: Embeddings model instance
         texts: List of text strings to embed
+        cache: Optional EmbeddingCache; texts embedded before are served from it
 
     Returns:
         List of embedding vectors (same length as texts)
@@ -60,6 +69,87 @@ async def generate_embeddings_batch(embeddings_model, texts: list[str]) -> list[
     if not texts:
         return []
 
+    if cache is not None:
+        return await cache.encode(embeddings_model, texts)
+
     embeddings = await embedding_utils.generate_embeddings_batch(embeddings_model, texts)
 
     return embeddings
+
+
+class StreamingEmbedder:
+    """
+    Embeds fact texts in micro-batches while fact extraction is still running.
+
+    The retain orchestrator submits augmented texts as each chunk's facts arrive.
+    A background task drains the queue in batches of up to ``micro_batch_size``
+    texts (smaller when the queue runs dry, so nothing waits for a full batch)
+    and caches the resulting vectors by text. ``embed()`` then returns vectors
+    for the final, ordered fact list, computing only the texts that were not
+    embedded during extraction.
+    """
+
+    def __init__(self, embeddings_model, micro_batch_size: int, cache=None):
+        self._embeddings_model = embeddings_model
+        self._cache = cache
+        self._micro_batch_size = max(1, micro_batch_size)
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self._vectors: dict[str, list[float]] = {}
+        self._batch_intervals: list[tuple[float, float]] = []
+        self._worker = asyncio.create_task(self._run())
+
+    @property
+    def micro_batches(self) -> int:
+        """Number of embedding batches computed so far."""
+        return len(self._batch_intervals)
+
+    @property
+    def busy_seconds(self) -> float:
+        """Total time spent computing embeddings."""
+        return sum(end - start for start, end in self._batch_intervals)
+
+    def overlap_seconds(self, until: float) -> float:
+        """Embedding time that ran before ``until`` (typically the end of extraction)."""
+        return sum(max(0.0, min(end, until) - start) for start, end in self._batch_intervals)
+
+    def submit(self, texts: list[str]) -> None:
+        """Queue texts for background embedding."""
+        for text in texts:
+            self._queue.put_nowait(text)
+
+    async def _run(self) -> None:
+        finished = False
+        while not finished:
+            batch = [await self._queue.get()]
+            while len(batch) < self._micro_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if None in batch:
+                finished = True
+                batch = batch[: batch.index(None)]
+            await self._embed_missing(batch)
+
+    async def _embed_missing(self, texts: list[str]) -> None:
+        missing = list(dict.fromkeys(text for text in texts if text not in self._vectors))
+        if not missing:
+            return
+        start = time.time()
+        vectors = await generate_embeddings_batch(self._embeddings_model, missing, self._cache)
+        self._batch_intervals.append((start, time.time()))
+        self._vectors.update(zip(missing, vectors))
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        Wait for queued micro-batches and return embeddings for ``texts``, in order.
+
+        Texts that were never submitted (or changed since) are embedded in one final batch.
+        """
+        self._queue.put_nowait(None)
+        await self._worker
+        await self._embed_missing(texts)
+        return [self._vectors[text] for text in texts]
+
+    async def aclose(self) -> None:
+        """Stop the background task without waiting for queued texts."""
+        if not self._worker.done():
+            self._worker.cancel()
+        await asyncio.gather(self._worker, return_exceptions=True)
@@ -2,7 +2,6 @@
 Embedding generation utilities for memory units.
 """
 
-import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,8 +29,9 @@ async def generate_embeddings_batch(embeddings_backend, texts: list[str]) -> lis
     """
     Generate embeddings for multiple texts using the provided embeddings backend.
 
-    Runs the embedding generation in a thread pool to avoid blocking the event loop
-    for CPU-bound operations.
+    Uses the backend's aencode(): remote providers send batches concurrently with
+    native async clients, local models run in a thread pool to avoid blocking the
+    event loop for CPU-bound operations.
 
     Args:
         embeddings_backend: Embeddings instance to use for encoding
@@ -41,12 +41,6 @@ async def generate_embeddings_batch(embeddings_backend, texts: list[str]) -> lis
         List of embeddings in same order as input texts
     """
     try:
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(
-            None,
-            embeddings_backend.encode,
-            texts,
-        )
-        return embeddings
+        return await embeddings_backend.aencode(texts)
     except Exception as e:
         raise Exception(f"Failed to generate batch embeddings: {str(e)}")
@@ -12,6 +12,47 @@ from .types import EntityLink, ProcessedFact
 logger = logging.getLogger(__name__)
 
 
+def merge_entities_per_fact(
+    facts: list[ProcessedFact], user_entities_per_content: dict[int, list[dict]] = None
+) -> list[list[dict]]:
+    """
+    Merge LLM-extracted entities with user-provided entities for each fact.
+
+    Args:
+        facts: List of ProcessedFact objects
+        user_entities_per_content: Dict mapping content_index to list of user-provided entities
+
+    Returns:
+        One list of {"text", "type"} entity dicts per fact
+    """
+    user_entities_per_content = user_entities_per_content or {}
+
+    # Convert EntityRef objects to dict format and merge with user-provided entities
+    entities_per_fact = []
+    for fact in facts:
+        # Start with LLM-extracted entities
+        llm_entities = [{"text": entity.name, "type": "CONCEPT"} for entity in (fact.entities or [])]
+
+        # Get user entities for this content (use content_index from fact)
+        user_entities = user_entities_per_content.get(fact.content_index, [])
+
+        # Merge with case-insensitive deduplication
+        seen_texts = {e["text"].lower() for e in llm_entities}
+        for user_entity in user_entities:
+            if user_entity["text"].lower() not in seen_texts:
+                llm_entities.append(
+                    {
+                        "text": user_entity["text"],
+                        "type": user_entity.get("type", "CONCEPT"),
+                    }
+                )
+                seen_texts.add(user_entity["text"].lower())
+
+        entities_per_fact.append(llm_entities)
+
+    return entities_per_fact
+
+
 async def process_entities_batch(
     entity_resolver,
     conn,
@@ -50,35 +91,12 @@ async def process_entities_batch(
     if len(unit_ids) != len(facts):
         raise ValueError(f"Mismatch between unit_ids ({len(unit_ids)}) and facts ({len(facts)})")
 
-    user_entities_per_content = user_entities_per_content or {}
-
     # Extract data for link_utils function
     fact_texts = [fact.fact_text for fact in facts]
     # Use occurred_start if available, otherwise use mentioned_at for entity timestamps
     fact_dates = [fact.occurred_start if fact.occurred_start is not None else fact.mentioned_at for fact in facts]
 
-    # Convert EntityRef objects to dict format and merge with user-provided entities
-    entities_per_fact = []
-    for fact in facts:
-        # Start with LLM-extracted entities
-        llm_entities = [{"text": entity.name, "type": "CONCEPT"} for entity in (fact.entities or [])]
-
-        # Get user entities for this content (use content_index from fact)
-        user_entities = user_entities_per_content.get(fact.content_index, [])
-
-        # Merge with case-insensitive deduplication
-        seen_texts = {e["text"].lower() for e in llm_entities}
-        for user_entity in user_entities:
-            if user_entity["text"].lower() not in seen_texts:
-                llm_entities.append(
-                    {
-                        "text": user_entity["text"],
-                        "type": user_entity.get("type", "CONCEPT"),
-                    }
-                )
-                seen_texts.add(user_entity["text"].lower())
-
-        entities_per_fact.append(llm_entities)
+    entities_per_fact = merge_entities_per_fact(facts, user_entities_per_content)
 
     # Use existing link_utils function for entity processing
     entity_links = await link_utils.extract_entities_batch_optimized(
@@ -9,12 +9,15 @@ import asyncio
 import json
 import logging
 import re
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Literal, cast
 
 from pydantic import BaseModel, ConfigDict, Field, create_model, field_validator
 
 from ...config import get_config
+from ...utils import cancel_tasks, sanitize_text
 from ..llm_wrapper import LLMConfig, OutputTooLongError
 from ..response_models import TokenUsage
 from .entity_labels import (
@@ -65,28 +68,6 @@ def _infer_temporal_date(fact_text: str, event_date: datetime | None) -> str | N
     return None
 
 
-def _sanitize_text(text: str | None) -> str | None:
-    """
-    Sanitize text by removing characters that break downstream systems.
-
-    Removes:
-    - Null bytes (\\x00): Invalid in PostgreSQL UTF-8 encoding
-    - Unicode surrogates (U+D800-U+DFFF): Invalid in UTF-8, break LLM APIs
-
-    Surrogate characters are used in UTF-16 encoding but cannot be encoded
-    in UTF-8. They can appear in Python strings from improperly decoded data
-    (e.g., from JavaScript or broken files). Null bytes commonly appear in
-    OCR output, PDF extraction, or copy-paste from binary sources.
-    """
-    if text is None:
-        return None
-    if not text:
-        return text
-    # Remove null bytes and surrogate characters
-    text = text.replace("\x00", "")
-    return re.sub(r"[\ud800-\udfff]", "", text)
-
-
 # ============================================================================
 # CONTENT TYPE DETECTION
 # ============================================================================
@@ -1303,8 +1284,8 @@ def _build_user_message(
     """Build user message for fact extraction."""
     from .orchestrator import parse_datetime_flexible
 
-    sanitized_chunk = _sanitize_text(chunk)
-    sanitized_context = _sanitize_text(context) if context else "none"
+    sanitized_chunk = sanitize_text(chunk)
+    sanitized_context = sanitize_text(context) if context else "none"
 
     if event_date is not None:
         event_date = parse_datetime_flexible(event_date)
@@ -2312,6 +2293,7 @@ async def extract_facts_from_contents_batch_api(
                 input_tokens=usage_data.get("prompt_tokens", 0),
                 output_tokens=usage_data.get("completion_tokens", 0),
                 total_tokens=usage_data.get("total_tokens", 0),
+                cached_input_tokens=(usage_data.get("prompt_tokens_details") or {}).get("cached_tokens", 0),
             )
 
     # Step 6: Convert to ExtractedFact objects with proper chunk mapping
@@ -2422,7 +2404,26 @@ async def extract_facts_from_contents(
     # Step 2: Wait for all fact extractions to complete
     all_fact_results = await asyncio.gather(*fact_extraction_tasks)
 
-    # Step 3: Flatten and convert to typed objects
+    # Step 3-5: Flatten, convert to typed objects, add offsets and label tags
+    return _flatten_content_results(contents, all_fact_results, config)
+
+
+def _flatten_content_results(
+    contents: list[RetainContent],
+    all_fact_results: list[tuple[list[Fact], list[tuple[str, int]], TokenUsage]],
+    config,
+) -> tuple[list[ExtractedFactType], list[ChunkMetadata], TokenUsage]:
+    """
+    Flatten per-content extraction results into typed, globally indexed facts and chunks.
+
+    Args:
+        contents: RetainContent objects, in the same order as all_fact_results
+        all_fact_results: Per-content (facts, [(chunk_text, fact_count)], usage) tuples
+        config: Resolved HindsightConfig for this bank
+
+    Returns:
+        Tuple of (extracted_facts, chunks_metadata, usage)
+    """
     extracted_facts: list[ExtractedFactType] = []
     chunks_metadata: list[ChunkMetadata] = []
     total_usage = TokenUsage()
@@ -2456,30 +2457,8 @@ async def extract_facts_from_contents(
                 if fact_idx_in_content < len(facts_from_llm):
                     fact_from_llm = facts_from_llm[fact_idx_in_content]
 
-                    # Convert Fact model from LLM to ExtractedFactType dataclass
-                    # mentioned_at is always the event_date (when the conversation/document occurred)
-                    extracted_fact = ExtractedFactType(
-                        fact_text=fact_from_llm.fact,
-                        fact_type=fact_from_llm.fact_type,
-                        entities=[e.text for e in (fact_from_llm.entities or [])],
-                        # occurred_start/end: from LLM only, leave None if not provided
-                        occurred_start=_parse_datetime(fact_from_llm.occurred_start)
-                        if fact_from_llm.occurred_start
-                        else None,
-                        occurred_end=_parse_datetime(fact_from_llm.occurred_end)
-                        if fact_from_llm.occurred_end
-                        else None,
-                        causal_relations=_convert_causal_relations(
-                            fact_from_llm.causal_relations or [], global_fact_idx
-                        ),
-                        content_index=content_index,
-                        chunk_index=chunk_global_idx,
-                        context=content.context,
-                        # mentioned_at: always the event_date (when the conversation/document occurred)
-                        mentioned_at=content.event_date,
-                        metadata=content.metadata,
-                        tags=content.tags,
-                        observation_scopes=content.observation_scopes,
+                    extracted_fact = _build_extracted_fact(
+                        fact_from_llm, content, content_index, chunk_global_idx, global_fact_idx
                     )
 
                     extracted_facts.append(extracted_fact)
@@ -2495,6 +2474,133 @@ async def extract_facts_from_contents(
     return extracted_facts, chunks_metadata, total_usage
 
 
+def _build_extracted_fact(
+    fact_from_llm: Fact,
+    content: RetainContent,
+    content_index: int,
+    chunk_index: int,
+    fact_idx: int,
+) -> ExtractedFactType:
+    """Convert a Fact model from the LLM into an ExtractedFactType dataclass."""
+    return ExtractedFactType(
+        fact_text=fact_from_llm.fact,
+        fact_type=fact_from_llm.fact_type,
+        entities=[e.text for e in (fact_from_llm.entities or [])],
+        # occurred_start/end: from LLM only, leave None if not provided
+        occurred_start=_parse_datetime(fact_from_llm.occurred_start) if fact_from_llm.occurred_start else None,
+        occurred_end=_parse_datetime(fact_from_llm.occurred_end) if fact_from_llm.occurred_end else None,
+        causal_relations=_convert_causal_relations(fact_from_llm.causal_relations or [], fact_idx),
+        content_index=content_index,
+        chunk_index=chunk_index,
+        context=content.context,
+        # mentioned_at: always the event_date (when the conversation/document occurred)
+        mentioned_at=content.event_date,
+        metadata=content.metadata,
+        tags=content.tags,
+        observation_scopes=content.observation_scopes,
+    )
+
+
+@dataclass
+class ChunkExtraction:
+    """Facts extracted from a single chunk, as yielded by stream_facts_from_contents()."""
+
+    content_index: int  # Index of the source content
+    chunk_index: int  # Index of the chunk within its content
+    chunk_text: str
+    facts: list[Fact]
+    usage: TokenUsage
+
+
+async def stream_facts_from_contents(
+    contents: list[RetainContent],
+    llm_config,
+    agent_name: str,
+    config,
+) -> AsyncIterator[ChunkExtraction]:
+    """
+    Extract facts from multiple content items, yielding each chunk as soon as it completes.
+
+    Chunks of all contents are extracted in parallel exactly like extract_facts_from_contents(),
+    but results are yielded in completion order so downstream stages (e.g. embeddings) can
+    start before the slowest LLM call returns. Pass the collected results to
+    assemble_chunk_extractions() to get the same output as extract_facts_from_contents().
+
+    The batch API path (config.retain_batch_enabled) is not supported here.
+
+    Args:
+        contents: List of RetainContent objects to process
+        llm_config: LLM configuration for fact extraction
+        agent_name: Name of the agent (for agent-related fact detection)
+        config: Resolved HindsightConfig for this bank
+
+    Yields:
+        ChunkExtraction for each chunk, in completion order
+    """
+
+    async def _extract_chunk(
+        content_index: int, chunk_index: int, chunk: str, total_chunks: int, item: RetainContent
+    ) -> ChunkExtraction:
+        facts, usage = await _extract_facts_with_auto_split(
+            chunk=chunk,
+            chunk_index=chunk_index,
+            total_chunks=total_chunks,
+            event_date=item.event_date,
+            context=item.context,
+            llm_config=llm_config,
+            config=config,
+            agent_name=agent_name,
+            metadata=item.metadata or None,
+        )
+        return ChunkExtraction(content_index, chunk_index, chunk, facts, usage)
+
+    tasks: list[asyncio.Task] = []
+    for content_index, item in enumerate(contents):
+        chunks = chunk_text(item.content, max_chars=config.retain_chunk_size)
+        for chunk_index, chunk in enumerate(chunks):
+            tasks.append(asyncio.create_task(_extract_chunk(content_index, chunk_index, chunk, len(chunks), item)))
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # On failure (or if the consumer stops early) don't leave LLM calls running
+        await cancel_tasks(tasks)
+
+
+def assemble_chunk_extractions(
+    contents: list[RetainContent],
+    chunk_results: list[ChunkExtraction],
+    config,
+) -> tuple[list[ExtractedFactType], list[ChunkMetadata], TokenUsage]:
+    """
+    Restore content/chunk order for streamed results and flatten them into typed facts.
+
+    Returns:
+        Tuple of (extracted_facts, chunks_metadata, usage), identical to extract_facts_from_contents()
+    """
+    all_fact_results: list[tuple[list[Fact], list[tuple[str, int]], TokenUsage]] = [
+        ([], [], TokenUsage()) for _ in contents
+    ]
+    for result in sorted(chunk_results, key=lambda r: (r.content_index, r.chunk_index)):
+        facts, chunks, usage = all_fact_results[result.content_index]
+        facts.extend(result.facts)
+        chunks.append((result.chunk_text, len(result.facts)))
+        all_fact_results[result.content_index] = (facts, chunks, usage + result.usage)
+
+    return _flatten_content_results(contents, all_fact_results, config)
+
+
+def chunk_facts_for_embedding(result: ChunkExtraction, content: RetainContent) -> list[ExtractedFactType]:
+    """
+    Convert one streamed chunk's facts to ExtractedFactType for early embedding.
+
+    Global indices and temporal offsets are not known yet, so these facts are only
+    suitable for building embedding texts, not for storage.
+    """
+    return [_build_extracted_fact(fact, content, result.content_index, result.chunk_index, 0) for fact in result.facts]
+
+
 def _parse_datetime(date_str: str):
     """Parse ISO datetime string."""
     from dateutil import parser as date_parser
@@ -0,0 +1,690 @@
+"""
+Bulk import of pre-extracted facts.
+
+Facts extracted elsewhere (another memory system, an export of this one) are
+stored without chunking or LLM extraction. Records are read as a stream and
+written in batches; each batch is one transaction that:
+
+1. COPYs the batch into temp staging tables
+2. Inserts the staged facts as memory units
+3. Upserts entities by exact (case-insensitive) name and links units to them
+4. Creates entity links and causal links with set-based INSERT ... SELECT
+5. Advances the import's checkpoint in fact_imports
+
+Because the checkpoint commits with the batch, an interrupted import is resumed
+by sending the same stream with the same import_id: records already committed
+are skipped. Unit ids are derived from (import_id, record position), which also
+lets causal relations reference records of earlier batches.
+
+Record format (one JSON object per NDJSON line, or one Parquet row):
+
+- text (required): The fact text
+- fact_type: "world" (default) or "experience"
+- context, document_id: Optional strings
+- occurred_start, occurred_end, mentioned_at: Optional ISO datetimes
+- entities: Optional list of names (or {"text": name} objects)
+- tags: Optional list of strings
+- metadata: Optional object
+- embedding: Optional vector; computed when missing
+- causal_relations: Optional list of {"target_index", "relation_type", "strength"},
+  where target_index is the 0-based position of an earlier record of the import
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from ...config import get_config
+from ...utils import sanitize_text
+from ..db_utils import acquire_with_retry
+from ..entity_resolver import bump_entity_generation
+from ..memory_engine import fq_table, get_current_schema
+from .embedding_processing import augment_texts_with_dates, format_readable_date
+from .fact_storage import build_text_signals, ensure_bank_exists
+from .orchestrator import parse_datetime_flexible
+from .types import ExtractedFact
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 5000
+IMPORT_FACT_TYPES = ("world", "experience")
+CAUSAL_LINK_TYPES = ("caused_by", "causes", "enables", "prevents")
+# Same cap as retain's entity linking: links per entity to avoid N² explosion on common entities
+MAX_LINKS_PER_ENTITY = 50
+
+# Namespace for unit ids derived from (import_id, record position)
+_UNIT_ID_NAMESPACE = uuid.UUID("6f1c0d2e-8b3a-5e47-9c1d-2a7b4e9f0c35")
+
+EmbedFn = Callable[[list[str]], Awaitable[list[list[float]]]]
+BatchHook = Callable[[list["ImportRecord"]], Awaitable[None]]
+
+
+class FactImportError(ValueError):
+    """Raised when an import record or the import itself is invalid."""
+
+
+@dataclass
+class CausalLink:
+    """Causal relation from an imported record to an earlier record of the same import."""
+
+    target_index: int
+    relation_type: str
+    strength: float
+
+
+@dataclass
+class ImportRecord:
+    """A validated fact record."""
+
+    position: int
+    text: str
+    fact_type: str
+    context: str | None
+    occurred_start: datetime | None
+    occurred_end: datetime | None
+    mentioned_at: datetime
+    document_id: str | None
+    entities: list[str]
+    tags: list[str]
+    metadata: dict
+    embedding: list[float] | None
+    causal_relations: list[CausalLink] = field(default_factory=list)
+
+
+@dataclass
+class ImportResult:
+    """Progress of an import after a call to import_facts."""
+
+    import_id: str
+    records_committed: int  # Records of the stream committed so far, including earlier runs
+    records_skipped: int  # Records skipped in this run because an earlier run committed them
+    units_imported: int  # Memory units created by this import, including earlier runs
+    completed: bool
+
+
+def unit_id_for(import_id: str, position: int) -> uuid.UUID:
+    """Deterministic memory unit id of the record at ``position`` of an import."""
+    return uuid.uuid5(_UNIT_ID_NAMESPACE, f"{import_id}:{position}")
+
+
+def _parse_date(raw: dict, key: str, position: int) -> datetime | None:
+    value = raw.get(key)
+    if value is None:
+        return None
+    try:
+        return parse_datetime_flexible(value)
+    except (TypeError, ValueError) as e:
+        raise FactImportError(f"Record {position}: invalid {key}: {e}") from e
+
+
+def _parse_list(raw: dict, key: str, position: int) -> list:
+    value = raw.get(key)
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise FactImportError(f"Record {position}: {key} must be a list")
+    return value
+
+
+def parse_import_record(raw: Any, position: int, dimension: int) -> ImportRecord:
+    """
+    Validate a raw record.
+
+    Args:
+        raw: Decoded record
+        position: 0-based position of the record in the import
+        dimension: Expected embedding dimension
+
+    Raises:
+        FactImportError: If the record is invalid
+    """
+    if not isinstance(raw, dict):
+        raise FactImportError(f"Record {position}: expected an object, got {type(raw).__name__}")
+
+    text = raw.get("text")
+    if not isinstance(text, str) or not text.strip():
+        raise FactImportError(f"Record {position}: text is required")
+
+    fact_type = raw.get("fact_type") or "world"
+    if fact_type not in IMPORT_FACT_TYPES:
+        raise FactImportError(f"Record {position}: fact_type must be one of {IMPORT_FACT_TYPES}, got {fact_type!r}")
+
+    for key in ("context", "document_id"):
+        if raw.get(key) is not None and not isinstance(raw[key], str):
+            raise FactImportError(f"Record {position}: {key} must be a string")
+
+    entities: list[str] = []
+    seen_entities: set[str] = set()
+    for entity in _parse_list(raw, "entities", position):
+        name = entity.get("text") if isinstance(entity, dict) else entity
+        if not isinstance(name, str) or not name.strip():
+            raise FactImportError(f"Record {position}: entities must be names or objects with a text field")
+        name = name.strip()
+        if name.lower() not in seen_entities:
+            seen_entities.add(name.lower())
+            entities.append(name)
+
+    tags = _parse_list(raw, "tags", position)
+    if not all(isinstance(tag, str) for tag in tags):
+        raise FactImportError(f"Record {position}: tags must be strings")
+
+    metadata = raw.get("metadata") or {}
+    if not isinstance(metadata, dict):
+        raise FactImportError(f"Record {position}: metadata must be an object")
+
+    embedding = raw.get("embedding")
+    if embedding is not None:
+        if not isinstance(embedding, list) or not all(
+            isinstance(v, (int, float)) and not isinstance(v, bool) for v in embedding
+        ):
+            raise FactImportError(f"Record {position}: embedding must be a list of numbers")
+        if len(embedding) != dimension:
+            raise FactImportError(
+                f"Record {position}: embedding has dimension {len(embedding)}, the bank's embeddings have {dimension}"
+            )
+
+    causal_relations = []
+    for relation in _parse_list(raw, "causal_relations", position):
+        if not isinstance(relation, dict):
+            raise FactImportError(f"Record {position}: causal_relations must be objects")
+        target_index = relation.get("target_index")
+        if not isinstance(target_index, int) or isinstance(target_index, bool) or not 0 <= target_index < position:
+            raise FactImportError(
+                f"Record {position}: causal target_index must be the position of an earlier record, got {target_index!r}"
+            )
+        relation_type = relation.get("relation_type") or "caused_by"
+        if relation_type not in CAUSAL_LINK_TYPES:
+            raise FactImportError(
+                f"Record {position}: relation_type must be one of {CAUSAL_LINK_TYPES}, got {relation_type!r}"
+            )
+        strength = relation.get("strength", 1.0)
+        if not isinstance(strength, (int, float)) or isinstance(strength, bool) or not 0.0 <= strength <= 1.0:
+            raise FactImportError(f"Record {position}: causal strength must be a number in [0, 1]")
+        causal_relations.append(CausalLink(target_index, relation_type, float(strength)))
+
+    return ImportRecord(
+        position=position,
+        text=sanitize_text(text),
+        fact_type=fact_type,
+        context=sanitize_text(raw.get("context")),
+        occurred_start=_parse_date(raw, "occurred_start", position),
+        occurred_end=_parse_date(raw, "occurred_end", position),
+        mentioned_at=_parse_date(raw, "mentioned_at", position) or datetime.now(UTC),
+        document_id=raw.get("document_id"),
+        entities=entities,
+        tags=tags,
+        metadata=metadata,
+        embedding=[float(v) for v in embedding] if embedding is not None else None,
+        causal_relations=causal_relations,
+    )
+
+
+async def iter_ndjson_records(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """
+    Decode NDJSON from a stream of byte chunks, one record per non-blank line.
+
+    Raises:
+        FactImportError: If a line is not valid JSON
+    """
+    buffer = bytearray()
+    position = 0
+
+    def decode(line: bytes) -> Any:
+        try:
+            return json.loads(line)
+        except ValueError as e:
+            raise FactImportError(f"Record {position}: invalid JSON: {e}") from e
+
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line = bytes(buffer[start:end])
+            start = end + 1
+            if line.strip():
+                yield decode(line)
+                position += 1
+        del buffer[:start]
+    if bytes(buffer).strip():
+        yield decode(bytes(buffer))
+
+
+async def iter_file_chunks(path: Path, chunk_size: int = 1 << 20) -> AsyncIterator[bytes]:
+    """Read a file as a stream of byte chunks without blocking the event loop."""
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
+
+
+async def iter_parquet_records(path: Path, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[dict]:
+    """
+    Read records from a Parquet file, one row group batch at a time.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow is required for Parquet imports. Install it with: pip install pyarrow")
+
+    parquet_file = pq.ParquetFile(path)
+    batches = parquet_file.iter_batches(batch_size=batch_size)
+    while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+        for row in batch.to_pylist():
+            yield row
+
+
+async def embedding_dimension(conn) -> int:
+    """Dimension of the memory_units.embedding column (pgvector keeps it in atttypmod)."""
+    return await conn.fetchval(
+        """
+        SELECT a.atttypmod
+        FROM pg_attribute a
+        JOIN pg_class c ON c.oid = a.attrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = $1 AND c.relname = 'memory_units' AND a.attname = 'embedding'
+        """,
+        get_current_schema(),
+    )
+
+
+async def _start_import(conn, import_id: str, bank_id: str):
+    await conn.execute(
+        f"""
+        INSERT INTO {fq_table("fact_imports")} (import_id, bank_id)
+        VALUES ($1, $2)
+        ON CONFLICT (import_id) DO NOTHING
+        """,
+        import_id,
+        bank_id,
+    )
+    row = await conn.fetchrow(
+        f"""
+        SELECT bank_id, records_committed, units_imported, completed_at
+        FROM {fq_table("fact_imports")}
+        WHERE import_id = $1
+        """,
+        import_id,
+    )
+    if row["bank_id"] != bank_id:
+        raise FactImportError(f"Import {import_id} belongs to bank {row['bank_id']}, not {bank_id}")
+    return row
+
+
+async def _stage_batch(conn, import_id: str, records: list[ImportRecord], embeddings: list[list[float]]) -> None:
+    """Create the temp staging tables for this transaction and COPY the batch into them."""
+    await conn.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS _import_units (
+            id uuid,
+            position bigint,
+            text text,
+            embedding text,
+            event_date timestamptz,
+            occurred_start timestamptz,
+            occurred_end timestamptz,
+            mentioned_at timestamptz,
+            context text,
+            fact_type text,
+            metadata text,
+            document_id text,
+            tags text[],
+            text_signals text
+        ) ON COMMIT DROP
+    """)
+    await conn.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS _import_mentions (
+            unit_id uuid,
+            position bigint,
+            name text,
+            event_date timestamptz
+        ) ON COMMIT DROP
+    """)
+    await conn.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS _import_causal_links (
+            from_unit_id uuid,
+            to_unit_id uuid,
+            link_type text,
+            weight float
+        ) ON COMMIT DROP
+    """)
+    await conn.execute("TRUNCATE _import_units, _import_mentions, _import_causal_links")
+
+    units = []
+    mentions = []
+    causal_links = []
+    for record, embedding in zip(records, embeddings):
+        unit_id = unit_id_for(import_id, record.position)
+        event_date = record.occurred_start or record.mentioned_at
+        units.append(
+            (
+                unit_id,
+                record.position,
+                record.text,
+                str(embedding),
+                event_date,
+                record.occurred_start,
+                record.occurred_end,
+                record.mentioned_at,
+                record.context,
+                record.fact_type,
+                json.dumps(record.metadata),
+                record.document_id,
+                record.tags,
+                build_text_signals(record.entities, record.occurred_start, record.occurred_end),
+            )
+        )
+        mentions.extend((unit_id, record.position, name, event_date) for name in record.entities)
+        causal_links.extend(
+            (unit_id, unit_id_for(import_id, relation.target_index), relation.relation_type, relation.strength)
+            for relation in record.causal_relations
+        )
+
+    await conn.copy_records_to_table(
+        "_import_units",
+        records=units,
+        columns=[
+            "id",
+            "position",
+            "text",
+            "embedding",
+            "event_date",
+            "occurred_start",
+            "occurred_end",
+            "mentioned_at",
+            "context",
+            "fact_type",
+            "metadata",
+            "document_id",
+            "tags",
+            "text_signals",
+        ],
+    )
+    if mentions:
+        await conn.copy_records_to_table(
+            "_import_mentions", records=mentions, columns=["unit_id", "position", "name", "event_date"]
+        )
+    if causal_links:
+        await conn.copy_records_to_table(
+            "_import_causal_links",
+            records=causal_links,
+            columns=["from_unit_id", "to_unit_id", "link_type", "weight"],
+        )
+
+
+async def _insert_staged_units(conn, bank_id: str) -> int:
+    await conn.execute(
+        f"""
+        INSERT INTO {fq_table("documents")} (id, bank_id)
+        SELECT DISTINCT document_id, $1 FROM _import_units WHERE document_id IS NOT NULL
+        ON CONFLICT (id, bank_id) DO NOTHING
+        """,
+        bank_id,
+    )
+
+    columns = """bank_id, id, text, embedding, event_date, occurred_start, occurred_end, mentioned_at,
+                 context, fact_type, metadata, document_id, tags, text_signals"""
+    values = """$1, id, text, embedding::vector, event_date, occurred_start, occurred_end, mentioned_at,
+                context, fact_type, metadata::jsonb, document_id, tags::varchar[], text_signals"""
+    if get_config().text_search_extension == "vchord":
+        # VectorChord: search_vector is not generated, tokenize like insert_facts_batch does
+        columns += ", search_vector"
+        values += """, tokenize(
+                    COALESCE(text, '') || ' ' || COALESCE(context, '') || ' ' || COALESCE(text_signals, ''),
+                    'llmlingua2'
+                )::bm25_catalog.bm25vector"""
+    result = await conn.execute(
+        f"""
+        INSERT INTO {fq_table("memory_units")} ({columns})
+        SELECT {values}
+        FROM _import_units
+        ORDER BY position
+        """,
+        bank_id,
+    )
+    return int(result.split()[-1])
+
+
+async def _link_staged_entities(conn, bank_id: str) -> None:
+    # Aggregate mentions per name (the first spelling becomes the canonical name);
+    # ordered by name so concurrent imports lock rows in the same order
+    await conn.execute(
+        f"""
+        INSERT INTO {fq_table("entities")} (bank_id, canonical_name, first_seen, last_seen, mention_count)
+        SELECT $1, (ARRAY_AGG(name ORDER BY position))[1], MIN(event_date), MAX(event_date), COUNT(*)
+        FROM _import_mentions
+        GROUP BY LOWER(name)
+        ORDER BY LOWER(name)
+        ON CONFLICT (bank_id, LOWER(canonical_name))
+        DO UPDATE SET
+            mention_count = {fq_table("entities")}.mention_count + EXCLUDED.mention_count,
+            first_seen    = LEAST({fq_table("entities")}.first_seen, EXCLUDED.first_seen),
+            last_seen     = GREATEST({fq_table("entities")}.last_seen, EXCLUDED.last_seen)
+        """,
+        bank_id,
+    )
+    await conn.execute(
+        f"""
+        INSERT INTO {fq_table("unit_entities")} (unit_id, entity_id)
+        SELECT m.unit_id, e.id
+        FROM _import_mentions m
+        JOIN {fq_table("entities")} e ON e.bank_id = $1 AND LOWER(e.canonical_name) = LOWER(m.name)
+        ON CONFLICT DO NOTHING
+        """,
+        bank_id,
+    )
+    await conn.execute(
+        f"""
+        INSERT INTO {fq_table("entity_cooccurrences")} (entity_id_1, entity_id_2, cooccurrence_count, last_cooccurred)
+        SELECT a.entity_id, b.entity_id, COUNT(*), NOW()
+        FROM _import_units u
+        JOIN {fq_table("unit_entities")} a ON a.unit_id = u.id
+        JOIN {fq_table("unit_entities")} b ON b.unit_id = u.id AND a.entity_id < b.entity_id
+        GROUP BY a.entity_id, b.entity_id
+        ORDER BY a.entity_id, b.entity_id
+        ON CONFLICT (entity_id_1, entity_id_2)
+        DO UPDATE SET
+            cooccurrence_count = {fq_table("entity_cooccurrences")}.cooccurrence_count + EXCLUDED.cooccurrence_count,
+            last_cooccurred    = GREATEST({fq_table("entity_cooccurrences")}.last_cooccurred, EXCLUDED.last_cooccurred)
+        """
+    )
+
+    # Entity links, as in retain: the batch's units that share an entity are linked to each
+    # other and to existing units with that entity, at most MAX_LINKS_PER_ENTITY per side.
+    await conn.execute(
+        f"""
+        WITH batch AS (
+            SELECT ue.entity_id, ue.unit_id, u.position
+            FROM _import_units u
+            JOIN {fq_table("unit_entities")} ue ON ue.unit_id = u.id
+        ),
+        batch_limited AS (
+            SELECT entity_id, unit_id
+            FROM (
+                SELECT entity_id, unit_id,
+                       ROW_NUMBER() OVER (PARTITION BY entity_id ORDER BY position DESC) AS rn
+                FROM batch
+            ) ranked
+            WHERE rn <= $1
+        ),
+        existing AS (
+            SELECT e.entity_id, x.unit_id
+            FROM (SELECT DISTINCT entity_id FROM batch) e
+            CROSS JOIN LATERAL (
+                SELECT ue.unit_id
+                FROM {fq_table("unit_entities")} ue
+                WHERE ue.entity_id = e.entity_id
+                  AND NOT EXISTS (SELECT 1 FROM _import_units u WHERE u.id = ue.unit_id)
+                LIMIT $1
+            ) x
+        ),
+        pairs AS (
+            SELECT a.unit_id AS unit_1, b.unit_id AS unit_2, a.entity_id
+            FROM batch_limited a
+            JOIN batch_limited b ON b.entity_id = a.entity_id AND a.unit_id < b.unit_id
+            UNION ALL
+            SELECT n.unit_id, x.unit_id, n.entity_id
+            FROM batch n
+            JOIN existing x ON x.entity_id = n.entity_id
+        )
+        INSERT INTO {fq_table("memory_links")} (from_unit_id, to_unit_id, link_type, weight, entity_id)
+        SELECT unit_1, unit_2, 'entity', 1.0, entity_id FROM pairs
+        UNION ALL
+        SELECT unit_2, unit_1, 'entity', 1.0, entity_id FROM pairs
+        ON CONFLICT (from_unit_id, to_unit_id, link_type, COALESCE(entity_id, '00000000-0000-0000-0000-000000000000'::uuid)) DO NOTHING
+        """,
+        MAX_LINKS_PER_ENTITY,
+    )
+
+
+async def _import_batch(
+    conn,
+    bank_id: str,
+    import_id: str,
+    records: list[ImportRecord],
+    embeddings: list[list[float]],
+    records_committed: int,
+) -> int:
+    """Write one batch and advance the checkpoint. Must run inside a transaction."""
+    await _stage_batch(conn, import_id, records, embeddings)
+    units = await _insert_staged_units(conn, bank_id)
+
+    if any(record.entities for record in records):
+        await _link_staged_entities(conn, bank_id)
+        # Entities changed outside the resolver: make every worker reload its entity index
+        await bump_entity_generation(conn, bank_id)
+
+    if any(record.causal_relations for record in records):
+        await conn.execute(
+            f"""
+            INSERT INTO {fq_table("memory_links")} (from_unit_id, to_unit_id, link_type, weight, entity_id)
+            SELECT from_unit_id, to_unit_id, link_type, weight, NULL
+            FROM _import_causal_links
+            ON CONFLICT (from_unit_id, to_unit_id, link_type, COALESCE(entity_id, '00000000-0000-0000-0000-000000000000'::uuid)) DO NOTHING
+            """
+        )
+
+    await conn.execute(
+        f"""
+        UPDATE {fq_table("fact_imports")}
+        SET records_committed = $2, units_imported = units_imported + $3, updated_at = NOW()
+        WHERE import_id = $1
+        """,
+        import_id,
+        records_committed,
+        units,
+    )
+    return units
+
+
+def _embedding_texts(records: list[ImportRecord]) -> list[str]:
+    """Texts to embed for records without an embedding, augmented with dates and entities like retain does."""
+    facts = [
+        ExtractedFact(
+            fact_text=record.text,
+            fact_type=record.fact_type,
+            entities=record.entities,
+            occurred_start=record.occurred_start,
+            occurred_end=record.occurred_end,
+            mentioned_at=record.mentioned_at,
+        )
+        for record in records
+    ]
+    return augment_texts_with_dates(facts, format_readable_date)
+
+
+async def import_facts(
+    pool,
+    bank_id: str,
+    records: AsyncIterable[Any],
+    *,
+    import_id: str,
+    embed: EmbedFn,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    validate_batch: BatchHook | None = None,
+    on_batch_committed: BatchHook | None = None,
+) -> ImportResult:
+    """
+    Import a stream of pre-extracted fact records into a bank.
+
+    Args:
+        pool: Database connection pool
+        bank_id: Bank identifier
+        records: Decoded records (see the module docstring for the format)
+        import_id: Identifier of the import; reuse it to resume an interrupted import
+        embed: Embeds texts of records that have no embedding
+        batch_size: Records per transaction
+        validate_batch: Called with each batch before it is written; raising aborts the import
+        on_batch_committed: Called with each batch once its transaction committed
+
+    Returns:
+        ImportResult with the import's progress
+
+    Raises:
+        FactImportError: If a record is invalid. Batches before it stay committed,
+            so the import can be resumed once the record is fixed.
+    """
+    start_time = time.time()
+    async with acquire_with_retry(pool) as conn:
+        await ensure_bank_exists(conn, bank_id)
+        checkpoint = await _start_import(conn, import_id, bank_id)
+        dimension = await embedding_dimension(conn)
+
+    resume_from = checkpoint["records_committed"]
+    units_imported = checkpoint["units_imported"]
+    if checkpoint["completed_at"] is not None:
+        return ImportResult(import_id, resume_from, resume_from, units_imported, completed=True)
+
+    position = 0
+    batch: list[ImportRecord] = []
+
+    async def flush() -> None:
+        nonlocal units_imported
+        if validate_batch is not None:
+            await validate_batch(batch)
+        missing = [i for i, record in enumerate(batch) if record.embedding is None]
+        computed = await embed(_embedding_texts([batch[i] for i in missing])) if missing else []
+        embeddings = [record.embedding for record in batch]
+        for i, embedding in zip(missing, computed):
+            embeddings[i] = embedding
+        async with acquire_with_retry(pool) as conn:
+            async with conn.transaction():
+                units_imported += await _import_batch(conn, bank_id, import_id, batch, embeddings, position)
+        if on_batch_committed is not None:
+            await on_batch_committed(batch)
+        batch.clear()
+
+    async for raw in records:
+        if position >= resume_from:
+            batch.append(parse_import_record(raw, position, dimension))
+        position += 1
+        if len(batch) >= batch_size:
+            await flush()
+    if batch:
+        await flush()
+
+    async with acquire_with_retry(pool) as conn:
+        await conn.execute(
+            f"""
+            UPDATE {fq_table("fact_imports")}
+            SET records_committed = GREATEST(records_committed, $2), completed_at = NOW(), updated_at = NOW()
+            WHERE import_id = $1
+            """,
+            import_id,
+            position,
+        )
+
+    skipped = min(resume_from, position)
+    elapsed = time.time() - start_time
+    logger.info(
+        f"Imported {position - skipped} facts into bank {bank_id} (import {import_id}, "
+        f"{skipped} already committed) in {elapsed:.3f}s"
+    )
+    return ImportResult(import_id, max(position, resume_from), skipped, units_imported, completed=True)
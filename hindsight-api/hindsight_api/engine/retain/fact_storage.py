@@ -6,15 +6,33 @@ Handles insertion of facts into the database.
 
 import json
 import logging
+from datetime import datetime
 
 from ...config import get_config
+from ...utils import sanitize_text
 from ..memory_engine import fq_table
-from .fact_extraction import _sanitize_text
 from .types import ProcessedFact
 
 logger = logging.getLogger(__name__)
 
 
+def build_text_signals(
+    entity_names: list[str], occurred_start: datetime | None, occurred_end: datetime | None
+) -> str | None:
+    """
+    Build text_signals for a fact: entity names + date tokens for enriched BM25 indexing.
+
+    Returns:
+        Space-separated signals, or None if there are none
+    """
+    signal_parts = list(entity_names)
+    if occurred_start:
+        signal_parts.append(occurred_start.strftime("%B %-d %Y"))
+    if occurred_end and occurred_end != occurred_start:
+        signal_parts.append(occurred_end.strftime("%B %-d %Y"))
+    return " ".join(signal_parts) if signal_parts else None
+
+
 async def insert_facts_batch(
     conn, bank_id: str, facts: list[ProcessedFact], document_id: str | None = None
 ) -> list[str]:
@@ -51,7 +69,7 @@ async def insert_facts_batch(
     text_signals_list = []
 
     for fact in facts:
-        fact_texts.append(_sanitize_text(fact.fact_text))
+        fact_texts.append(sanitize_text(fact.fact_text))
         # Convert embedding to string for asyncpg vector type
         embeddings.append(str(fact.embedding))
         # event_date: Use occurred_start if available, otherwise use mentioned_at
@@ -60,7 +78,7 @@ async def insert_facts_batch(
         occurred_starts.append(fact.occurred_start)
         occurred_ends.append(fact.occurred_end)
         mentioned_ats.append(fact.mentioned_at)
-        contexts.append(_sanitize_text(fact.context))
+        contexts.append(sanitize_text(fact.context))
         fact_types.append(fact.fact_type)
         # confidence_score is only for opinion facts
         confidence_scores.append(1.0 if fact.fact_type == "opinion" else None)
@@ -74,15 +92,9 @@ async def insert_facts_batch(
         observation_scopes_list.append(
             json.dumps(fact.observation_scopes) if fact.observation_scopes is not None else None
         )
-        # Build text_signals: entity names + date tokens for enriched BM25 indexing
-        signal_parts = []
-        if fact.entities:
-            signal_parts.extend(e.name for e in fact.entities)
-        if fact.occurred_start:
-            signal_parts.append(fact.occurred_start.strftime("%B %-d %Y"))
-        if fact.occurred_end and fact.occurred_end != fact.occurred_start:
-            signal_parts.append(fact.occurred_end.strftime("%B %-d %Y"))
-        text_signals_list.append(" ".join(signal_parts) if signal_parts else None)
+        text_signals_list.append(
+            build_text_signals([e.name for e in fact.entities or []], fact.occurred_start, fact.occurred_end)
+        )
 
     # Batch insert all facts
     # Note: tags are passed as JSON strings and converted back to varchar[] via jsonb_array_elements_text + array_agg
@@ -220,15 +232,20 @@ async def handle_document_tracking(
     import hashlib
 
     # Sanitize and calculate content hash
-    combined_content = _sanitize_text(combined_content) or ""
+    combined_content = sanitize_text(combined_content) or ""
     content_hash = hashlib.sha256(combined_content.encode()).hexdigest()
 
     # Always delete old document first if it exists (cascades to units and links)
     # Only delete on the first batch to avoid deleting data we just inserted
     if is_first_batch:
-        await conn.fetchval(
+        replaced = await conn.fetchval(
             f"DELETE FROM {fq_table('documents')} WHERE id = $1 AND bank_id = $2 RETURNING id", document_id, bank_id
         )
+        if replaced:
+            from ..entity_resolver import bump_entity_generation
+
+            # The cascade removed entity links of the old units: make every worker reload its entity index
+            await bump_entity_generation(conn, bank_id)
 
     # Insert document (or update if exists from concurrent operations)
     await conn.execute(
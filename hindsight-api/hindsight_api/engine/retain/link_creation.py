@@ -32,7 +32,13 @@ async def create_temporal_links_batch(conn, bank_id: str, unit_ids: list[str]) -
     return await link_utils.create_temporal_links_batch_per_fact(conn, bank_id, unit_ids, log_buffer=[])
 
 
-async def create_semantic_links_batch(conn, bank_id: str, unit_ids: list[str], embeddings: list[list[float]]) -> int:
+async def create_semantic_links_batch(
+    conn,
+    bank_id: str,
+    unit_ids: list[str],
+    embeddings: list[list[float]],
+    neighbors: list[list[dict]] | None = None,
+) -> int:
     """
     Create semantic links between facts.
 
@@ -43,6 +49,7 @@ async def create_semantic_links_batch(conn, bank_id: str, unit_ids: list[str], e
         bank_id: Bank identifier
         unit_ids: List of unit IDs to create links for
         embeddings: List of embedding vectors (same length as unit_ids)
+        neighbors: Existing-unit neighbors per unit, if already looked up
 
     Returns:
         Number of semantic links created
@@ -53,7 +60,9 @@ async def create_semantic_links_batch(conn, bank_id: str, unit_ids: list[str], e
     if len(unit_ids) != len(embeddings):
         raise ValueError(f"Mismatch between unit_ids ({len(unit_ids)}) and embeddings ({len(embeddings)})")
 
-    return await link_utils.create_semantic_links_batch(conn, bank_id, unit_ids, embeddings, log_buffer=[])
+    return await link_utils.create_semantic_links_batch(
+        conn, bank_id, unit_ids, embeddings, log_buffer=[], neighbors=neighbors
+    )
 
 
 async def create_causal_links_batch(conn, unit_ids: list[str], facts: list[ProcessedFact]) -> int:
@@ -518,6 +518,52 @@ async def create_temporal_links_batch_per_fact(
         raise
 
 
+async def find_semantic_neighbors(
+    conn,
+    bank_id: str,
+    embeddings: list[list[float]],
+    exclude_unit_ids: list[str] | None = None,
+    top_k: int = 5,
+) -> list[list[dict]]:
+    """
+    Find the nearest existing units for each embedding with pgvector ANN search.
+
+    Args:
+        conn: Database connection
+        bank_id: Bank identifier
+        embeddings: Embedding vectors to search for
+        exclude_unit_ids: Units to leave out of the results (e.g. the units being linked)
+        top_k: Number of neighbors per embedding
+
+    Returns:
+        One list per embedding of neighbor dicts with id, similarity (clamped to [0, 1]),
+        fact_type, tags, text_signals, document_id, occurred_start and occurred_end
+    """
+    exclude_uuids = [UUID(uid) if isinstance(uid, str) else uid for uid in exclude_unit_ids or []]
+    neighbors = []
+    for embedding in embeddings:
+        emb_str = str(list(embedding) if not isinstance(embedding, list) else embedding)
+        rows = await conn.fetch(
+            f"""
+            SELECT id::text,
+                   1 - (embedding <=> $1::vector) AS similarity,
+                   fact_type, tags, text_signals, document_id, occurred_start, occurred_end
+            FROM {fq_table("memory_units")}
+            WHERE bank_id = $2
+              AND embedding IS NOT NULL
+              AND id != ALL($3::uuid[])
+            ORDER BY embedding <=> $1::vector
+            LIMIT $4
+            """,
+            emb_str,
+            bank_id,
+            exclude_uuids,
+            top_k,
+        )
+        neighbors.append([{**dict(row), "similarity": float(min(1.0, max(0.0, row["similarity"])))} for row in rows])
+    return neighbors
+
+
 async def create_semantic_links_batch(
     conn,
     bank_id: str,
@@ -526,6 +572,7 @@ async def create_semantic_links_batch(
     top_k: int = 5,
     threshold: float = 0.7,
     log_buffer: list[str] = None,
+    neighbors: list[list[dict]] | None = None,
 ) -> int:
     """
     Create semantic links for multiple units efficiently.
@@ -540,6 +587,8 @@ async def create_semantic_links_batch(
         top_k: Number of top similar units to link
         threshold: Minimum similarity threshold
         log_buffer: Optional buffer for logging
+        neighbors: Existing-unit neighbors per unit from find_semantic_neighbors,
+            when already looked up before the units were inserted
 
     Returns:
         Number of semantic links created
@@ -559,33 +608,13 @@ async def create_semantic_links_batch(
         ann_start = time_mod.time()
         all_links = []
 
-        # Build UUID exclude list once for all ANN queries
-        import uuid as uuid_mod
-
-        exclude_uuids = [uuid_mod.UUID(uid) if isinstance(uid, str) else uid for uid in unit_ids]
+        if neighbors is None:
+            neighbors = await find_semantic_neighbors(conn, bank_id, embeddings, unit_ids, top_k)
 
-        for unit_id, new_embedding in zip(unit_ids, embeddings):
-            emb_str = str(list(new_embedding) if not isinstance(new_embedding, list) else new_embedding)
-            rows = await conn.fetch(
-                f"""
-                SELECT id::text,
-                       1 - (embedding <=> $1::vector) AS similarity
-                FROM {fq_table("memory_units")}
-                WHERE bank_id = $2
-                  AND embedding IS NOT NULL
-                  AND id != ALL($3::uuid[])
-                ORDER BY embedding <=> $1::vector
-                LIMIT $4
-                """,
-                emb_str,
-                bank_id,
-                exclude_uuids,
-                top_k,
-            )
-            for row in rows:
-                sim = float(min(1.0, max(0.0, row["similarity"])))
-                if sim >= threshold:
-                    all_links.append((unit_id, str(row["id"]), "semantic", sim, None))
+        for unit_id, unit_neighbors in zip(unit_ids, neighbors):
+            for neighbor in unit_neighbors[:top_k]:
+                if neighbor["similarity"] >= threshold:
+                    all_links.append((unit_id, neighbor["id"], "semantic", neighbor["similarity"], None))
 
         _log(
             log_buffer,
@@ -55,14 +55,21 @@ def parse_datetime_flexible(value: Any) -> datetime:
 
 import asyncpg
 
+from ...metrics import get_metrics_collector
+from ..bank_snapshot import BankSnapshotCache
+from ..embedding_cache import EmbeddingCache
+from ..memory_engine import get_current_schema
 from ..response_models import TokenUsage
+from ..task_backend import TaskBackend
 from . import (
     chunk_storage,
+    deduplication,
     embedding_processing,
     entity_processing,
     fact_extraction,
     fact_storage,
     link_creation,
+    staged_linking,
 )
 from .types import EntityLink, ExtractedFact, ProcessedFact, RetainContent, RetainContentDict
 
@@ -86,6 +93,8 @@ async def retain_batch(
     operation_id: str | None = None,
     schema: str | None = None,
     outbox_callback: Callable[["asyncpg.Connection"], Awaitable[None]] | None = None,
+    bank_snapshots: BankSnapshotCache | None = None,
+    task_backend: TaskBackend | None = None,
 ) -> tuple[list[list[str]], TokenUsage]:
     """
     Process a batch of content through the retain pipeline.
@@ -104,6 +113,9 @@ async def retain_batch(
         fact_type_override: Override fact type for all facts
         confidence_score: Confidence score for opinions
         document_tags: Tags applied to all items in this batch
+        bank_snapshots: Optional cache serving the bank profile without a query
+        task_backend: Task backend that runs the recovery task of a staged commit whose
+            inline linking pass left units unlinked
 
     Returns:
         Tuple of (unit ID lists, token usage for fact extraction)
@@ -119,7 +131,7 @@ async def retain_batch(
     log_buffer.append(f"{'=' * 60}")
 
     # Get bank profile
-    profile = await bank_utils.get_bank_profile(pool, bank_id)
+    profile = await bank_utils.get_bank_profile(pool, bank_id, bank_snapshots)
     agent_name = profile["name"]
 
     # Convert dicts to RetainContent objects
@@ -153,14 +165,43 @@ async def retain_batch(
     # Step 1: Extract facts from all contents
     step_start = time.time()
 
-    extracted_facts, chunks, usage = await fact_extraction.extract_facts_from_contents(
-        contents, llm_config, agent_name, config, pool, operation_id, schema
-    )
+    embedding_cache = None
+    if getattr(config, "embeddings_cache_enabled", False):
+        embedding_cache = EmbeddingCache(pool, config.embeddings_cache_max_age_days, get_current_schema())
+
+    embedder = None
+    micro_batch_size = config.retain_embedding_micro_batch_size
+    if config.retain_batch_enabled or micro_batch_size <= 0:
+        extracted_facts, chunks, usage = await fact_extraction.extract_facts_from_contents(
+            contents, llm_config, agent_name, config, pool, operation_id, schema
+        )
+    else:
+        # Stream per-chunk results into the embedding stage so most embeddings are
+        # already computed by the time the slowest extraction call returns
+        embedder = embedding_processing.StreamingEmbedder(embeddings_model, micro_batch_size, embedding_cache)
+        chunk_results = []
+        try:
+            async for chunk_result in fact_extraction.stream_facts_from_contents(
+                contents, llm_config, agent_name, config
+            ):
+                chunk_results.append(chunk_result)
+                preview_facts = fact_extraction.chunk_facts_for_embedding(
+                    chunk_result, contents[chunk_result.content_index]
+                )
+                embedder.submit(embedding_processing.augment_texts_with_dates(preview_facts, format_date_fn))
+        except BaseException:
+            await embedder.aclose()
+            raise
+        extracted_facts, chunks, usage = fact_extraction.assemble_chunk_extractions(contents, chunk_results, config)
+    extraction_end = time.time()
     log_buffer.append(
-        f"[1] Extract facts: {len(extracted_facts)} facts, {len(chunks)} chunks from {len(contents)} contents in {time.time() - step_start:.3f}s"
+        f"[1] Extract facts: {len(extracted_facts)} facts, {len(chunks)} chunks from {len(contents)} contents in {extraction_end - step_start:.3f}s"
     )
 
     if not extracted_facts:
+        if embedder is not None:
+            await embedder.aclose()
+
         # Still need to create document if document_id was provided or chunks exist
         from collections import defaultdict
 
@@ -261,8 +302,24 @@ async def retain_batch(
     # Step 2: Augment texts and generate embeddings
     step_start = time.time()
     augmented_texts = embedding_processing.augment_texts_with_dates(extracted_facts, format_date_fn)
-    embeddings = await embedding_processing.generate_embeddings_batch(embeddings_model, augmented_texts)
-    log_buffer.append(f"[2] Generate embeddings: {len(embeddings)} embeddings in {time.time() - step_start:.3f}s")
+    if embedder is not None:
+        # Collects the streamed micro-batches; only texts not embedded during extraction are computed here
+        embeddings = await embedder.embed(augmented_texts)
+        embedding_tail = time.time() - step_start
+        overlap = embedder.overlap_seconds(extraction_end)
+        busy = embedder.busy_seconds
+        overlap_ratio = overlap / busy if busy > 0 else 0.0
+        log_buffer.append(
+            f"[2] Generate embeddings: {len(embeddings)} embeddings in {embedder.micro_batches} micro-batches, "
+            f"{overlap:.3f}s of {busy:.3f}s overlapped with extraction ({overlap_ratio:.0%}), "
+            f"{embedding_tail:.3f}s after extraction"
+        )
+        get_metrics_collector().record_retain_stage_overlap(bank_id, overlap_ratio, embedding_tail)
+    else:
+        embeddings = await embedding_processing.generate_embeddings_batch(
+            embeddings_model, augmented_texts, embedding_cache
+        )
+        log_buffer.append(f"[2] Generate embeddings: {len(embeddings)} embeddings in {time.time() - step_start:.3f}s")
 
     # Step 3: Convert to ProcessedFact objects (without chunk_ids yet)
     processed_facts = [
@@ -282,7 +339,13 @@ async def retain_batch(
         contents_by_doc[doc_id].append((idx, content_dict))
 
     # Step 4: Database transaction
+    # In staged mode only documents, chunks, units and causal links are written here;
+    # entity/temporal/semantic links follow in short transactions after commit.
+    staged = config.retain_staged_commit
+    link_batch_id = uuid.uuid4() if staged else None
+    txn_requested = time.time()
     async with acquire_with_retry(pool) as conn:
+        txn_started = time.time()
         async with conn.transaction():
             # Handle document tracking for all documents
             step_start = time.time()
@@ -435,80 +498,148 @@ async def retain_batch(
                         actual_doc_id = document_id
                     processed_fact.document_id = actual_doc_id
 
+            # Merge near-duplicates into the units they repeat instead of inserting them
+            dedup_plan = None
+            semantic_neighbors = None
             non_duplicate_facts = processed_facts
+            if config.retain_dedup_enabled:
+                step_start = time.time()
+                dedup_plan = await deduplication.plan_deduplication(
+                    conn, bank_id, processed_facts, config.retain_dedup_similarity
+                )
+                non_duplicate_facts = [processed_facts[i] for i in dedup_plan.kept_indices]
+                semantic_neighbors = [dedup_plan.neighbors[i] for i in dedup_plan.kept_indices]
+                log_buffer.append(
+                    f"[4] Deduplicate: {dedup_plan.merged_count}/{len(processed_facts)} facts merged "
+                    f"({dedup_plan.ratio:.1%}) in {time.time() - step_start:.3f}s"
+                )
+                get_metrics_collector().record_retain_dedup(bank_id, len(processed_facts), dedup_plan.merged_count)
 
             # Insert facts (document_id is now stored per-fact)
             step_start = time.time()
             unit_ids = await fact_storage.insert_facts_batch(conn, bank_id, non_duplicate_facts)
             log_buffer.append(f"[5] Insert facts: {len(unit_ids)} units in {time.time() - step_start:.3f}s")
+            # Every fact, merged or not, resolves to the unit that holds it
+            fact_unit_ids = unit_ids
+            if dedup_plan is not None:
+                fact_unit_ids = dedup_plan.resolve_unit_ids(unit_ids)
+                await deduplication.record_mentions(conn, dedup_plan, processed_facts, fact_unit_ids)
 
-            # Process entities
-            step_start = time.time()
             # Build map of content_index -> user entities for merging
             user_entities_per_content = {
                 idx: content.entities for idx, content in enumerate(contents) if content.entities
             }
-            entity_links = await entity_processing.process_entities_batch(
-                entity_resolver,
-                conn,
-                bank_id,
-                unit_ids,
-                non_duplicate_facts,
-                log_buffer,
-                user_entities_per_content=user_entities_per_content,
-                entity_labels=getattr(config, "entity_labels", None),
-            )
-            log_buffer.append(f"[6] Process entities: {len(entity_links)} links in {time.time() - step_start:.3f}s")
-
-            # Create temporal links
-            step_start = time.time()
-            temporal_link_count = await link_creation.create_temporal_links_batch(conn, bank_id, unit_ids)
-            log_buffer.append(f"[7] Temporal links: {temporal_link_count} links in {time.time() - step_start:.3f}s")
-
-            # Create semantic links
-            step_start = time.time()
-            embeddings_for_links = [fact.embedding for fact in non_duplicate_facts]
-            semantic_link_count = await link_creation.create_semantic_links_batch(
-                conn, bank_id, unit_ids, embeddings_for_links
-            )
-            log_buffer.append(f"[8] Semantic links: {semantic_link_count} links in {time.time() - step_start:.3f}s")
+            if staged:
+                step_start = time.time()
+                await staged_linking.stage_pending_links(
+                    conn,
+                    bank_id,
+                    link_batch_id,
+                    unit_ids,
+                    entity_processing.merge_entities_per_fact(non_duplicate_facts, user_entities_per_content),
+                    entity_labels=getattr(config, "entity_labels", None),
+                )
+                log_buffer.append(f"[6] Stage links: {len(unit_ids)} pending units in {time.time() - step_start:.3f}s")
+            else:
+                # Process entities
+                step_start = time.time()
+                entity_links = await entity_processing.process_entities_batch(
+                    entity_resolver,
+                    conn,
+                    bank_id,
+                    unit_ids,
+                    non_duplicate_facts,
+                    log_buffer,
+                    user_entities_per_content=user_entities_per_content,
+                    entity_labels=getattr(config, "entity_labels", None),
+                )
+                log_buffer.append(f"[6] Process entities: {len(entity_links)} links in {time.time() - step_start:.3f}s")
+
+                # Create temporal links
+                step_start = time.time()
+                temporal_link_count = await link_creation.create_temporal_links_batch(conn, bank_id, unit_ids)
+                log_buffer.append(f"[7] Temporal links: {temporal_link_count} links in {time.time() - step_start:.3f}s")
+
+                # Create semantic links
+                step_start = time.time()
+                embeddings_for_links = [fact.embedding for fact in non_duplicate_facts]
+                semantic_link_count = await link_creation.create_semantic_links_batch(
+                    conn, bank_id, unit_ids, embeddings_for_links, neighbors=semantic_neighbors
+                )
+                log_buffer.append(f"[8] Semantic links: {semantic_link_count} links in {time.time() - step_start:.3f}s")
 
-            # Insert entity links
-            step_start = time.time()
-            if entity_links:
-                await entity_processing.insert_entity_links_batch(conn, entity_links)
-            log_buffer.append(
-                f"[9] Entity links: {len(entity_links) if entity_links else 0} links in {time.time() - step_start:.3f}s"
-            )
+                # Insert entity links
+                step_start = time.time()
+                if entity_links:
+                    await entity_processing.insert_entity_links_batch(conn, entity_links)
+                log_buffer.append(
+                    f"[9] Entity links: {len(entity_links) if entity_links else 0} links in {time.time() - step_start:.3f}s"
+                )
 
             # Create causal links
             step_start = time.time()
-            causal_link_count = await link_creation.create_causal_links_batch(conn, unit_ids, non_duplicate_facts)
+            causal_link_count = await link_creation.create_causal_links_batch(conn, fact_unit_ids, processed_facts)
             log_buffer.append(f"[10] Causal links: {causal_link_count} links in {time.time() - step_start:.3f}s")
 
             # Map results back to original content items
-            result_unit_ids = _map_results_to_contents(contents, extracted_facts, unit_ids)
+            result_unit_ids = _map_results_to_contents(contents, extracted_facts, fact_unit_ids)
 
             # Transactional outbox: queue any side-effect tasks (e.g. webhook deliveries)
             # inside the same transaction so they are atomically committed with the retain data.
             if outbox_callback:
                 await outbox_callback(conn)
 
+        get_metrics_collector().record_retain_transaction(
+            bank_id,
+            "staged" if staged else "single",
+            "units" if staged else "all",
+            txn_started - txn_requested,
+            time.time() - txn_started,
+        )
+
+    if staged:
+        # Units are durable; a failure here leaves the rest to the retain_links recovery task
+        step_start = time.time()
+        try:
+            remaining = await staged_linking.link_pending_units(
+                pool,
+                entity_resolver,
+                bank_id,
+                link_batch_id,
+                entity_labels=getattr(config, "entity_labels", None),
+                log_buffer=log_buffer,
+            )
+        except Exception as e:
+            logger.warning(f"Staged linking failed for bank {bank_id}, deferring to worker: {e}")
+            remaining = len(unit_ids)
+        await staged_linking.finish_link_task(
+            pool,
+            task_backend,
+            bank_id,
+            link_batch_id,
+            remaining,
+            entity_labels=getattr(config, "entity_labels", None),
+        )
+        log_buffer.append(
+            f"[6-9] Staged linking: {len(unit_ids) - remaining} units linked, {remaining} deferred "
+            f"in {time.time() - step_start:.3f}s"
+        )
+    else:
         # Flush entity stats (mention_count / last_seen) now that the transaction
         # has committed.  Uses a fresh pool connection — no locks held.
         await entity_resolver.flush_pending_stats()
 
-        # Log final summary
-        total_time = time.time() - start_time
-        log_buffer.append(f"{'=' * 60}")
-        log_buffer.append(f"RETAIN_BATCH COMPLETE: {len(unit_ids)} units in {total_time:.3f}s")
-        if document_ids_added:
-            log_buffer.append(f"Documents: {', '.join(document_ids_added)}")
-        log_buffer.append(f"{'=' * 60}")
+    # Log final summary
+    total_time = time.time() - start_time
+    log_buffer.append(f"{'=' * 60}")
+    log_buffer.append(f"RETAIN_BATCH COMPLETE: {len(unit_ids)} units in {total_time:.3f}s")
+    if document_ids_added:
+        log_buffer.append(f"Documents: {', '.join(document_ids_added)}")
+    log_buffer.append(f"{'=' * 60}")
 
-        logger.info("\n" + "\n".join(log_buffer) + "\n")
+    logger.info("\n" + "\n".join(log_buffer) + "\n")
 
-        return result_unit_ids, usage
+    return result_unit_ids, usage
 
 
 def _map_results_to_contents(
@@ -0,0 +1,245 @@
+"""
+Staged linking for the retain pipeline.
+
+With staged commits, retain stores documents, chunks and memory units in one
+short transaction and records a pending_links row for every new unit, together
+with a delayed retain_links recovery task. Entity, temporal and semantic links
+are then created here in small transactions. Each transaction claims its
+pending rows with FOR UPDATE SKIP LOCKED and deletes them before committing,
+so every unit is linked exactly once whether the inline pass finishes the
+batch or the worker picks it up after an interruption. When the inline pass
+leaves units unlinked, the recovery task is submitted through the task
+backend, so it runs right away (and wakes listening workers).
+
+Until a unit is linked it is still found by recall's semantic, keyword and
+temporal retrieval; it just has no graph links to expand through yet.
+"""
+
+import json
+import logging
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from ...metrics import get_metrics_collector
+from ..db_utils import acquire_with_retry
+from ..memory_engine import fq_table, get_current_schema
+from ..task_backend import TaskBackend, notify_task_workers
+from . import link_creation, link_utils
+
+logger = logging.getLogger(__name__)
+
+LINK_TASK_TYPE = "retain_links"
+LINK_BATCH_SIZE = 200  # Units linked per follow-up transaction
+RECOVERY_DELAY_SECONDS = 300  # Grace period before the worker takes over an unfinished inline pass
+
+
+def link_task_payload(bank_id: str, batch_id: uuid.UUID, entity_labels: list | None = None) -> dict[str, Any]:
+    """Task dict of the retain_links recovery task of a batch."""
+    return {
+        "type": LINK_TASK_TYPE,
+        "operation_id": str(batch_id),
+        "bank_id": bank_id,
+        "entity_labels": entity_labels,
+    }
+
+
+async def stage_pending_links(
+    conn,
+    bank_id: str,
+    batch_id: uuid.UUID,
+    unit_ids: list[str],
+    entities_per_unit: list[list[dict]],
+    entity_labels: list | None = None,
+) -> None:
+    """
+    Record units awaiting links and enqueue the task that recovers them.
+
+    Must run in the transaction that inserts the units, so a committed unit
+    always has either its links or a pending_links row with a recovery task.
+
+    Args:
+        conn: Database connection (inside the retain transaction)
+        bank_id: Bank identifier
+        batch_id: Identifier of this batch; also the recovery task's operation_id
+        unit_ids: Inserted unit IDs
+        entities_per_unit: Merged {"text", "type"} entity dicts per unit
+        entity_labels: Bank entity labels to apply when resolving entities
+    """
+    if not unit_ids:
+        return
+
+    await conn.execute(
+        f"""
+        INSERT INTO {fq_table("pending_links")} (unit_id, batch_id, bank_id, position, entities)
+        SELECT t.unit_id, $2, $3, t.position, t.entities::jsonb
+        FROM unnest($1::uuid[], $4::int[], $5::text[]) AS t(unit_id, position, entities)
+        """,
+        [uuid.UUID(unit_id) for unit_id in unit_ids],
+        batch_id,
+        bank_id,
+        list(range(len(unit_ids))),
+        [json.dumps(entities) for entities in entities_per_unit],
+    )
+
+    # Inserted here rather than submitted, so it commits with the units; finish_link_task
+    # submits it through the task backend if the inline pass does not finish the batch.
+    # Workers are not notified: the task is not due before the grace period, and
+    # polling finds it then.
+    task_payload = link_task_payload(bank_id, batch_id, entity_labels)
+    await conn.execute(
+        f"""
+        INSERT INTO {fq_table("async_operations")}
+          (operation_id, bank_id, operation_type, status, task_payload, result_metadata, next_retry_at)
+        VALUES ($1, $2, $3, 'pending', $4::jsonb, '{{}}'::jsonb, NOW() + make_interval(secs => $5))
+        """,
+        batch_id,
+        bank_id,
+        LINK_TASK_TYPE,
+        json.dumps(task_payload),
+        RECOVERY_DELAY_SECONDS,
+    )
+
+
+async def link_pending_units(
+    pool,
+    entity_resolver,
+    bank_id: str,
+    batch_id: uuid.UUID,
+    entity_labels: list | None = None,
+    log_buffer: list[str] | None = None,
+) -> int:
+    """
+    Create links for the pending units of a batch in small transactions.
+
+    Rows locked by a concurrent pass over the same batch are skipped.
+
+    Args:
+        pool: Database connection pool
+        entity_resolver: EntityResolver instance for entity resolution
+        bank_id: Bank identifier
+        batch_id: Batch whose pending units should be linked
+        entity_labels: Bank entity labels to apply when resolving entities
+        log_buffer: Optional buffer for logging
+
+    Returns:
+        Number of pending units of the batch left unlinked
+    """
+    metrics = get_metrics_collector()
+    while True:
+        requested = time.time()
+        async with acquire_with_retry(pool) as conn:
+            acquired = time.time()
+            async with conn.transaction():
+                rows = await conn.fetch(
+                    f"""
+                    SELECT p.unit_id, p.entities, u.text,
+                           COALESCE(u.occurred_start, u.mentioned_at) AS fact_date,
+                           u.embedding::text AS embedding
+                    FROM {fq_table("pending_links")} p
+                    JOIN {fq_table("memory_units")} u ON u.id = p.unit_id
+                    WHERE p.batch_id = $1
+                    ORDER BY p.position
+                    LIMIT $2
+                    FOR UPDATE OF p SKIP LOCKED
+                    """,
+                    batch_id,
+                    LINK_BATCH_SIZE,
+                )
+                if rows:
+                    await _link_units(conn, entity_resolver, bank_id, rows, entity_labels, log_buffer)
+                    await conn.execute(
+                        f"DELETE FROM {fq_table('pending_links')} WHERE unit_id = ANY($1::uuid[])",
+                        [row["unit_id"] for row in rows],
+                    )
+            metrics.record_retain_transaction(bank_id, "staged", "links", acquired - requested, time.time() - acquired)
+        if not rows:
+            break
+        # Entity stats are deferred until the linking transaction has committed
+        await entity_resolver.flush_pending_stats()
+
+    async with acquire_with_retry(pool) as conn:
+        return await conn.fetchval(
+            f"SELECT COUNT(*) FROM {fq_table('pending_links')} WHERE batch_id = $1",
+            batch_id,
+        )
+
+
+async def _link_units(conn, entity_resolver, bank_id: str, rows, entity_labels, log_buffer) -> None:
+    """Create entity, temporal and semantic links for claimed pending rows."""
+    step_start = time.time()
+    unit_ids = [str(row["unit_id"]) for row in rows]
+    entity_links = await link_utils.extract_entities_batch_optimized(
+        entity_resolver,
+        conn,
+        bank_id,
+        unit_ids,
+        [row["text"] for row in rows],
+        "",  # context (not used in current implementation)
+        [row["fact_date"] for row in rows],
+        [json.loads(row["entities"]) for row in rows],
+        log_buffer,
+        entity_labels=entity_labels,
+    )
+    temporal_link_count = await link_creation.create_temporal_links_batch(conn, bank_id, unit_ids)
+
+    # Units are committed before linking, so every unit of the batch is already a
+    # candidate neighbor: links across linking transactions stay bidirectional.
+    linked = [(unit_id, row["embedding"]) for unit_id, row in zip(unit_ids, rows) if row["embedding"] is not None]
+    semantic_link_count = await link_creation.create_semantic_links_batch(
+        conn, bank_id, [unit_id for unit_id, _ in linked], [json.loads(embedding) for _, embedding in linked]
+    )
+
+    if entity_links:
+        await link_utils.insert_entity_links_batch(conn, entity_links)
+
+    if log_buffer is not None:
+        log_buffer.append(
+            f"[6-9] Staged links for {len(unit_ids)} units: {len(entity_links)} entity, "
+            f"{temporal_link_count} temporal, {semantic_link_count} semantic in {time.time() - step_start:.3f}s"
+        )
+
+
+async def finish_link_task(
+    pool,
+    task_backend: TaskBackend | None,
+    bank_id: str,
+    batch_id: uuid.UUID,
+    remaining: int,
+    entity_labels: list | None = None,
+) -> None:
+    """
+    Settle the recovery task after an inline linking pass.
+
+    Deletes the task when the batch is fully linked. Otherwise makes it due now
+    and submits it through the task backend, so the remaining units are linked
+    without waiting for the grace period. Without a task backend the workers are
+    notified of the due task directly. A task already claimed by a worker is left
+    to the worker.
+    """
+    async with acquire_with_retry(pool) as conn:
+        if remaining == 0:
+            await conn.execute(
+                f"DELETE FROM {fq_table('async_operations')} WHERE operation_id = $1 AND status = 'pending'",
+                batch_id,
+            )
+            return
+        due = await conn.fetchval(
+            f"""
+            UPDATE {fq_table("async_operations")}
+            SET next_retry_at = NULL, updated_at = now()
+            WHERE operation_id = $1 AND status = 'pending'
+            RETURNING operation_id
+            """,
+            batch_id,
+        )
+        if due is not None and task_backend is None:
+            await notify_task_workers(conn, get_current_schema())
+    if due is not None and task_backend is not None:
+        await task_backend.submit_task(link_task_payload(bank_id, batch_id, entity_labels))
+
+
+def recovery_retry_at() -> datetime:
+    """Time at which the worker should look again at a batch whose units are still locked."""
+    return datetime.now(UTC) + timedelta(seconds=RECOVERY_DELAY_SECONDS)
@@ -121,32 +121,26 @@ class CrossEncoderReranker:
         """
         if not candidates:
             return []
+        [scored_results] = await self.rerank_batch([(query, candidates)])
+        return scored_results
 
-        # Prepare query-document pairs with date information
-        pairs = []
-        for candidate in candidates:
-            retrieval = candidate.retrieval
-
-            # Use text + context for better ranking
-            doc_text = retrieval.text
-            if retrieval.context:
-                doc_text = f"{retrieval.context}: {doc_text}"
-
-            # Add formatted date information for temporal awareness
-            if retrieval.occurred_start:
-                occurred_start = retrieval.occurred_start
-
-                # Format in two styles for better model understanding
-                # 1. ISO format: YYYY-MM-DD
-                date_iso = occurred_start.strftime("%Y-%m-%d")
-
-                # 2. Human-readable: "June 5, 2022"
-                date_readable = occurred_start.strftime("%B %d, %Y")
+    async def rerank_batch(self, queries: list[tuple[str, list[MergedCandidate]]]) -> list[list[ScoredResult]]:
+        """
+        Rerank candidates for several queries with a single cross-encoder call.
 
-                # Prepend date to document text
-                doc_text = f"[Date: {date_readable} ({date_iso})] {doc_text}"
+        Args:
+            queries: (query, candidates) pairs
 
-            pairs.append([query, doc_text])
+        Returns:
+            One list of ScoredResult objects per query, each sorted by cross-encoder score
+        """
+        pairs = [
+            [query, self._document_text(candidate.retrieval)]
+            for query, candidates in queries
+            for candidate in candidates
+        ]
+        if not pairs:
+            return [[] for _ in queries]
 
         # Get cross-encoder scores
         scores = await self.cross_encoder.predict(pairs)
@@ -158,20 +152,50 @@ class CrossEncoderReranker:
         def sigmoid(x):
             return 1 / (1 + np.exp(-x))
 
-        normalized_scores = [sigmoid(score) for score in scores]
-
-        # Create ScoredResult objects with cross-encoder scores
-        scored_results = []
-        for candidate, raw_score, norm_score in zip(candidates, scores, normalized_scores):
-            scored_result = ScoredResult(
-                candidate=candidate,
-                cross_encoder_score=float(raw_score),
-                cross_encoder_score_normalized=float(norm_score),
-                weight=float(norm_score),  # Initial weight is just cross-encoder score
-            )
-            scored_results.append(scored_result)
-
-        # Sort by cross-encoder score
-        scored_results.sort(key=lambda x: x.weight, reverse=True)
-
-        return scored_results
+        results: list[list[ScoredResult]] = []
+        offset = 0
+        for _, candidates in queries:
+            query_scores = scores[offset : offset + len(candidates)]
+            offset += len(candidates)
+
+            # Create ScoredResult objects with cross-encoder scores
+            scored_results = []
+            for candidate, raw_score in zip(candidates, query_scores):
+                norm_score = sigmoid(raw_score)
+                scored_result = ScoredResult(
+                    candidate=candidate,
+                    cross_encoder_score=float(raw_score),
+                    cross_encoder_score_normalized=float(norm_score),
+                    weight=float(norm_score),  # Initial weight is just cross-encoder score
+                )
+                scored_results.append(scored_result)
+
+            # Sort by cross-encoder score
+            scored_results.sort(key=lambda x: x.weight, reverse=True)
+            results.append(scored_results)
+
+        return results
+
+    @staticmethod
+    def _document_text(retrieval) -> str:
+        """Build the document side of a query-document pair, with date information."""
+        # Use text + context for better ranking
+        doc_text = retrieval.text
+        if retrieval.context:
+            doc_text = f"{retrieval.context}: {doc_text}"
+
+        # Add formatted date information for temporal awareness
+        if retrieval.occurred_start:
+            occurred_start = retrieval.occurred_start
+
+            # Format in two styles for better model understanding
+            # 1. ISO format: YYYY-MM-DD
+            date_iso = occurred_start.strftime("%Y-%m-%d")
+
+            # 2. Human-readable: "June 5, 2022"
+            date_readable = occurred_start.strftime("%B %d, %Y")
+
+            # Prepend date to document text
+            doc_text = f"[Date: {date_readable} ({date_iso})] {doc_text}"
+
+        return doc_text
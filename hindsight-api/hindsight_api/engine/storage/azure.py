@@ -2,11 +2,13 @@
 
 import logging
 from datetime import timedelta
+from pathlib import Path
+from typing import BinaryIO
 
 import obstore as obs
 from obstore.store import AzureStore
 
-from .base import FileStorage
+from .base import STREAM_CHUNK_SIZE, FileStorage, write_chunks_to_file
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,12 @@ class AzureFileStorage(FileStorage):
         logger.debug(f"Stored file {key} ({len(file_data)} bytes) in Azure")
         return key
 
+    async def store_stream(self, stream: BinaryIO, key: str, metadata: dict[str, str] | None = None) -> str:
+        # obstore reads the stream in parts and uses a multipart upload for large files
+        await obs.put_async(self._store, key, stream, chunk_size=STREAM_CHUNK_SIZE)
+        logger.debug(f"Streamed file {key} to Azure")
+        return key
+
     async def retrieve(self, key: str) -> bytes:
         try:
             response = await obs.get_async(self._store, key)
@@ -48,6 +56,15 @@ class AzureFileStorage(FileStorage):
                 raise FileNotFoundError(f"File not found: {key}") from e
             raise
 
+    async def retrieve_to_file(self, key: str, path: Path) -> None:
+        try:
+            response = await obs.get_async(self._store, key)
+            await write_chunks_to_file(response.stream(min_chunk_size=STREAM_CHUNK_SIZE), path)
+        except Exception as e:
+            if "not found" in str(e).lower() or "BlobNotFound" in str(e):
+                raise FileNotFoundError(f"File not found: {key}") from e
+            raise
+
     async def delete(self, key: str) -> None:
         await obs.delete_async(self._store, key)
 
@@ -1,6 +1,23 @@
 """Abstract base class for file storage backends."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
+from pathlib import Path
+from typing import BinaryIO
+
+# Read/write granularity for streamed uploads and downloads
+STREAM_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+async def write_chunks_to_file(chunks: AsyncIterable[bytes], path: Path) -> None:
+    """Write a stream of chunks to a local file, doing the blocking file I/O in a thread."""
+    f = await asyncio.to_thread(open, path, "wb")
+    try:
+        async for chunk in chunks:
+            await asyncio.to_thread(f.write, chunk)
+    finally:
+        await asyncio.to_thread(f.close)
 
 
 class FileStorage(ABC):
@@ -26,6 +43,44 @@ class FileStorage(ABC):
         """
         pass
 
+    async def store_stream(
+        self,
+        stream: BinaryIO,
+        key: str,
+        metadata: dict[str, str] | None = None,
+    ) -> str:
+        """
+        Store file from a readable binary stream (e.g. a spooled upload).
+
+        The default reads the whole stream and calls store(); backends that can
+        upload in parts override this to keep memory use independent of file size.
+
+        Args:
+            stream: Binary file-like object positioned at the start of the data
+            key: Storage key
+            metadata: Optional metadata to store with file
+
+        Returns:
+            Storage key that can be used to retrieve the file
+        """
+        return await self.store(await asyncio.to_thread(stream.read), key, metadata)
+
+    async def retrieve_to_file(self, key: str, path: Path) -> None:
+        """
+        Download file by storage key into a local path.
+
+        The default retrieves the whole file; backends override this to copy it in chunks.
+
+        Args:
+            key: Storage key
+            path: Local file to write
+
+        Raises:
+            FileNotFoundError: If file does not exist
+        """
+        data = await self.retrieve(key)
+        await asyncio.to_thread(Path(path).write_bytes, bytes(data))
+
     @abstractmethod
     async def retrieve(self, key: str) -> bytes:
         """
@@ -1,13 +1,15 @@
 """PostgreSQL BYTEA-based file storage (default, zero-config)."""
 
+import asyncio
 import logging
 from collections.abc import Callable
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
 
 if TYPE_CHECKING:
     import asyncpg
 
-from .base import FileStorage
+from .base import STREAM_CHUNK_SIZE, FileStorage, write_chunks_to_file
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +92,44 @@ class PostgreSQLFileStorage(FileStorage):
         logger.debug(f"Stored file {key} ({len(file_data)} bytes) in PostgreSQL")
         return key
 
+    async def store_stream(
+        self,
+        stream: BinaryIO,
+        key: str,
+        metadata: dict[str, str] | None = None,
+    ) -> str:
+        """
+        Store file in PostgreSQL, sending it in chunks.
+
+        The chunks are written to a temporary large object, which lo_put() extends
+        in place, and the row's data is filled from it in one statement. Appending
+        to the BYTEA value instead would rewrite the whole value on every chunk.
+        """
+        pool = self._pool_getter()
+        size = 0
+
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                oid = await conn.fetchval("SELECT lo_create(0)")
+                while chunk := await asyncio.to_thread(stream.read, STREAM_CHUNK_SIZE):
+                    await conn.execute("SELECT lo_put($1, $2, $3)", oid, size, chunk)
+                    size += len(chunk)
+                await conn.execute(
+                    f"""
+                    INSERT INTO {fq_table("file_storage", self._schema)}
+                    (storage_key, data)
+                    VALUES ($1, lo_get($2))
+                    ON CONFLICT (storage_key) DO UPDATE SET
+                        data = EXCLUDED.data
+                    """,
+                    key,
+                    oid,
+                )
+                await conn.execute("SELECT lo_unlink($1)", oid)
+
+        logger.debug(f"Stored file {key} ({size} bytes) in PostgreSQL")
+        return key
+
     async def retrieve(self, key: str) -> bytes:
         """Retrieve file from PostgreSQL."""
         pool = self._pool_getter()
@@ -108,6 +148,49 @@ class PostgreSQLFileStorage(FileStorage):
 
             return bytes(row["data"])
 
+    async def retrieve_to_file(self, key: str, path: Path) -> None:
+        """Copy file from PostgreSQL to a local path in chunks."""
+        pool = self._pool_getter()
+
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"""
+                SELECT pg_column_compression(data) IS NOT NULL AS compressed
+                FROM {fq_table("file_storage", self._schema)}
+                WHERE storage_key = $1
+                """,
+                key,
+            )
+            if not row:
+                raise FileNotFoundError(f"File not found: {key}")
+
+            if row["compressed"]:
+                # Written before data switched to EXTERNAL storage (l2m3n4o5p6q7): every slice
+                # would decompress the value up to its offset, so read it in one go instead.
+                data = await conn.fetchval(
+                    f"SELECT data FROM {fq_table('file_storage', self._schema)} WHERE storage_key = $1",
+                    key,
+                )
+                await asyncio.to_thread(Path(path).write_bytes, bytes(data))
+                return
+
+            # One query streamed through a server-side cursor, one slice per row.
+            # data uses EXTERNAL storage, so each substring() reads only its own TOAST chunks.
+            async with conn.transaction():
+                rows = conn.cursor(
+                    f"""
+                    SELECT substring(f.data FROM offsets.start FOR $2) AS chunk
+                    FROM {fq_table("file_storage", self._schema)} f,
+                         generate_series(1, octet_length(f.data), $2) AS offsets(start)
+                    WHERE f.storage_key = $1
+                    ORDER BY offsets.start
+                    """,
+                    key,
+                    STREAM_CHUNK_SIZE,
+                    prefetch=1,
+                )
+                await write_chunks_to_file((row["chunk"] async for row in rows), path)
+
     async def delete(self, key: str) -> None:
         """Delete file from PostgreSQL."""
         pool = self._pool_getter()
@@ -17,6 +17,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Channel on which submitted tasks are announced to listening workers
+TASK_NOTIFY_CHANNEL = "hindsight_task_submitted"
+
 
 def fq_table(table: str, schema: str | None = None) -> str:
     """Get fully-qualified table name with optional schema prefix."""
@@ -25,6 +28,21 @@ def fq_table(table: str, schema: str | None = None) -> str:
     return table
 
 
+async def notify_task_workers(conn, schema: str | None) -> None:
+    """
+    Tell listening workers that a schema has a new or reset pending task.
+
+    Sent inside a transaction, the notification is delivered on commit and
+    dropped on rollback. Rows due later are announced too, so workers shorten
+    their wait to the row's next_retry_at.
+
+    Args:
+        conn: Database connection or pool
+        schema: Schema of the async_operations row (None = default schema)
+    """
+    await conn.execute("SELECT pg_notify($1, $2)", TASK_NOTIFY_CHANNEL, json.dumps({"schema": schema}))
+
+
 class TaskBackend(ABC):
     """
     Abstract base class for task execution backends.
@@ -133,8 +151,10 @@ class BrokerTaskBackend(TaskBackend):
     """
     Task backend using PostgreSQL as broker.
 
-    submit_task() stores task_payload in async_operations table.
-    Actual polling and execution is handled separately by WorkerPoller.
+    submit_task() stores task_payload in async_operations table and sends a
+    NOTIFY on TASK_NOTIFY_CHANNEL carrying the schema, so listening workers
+    claim it right away. Actual polling and execution is handled separately
+    by WorkerPoller.
 
     This backend is used by the API to store tasks. Workers poll
     the database separately to claim and execute tasks.
@@ -167,7 +187,10 @@ class BrokerTaskBackend(TaskBackend):
 
     async def submit_task(self, task_dict: dict[str, Any]):
         """
-        Store task payload in async_operations table.
+        Store task payload in async_operations table and notify listening workers.
+
+        The notification is sent in the same statement as the write, so it is
+        delivered once the task is committed, and only if a row was written.
 
         The task_dict should contain an 'operation_id' if updating an existing
         operation record, otherwise a new operation will be created.
@@ -195,17 +218,24 @@ class BrokerTaskBackend(TaskBackend):
 
         schema = self._schema_getter() if self._schema_getter else self._schema
         table = fq_table("async_operations", schema)
+        notify_payload = json.dumps({"schema": schema})
 
         if operation_id:
             # Update existing operation with task payload
             await pool.execute(
                 f"""
-                UPDATE {table}
-                SET task_payload = $1::jsonb, updated_at = now()
-                WHERE operation_id = $2
+                WITH updated AS (
+                    UPDATE {table}
+                    SET task_payload = $1::jsonb, updated_at = now()
+                    WHERE operation_id = $2
+                    RETURNING 1
+                )
+                SELECT pg_notify($3, $4) FROM updated
                 """,
                 payload_json,
                 operation_id,
+                TASK_NOTIFY_CHANNEL,
+                notify_payload,
             )
             logger.debug(f"Updated task payload for operation {operation_id}")
         else:
@@ -216,13 +246,19 @@ class BrokerTaskBackend(TaskBackend):
             new_id = uuid.uuid4()
             await pool.execute(
                 f"""
-                INSERT INTO {table} (operation_id, bank_id, operation_type, status, task_payload)
-                VALUES ($1, $2, $3, 'pending', $4::jsonb)
+                WITH inserted AS (
+                    INSERT INTO {table} (operation_id, bank_id, operation_type, status, task_payload)
+                    VALUES ($1, $2, $3, 'pending', $4::jsonb)
+                    RETURNING 1
+                )
+                SELECT pg_notify($5, $6) FROM inserted
                 """,
                 new_id,
                 bank_id,
                 task_type,
                 payload_json,
+                TASK_NOTIFY_CHANNEL,
+                notify_payload,
             )
             logger.debug(f"Created new operation {new_id} for task type {task_type}")
 
@@ -162,6 +162,11 @@ def main():
             llm_model=config.llm_model,
             llm_base_url=config.llm_base_url,
             llm_max_concurrent=config.llm_max_concurrent,
+            llm_min_concurrent=config.llm_min_concurrent,
+            llm_adaptive_concurrency=config.llm_adaptive_concurrency,
+            llm_tokens_per_minute=config.llm_tokens_per_minute,
+            llm_interactive_reserved_fraction=config.llm_interactive_reserved_fraction,
+            llm_prompt_caching=config.llm_prompt_caching,
             llm_max_retries=config.llm_max_retries,
             llm_initial_backoff=config.llm_initial_backoff,
             llm_max_backoff=config.llm_max_backoff,
@@ -214,6 +219,9 @@ def main():
             embeddings_litellm_sdk_api_key=config.embeddings_litellm_sdk_api_key,
             embeddings_litellm_sdk_model=config.embeddings_litellm_sdk_model,
             embeddings_litellm_sdk_api_base=config.embeddings_litellm_sdk_api_base,
+            embeddings_max_concurrent=config.embeddings_max_concurrent,
+            embeddings_cache_enabled=config.embeddings_cache_enabled,
+            embeddings_cache_max_age_days=config.embeddings_cache_max_age_days,
             reranker_provider=config.reranker_provider,
             reranker_local_model=config.reranker_local_model,
             reranker_local_force_cpu=config.reranker_local_force_cpu,
@@ -254,8 +262,14 @@ def main():
             retain_custom_instructions=config.retain_custom_instructions,
             retain_batch_tokens=config.retain_batch_tokens,
             retain_entity_lookup=config.retain_entity_lookup,
+            retain_entity_index_max_banks=config.retain_entity_index_max_banks,
             retain_batch_enabled=config.retain_batch_enabled,
             retain_batch_poll_interval_seconds=config.retain_batch_poll_interval_seconds,
+            retain_embedding_micro_batch_size=config.retain_embedding_micro_batch_size,
+            retain_staged_commit=config.retain_staged_commit,
+            retain_sub_batch_concurrency=config.retain_sub_batch_concurrency,
+            retain_dedup_enabled=config.retain_dedup_enabled,
+            retain_dedup_similarity=config.retain_dedup_similarity,
             file_storage_type=config.file_storage_type,
             file_storage_s3_bucket=config.file_storage_s3_bucket,
             file_storage_s3_region=config.file_storage_s3_region,
@@ -271,6 +285,9 @@ def main():
             file_parser_allowlist=config.file_parser_allowlist,
             file_parser_iris_token=config.file_parser_iris_token,
             file_parser_iris_org_id=config.file_parser_iris_org_id,
+            file_parser_process_workers=config.file_parser_process_workers,
+            file_parser_timeout_seconds=config.file_parser_timeout_seconds,
+            file_parser_memory_limit_mb=config.file_parser_memory_limit_mb,
             file_conversion_max_batch_size_mb=config.file_conversion_max_batch_size_mb,
             file_conversion_max_batch_size=config.file_conversion_max_batch_size,
             enable_file_upload_api=config.enable_file_upload_api,
@@ -280,6 +297,7 @@ def main():
             enable_mental_model_history=config.enable_mental_model_history,
             consolidation_batch_size=config.consolidation_batch_size,
             consolidation_llm_batch_size=config.consolidation_llm_batch_size,
+            consolidation_tag_group_concurrency=config.consolidation_tag_group_concurrency,
             consolidation_max_tokens=config.consolidation_max_tokens,
             consolidation_source_facts_max_tokens=config.consolidation_source_facts_max_tokens,
             consolidation_source_facts_max_tokens_per_observation=config.consolidation_source_facts_max_tokens_per_observation,
@@ -293,20 +311,29 @@ def main():
             db_pool_max_size=config.db_pool_max_size,
             db_command_timeout=config.db_command_timeout,
             db_acquire_timeout=config.db_acquire_timeout,
+            bank_snapshot_cache_enabled=config.bank_snapshot_cache_enabled,
+            bank_snapshot_cache_max_age_seconds=config.bank_snapshot_cache_max_age_seconds,
             worker_enabled=config.worker_enabled,
             worker_id=config.worker_id,
             worker_poll_interval_ms=config.worker_poll_interval_ms,
+            worker_notify_enabled=config.worker_notify_enabled,
+            worker_notify_poll_interval_ms=config.worker_notify_poll_interval_ms,
             worker_max_retries=config.worker_max_retries,
             worker_http_port=config.worker_http_port,
             worker_max_slots=config.worker_max_slots,
             worker_consolidation_max_slots=config.worker_consolidation_max_slots,
+            worker_counters_reconcile_interval_seconds=config.worker_counters_reconcile_interval_seconds,
             reflect_max_iterations=config.reflect_max_iterations,
             reflect_max_context_tokens=config.reflect_max_context_tokens,
             reflect_mission=config.reflect_mission,
+            reflect_cache_enabled=config.reflect_cache_enabled,
+            reflect_cache_min_similarity=config.reflect_cache_min_similarity,
+            reflect_cache_max_age_seconds=config.reflect_cache_max_age_seconds,
             disposition_skepticism=config.disposition_skepticism,
             disposition_literalism=config.disposition_literalism,
             disposition_empathy=config.disposition_empathy,
             mental_model_refresh_concurrency=config.mental_model_refresh_concurrency,
+            mental_model_refresh_min_similarity=config.mental_model_refresh_min_similarity,
             otel_traces_enabled=config.otel_traces_enabled,
             otel_exporter_otlp_endpoint=config.otel_exporter_otlp_endpoint,
             otel_exporter_otlp_headers=config.otel_exporter_otlp_headers,
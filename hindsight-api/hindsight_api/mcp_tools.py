@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from hindsight_api import MemoryEngine
 from hindsight_api.config import (
@@ -19,6 +19,7 @@ from hindsight_api.config import (
     DEFAULT_MCP_RETAIN_DESCRIPTION,
 )
 from hindsight_api.engine.memory_engine import Budget
+from hindsight_api.engine.reflect import ReflectEventCallback
 from hindsight_api.engine.response_models import VALID_RECALL_FACT_TYPES
 from hindsight_api.extensions import OperationValidationError
 from hindsight_api.models import RequestContext
@@ -562,6 +563,32 @@ def _register_recall(mcp: FastMCP, memory: MemoryEngine, config: MCPToolsConfig)
                 return {"error": str(e), "results": []}
 
 
+def _reflect_progress_reporter(ctx: Context | None) -> ReflectEventCallback | None:
+    """
+    Relay reflect events to the MCP client as progress notifications.
+
+    Each tool call and answer chunk advances the progress by one; the notification
+    message names the tool, or carries the answer chunk. Clients that did not ask
+    for progress receive nothing.
+    """
+    if ctx is None:
+        return None
+    progress = 0
+
+    async def on_event(event: dict[str, Any]) -> None:
+        nonlocal progress
+        if event["type"] == "tool_call":
+            message = f"[{event['tool']}] {event.get('reason') or ''}".rstrip()
+        elif event["type"] == "answer_delta":
+            message = event["text"]
+        else:
+            return
+        progress += 1
+        await ctx.report_progress(progress, message=message)
+
+    return on_event
+
+
 def _register_reflect(mcp: FastMCP, memory: MemoryEngine, config: MCPToolsConfig) -> None:
     """Register the reflect tool."""
 
@@ -577,6 +604,7 @@ def _register_reflect(mcp: FastMCP, memory: MemoryEngine, config: MCPToolsConfig
             tags: list[str] | None = None,
             tags_match: str = "any",
             bank_id: str | None = None,
+            ctx: Context | None = None,
         ) -> str:
             """
             Generate thoughtful analysis by synthesizing stored memories with the bank's personality.
@@ -628,6 +656,9 @@ def _register_reflect(mcp: FastMCP, memory: MemoryEngine, config: MCPToolsConfig
                 if tags is not None:
                     reflect_kwargs["tags"] = tags
                     reflect_kwargs["tags_match"] = tags_match
+                on_event = _reflect_progress_reporter(ctx)
+                if on_event is not None:
+                    reflect_kwargs["on_event"] = on_event
 
                 reflect_result = await memory.reflect_async(**reflect_kwargs)
 
@@ -653,6 +684,7 @@ def _register_reflect(mcp: FastMCP, memory: MemoryEngine, config: MCPToolsConfig
             response_schema: dict | None = None,
             tags: list[str] | None = None,
             tags_match: str = "any",
+            ctx: Context | None = None,
         ) -> dict:
             """
             Generate thoughtful analysis by synthesizing stored memories with the bank's personality.
@@ -703,6 +735,9 @@ def _register_reflect(mcp: FastMCP, memory: MemoryEngine, config: MCPToolsConfig
                 if tags is not None:
                     reflect_kwargs["tags"] = tags
                     reflect_kwargs["tags_match"] = tags_match
+                on_event = _reflect_progress_reporter(ctx)
+                if on_event is not None:
+                    reflect_kwargs["on_event"] = on_event
 
                 reflect_result = await memory.reflect_async(**reflect_kwargs)
 
@@ -9,6 +9,7 @@ This module provides metrics for:
 - HTTP request metrics (latency, count by endpoint/method/status)
 - Process metrics (CPU, memory, file descriptors, threads)
 - Database connection pool metrics
+- Retain pipeline stage overlap (extraction vs. embeddings)
 """
 
 import logging
@@ -47,6 +48,9 @@ LLM_DURATION_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 15.0, 30.0, 60
 # HTTP request duration buckets (millisecond-level for fast endpoints)
 HTTP_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
 
+# Ratio buckets (0.0-1.0) for fractions such as retain stage overlap
+RATIO_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0)
+
 
 def get_token_bucket(token_count: int) -> str:
     """
@@ -135,11 +139,21 @@ def initialize_metrics(service_name: str = "hindsight-api", service_version: str
         aggregation=ExplicitBucketHistogramAggregation(boundaries=HTTP_DURATION_BUCKETS),
     )
 
+    # Create views for retain stage overlap histograms
+    retain_overlap_view = View(
+        instrument_name="hindsight.retain.embedding_overlap",
+        aggregation=ExplicitBucketHistogramAggregation(boundaries=RATIO_BUCKETS),
+    )
+    retain_tail_view = View(
+        instrument_name="hindsight.retain.embedding_tail.duration",
+        aggregation=ExplicitBucketHistogramAggregation(boundaries=LLM_DURATION_BUCKETS),
+    )
+
     # Create meter provider with Prometheus exporter and custom views
     provider = MeterProvider(
         resource=resource,
         metric_readers=[prometheus_reader],
-        views=[duration_view, llm_duration_view, http_duration_view],
+        views=[duration_view, llm_duration_view, http_duration_view, retain_overlap_view, retain_tail_view],
     )
 
     # Set the global meter provider
@@ -182,6 +196,7 @@ class MetricsCollectorBase:
         input_tokens: int = 0,
         output_tokens: int = 0,
         success: bool = True,
+        cached_input_tokens: int = 0,
     ):
         """
         Record metrics for an LLM call.
@@ -194,6 +209,7 @@ class MetricsCollectorBase:
             input_tokens: Number of input/prompt tokens
             output_tokens: Number of output/completion tokens
             success: Whether the call was successful
+            cached_input_tokens: Input tokens served from the provider's prompt cache
         """
         raise NotImplementedError
 
@@ -202,6 +218,64 @@ class MetricsCollectorBase:
         """Context manager to record HTTP request metrics."""
         raise NotImplementedError
 
+    def record_retain_stage_overlap(self, bank_id: str, overlap_ratio: float, embedding_tail: float):
+        """
+        Record how much embedding work overlapped with fact extraction in a retain batch.
+
+        Args:
+            bank_id: Memory bank ID
+            overlap_ratio: Fraction (0.0-1.0) of embedding time spent while extraction was still running
+            embedding_tail: Seconds spent embedding after the last extraction call returned
+        """
+        raise NotImplementedError
+
+    def record_retain_dedup(self, bank_id: str, facts: int, merged: int):
+        """
+        Record how many facts of a retain batch were merged into existing units as near-duplicates.
+
+        Args:
+            bank_id: Memory bank ID
+            facts: Number of facts extracted in the batch
+            merged: Number of those facts merged instead of inserted
+        """
+        raise NotImplementedError
+
+    def record_reflect_cache(self, bank_id: str, hit: bool, similarity: float | None = None):
+        """
+        Record the outcome of a reflect cache lookup.
+
+        Args:
+            bank_id: Memory bank ID
+            hit: Whether a cached answer was returned
+            similarity: Similarity to the cached query that answered a hit
+        """
+        raise NotImplementedError
+
+    def record_retain_transaction(self, bank_id: str, mode: str, stage: str, connection_wait: float, duration: float):
+        """
+        Record the duration of a retain database transaction and its wait for a connection.
+
+        Args:
+            bank_id: Memory bank ID
+            mode: Commit mode ("single" or "staged")
+            stage: Transaction stage ("all" in single mode, "units" or "links" in staged mode)
+            connection_wait: Seconds spent waiting for a pooled connection before the transaction began
+            duration: Seconds from BEGIN to COMMIT (or rollback)
+        """
+        raise NotImplementedError
+
+    def record_llm_queue_wait(self, provider: str, model: str, priority: str, wait: float):
+        """
+        Record how long an LLM call waited for a concurrency slot.
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+            priority: Work class of the call (interactive, mental_model, consolidation, retain)
+            wait: Seconds between requesting and acquiring the slot
+        """
+        raise NotImplementedError
+
     def set_db_pool(self, pool: "asyncpg.Pool"):
         """Set the database pool for metrics collection."""
         pass
@@ -231,6 +305,7 @@ class NoOpMetricsCollector(MetricsCollectorBase):
         input_tokens: int = 0,
         output_tokens: int = 0,
         success: bool = True,
+        cached_input_tokens: int = 0,
     ):
         """No-op LLM call recording."""
         pass
@@ -240,6 +315,26 @@ class NoOpMetricsCollector(MetricsCollectorBase):
         """No-op HTTP request recording."""
         yield
 
+    def record_retain_stage_overlap(self, bank_id: str, overlap_ratio: float, embedding_tail: float):
+        """No-op retain stage overlap recording."""
+        pass
+
+    def record_retain_transaction(self, bank_id: str, mode: str, stage: str, connection_wait: float, duration: float):
+        """No-op retain transaction recording."""
+        pass
+
+    def record_retain_dedup(self, bank_id: str, facts: int, merged: int):
+        """No-op retain deduplication recording."""
+        pass
+
+    def record_reflect_cache(self, bank_id: str, hit: bool, similarity: float | None = None):
+        """No-op reflect cache recording."""
+        pass
+
+    def record_llm_queue_wait(self, provider: str, model: str, priority: str, wait: float):
+        """No-op LLM queue wait recording."""
+        pass
+
 
 class MetricsCollector(MetricsCollectorBase):
     """
@@ -277,6 +372,12 @@ class MetricsCollector(MetricsCollectorBase):
             name="hindsight.llm.tokens.output", description="Number of output tokens from LLM calls", unit="tokens"
         )
 
+        self.llm_tokens_cached_input = self.meter.create_counter(
+            name="hindsight.llm.tokens.cached_input",
+            description="Number of input tokens served from the provider's prompt cache",
+            unit="tokens",
+        )
+
         # LLM call counter (success/failure)
         self.llm_calls_total = self.meter.create_counter(
             name="hindsight.llm.calls.total", description="Total number of LLM API calls", unit="calls"
@@ -297,8 +398,68 @@ class MetricsCollector(MetricsCollectorBase):
             unit="requests",
         )
 
+        # Retain stage overlap: how much embedding ran concurrently with fact extraction
+        self.retain_embedding_overlap = self.meter.create_histogram(
+            name="hindsight.retain.embedding_overlap",
+            description="Fraction of retain embedding time that overlapped with fact extraction",
+            unit="1",
+        )
+
+        self.retain_embedding_tail = self.meter.create_histogram(
+            name="hindsight.retain.embedding_tail.duration",
+            description="Time spent embedding after fact extraction finished, in seconds",
+            unit="s",
+        )
+
+        # Near-duplicate facts merged into existing units at retain time
+        self.retain_dedup_ratio = self.meter.create_histogram(
+            name="hindsight.retain.dedup_ratio",
+            description="Fraction of extracted facts per retain batch merged into existing units as near-duplicates",
+            unit="1",
+        )
+
+        self.retain_facts_merged = self.meter.create_counter(
+            name="hindsight.retain.facts_merged",
+            description="Extracted facts merged into existing units instead of being inserted",
+            unit="{facts}",
+        )
+
+        # Reflect answer cache lookups and how close the hits were
+        self.reflect_cache_lookups = self.meter.create_counter(
+            name="hindsight.reflect.cache.lookups",
+            description="Reflect cache lookups, by result (hit or miss)",
+            unit="{lookups}",
+        )
+
+        self.reflect_cache_hit_similarity = self.meter.create_histogram(
+            name="hindsight.reflect.cache.hit_similarity",
+            description="Similarity between a reflect query and the cached query that answered it",
+            unit="1",
+        )
+
+        # Retain transactions: how long locks are held, and how long retains queue for a connection
+        self.retain_transaction_duration = self.meter.create_histogram(
+            name="hindsight.retain.transaction.duration",
+            description="Duration of retain database transactions in seconds",
+            unit="s",
+        )
+
+        self.retain_connection_wait = self.meter.create_histogram(
+            name="hindsight.retain.connection_wait.duration",
+            description="Time a retain transaction waited for a database connection, in seconds",
+            unit="s",
+        )
+
+        # LLM concurrency slot wait (adaptive limiter per provider/model/key)
+        self.llm_queue_wait = self.meter.create_histogram(
+            name="hindsight.llm.queue_wait.duration",
+            description="Time LLM calls waited for a concurrency slot, in seconds",
+            unit="s",
+        )
+
         # Process metrics (observable gauges - collected on scrape)
         self._setup_process_metrics()
+        self._setup_llm_concurrency_metrics()
 
         # DB pool metrics holder (set via set_db_pool)
         self._db_pool: "asyncpg.Pool | None" = None
@@ -364,6 +525,7 @@ class MetricsCollector(MetricsCollectorBase):
         input_tokens: int = 0,
         output_tokens: int = 0,
         success: bool = True,
+        cached_input_tokens: int = 0,
     ):
         """
         Record metrics for an LLM call.
@@ -376,6 +538,7 @@ class MetricsCollector(MetricsCollectorBase):
             input_tokens: Number of input/prompt tokens
             output_tokens: Number of output/completion tokens
             success: Whether the call was successful
+            cached_input_tokens: Input tokens served from the provider's prompt cache
         """
         # Base attributes for all metrics
         base_attributes = {
@@ -407,6 +570,9 @@ class MetricsCollector(MetricsCollectorBase):
             }
             self.llm_tokens_output.add(output_tokens, output_attributes)
 
+        if cached_input_tokens > 0:
+            self.llm_tokens_cached_input.add(cached_input_tokens, base_attributes)
+
     @contextmanager
     def record_http_request(self, method: str, endpoint: str, status_code_getter: Callable[[], int]):
         """
@@ -453,6 +619,110 @@ class MetricsCollector(MetricsCollectorBase):
             # Decrement in-progress
             self.http_requests_in_progress.add(-1, base_attributes)
 
+    def record_retain_stage_overlap(self, bank_id: str, overlap_ratio: float, embedding_tail: float):
+        """
+        Record how much embedding work overlapped with fact extraction in a retain batch.
+
+        Args:
+            bank_id: Memory bank ID
+            overlap_ratio: Fraction (0.0-1.0) of embedding time spent while extraction was still running
+            embedding_tail: Seconds spent embedding after the last extraction call returned
+        """
+        attributes = {"bank_id": bank_id, "tenant": _get_tenant()}
+        self.retain_embedding_overlap.record(overlap_ratio, attributes)
+        self.retain_embedding_tail.record(embedding_tail, attributes)
+
+    def record_retain_dedup(self, bank_id: str, facts: int, merged: int):
+        """
+        Record how many facts of a retain batch were merged into existing units as near-duplicates.
+
+        Args:
+            bank_id: Memory bank ID
+            facts: Number of facts extracted in the batch
+            merged: Number of those facts merged instead of inserted
+        """
+        if facts <= 0:
+            return
+        attributes = {"bank_id": bank_id, "tenant": _get_tenant()}
+        self.retain_dedup_ratio.record(merged / facts, attributes)
+        if merged:
+            self.retain_facts_merged.add(merged, attributes)
+
+    def record_reflect_cache(self, bank_id: str, hit: bool, similarity: float | None = None):
+        """
+        Record the outcome of a reflect cache lookup.
+
+        Args:
+            bank_id: Memory bank ID
+            hit: Whether a cached answer was returned
+            similarity: Similarity to the cached query that answered a hit
+        """
+        attributes = {"bank_id": bank_id, "tenant": _get_tenant()}
+        self.reflect_cache_lookups.add(1, {**attributes, "result": "hit" if hit else "miss"})
+        if hit and similarity is not None:
+            self.reflect_cache_hit_similarity.record(similarity, attributes)
+
+    def record_retain_transaction(self, bank_id: str, mode: str, stage: str, connection_wait: float, duration: float):
+        """
+        Record the duration of a retain database transaction and its wait for a connection.
+
+        Args:
+            bank_id: Memory bank ID
+            mode: Commit mode ("single" or "staged")
+            stage: Transaction stage ("all" in single mode, "units" or "links" in staged mode)
+            connection_wait: Seconds spent waiting for a pooled connection before the transaction began
+            duration: Seconds from BEGIN to COMMIT (or rollback)
+        """
+        attributes = {"bank_id": bank_id, "mode": mode, "stage": stage, "tenant": _get_tenant()}
+        self.retain_transaction_duration.record(duration, attributes)
+        self.retain_connection_wait.record(connection_wait, attributes)
+
+    def record_llm_queue_wait(self, provider: str, model: str, priority: str, wait: float):
+        """
+        Record how long an LLM call waited for a concurrency slot.
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+            priority: Work class of the call (interactive, mental_model, consolidation, retain)
+            wait: Seconds between requesting and acquiring the slot
+        """
+        self.llm_queue_wait.record(wait, {"provider": provider, "model": model, "priority": priority})
+
+    def _setup_llm_concurrency_metrics(self):
+        """Set up observable gauges for the adaptive LLM concurrency limiters."""
+
+        def observe(attribute: str):
+            def callback(_options):
+                from .engine.llm_concurrency import iter_llm_limiters
+
+                for limiter in iter_llm_limiters():
+                    attributes = {"provider": limiter.provider, "model": limiter.model, "key_id": limiter.key_id}
+                    yield metrics.Observation(getattr(limiter, attribute), attributes)
+
+            return callback
+
+        self.meter.create_observable_gauge(
+            name="hindsight.llm.concurrency.limit",
+            callbacks=[observe("limit")],
+            description="Current adaptive concurrency limit per LLM provider, model and API key",
+            unit="{calls}",
+        )
+
+        self.meter.create_observable_gauge(
+            name="hindsight.llm.concurrency.in_flight",
+            callbacks=[observe("in_flight")],
+            description="LLM calls currently holding a concurrency slot",
+            unit="{calls}",
+        )
+
+        self.meter.create_observable_gauge(
+            name="hindsight.llm.concurrency.waiting",
+            callbacks=[observe("waiting")],
+            description="LLM calls queued for a concurrency slot",
+            unit="{calls}",
+        )
+
     def _setup_process_metrics(self):
         """Set up observable gauges for process metrics."""
 
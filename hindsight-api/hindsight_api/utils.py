@@ -1,3 +1,7 @@
+import asyncio
+import re
+from collections.abc import Awaitable, Iterable
+from typing import Any
 from urllib.parse import urlparse, urlunparse
 
 
@@ -11,3 +15,44 @@ def mask_network_location(url):
     if parsed_url.username or parsed_url.password:
         masked_network_location = f"***:***@{masked_network_location}"
     return urlunparse(parsed_url._replace(netloc=masked_network_location))
+
+
+async def cancel_tasks(tasks: Iterable[asyncio.Future]) -> None:
+    """Cancel the tasks that are still running and wait for all of them to settle."""
+    tasks = list(tasks)
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def gather_or_cancel(*aws: Awaitable[Any]) -> list[Any]:
+    """Like asyncio.gather, but cancels the remaining awaitables if one fails or the caller is cancelled."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        await cancel_tasks(tasks)
+
+
+def sanitize_text(text: str | None) -> str | None:
+    """
+    Sanitize text by removing characters that break downstream systems.
+
+    Removes:
+    - Null bytes (\\x00): Invalid in PostgreSQL UTF-8 encoding
+    - Unicode surrogates (U+D800-U+DFFF): Invalid in UTF-8, break LLM APIs
+
+    Surrogate characters are used in UTF-16 encoding but cannot be encoded
+    in UTF-8. They can appear in Python strings from improperly decoded data
+    (e.g., from JavaScript or broken files). Null bytes commonly appear in
+    OCR output, PDF extraction, or copy-paste from binary sources.
+    """
+    if text is None:
+        return None
+    if not text:
+        return text
+    # Remove null bytes and surrogate characters
+    text = text.replace("\x00", "")
+    return re.sub(r"[\ud800-\udfff]", "", text)
@@ -74,6 +74,8 @@ class WebhookManager:
             event: The event to deliver.
             schema: Database schema (for multi-tenant). None = default schema.
         """
+        from ..engine.task_backend import notify_task_workers
+
         webhook_table = _fq_table("webhooks", schema)
         ops_table = _fq_table("async_operations", schema)
         now = datetime.now(timezone.utc)
@@ -143,6 +145,8 @@ class WebhookManager:
                 )
                 matched += 1
 
+            if matched:
+                await notify_task_workers(self._pool, schema)
             logger.debug(f"Fired webhook event {event.event} for bank {event.bank_id}: {matched} delivery(ies) queued")
 
         except Exception as e:
@@ -163,6 +167,8 @@ class WebhookManager:
             conn: Existing asyncpg connection (may be inside an active transaction).
             schema: Database schema (for multi-tenant). None = default schema.
         """
+        from ..engine.task_backend import notify_task_workers
+
         webhook_table = _fq_table("webhooks", schema)
         ops_table = _fq_table("async_operations", schema)
         now = datetime.now(timezone.utc)
@@ -230,6 +236,9 @@ class WebhookManager:
                 )
                 matched += 1
 
+            if matched:
+                # Delivered when the enclosing transaction commits
+                await notify_task_workers(conn, schema)
             logger.debug(
                 f"Fired webhook event {event.event} for bank {event.bank_id}: {matched} delivery(ies) queued (in-transaction)"
             )
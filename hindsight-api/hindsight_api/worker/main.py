@@ -162,6 +162,10 @@ def main():
 
     print(f"Starting Hindsight Worker: {args.worker_id}")
     print(f"  Poll interval: {args.poll_interval}ms")
+    if config.worker_notify_enabled:
+        print(
+            f"  Task notifications: enabled (poll interval while listening: {config.worker_notify_poll_interval_ms}ms)"
+        )
     print(f"  Max retries: {args.max_retries}")
     print(f"  Max slots: {config.worker_max_slots}")
     print(f"  Consolidation max slots: {config.worker_consolidation_max_slots}")
@@ -223,6 +227,9 @@ def main():
             tenant_extension=tenant_extension,
             max_slots=config.worker_max_slots,
             consolidation_max_slots=config.worker_consolidation_max_slots,
+            counters_reconcile_interval=config.worker_counters_reconcile_interval_seconds,
+            listen_dsn=memory.db_url if config.worker_notify_enabled else None,
+            notify_poll_interval_ms=config.worker_notify_poll_interval_ms,
         )
 
         # Create the HTTP app for metrics/health
@@ -3,6 +3,12 @@ Worker poller for distributed task execution.
 
 Polls PostgreSQL for pending tasks and executes them using
 FOR UPDATE SKIP LOCKED for safe concurrent claiming.
+
+When given a DSN to listen on, the poller holds a dedicated connection that
+LISTENs for the notifications BrokerTaskBackend sends on task submission and
+claims the new task right away, from the notified schema only. Polling then
+only runs as a slow safety net, and falls back to the regular interval while
+the listener connection is down.
 """
 
 import asyncio
@@ -26,6 +32,12 @@ logger = logging.getLogger(__name__)
 # Progress logging interval in seconds
 PROGRESS_LOG_INTERVAL = 30
 
+# Delay between attempts to re-establish a lost listener connection
+LISTEN_RECONNECT_INTERVAL_SECONDS = 5.0
+
+# Interval between folds of the appended per-bank unit counter and generation changes
+DELTA_FOLD_INTERVAL_SECONDS = 60.0
+
 
 def fq_table(table: str, schema: str | None = None) -> str:
     """Get fully-qualified table name with optional schema prefix."""
@@ -63,6 +75,9 @@ class WorkerPoller:
         tenant_extension: "TenantExtension | None" = None,
         max_slots: int = 10,
         consolidation_max_slots: int = 2,
+        counters_reconcile_interval: float = 0,
+        listen_dsn: str | None = None,
+        notify_poll_interval_ms: int = 30000,
     ):
         """
         Initialize the worker poller.
@@ -77,6 +92,12 @@ class WorkerPoller:
                             DefaultTenantExtension with the configured schema.
             max_slots: Maximum concurrent tasks per worker
             consolidation_max_slots: Maximum concurrent consolidation tasks per worker
+            counters_reconcile_interval: Seconds between reconciliations of the per-bank unit
+                            counters with memory_units (0 = disabled)
+            listen_dsn: Database URL to LISTEN for task submissions on. If None, tasks are
+                            only picked up by polling every poll_interval_ms.
+            notify_poll_interval_ms: Interval between safety-net polls while listening
+                            for task submissions (milliseconds)
         """
         self._pool = pool
         self._worker_id = worker_id
@@ -103,6 +124,21 @@ class WorkerPoller:
         self._active_tasks: dict[str, tuple[str, str, str | None, asyncio.Task]] = {}
         # Track in-flight tasks by operation type
         self._in_flight_by_type: dict[str, int] = {}
+        self._counters_reconcile_interval = counters_reconcile_interval
+        self._last_counters_reconcile = time.time()
+        self._counters_reconcile_task: asyncio.Task | None = None
+        self._last_delta_fold = time.time()
+        self._delta_fold_task: asyncio.Task | None = None
+        self._listen_dsn = listen_dsn
+        self._notify_poll_interval_ms = notify_poll_interval_ms
+        self._listener: "asyncpg.Connection | None" = None
+        self._listener_reconnect_task: asyncio.Task | None = None
+        # Set when tasks may have become claimable: submitted, or slots freed
+        self._wakeup = asyncio.Event()
+        # Schemas notified since the last claim, or None when all schemas need claiming
+        self._wakeup_schemas: set[str | None] | None = set()
+        # Whether the last claim stopped at a slot limit, so a finished task frees a claimable slot
+        self._claim_limited = False
 
     async def _get_schemas(self) -> list[str | None]:
         """Get list of schemas to poll. Returns [None] for default schema (no prefix)."""
@@ -154,13 +190,21 @@ class WorkerPoller:
             # Short sleep to avoid busy-waiting
             await asyncio.sleep(0.01)
 
-    async def claim_batch(self) -> list[ClaimedTask]:
+    @property
+    def listening(self) -> bool:
+        """Whether task submissions are received as notifications."""
+        return self._listener is not None and not self._listener.is_closed()
+
+    async def claim_batch(self, schemas: set[str | None] | None = None) -> list[ClaimedTask]:
         """
         Claim pending tasks atomically across all tenant schemas,
         respecting slot limits (total and consolidation).
 
         Uses FOR UPDATE SKIP LOCKED to ensure no conflicts with other workers.
 
+        Args:
+            schemas: Only claim from these of the tenant schemas (None = all)
+
         Returns:
             List of ClaimedTask objects containing operation_id, task_dict, and schema
         """
@@ -168,14 +212,17 @@ class WorkerPoller:
         total_available, consolidation_available = await self._get_available_slots()
 
         if total_available <= 0:
+            self._claim_limited = True
             return []
 
-        schemas = await self._get_schemas()
+        tenant_schemas = await self._get_schemas()
+        if schemas is not None:
+            tenant_schemas = [schema for schema in tenant_schemas if schema in schemas]
         all_tasks: list[ClaimedTask] = []
         remaining_total = total_available
         remaining_consolidation = consolidation_available
 
-        for schema in schemas:
+        for schema in tenant_schemas:
             if remaining_total <= 0:
                 break
 
@@ -190,6 +237,7 @@ class WorkerPoller:
             all_tasks.extend(tasks)
             remaining_total -= len(tasks)
 
+        self._claim_limited = remaining_total <= 0 or remaining_consolidation <= 0
         return all_tasks
 
     async def _claim_batch_for_schema(
@@ -317,7 +365,9 @@ class WorkerPoller:
         )
 
     async def _schedule_retry(self, operation_id: str, retry_at: "Any", error_message: str, schema: str | None):
-        """Reset task to pending with a future retry timestamp."""
+        """Reset task to pending with a future retry timestamp, and notify workers so they wait for it."""
+        from ..engine.task_backend import notify_task_workers
+
         table = fq_table("async_operations", schema)
         error_message = error_message[:5000] if len(error_message) > 5000 else error_message
         await self._pool.execute(
@@ -331,6 +381,7 @@ class WorkerPoller:
             retry_at,
             error_message,
         )
+        await notify_task_workers(self._pool, schema)
         logger.warning(f"Task {operation_id} scheduled for retry at {retry_at}: {error_message}")
 
     async def execute_task(self, task: ClaimedTask):
@@ -362,6 +413,9 @@ class WorkerPoller:
                     self._in_flight_by_type[operation_type] = count - 1
                     if self._in_flight_by_type[operation_type] == 0:
                         del self._in_flight_by_type[operation_type]
+        if self._claim_limited:
+            # Pending tasks may have been left unclaimed for lack of a slot
+            self._wake_all()
 
     async def _execute_task_inner(self, task: ClaimedTask):
         """Inner task execution with retry/fail handling.
@@ -403,6 +457,8 @@ class WorkerPoller:
         Returns:
             Number of tasks recovered
         """
+        from ..engine.task_backend import notify_task_workers
+
         schemas = await self._get_schemas()
         total_count = 0
 
@@ -427,6 +483,8 @@ class WorkerPoller:
                 # Parse "UPDATE N" to get count
                 count = int(result.split()[-1]) if result else 0
                 total_count += count
+                if batch_count or count:
+                    await notify_task_workers(self._pool, schema)
             except Exception as e:
                 # Format schema for logging: custom schemas in quotes, None as-is
                 schema_display = f'"{schema}"' if schema else str(schema)
@@ -518,16 +576,20 @@ class WorkerPoller:
         and immediately continues polling (up to slot limits).
         """
         await self.recover_own_tasks()
+        if self._listen_dsn and not await self._connect_listener():
+            self._schedule_listener_reconnect()
 
         logger.info(
             f"Worker {self._worker_id} starting polling loop "
             f"(max_slots={self._max_slots}, consolidation_max_slots={self._consolidation_max_slots})"
         )
 
+        # Schemas to claim from; None claims from all of them
+        claim_schemas: set[str | None] | None = None
         while not self._shutdown.is_set():
             try:
                 # Claim a batch of tasks (respecting slot limits)
-                tasks = await self.claim_batch()
+                tasks = await self.claim_batch(claim_schemas)
 
                 if tasks:
                     # Log batch info
@@ -558,17 +620,13 @@ class WorkerPoller:
                     continue
 
                 # No tasks claimed (either no pending tasks or slots full)
-                # Wait before polling again
-                try:
-                    await asyncio.wait_for(
-                        self._shutdown.wait(),
-                        timeout=self._poll_interval_ms / 1000,
-                    )
-                except asyncio.TimeoutError:
-                    pass  # Normal timeout, continue polling
+                # Wait for a task notification or a freed slot, or before polling again
+                claim_schemas = await self._wait_for_wakeup()
 
                 # Log progress stats periodically
                 await self._log_progress_if_due()
+                self._reconcile_counters_if_due()
+                self._fold_deltas_if_due()
 
             except asyncio.CancelledError:
                 logger.info(f"Worker {self._worker_id} polling loop cancelled")
@@ -590,6 +648,12 @@ class WorkerPoller:
         """
         logger.info(f"Worker {self._worker_id} initiating graceful shutdown")
         self._shutdown.set()
+        self._wakeup.set()
+        await self._close_listener()
+        if self._counters_reconcile_task is not None:
+            self._counters_reconcile_task.cancel()
+        if self._delta_fold_task is not None:
+            self._delta_fold_task.cancel()
 
         # Wait for in-flight tasks to complete
         start_time = asyncio.get_event_loop().time()
@@ -618,6 +682,138 @@ class WorkerPoller:
                 if not bg_task.done():
                     bg_task.cancel()
 
+    def _wake(self, schema: str | None) -> None:
+        """Wake the polling loop to claim from a schema (None = default schema)."""
+        if self._wakeup_schemas is not None:
+            self._wakeup_schemas.add(schema)
+        self._wakeup.set()
+
+    def _wake_all(self) -> None:
+        """Wake the polling loop to claim from all schemas."""
+        self._wakeup_schemas = None
+        self._wakeup.set()
+
+    async def _next_retry(self) -> tuple[float, str | None] | None:
+        """
+        Find the pending task that becomes due next through its next_retry_at.
+
+        Returns:
+            (seconds until it is due, its schema), or None if no task is waiting for a retry
+        """
+        earliest: tuple[float, str | None] | None = None
+        for schema in await self._get_schemas():
+            try:
+                delay = await self._pool.fetchval(
+                    f"""
+                    SELECT EXTRACT(EPOCH FROM MIN(next_retry_at) - now())::float8
+                    FROM {fq_table("async_operations", schema)}
+                    WHERE status = 'pending' AND next_retry_at > now()
+                    """
+                )
+            except Exception as e:
+                schema_display = f'"{schema}"' if schema else str(schema)
+                logger.warning(f"Worker {self._worker_id} failed to look up retries for schema {schema_display}: {e}")
+                continue
+            if delay is not None and (earliest is None or delay < earliest[0]):
+                earliest = (delay, schema)
+        return earliest
+
+    async def _wait_for_wakeup(self) -> set[str | None] | None:
+        """
+        Wait until tasks may have become claimable, or until the next poll is due.
+
+        While listening, the wait also ends when a task waiting for a retry
+        becomes due; its schema was notified when the retry was scheduled, which
+        woke this loop to look it up here.
+
+        Returns:
+            The schemas to claim from, or None to claim from all schemas
+        """
+        listening = self.listening
+        interval_ms = self._notify_poll_interval_ms if listening else self._poll_interval_ms
+        timeout = interval_ms / 1000
+        retry = await self._next_retry() if listening else None
+        if retry is not None and retry[0] < timeout:
+            timeout = max(0.0, retry[0])
+        else:
+            retry = None
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            if retry is not None:
+                self._wake(retry[1])
+            else:
+                # Safety-net poll
+                self._wake_all()
+
+        self._wakeup.clear()
+        schemas, self._wakeup_schemas = self._wakeup_schemas, set()
+        return schemas if listening else None
+
+    async def _connect_listener(self) -> bool:
+        """Open the listener connection; returns whether it is listening."""
+        import asyncpg
+
+        from ..engine.task_backend import TASK_NOTIFY_CHANNEL
+
+        try:
+            listener = await asyncpg.connect(self._listen_dsn)
+            await listener.add_listener(TASK_NOTIFY_CHANNEL, self._on_task_notification)
+        except Exception as e:
+            logger.warning(f"Worker {self._worker_id} could not listen for task submissions, polling instead: {e}")
+            return False
+        listener.add_termination_listener(self._on_listener_terminated)
+        self._listener = listener
+        # Tasks submitted while nobody was listening were not announced
+        self._wake_all()
+        logger.info(f"Worker {self._worker_id} listening for task submissions on {TASK_NOTIFY_CHANNEL}")
+        return True
+
+    def _schedule_listener_reconnect(self) -> None:
+        if self._shutdown.is_set():
+            return
+        if self._listener_reconnect_task is not None and not self._listener_reconnect_task.done():
+            return
+        self._listener_reconnect_task = asyncio.create_task(self._reconnect_listener())
+
+    async def _reconnect_listener(self) -> None:
+        while not self._shutdown.is_set():
+            await asyncio.sleep(LISTEN_RECONNECT_INTERVAL_SECONDS)
+            if not self._shutdown.is_set() and await self._connect_listener():
+                return
+
+    async def _close_listener(self) -> None:
+        if self._listener_reconnect_task is not None:
+            self._listener_reconnect_task.cancel()
+            self._listener_reconnect_task = None
+        listener, self._listener = self._listener, None
+        if listener is not None and not listener.is_closed():
+            try:
+                await listener.close(timeout=5)
+            except Exception:
+                listener.terminate()
+
+    def _on_task_notification(self, connection, pid: int, channel: str, payload: str) -> None:
+        from ..config import DEFAULT_DATABASE_SCHEMA
+
+        try:
+            schema = json.loads(payload)["schema"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Worker {self._worker_id} got unexpected task notification payload {payload!r}")
+            self._wake_all()
+            return
+        # Default schema is claimed without prefix, as None
+        self._wake(None if schema in (None, DEFAULT_DATABASE_SCHEMA) else schema)
+
+    def _on_listener_terminated(self, connection) -> None:
+        if connection is not self._listener:
+            return
+        self._listener = None
+        if not self._shutdown.is_set():
+            logger.warning(f"Worker {self._worker_id} lost its task listener connection, polling until it is back")
+            self._wake_all()
+            self._schedule_listener_reconnect()
+
     async def _log_progress_if_due(self):
         """Log progress stats every PROGRESS_LOG_INTERVAL seconds."""
         now = time.time()
@@ -692,6 +888,58 @@ class WorkerPoller:
         except Exception as e:
             logger.debug(f"Failed to log progress stats: {e}")
 
+    def _reconcile_counters_if_due(self):
+        """Start a background reconciliation of the per-bank unit counters every reconcile interval."""
+        if self._counters_reconcile_interval <= 0:
+            return
+        if self._counters_reconcile_task is not None and not self._counters_reconcile_task.done():
+            return
+        now = time.time()
+        if now - self._last_counters_reconcile < self._counters_reconcile_interval:
+            return
+        self._last_counters_reconcile = now
+        self._counters_reconcile_task = asyncio.create_task(self._reconcile_counters())
+
+    def _fold_deltas_if_due(self):
+        """Start a background fold of the appended per-bank counter and generation changes every fold interval."""
+        if self._delta_fold_task is not None and not self._delta_fold_task.done():
+            return
+        now = time.time()
+        if now - self._last_delta_fold < DELTA_FOLD_INTERVAL_SECONDS:
+            return
+        self._last_delta_fold = now
+        self._delta_fold_task = asyncio.create_task(self._fold_deltas())
+
+    async def _fold_deltas(self):
+        """Fold the unit counter, bank generation and entity generation deltas of every bank in every schema."""
+        from ..engine.bank_counters import fold_all_bank_counter_deltas
+        from ..engine.entity_resolver import fold_entity_generation_deltas
+        from ..engine.reflect_cache import fold_bank_generation_deltas
+
+        try:
+            schemas = await self._get_schemas()
+            async with self._pool.acquire() as conn:
+                for schema in schemas:
+                    await fold_all_bank_counter_deltas(conn, schema)
+                    await fold_bank_generation_deltas(conn, schema)
+                    await fold_entity_generation_deltas(conn, schema)
+        except Exception as e:
+            logger.warning(f"Failed to fold bank counter deltas: {e}")
+
+    async def _reconcile_counters(self):
+        """Recompute the unit counters of every bank in every schema, fixing drift."""
+        from ..engine.bank_counters import reconcile_all_bank_counters
+
+        try:
+            schemas = await self._get_schemas()
+            async with self._pool.acquire() as conn:
+                for schema in schemas:
+                    corrected = await reconcile_all_bank_counters(conn, schema)
+                    if corrected is None:
+                        logger.debug(f"Unit counters of schema {schema or 'default'} are reconciled by another worker")
+        except Exception as e:
+            logger.warning(f"Failed to reconcile bank unit counters: {e}")
+
     @property
     def worker_id(self) -> str:
         """Get the worker ID."""
@@ -421,3 +421,26 @@ async def test_config_retain_batch_tokens_respected(memory, request_context):
     # Even small batches use parent-child pattern now (simpler code path)
     assert "child_operations" in status
     assert status["result_metadata"]["num_sub_batches"] == 1
+
+
+def test_sub_batches_chained_only_when_sharing_a_document():
+    """Independent sub-batches get their own chain; a split document stays in order."""
+    from hindsight_api.engine.memory_engine import _chain_sub_batches
+
+    sub_batches = [
+        [{"content": "a", "document_id": "doc-1"}],
+        [{"content": "b", "document_id": "doc-2"}, {"content": "c"}],
+        [{"content": "d"}],
+    ]
+    assert _chain_sub_batches(sub_batches) == [[0], [1], [2]]
+
+    # A batch-level document_id is shared by every sub-batch
+    assert _chain_sub_batches(sub_batches, document_id="legacy") == [[0, 1, 2]]
+
+    split = [
+        [{"content": "a", "document_id": "doc-1"}],
+        [{"content": "b", "document_id": "doc-2"}],
+        [{"content": "c", "document_id": "doc-1"}, {"content": "d", "document_id": "doc-3"}],
+        [{"content": "e", "document_id": "doc-3"}, {"content": "f", "document_id": "doc-2"}],
+    ]
+    assert _chain_sub_batches(split) == [[0, 1, 2, 3]]
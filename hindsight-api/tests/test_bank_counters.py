@@ -0,0 +1,118 @@
+"""
+Tests for the per-bank unit counters maintained by triggers on memory_units.
+"""
+
+import uuid
+
+import pytest
+
+from hindsight_api import RequestContext
+from hindsight_api.engine.bank_counters import (
+    FOLD_THRESHOLD,
+    fetch_bank_counters,
+    fold_all_bank_counter_deltas,
+    reconcile_bank_counters,
+)
+from hindsight_api.engine.memory_engine import MemoryEngine
+
+
+async def _insert_units(conn, bank_id: str, fact_type: str, count: int, consolidated: bool = False) -> list[uuid.UUID]:
+    ids = [uuid.uuid4() for _ in range(count)]
+    await conn.executemany(
+        f"""
+        INSERT INTO memory_units (id, bank_id, text, fact_type, event_date, created_at, updated_at, consolidated_at)
+        VALUES ($1, $2, $3, $4, NOW(), NOW(), NOW(), {"NOW()" if consolidated else "NULL"})
+        """,
+        [(unit_id, bank_id, f"{fact_type} fact {i}", fact_type) for i, unit_id in enumerate(ids)],
+    )
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_counters_track_retain_consolidation_and_delete(memory: MemoryEngine, request_context: RequestContext):
+    """Inserts, consolidation updates and deletes keep the counters equal to the stored units."""
+    bank_id = f"test-counters-{uuid.uuid4().hex[:8]}"
+    await memory.get_bank_profile(bank_id=bank_id, request_context=request_context)
+
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        world_ids = await _insert_units(conn, bank_id, "world", 3)
+        await _insert_units(conn, bank_id, "experience", 2)
+        await _insert_units(conn, bank_id, "observation", 1, consolidated=True)
+
+        counters = await fetch_bank_counters(conn, bank_id, None)
+        assert counters.node_counts == {"world": 3, "experience": 2, "observation": 1}
+        assert counters.pending_consolidation == 5
+        assert counters.last_consolidated_at is None
+
+        await conn.execute("UPDATE memory_units SET consolidated_at = NOW() WHERE id = ANY($1::uuid[])", world_ids[:2])
+        await conn.execute("DELETE FROM memory_units WHERE id = $1", world_ids[2])
+
+        counters = await fetch_bank_counters(conn, bank_id, None)
+        assert counters.node_counts == {"world": 2, "experience": 2, "observation": 1}
+        assert counters.pending_consolidation == 2
+        assert counters.last_consolidated_at is not None
+
+        # Counters already match memory_units, so reconciliation has nothing to fix; it folds the deltas
+        assert await conn.fetchval("SELECT COUNT(*) FROM bank_unit_counter_deltas WHERE bank_id = $1", bank_id) > 0
+        assert await reconcile_bank_counters(conn, bank_id, None) == 0
+        assert await conn.fetchval("SELECT COUNT(*) FROM bank_unit_counter_deltas WHERE bank_id = $1", bank_id) == 0
+        assert await fetch_bank_counters(conn, bank_id, None) == counters
+
+    stats = await memory.get_bank_stats(bank_id, request_context=request_context)
+    assert stats["node_counts"] == {"world": 2, "experience": 2, "observation": 1}
+    assert stats["pending_consolidation"] == 2
+
+    await memory.delete_bank(bank_id, request_context=request_context)
+    async with pool.acquire() as conn:
+        assert await conn.fetchval("SELECT COUNT(*) FROM bank_unit_counters WHERE bank_id = $1", bank_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_fixes_drifted_counters(memory: MemoryEngine, request_context: RequestContext):
+    """Reconciliation recomputes counters that no longer match memory_units."""
+    bank_id = f"test-counters-drift-{uuid.uuid4().hex[:8]}"
+    await memory.get_bank_profile(bank_id=bank_id, request_context=request_context)
+
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        await _insert_units(conn, bank_id, "experience", 4)
+        await conn.execute(
+            """
+            INSERT INTO bank_unit_counter_deltas (bank_id, fact_type, total, pending_consolidation)
+            VALUES ($1, 'experience', 96, -4)
+            """,
+            bank_id,
+        )
+
+        assert await reconcile_bank_counters(conn, bank_id, None) == 1
+
+        counters = await fetch_bank_counters(conn, bank_id, None)
+        assert counters.node_counts == {"experience": 4}
+        assert counters.pending_consolidation == 4
+
+    await memory.delete_bank(bank_id, request_context=request_context)
+
+
+@pytest.mark.asyncio
+async def test_deltas_are_folded_by_readers_and_the_worker(memory: MemoryEngine, request_context: RequestContext):
+    """A reader folds a bank's deltas once they reach the threshold; the schema-wide fold folds the rest."""
+    bank_id = f"test-counters-fold-{uuid.uuid4().hex[:8]}"
+    await memory.get_bank_profile(bank_id=bank_id, request_context=request_context)
+
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        # One statement per unit, so one delta row per unit
+        await _insert_units(conn, bank_id, "world", FOLD_THRESHOLD)
+        counters = await fetch_bank_counters(conn, bank_id, None)
+        assert counters.node_counts == {"world": FOLD_THRESHOLD}
+        assert await conn.fetchval("SELECT COUNT(*) FROM bank_unit_counter_deltas WHERE bank_id = $1", bank_id) == 0
+
+        await _insert_units(conn, bank_id, "experience", 2)
+        assert await fold_all_bank_counter_deltas(conn, None)
+        assert await conn.fetchval("SELECT COUNT(*) FROM bank_unit_counter_deltas WHERE bank_id = $1", bank_id) == 0
+        counters = await fetch_bank_counters(conn, bank_id, None)
+        assert counters.node_counts == {"world": FOLD_THRESHOLD, "experience": 2}
+        assert counters.pending_consolidation == FOLD_THRESHOLD + 2
+
+    await memory.delete_bank(bank_id, request_context=request_context)
@@ -0,0 +1,80 @@
+"""
+Tests for the in-process bank snapshot cache.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from hindsight_api import RequestContext
+from hindsight_api.engine.memory_engine import MemoryEngine
+
+
+async def _wait_for_mission(memory: MemoryEngine, bank_id: str, request_context: RequestContext, mission: str):
+    for _ in range(50):
+        profile = await memory.get_bank_profile(bank_id, request_context=request_context)
+        if profile["mission"] == mission:
+            return profile
+        await asyncio.sleep(0.1)
+    return profile
+
+
+@pytest.mark.asyncio
+async def test_profile_and_directives_invalidated_on_change(memory: MemoryEngine, request_context: RequestContext):
+    """Snapshots are dropped by the engine's own writes and by changes notified from other processes."""
+    bank_id = f"test-bank-snapshot-{uuid.uuid4().hex[:8]}"
+    assert memory._bank_snapshots is not None and memory._bank_snapshots.listening
+
+    await memory.set_bank_mission(bank_id, "Track projects", request_context=request_context)
+    profile = await memory.get_bank_profile(bank_id, request_context=request_context)
+    assert profile["mission"] == "Track projects"
+
+    # A write that bypasses the engine (e.g. another API server) arrives as a notification
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        await conn.execute("UPDATE banks SET mission = $2 WHERE bank_id = $1", bank_id, "Track people")
+    profile = await _wait_for_mission(memory, bank_id, request_context, "Track people")
+    assert profile["mission"] == "Track people"
+
+    # Directive changes through the engine are visible immediately
+    assert await memory.list_directives(bank_id, request_context=request_context, isolation_mode=True) == []
+    directive = await memory.create_directive(
+        bank_id, name="Style", content="Be brief", request_context=request_context
+    )
+    listed = await memory.list_directives(bank_id, request_context=request_context, isolation_mode=True)
+    assert [d["id"] for d in listed] == [directive["id"]]
+
+    await memory.update_directive(bank_id, directive["id"], is_active=False, request_context=request_context)
+    assert await memory.list_directives(bank_id, request_context=request_context, isolation_mode=True) == []
+
+    await memory.delete_bank(bank_id, request_context=request_context)
+
+
+@pytest.mark.asyncio
+async def test_read_racing_with_change_is_not_cached(memory: MemoryEngine, request_context: RequestContext):
+    """A value read while the bank was being changed is returned but not kept."""
+    await memory._authenticate_tenant(request_context)
+    snapshots = memory._bank_snapshots
+    bank_id = f"test-bank-snapshot-{uuid.uuid4().hex[:8]}"
+    loads = []
+
+    async def racing_load():
+        loads.append(1)
+        snapshots.invalidate(bank_id)
+        return {"value": len(loads)}
+
+    assert await snapshots.get(bank_id, "part", racing_load) == {"value": 1}
+    assert await snapshots.get(bank_id, "part", racing_load) == {"value": 2}
+
+    async def load():
+        loads.append(1)
+        return {"value": len(loads)}
+
+    cached = await snapshots.get(bank_id, "other", load)
+    cached["value"] = -1
+    # Callers get copies, so modifying a returned value does not alter the snapshot
+    assert await snapshots.get(bank_id, "other", load) == {"value": 3}
+    assert len(loads) == 3
+    # Nothing is kept for banks without a read in flight
+    assert all(key[1] != bank_id for key in snapshots._loads)
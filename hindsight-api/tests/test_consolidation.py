@@ -13,7 +13,9 @@ import pytest
 from hindsight_api.config import _get_raw_config
 from hindsight_api.engine.consolidation.consolidator import (
     _aggregate_source_fields,
-    _find_related_observations,
+    _find_related_observations_batch,
+    _schedule_tag_groups,
+    _trigger_mental_model_refreshes,
     run_consolidation_job,
 )
 from hindsight_api.engine.memory_engine import MemoryEngine
@@ -1906,6 +1908,64 @@ class TestMentalModelRefreshAfterConsolidation:
         # Cleanup
         await memory.delete_bank(bank_id, request_context=request_context)
 
+    @pytest.mark.asyncio
+    async def test_only_mental_models_with_changed_sources_are_refreshed(self, memory: MemoryEngine, request_context):
+        """A mental model whose recorded sources are untouched by consolidation is not refreshed."""
+        bank_id = f"test-mm-dirty-{uuid.uuid4().hex[:8]}"
+        await memory.get_bank_profile(bank_id=bank_id, request_context=request_context)
+
+        obs_id = uuid.uuid4()
+        async with memory._pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO memory_units (id, bank_id, text, fact_type, event_date, created_at, updated_at)
+                VALUES ($1, $2, 'The user prefers dark mode.', 'observation', NOW(), NOW(), NOW())
+                """,
+                obs_id,
+                bank_id,
+            )
+
+        mental_model = await memory.create_mental_model(
+            bank_id=bank_id,
+            mental_model_id=str(uuid.uuid4()),
+            name="User Preferences",
+            source_query="What are the user's preferences?",
+            content="Initial content about user preferences.",
+            tags=[],
+            trigger={"refresh_after_consolidation": True},
+            request_context=request_context,
+        )
+        # Record the observation as the model's source, as a refresh would
+        await memory.update_mental_model(
+            bank_id,
+            mental_model["id"],
+            reflect_response={
+                "text": "The user prefers dark mode.",
+                "based_on": {"observation": [{"id": str(obs_id), "text": "The user prefers dark mode."}]},
+            },
+            request_context=request_context,
+        )
+
+        with patch.object(memory, "submit_async_refresh_mental_model", new=AsyncMock()) as submit:
+            refreshed = await _trigger_mental_model_refreshes(
+                memory, bank_id, request_context, changed_observation_ids={str(uuid.uuid4())}
+            )
+            assert refreshed == 0
+            submit.assert_not_awaited()
+
+            refreshed = await _trigger_mental_model_refreshes(
+                memory, bank_id, request_context, changed_observation_ids={str(obs_id)}
+            )
+            assert refreshed == 1
+
+            # A source changed outside consolidation no longer matches the recorded fingerprint
+            async with memory._pool.acquire() as conn:
+                await conn.execute("UPDATE memory_units SET text = 'The user prefers light mode.' WHERE id = $1", obs_id)
+            refreshed = await _trigger_mental_model_refreshes(memory, bank_id, request_context)
+            assert refreshed == 1
+
+        await memory.delete_bank(bank_id, request_context=request_context)
+
     @pytest.mark.asyncio
     async def test_graph_endpoint_observations_inherit_links_and_entities(
         self, memory: MemoryEngine, request_context
@@ -2002,8 +2062,9 @@ def test_consolidation_prompt_default():
     prompt = build_batch_consolidation_prompt()
     assert "temporal markers" in prompt
     assert "RESOLVE REFERENCES" in prompt
-    assert "{facts_text}" in prompt
-    assert "{observations_text}" in prompt
+    # Batch data goes in the user message, keeping the system prompt cacheable
+    assert "{facts_text}" not in prompt
+    assert '{"creates": [], "updates": [], "deletes": []}' in prompt
 
 
 def test_consolidation_prompt_observations_mission():
@@ -2019,13 +2080,49 @@ def test_consolidation_prompt_observations_mission():
     assert "RESOLVE REFERENCES" in prompt
     assert "creates" in prompt
     assert "updates" in prompt
-    assert "{facts_text}" in prompt
-    assert "{observations_text}" in prompt
 
-    # Renders cleanly
-    rendered = prompt.format(facts_text="Alice fixed a bug.", observations_text="[]")
-    assert "{facts_text}" not in rendered
-    assert spec in rendered
+
+@pytest.mark.asyncio
+async def test_consolidation_prompt_prefix_is_static_across_batches():
+    """Batches of a bank share the system prompt; only the user message carries facts."""
+    from hindsight_api.engine.consolidation.consolidator import (
+        _consolidate_batch_with_llm,
+        _ConsolidationBatchResponse,
+    )
+    from hindsight_api.engine.llm_wrapper import LLMProvider
+
+    llm = LLMProvider(provider="mock", api_key="", base_url="", model="mock-model")
+    llm.set_mock_response(_ConsolidationBatchResponse())
+
+    for text in ("Alice fixed a bug.", "Bob moved to Berlin."):
+        await _consolidate_batch_with_llm(llm, [{"id": str(uuid.uuid4()), "text": text}], [], {})
+
+    first, second = llm.get_mock_calls()
+    assert first["messages"][0]["role"] == "system"
+    assert first["messages"][0] == second["messages"][0]
+    assert first["prompt_cache_key"] == second["prompt_cache_key"]
+    assert "Alice fixed a bug." in first["messages"][1]["content"]
+    assert "Alice fixed a bug." not in first["messages"][0]["content"]
+
+
+@pytest.mark.asyncio
+async def test_mock_llm_reports_cached_prefix_tokens():
+    """A repeated static prefix is reported as cached input tokens and aggregated in TokenUsage."""
+    from hindsight_api.engine.llm_wrapper import LLMProvider
+    from hindsight_api.engine.providers.mock_llm import MOCK_CACHED_PREFIX_TOKENS
+
+    llm = LLMProvider(provider="mock", api_key="", base_url="", model="mock-model")
+    usages = []
+    for text in ("first", "second"):
+        _, usage = await llm.call(
+            messages=[{"role": "system", "content": "static instructions"}, {"role": "user", "content": text}],
+            return_usage=True,
+        )
+        usages.append(usage)
+
+    assert usages[0].cached_input_tokens == 0
+    assert usages[1].cached_input_tokens == MOCK_CACHED_PREFIX_TOKENS
+    assert (usages[0] + usages[1]).cached_input_tokens == MOCK_CACHED_PREFIX_TOKENS
 
 
 def test_observations_mission_config():
@@ -2422,79 +2519,237 @@ class TestAggregateSourceFields:
         assert agg.tags == ["x"]
 
 
-class TestConsolidationSourceFactsConfig:
-    """Tests that consolidation uses the source_facts token config when calling recall."""
+def _config_with(**overrides):
+    raw = _get_raw_config()
+    return type(raw)(**{**{f: getattr(raw, f) for f in raw.__dataclass_fields__}, **overrides})
 
-    @pytest.fixture(autouse=True)
-    def enable_observations(self):
-        config = _get_raw_config()
-        original = config.enable_observations
-        config.enable_observations = True
-        yield
-        config.enable_observations = original
+
+def test_schedule_tag_groups_runs_only_disjoint_scopes_concurrently():
+    """Groups sharing a tag (directly or via explicit observation scopes) stay serial; untagged groups run first."""
+    tag_groups = {
+        ("session-1", "user-a"): [{"tags": ["user-a", "session-1"]}],
+        ("session-2", "user-b"): [{"tags": ["user-b", "session-2"]}],
+        (): [{"tags": []}],
+        ("session-3", "user-a"): [{"tags": ["user-a", "session-3"]}],
+        ("user-c",): [{"tags": ["user-c"], "observation_scopes": '[["user-b"]]'}],
+        ("user-d",): [{"tags": ["user-d"], "observation_scopes": '"per_tag"'}],
+    }
+
+    serial, components = _schedule_tag_groups(tag_groups)
+
+    assert serial == [()]
+    assert sorted(components) == [
+        [("session-1", "user-a"), ("session-3", "user-a")],
+        [("session-2", "user-b"), ("user-c",)],
+        [("user-d",)],
+    ]
+
+
+def test_batch_plan_is_stale_after_changes_in_its_scope():
+    """A plan is made again when the previous pass touched its observations or created one its lookup would find."""
+    from hindsight_api.engine.consolidation import consolidator
+    from hindsight_api.engine.response_models import MemoryFact
+
+    def plan(fact_tags, observation_ids=(), fact_embeddings=([1.0, 0.0],)):
+        return consolidator._BatchPlan(
+            memories=[],
+            fact_tags=fact_tags,
+            per_fact_obs_ids={},
+            union_observations=[MemoryFact(id=i, text="", fact_type="observation") for i in observation_ids],
+            llm_result=consolidator._BatchLLMResult(),
+            fact_embeddings=list(fact_embeddings),
+        )
+
+    previous = plan(["user-a"])
+    assert not plan(["user-a"], ["obs-1"]).is_stale_after(previous)
+
+    previous.touched_observation_ids.add("obs-1")
+    assert plan(["user-b"], ["obs-1"]).is_stale_after(previous)
+
+    previous = plan(["user-a"])
+    previous.created_observations.append((["session-1", "user-a"], [1.0, 0.0]))
+    assert plan(["user-a"]).is_stale_after(previous)
+    assert plan([]).is_stale_after(previous)
+    assert not plan(["user-b"]).is_stale_after(previous)
+    assert not plan(["session-1", "user-b"]).is_stale_after(previous)
+    # Observations unrelated to every fact of the plan would not be found by its lookup
+    assert not plan([], fact_embeddings=[[0.0, 1.0]]).is_stale_after(previous)
+    assert plan([], fact_embeddings=[[0.0, 1.0], [0.6, 0.8]]).is_stale_after(previous)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_replans_when_previous_batch_touched_its_observations(memory: MemoryEngine, request_context):
+    """The next batch is planned while the current one is applied, and planned again if both touch an observation."""
+    from hindsight_api.engine.consolidation import consolidator
+    from hindsight_api.engine.response_models import MemoryFact
+
+    bank_id = f"test-consolidation-pipeline-{uuid.uuid4().hex[:8]}"
+    await memory.get_bank_profile(bank_id=bank_id, request_context=request_context)
+    texts = ["Alice likes tea", "Alice switched to green tea"]
+    async with memory._pool.acquire() as conn:
+        for text in texts:
+            await conn.execute(
+                "INSERT INTO memory_units (id, bank_id, text, fact_type, created_at) VALUES ($1, $2, $3, 'world', now())",
+                uuid.uuid4(),
+                bank_id,
+                text,
+            )
+
+    shared = MemoryFact(id=str(uuid.uuid4()), text="Alice likes tea", fact_type="observation")
+    planned: list[str] = []
+
+    async def fake_plan(*, memories, **kwargs):
+        planned.append(memories[0]["text"])
+        return consolidator._BatchPlan(
+            memories=memories,
+            fact_tags=[],
+            per_fact_obs_ids={},
+            union_observations=[shared],
+            llm_result=consolidator._BatchLLMResult(),
+        )
+
+    async def fake_apply(*, plan, **kwargs):
+        plan.touched_observation_ids.add(shared.id)
+        return [{"action": "updated"} for _ in plan.memories], 0
+
+    config = _config_with(enable_observations=True, consolidation_llm_batch_size=1)
+    try:
+        with (
+            patch.object(memory._config_resolver, "resolve_full_config", return_value=config),
+            patch.object(consolidator, "_plan_memory_batch", fake_plan),
+            patch.object(consolidator, "_apply_memory_batch_plan", fake_apply),
+        ):
+            result = await run_consolidation_job(memory_engine=memory, bank_id=bank_id, request_context=request_context)
+
+        assert result["memories_processed"] == 2
+        assert result["observations_updated"] == 2
+        assert planned == [texts[0], texts[1], texts[1]]
+    finally:
+        await memory.delete_bank(bank_id, request_context=request_context)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_keeps_plans_when_created_observations_are_unrelated(
+    memory: MemoryEngine, request_context
+):
+    """Observations created in an untagged bank do not make the next, unrelated batch plan again."""
+    from hindsight_api.engine.consolidation import consolidator
+
+    bank_id = f"test-consolidation-pipeline-{uuid.uuid4().hex[:8]}"
+    await memory.get_bank_profile(bank_id=bank_id, request_context=request_context)
+    texts = ["Alice likes tea", "The build server runs Debian", "Bob moved to Lisbon"]
+    async with memory._pool.acquire() as conn:
+        for text in texts:
+            await conn.execute(
+                "INSERT INTO memory_units (id, bank_id, text, fact_type, created_at) VALUES ($1, $2, $3, 'world', now())",
+                uuid.uuid4(),
+                bank_id,
+                text,
+            )
+
+    # Every text gets its own axis, so no observation is similar to another batch's fact
+    [probe] = await memory._generate_embeddings(["probe"])
+    axes: dict[str, int] = {}
+
+    async def orthogonal_embeddings(batch):
+        vectors = []
+        for text in batch:
+            vector = [0.0] * len(probe)
+            vector[axes.setdefault(text, len(axes))] = 1.0
+            vectors.append(vector)
+        return vectors
+
+    llm_calls: list[str] = []
+
+    async def fake_llm(*, memories, **kwargs):
+        llm_calls.append(memories[0]["text"])
+        return consolidator._BatchLLMResult(
+            creates=[consolidator._CreateAction(text=f"Noted: {m['text']}", source_fact_ids=[str(m["id"])]) for m in memories]
+        )
+
+    config = _config_with(enable_observations=True, consolidation_llm_batch_size=1)
+    try:
+        with (
+            patch.object(memory._config_resolver, "resolve_full_config", return_value=config),
+            patch.object(memory, "_generate_embeddings", orthogonal_embeddings),
+            patch.object(consolidator, "_consolidate_batch_with_llm", fake_llm),
+        ):
+            result = await run_consolidation_job(memory_engine=memory, bank_id=bank_id, request_context=request_context)
+
+        assert result["observations_created"] == 3
+        # One LLM call per batch: no plan was thrown away and made again
+        assert llm_calls == texts
+    finally:
+        await memory.delete_bank(bank_id, request_context=request_context)
+
+
+class TestConsolidationObservationLookup:
+    """Tests for the batched observation lookup used by consolidation."""
 
     @pytest.mark.asyncio
-    async def test_consolidation_passes_source_facts_max_tokens_to_recall(
-        self, memory: MemoryEngine, request_context
-    ):
-        """consolidation_source_facts_max_tokens from config is forwarded to recall_async."""
-        bank_id = f"test-sf-config-total-{uuid.uuid4().hex[:8]}"
+    async def test_batch_lookup_scopes_by_tags_and_budgets_source_facts(self, memory: MemoryEngine, request_context):
+        """Observations come back per query within the tag scope; source facts follow the configured budgets."""
+        bank_id = f"test-obs-lookup-{uuid.uuid4().hex[:8]}"
         await memory.get_bank_profile(bank_id=bank_id, request_context=request_context)
-
-        raw = _get_raw_config()
-        fake_config = type(raw)(**{
-            **{f: getattr(raw, f) for f in raw.__dataclass_fields__},
-            "consolidation_source_facts_max_tokens": 999,
-            "consolidation_source_facts_max_tokens_per_observation": -1,
-        })
+        queries = ["Sarah enjoys hiking in the mountains", "Sarah went hiking in the Alps last summer"]
+        [embedding] = await memory._generate_embeddings(["Sarah loves hiking"])
+        source_ids = [uuid.uuid4(), uuid.uuid4()]
+        in_scope, out_of_scope = uuid.uuid4(), uuid.uuid4()
 
         try:
-            with (
-                patch.object(memory._config_resolver, "resolve_full_config", return_value=fake_config),
-                patch.object(memory, "recall_async", wraps=memory.recall_async) as mock_recall,
-            ):
-                await _find_related_observations(
+            async with memory._pool.acquire() as conn:
+                for source_id, text in zip(source_ids, ["Sarah hiked Mont Blanc", "Sarah bought hiking boots"]):
+                    await conn.execute(
+                        """
+                        INSERT INTO memory_units (id, bank_id, text, fact_type, tags)
+                        VALUES ($1, $2, $3, 'world', ARRAY['user-a'])
+                        """,
+                        source_id,
+                        bank_id,
+                        text,
+                    )
+                for obs_id, tags in [(in_scope, ["user-a"]), (out_of_scope, ["user-b"])]:
+                    await conn.execute(
+                        """
+                        INSERT INTO memory_units (id, bank_id, text, fact_type, embedding, source_memory_ids, tags)
+                        VALUES ($1, $2, 'Sarah loves hiking', 'observation', $3::vector, $4, $5)
+                        """,
+                        obs_id,
+                        bank_id,
+                        str(embedding),
+                        source_ids,
+                        tags,
+                    )
+
+                per_query, source_facts = await _find_related_observations_batch(
+                    conn=conn,
                     memory_engine=memory,
                     bank_id=bank_id,
-                    query="test query",
-                    request_context=request_context,
+                    queries=queries,
+                    tags=["user-a"],
+                    config=_config_with(
+                        consolidation_source_facts_max_tokens=-1,
+                        consolidation_source_facts_max_tokens_per_observation=-1,
+                    ),
                 )
-                assert mock_recall.called
-                _, kwargs = mock_recall.call_args
-                assert kwargs.get("max_source_facts_tokens") == 999
-                assert kwargs.get("max_source_facts_tokens_per_observation") == -1
-        finally:
-            await memory.delete_bank(bank_id, request_context=request_context)
-
-    @pytest.mark.asyncio
-    async def test_consolidation_passes_source_facts_per_obs_tokens_to_recall(
-        self, memory: MemoryEngine, request_context
-    ):
-        """consolidation_source_facts_max_tokens_per_observation from config is forwarded to recall_async."""
-        bank_id = f"test-sf-config-per-obs-{uuid.uuid4().hex[:8]}"
-        await memory.get_bank_profile(bank_id=bank_id, request_context=request_context)
-
-        raw = _get_raw_config()
-        fake_config = type(raw)(**{
-            **{f: getattr(raw, f) for f in raw.__dataclass_fields__},
-            "consolidation_source_facts_max_tokens": -1,
-            "consolidation_source_facts_max_tokens_per_observation": 128,
-        })
+                assert [[obs.id for obs in observations] for observations in per_query] == [
+                    [str(in_scope)],
+                    [str(in_scope)],
+                ]
+                assert per_query[0][0].source_fact_ids == [str(sid) for sid in source_ids]
+                assert set(source_facts) == {str(sid) for sid in source_ids}
 
-        try:
-            with (
-                patch.object(memory._config_resolver, "resolve_full_config", return_value=fake_config),
-                patch.object(memory, "recall_async", wraps=memory.recall_async) as mock_recall,
-            ):
-                await _find_related_observations(
+                _, source_facts = await _find_related_observations_batch(
+                    conn=conn,
                     memory_engine=memory,
                     bank_id=bank_id,
-                    query="test query",
-                    request_context=request_context,
+                    queries=queries,
+                    tags=["user-a"],
+                    config=_config_with(
+                        consolidation_source_facts_max_tokens=-1,
+                        consolidation_source_facts_max_tokens_per_observation=0,
+                    ),
                 )
-                assert mock_recall.called
-                _, kwargs = mock_recall.call_args
-                assert kwargs.get("max_source_facts_tokens") == -1
-                assert kwargs.get("max_source_facts_tokens_per_observation") == 128
+                assert source_facts == {}
         finally:
             await memory.delete_bank(bank_id, request_context=request_context)
@@ -0,0 +1,105 @@
+"""
+Tests for the content-addressed embedding cache.
+"""
+
+import hashlib
+import uuid
+
+import pytest
+
+from hindsight_api.engine.embedding_cache import (
+    EmbeddingCache,
+    cache_model_key,
+    evict_expired_embeddings,
+    lookup_embeddings,
+    text_hash,
+)
+from hindsight_api.engine.memory_engine import get_current_schema
+
+
+class CountingEmbeddings:
+    """Wraps an embeddings backend and records the texts sent to it."""
+
+    def __init__(self, backend):
+        self._backend = backend
+        self.encoded: list[str] = []
+
+    @property
+    def provider_name(self) -> str:
+        return self._backend.provider_name
+
+    @property
+    def model_id(self) -> str:
+        return self._backend.model_id
+
+    @property
+    def dimension(self) -> int:
+        return self._backend.dimension
+
+    async def aencode(self, texts: list[str]) -> list[list[float]]:
+        self.encoded.extend(texts)
+        return await self._backend.aencode(texts)
+
+
+def test_text_hash_is_sha256():
+    assert text_hash("hello") == hashlib.sha256(b"hello").digest()
+
+
+def test_cache_model_key_includes_provider_and_model(embeddings):
+    assert cache_model_key(embeddings) == f"{embeddings.provider_name}:{embeddings.model_id}"
+
+
+@pytest.mark.asyncio
+async def test_second_encode_is_served_from_cache(memory):
+    backend = CountingEmbeddings(memory.embeddings)
+    cache = EmbeddingCache(await memory._get_pool(), max_age_days=30, schema=get_current_schema())
+    texts = [f"Alice moved to Paris {uuid.uuid4()}", f"Bob likes hiking {uuid.uuid4()}"]
+
+    first = await cache.encode(backend, texts)
+    assert backend.encoded == texts
+
+    backend.encoded.clear()
+    second = await cache.encode(backend, list(reversed(texts)))
+
+    assert backend.encoded == []
+    assert second == list(reversed(first))
+    assert len(first[0]) == memory.embeddings.dimension
+
+
+@pytest.mark.asyncio
+async def test_only_misses_and_duplicates_once_are_embedded(memory):
+    backend = CountingEmbeddings(memory.embeddings)
+    cache = EmbeddingCache(await memory._get_pool(), max_age_days=30, schema=get_current_schema())
+    cached = f"cached text {uuid.uuid4()}"
+    fresh = f"fresh text {uuid.uuid4()}"
+    await cache.encode(backend, [cached])
+
+    backend.encoded.clear()
+    vectors = await cache.encode(backend, [fresh, cached, fresh])
+
+    assert backend.encoded == [fresh]
+    assert vectors[0] == vectors[2]
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_ignored_and_evicted(memory):
+    backend = CountingEmbeddings(memory.embeddings)
+    pool = await memory._get_pool()
+    cache = EmbeddingCache(pool, max_age_days=30, schema=get_current_schema())
+    text = f"old text {uuid.uuid4()}"
+    await cache.encode(backend, [text])
+
+    model_key = cache_model_key(backend)
+    digest = text_hash(text)
+    async with pool.acquire() as conn:
+        await conn.execute(
+            "UPDATE embedding_cache SET created_at = NOW() - INTERVAL '40 days' WHERE text_hash = $1", digest
+        )
+        assert await lookup_embeddings(
+            conn, get_current_schema(), model_key, backend.dimension, [digest], max_age_days=30
+        ) == {}
+
+        deleted = await evict_expired_embeddings(conn, get_current_schema(), max_age_days=30)
+        assert deleted >= 1
+        remaining = await conn.fetchval("SELECT COUNT(*) FROM embedding_cache WHERE text_hash = $1", digest)
+        assert remaining == 0
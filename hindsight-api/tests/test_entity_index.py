@@ -0,0 +1,169 @@
+"""
+Tests for the in-memory per-bank entity index used by the "full" entity lookup.
+"""
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from hindsight_api.engine.entity_index import BankEntityIndex, EntityIndexCache
+from hindsight_api.engine.entity_resolver import (
+    GENERATION_FOLD_THRESHOLD,
+    EntityResolver,
+    bump_entity_generation,
+    fetch_entity_generation,
+    fold_entity_generation_deltas,
+)
+
+
+def _candidate_names(index: BankEntityIndex, text: str) -> set[str]:
+    return {candidate[1] for candidate in index.candidates(text)}
+
+
+class TestBankEntityIndex:
+    def test_candidates_match_exact_and_substrings_case_insensitively(self):
+        index = BankEntityIndex(generation=0)
+        index.add_entity("1", "Alice", None)
+        index.add_entity("2", "Alice Smith", None)
+        index.add_entity("3", "Bob", None)
+        index.add_entity("4", "Al", None)
+
+        # Exact, new name inside canonical name, canonical name inside new name
+        assert _candidate_names(index, "alice") == {"Alice", "Alice Smith", "Al"}
+        assert _candidate_names(index, "Smith") == {"Alice Smith"}
+        assert _candidate_names(index, "Dr. Alice Smith") == {"Alice", "Alice Smith", "Al"}
+        assert _candidate_names(index, "Carol") == set()
+
+    def test_short_names_match_without_trigrams(self):
+        index = BankEntityIndex(generation=0)
+        index.add_entity("1", "Bob", None)
+        index.add_entity("2", "Robert", None)
+
+        assert _candidate_names(index, "bo") == {"Bob"}
+        assert _candidate_names(index, "b") == {"Bob", "Robert"}
+
+    def test_candidate_tuples_and_mention_updates(self):
+        index = BankEntityIndex(generation=0)
+        seen = datetime(2024, 1, 1, tzinfo=UTC)
+        index.add_entity("1", "Alice", seen, mention_count=2, metadata={"k": "v"})
+
+        index.record_mentions("1", 3, datetime(2024, 2, 1, tzinfo=UTC))
+        index.record_mentions("1", 1, datetime(2023, 1, 1, tzinfo=UTC))
+
+        assert index.candidates("Alice") == [("1", "Alice", {"k": "v"}, datetime(2024, 2, 1, tzinfo=UTC), 6)]
+
+    def test_cooccurrences_are_symmetric(self):
+        index = BankEntityIndex(generation=0)
+        index.add_entity("1", "Alice", None)
+        index.add_entity("2", "Paris", None)
+        index.add_cooccurrence("1", "2")
+
+        assert index.cooccurring_names("1") == {"paris"}
+        assert index.cooccurring_names("2") == {"alice"}
+        assert index.cooccurring_names("missing") == set()
+
+
+def test_index_cache_evicts_least_recently_used():
+    cache = EntityIndexCache(max_banks=2)
+    cache.put(("public", "a"), BankEntityIndex(0))
+    cache.put(("public", "b"), BankEntityIndex(0))
+    cache.get(("public", "a"))
+    cache.put(("public", "c"), BankEntityIndex(0))
+
+    assert cache.get(("public", "b")) is None
+    assert cache.get(("public", "a")) is not None
+    assert cache.get(("public", "c")) is not None
+
+
+@pytest.mark.asyncio
+async def test_full_lookup_keeps_index_warm_and_reloads_on_other_writers(memory):
+    pool = await memory._get_pool()
+    resolver = EntityResolver(pool, entity_lookup="full")
+    bank_id = f"test-entity-index-{uuid.uuid4()}"
+    now = datetime.now(UTC)
+
+    async def resolve(names: list[str]) -> list[str]:
+        entities = [{"text": name, "type": "CONCEPT", "event_date": now} for name in names]
+        for entity in entities:
+            entity["nearby_entities"] = entities
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                ids = await resolver.resolve_entities_batch(bank_id, entities, "", now, conn=conn)
+        await resolver.flush_pending_stats()
+        return ids
+
+    try:
+        alice_id, paris_id = await resolve(["Alice", "Paris"])
+
+        # New entities are applied to the warm index after commit
+        index = resolver._indexes.get(("public", bank_id))
+        assert index is not None and index.generation == 1
+        assert _candidate_names(index, "Alice") == {"Alice"}
+
+        # Another worker creates an entity and bumps the generation: the index is reloaded
+        async with pool.acquire() as conn:
+            bob_id = await conn.fetchval(
+                "INSERT INTO entities (bank_id, canonical_name, first_seen, last_seen, mention_count) "
+                "VALUES ($1, 'Bob', now(), now(), 1) RETURNING id",
+                bank_id,
+            )
+            await bump_entity_generation(conn, bank_id)
+
+        assert await resolve(["alice", "Bob"]) == [alice_id, bob_id]
+        assert resolver._indexes.get(("public", bank_id)).generation == 3
+    finally:
+        async with pool.acquire() as conn:
+            await conn.execute("DELETE FROM entities WHERE bank_id = $1", bank_id)
+            await conn.execute("DELETE FROM entity_index_generations WHERE bank_id = $1", bank_id)
+            await conn.execute("DELETE FROM entity_index_generation_deltas WHERE bank_id = $1", bank_id)
+
+
+@pytest.mark.asyncio
+async def test_single_entity_creation_updates_warm_index(memory):
+    pool = await memory._get_pool()
+    resolver = EntityResolver(pool, entity_lookup="full")
+    bank_id = f"test-entity-index-{uuid.uuid4()}"
+    now = datetime.now(UTC)
+
+    try:
+        async with pool.acquire() as conn:
+            index = await resolver._get_bank_index(conn, bank_id)
+        assert len(index) == 0
+
+        carol_id = await resolver.resolve_entity(bank_id, "Carol", "", [], now)
+
+        # The created entity is in the warm index, which stays current with the bumped generation
+        index = resolver._indexes.get(("public", bank_id))
+        assert index is not None and index.generation == 1
+        assert [candidate[0] for candidate in index.candidates("Carol")] == [carol_id]
+    finally:
+        async with pool.acquire() as conn:
+            await conn.execute("DELETE FROM entities WHERE bank_id = $1", bank_id)
+            await conn.execute("DELETE FROM entity_index_generations WHERE bank_id = $1", bank_id)
+            await conn.execute("DELETE FROM entity_index_generation_deltas WHERE bank_id = $1", bank_id)
+
+
+@pytest.mark.asyncio
+async def test_entity_generation_deltas_fold_without_changing_the_generation(memory):
+    pool = await memory._get_pool()
+    bank_id = f"test-entity-index-{uuid.uuid4()}"
+
+    try:
+        async with pool.acquire() as conn:
+            for _ in range(GENERATION_FOLD_THRESHOLD):
+                await bump_entity_generation(conn, bank_id)
+            # Lookups fold a bank's deltas once they reach the threshold
+            assert await fetch_entity_generation(conn, bank_id) == GENERATION_FOLD_THRESHOLD
+            assert (
+                await conn.fetchval("SELECT COUNT(*) FROM entity_index_generation_deltas WHERE bank_id = $1", bank_id)
+                == 0
+            )
+
+            await bump_entity_generation(conn, bank_id)
+            assert await fold_entity_generation_deltas(conn, None)
+            assert await fetch_entity_generation(conn, bank_id) == GENERATION_FOLD_THRESHOLD + 1
+    finally:
+        async with pool.acquire() as conn:
+            await conn.execute("DELETE FROM entity_index_generations WHERE bank_id = $1", bank_id)
+            await conn.execute("DELETE FROM entity_index_generation_deltas WHERE bank_id = $1", bank_id)
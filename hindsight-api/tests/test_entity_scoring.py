@@ -0,0 +1,103 @@
+"""
+Tests for batched entity candidate scoring.
+"""
+
+import random
+from datetime import UTC, datetime, timedelta
+from difflib import SequenceMatcher
+
+import pytest
+
+from hindsight_api.engine.entity_scoring import EntityMention, best_candidates, name_similarity
+
+NAMES = [
+    "Alice",
+    "Alice Smith",
+    "Dr. Alice Smith",
+    "Bob",
+    "Google",
+    "Google LLC",
+    "New York",
+    "New York City",
+    "OpenAI",
+    "Open AI",
+    "J.P. Morgan",
+    "JPMorgan Chase",
+    "Python",
+    "python 3.11",
+]
+
+
+def _difflib_ratio(a: str, b: str) -> float:
+    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+
+
+def _reference_best(mention: EntityMention, candidates: list[tuple], cooccurrence_map: dict):
+    """The scoring loop entity resolution used before batching, with difflib similarity."""
+    best_candidate, best_score = None, 0.0
+    for candidate_id, canonical_name, _metadata, last_seen, _count in candidates:
+        score = _difflib_ratio(mention.text, canonical_name) * 0.5
+        if mention.nearby:
+            overlap = len(mention.nearby & cooccurrence_map.get(candidate_id, set()))
+            score += overlap / len(mention.nearby) * 0.3
+        if last_seen and mention.event_date:
+            days_diff = abs((mention.event_date - last_seen).total_seconds() / 86400)
+            if days_diff < 7:
+                score += max(0, 1.0 - days_diff / 7) * 0.2
+        if score > best_score:
+            best_candidate, best_score = candidate_id, score
+    return best_candidate, best_score
+
+
+class TestNameSimilarity:
+    def test_matches_difflib_when_one_name_contains_the_other(self):
+        for a in NAMES:
+            for b in NAMES:
+                if a.lower() in b.lower() or b.lower() in a.lower():
+                    assert name_similarity(a, b) == pytest.approx(_difflib_ratio(a, b))
+
+    def test_never_below_difflib(self):
+        for a in NAMES:
+            for b in NAMES:
+                assert name_similarity(a, b) >= _difflib_ratio(a, b) - 1e-9
+
+    def test_edge_cases(self):
+        assert name_similarity("", "") == 1.0
+        assert name_similarity("Alice", "") == 0.0
+        assert name_similarity("ALICE", "alice") == 1.0
+
+
+def test_best_candidates_match_reference_scoring():
+    rng = random.Random(7)
+    now = datetime(2024, 6, 1, tzinfo=UTC)
+    entity_ids = {name: f"id-{i}" for i, name in enumerate(NAMES)}
+    cooccurrence_map = {entity_id: {n.lower() for n in rng.sample(NAMES, 3)} for entity_id in entity_ids.values()}
+
+    mentions, candidate_lists = [], []
+    for _ in range(200):
+        text = rng.choice(NAMES)
+        candidates = [
+            (entity_ids[name], name, None, now - timedelta(days=rng.uniform(0, 10)), 1)
+            for name in NAMES
+            if name.lower() in text.lower() or text.lower() in name.lower()
+        ]
+        nearby = frozenset(n.lower() for n in rng.sample(NAMES, rng.randint(0, 3)) if n != text)
+        mentions.append(EntityMention(text=text, nearby=nearby, event_date=now))
+        candidate_lists.append(candidates)
+
+    results = best_candidates(mentions, candidate_lists, cooccurrence_map)
+
+    for mention, candidates, (best_id, best_score) in zip(mentions, candidate_lists, results):
+        expected_id, expected_score = _reference_best(mention, candidates, cooccurrence_map)
+        assert best_score == pytest.approx(expected_score)
+        assert best_id == expected_id
+
+
+def test_best_candidates_without_candidates_or_dates():
+    mentions = [
+        EntityMention(text="Alice", nearby=frozenset(), event_date=None),
+        EntityMention(text="Bob", nearby=frozenset(), event_date=None),
+    ]
+    results = best_candidates(mentions, [[], [("id-bob", "Bob", None, None, 1)]], {})
+
+    assert results == [(None, 0.0), ("id-bob", pytest.approx(0.5))]
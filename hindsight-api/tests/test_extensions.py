@@ -221,6 +221,24 @@ class TestMemoryEngineValidation:
 
         assert "limit exceeded" in str(exc_info.value).lower()
 
+    @pytest.mark.asyncio
+    async def test_import_facts_validation(self, memory_with_validator):
+        """Fact imports count against the same retain validation."""
+        memory = memory_with_validator
+        bank_id = "test-import-validation"
+        ctx = RequestContext()
+
+        async def records():
+            yield {"text": "Imported fact"}
+
+        await memory.retain_batch_async(bank_id=bank_id, contents=[{"content": "First item"}], request_context=ctx)
+        await memory.import_facts_async(bank_id, records(), request_context=ctx)
+
+        with pytest.raises(OperationValidationError) as exc_info:
+            await memory.import_facts_async(bank_id, records(), request_context=ctx)
+
+        assert "limit exceeded" in str(exc_info.value).lower()
+
     @pytest.mark.asyncio
     async def test_recall_validation(self, memory_with_validator):
         """Recall is validated before execution."""
@@ -509,6 +527,33 @@ class TestOperationHooksParameters:
         assert post_result.result == result  # Should match the return value
         assert post_result.result.text is not None
 
+    @pytest.mark.asyncio
+    async def test_import_hooks_receive_imported_records(self, memory_with_tracking_validator):
+        """Fact imports go through the retain hooks, with the imported unit ids as result."""
+        from hindsight_api.engine.retain.fact_import import unit_id_for
+
+        memory, validator = memory_with_tracking_validator
+        bank_id = "test-import-hooks"
+        ctx = RequestContext()
+
+        async def records():
+            yield {"text": "Alice lives in Paris", "context": "profile"}
+            yield {"text": "Bob works at Acme"}
+
+        result = await memory.import_facts_async(bank_id, records(), request_context=ctx, import_id="import-hooks")
+
+        assert result.records_committed == 2
+        assert len(validator.pre_retain_calls) == 1
+        pre_ctx = validator.pre_retain_calls[0]
+        assert pre_ctx.bank_id == bank_id
+        assert [c["content"] for c in pre_ctx.contents] == ["Alice lives in Paris", "Bob works at Acme"]
+        assert pre_ctx.contents[0]["context"] == "profile"
+
+        assert len(validator.post_retain_calls) == 1
+        post_result = validator.post_retain_calls[0]
+        assert post_result.success is True
+        assert post_result.unit_ids == [[str(unit_id_for("import-hooks", i))] for i in range(2)]
+
     @pytest.mark.asyncio
     async def test_post_hooks_called_in_order_after_pre_hooks(self, memory_with_tracking_validator):
         """Post hooks are called after pre hooks and after operation completes."""
@@ -0,0 +1,199 @@
+"""
+Tests for bulk import of pre-extracted facts.
+"""
+
+import uuid
+
+import pytest
+
+from hindsight_api.engine.retain.fact_import import (
+    FactImportError,
+    _embedding_texts,
+    iter_ndjson_records,
+    parse_import_record,
+    unit_id_for,
+)
+
+
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _records(records: list[dict]):
+    for record in records:
+        yield record
+
+
+class TestParseImportRecord:
+    def test_minimal_record_gets_defaults(self):
+        record = parse_import_record({"text": "Alice lives in Paris"}, 0, dimension=3)
+
+        assert record.fact_type == "world"
+        assert record.embedding is None
+        assert record.entities == []
+        assert record.mentioned_at is not None
+
+    def test_entities_are_deduplicated_case_insensitively(self):
+        raw = {"text": "Alice met Bob", "entities": ["Alice", {"text": "Bob"}, "alice"]}
+
+        assert parse_import_record(raw, 0, dimension=3).entities == ["Alice", "Bob"]
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            {"text": ""},
+            {"text": "x", "fact_type": "observation"},
+            {"text": "x", "embedding": [1.0, 2.0]},
+            {"text": "x", "occurred_start": "not a date"},
+            {"text": "x", "causal_relations": [{"target_index": 5}]},
+            {"text": "x", "causal_relations": [{"target_index": 0, "relation_type": "semantic"}]},
+        ],
+    )
+    def test_invalid_records_are_rejected_with_their_position(self, raw):
+        with pytest.raises(FactImportError, match="Record 2"):
+            parse_import_record(raw, 2, dimension=3)
+
+
+@pytest.mark.asyncio
+async def test_ndjson_records_span_chunk_boundaries():
+    stream = _chunks(b'{"text": "a"}\n\n{"te', b'xt": "b"}\n{"text"', b': "c"}')
+
+    assert [record async for record in iter_ndjson_records(stream)] == [{"text": "a"}, {"text": "b"}, {"text": "c"}]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_invalid_line_reports_position():
+    stream = _chunks(b'{"text": "a"}\nnot json\n')
+
+    with pytest.raises(FactImportError, match="Record 1"):
+        _ = [record async for record in iter_ndjson_records(stream)]
+
+
+def test_missing_embeddings_use_retain_text_augmentation():
+    raw = {"text": "Alice moved to Paris", "occurred_start": "2024-06-03T00:00:00Z", "entities": ["Alice", "Paris"]}
+    undated = {"text": "Bob likes tea", "mentioned_at": "2023-01-10T00:00:00Z"}
+
+    records = [parse_import_record(raw, 0, dimension=3), parse_import_record(undated, 1, dimension=3)]
+
+    assert _embedding_texts(records) == [
+        "Alice moved to Paris (happened in June 2024) [Alice, Paris]",
+        "Bob likes tea (happened in January 2023)",
+    ]
+
+
+def test_unit_ids_are_deterministic_per_import():
+    assert unit_id_for("import-a", 3) == unit_id_for("import-a", 3)
+    assert unit_id_for("import-a", 3) != unit_id_for("import-b", 3)
+
+
+@pytest.mark.asyncio
+async def test_import_writes_units_entities_links_and_resumes(memory, request_context):
+    bank_id = f"test-import-{uuid.uuid4().hex[:8]}"
+    import_id = f"import-{uuid.uuid4().hex[:8]}"
+    dimension = memory.embeddings.dimension
+    records = [
+        {
+            "text": "Alice moved to Paris",
+            "entities": ["Alice", "Paris"],
+            "occurred_start": "2024-01-01T00:00:00Z",
+            "tags": ["user:alice"],
+        },
+        {
+            "text": "Alice started a job in Paris",
+            "entities": ["alice", "Paris"],
+            "embedding": [0.1] * dimension,
+            "causal_relations": [{"target_index": 0, "relation_type": "caused_by", "strength": 0.8}],
+        },
+        {"text": "Bob likes hiking", "fact_type": "experience", "entities": ["Bob"]},
+    ]
+
+    try:
+        # An invalid record fails the attempt before its batch is written
+        bad = [*records[:2], {"text": ""}]
+        with pytest.raises(FactImportError):
+            await memory.import_facts_async(
+                bank_id, _records(bad), request_context=request_context, import_id=import_id
+            )
+
+        result = await memory.import_facts_async(
+            bank_id, _records(records), request_context=request_context, import_id=import_id
+        )
+        assert result.records_skipped == 0
+        assert result.records_committed == 3
+        assert result.units_imported == 3
+
+        pool = await memory._get_pool()
+        async with pool.acquire() as conn:
+            units = await conn.fetch(
+                "SELECT id, fact_type, tags FROM memory_units WHERE bank_id = $1 ORDER BY text", bank_id
+            )
+            assert [u["id"] for u in units] == [unit_id_for(import_id, i) for i in (0, 1, 2)]
+            assert units[2]["fact_type"] == "experience"
+            assert units[0]["tags"] == ["user:alice"]
+
+            entities = await conn.fetch(
+                "SELECT canonical_name, mention_count FROM entities WHERE bank_id = $1 ORDER BY canonical_name",
+                bank_id,
+            )
+            assert [(e["canonical_name"], e["mention_count"]) for e in entities] == [
+                ("Alice", 2),
+                ("Bob", 1),
+                ("Paris", 2),
+            ]
+
+            link_types = await conn.fetch(
+                """
+                SELECT link_type, COUNT(*) AS n FROM memory_links
+                WHERE from_unit_id = ANY($1::uuid[]) GROUP BY link_type
+                """,
+                [u["id"] for u in units],
+            )
+            counts = {row["link_type"]: row["n"] for row in link_types}
+            # Units 0 and 1 share two entities: one link per direction per entity
+            assert counts["entity"] == 4
+            assert counts["caused_by"] == 1
+
+        # Running the completed import again is a no-op
+        again = await memory.import_facts_async(
+            bank_id, _records(records), request_context=request_context, import_id=import_id
+        )
+        assert again.records_skipped == 3
+        assert again.units_imported == 3
+    finally:
+        await memory.delete_bank(bank_id, request_context=request_context)
+
+
+@pytest.mark.asyncio
+async def test_import_resumes_after_last_committed_batch(memory, request_context):
+    from hindsight_api.engine.retain import fact_import
+
+    bank_id = f"test-import-{uuid.uuid4().hex[:8]}"
+    import_id = f"import-{uuid.uuid4().hex[:8]}"
+    pool = await memory._get_pool()
+    records = [{"text": f"Fact number {i}"} for i in range(5)]
+
+    try:
+        await memory._authenticate_tenant(request_context)
+        with pytest.raises(FactImportError):
+            await fact_import.import_facts(
+                pool,
+                bank_id,
+                _records([*records[:4], {"text": ""}]),
+                import_id=import_id,
+                embed=memory._generate_embeddings,
+                batch_size=2,
+            )
+
+        result = await fact_import.import_facts(
+            pool, bank_id, _records(records), import_id=import_id, embed=memory._generate_embeddings, batch_size=2
+        )
+
+        assert result.records_skipped == 4
+        assert result.records_committed == 5
+        assert result.units_imported == 5
+        async with pool.acquire() as conn:
+            count = await conn.fetchval("SELECT COUNT(*) FROM memory_units WHERE bank_id = $1", bank_id)
+        assert count == 5
+    finally:
+        await memory.delete_bank(bank_id, request_context=request_context)
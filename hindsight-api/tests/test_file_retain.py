@@ -327,6 +327,94 @@ async def test_file_storage_postgresql(memory_no_llm_verify, sample_txt_content)
     assert exists_after is False
 
 
+@pytest.mark.asyncio
+async def test_file_storage_streams_in_chunks(memory_no_llm_verify, monkeypatch, tmp_path):
+    """Streamed uploads and chunked downloads round-trip the file unchanged."""
+    from hindsight_api.engine.storage import postgresql
+
+    storage = memory_no_llm_verify._file_storage
+    monkeypatch.setattr(postgresql, "STREAM_CHUNK_SIZE", 7)
+    data = bytes(range(256)) * 3
+
+    key = "test/streamed.bin"
+    await storage.store_stream(io.BytesIO(data), key=key)
+    try:
+        target = tmp_path / "streamed.bin"
+        await storage.retrieve_to_file(key, target)
+        assert target.read_bytes() == data
+
+        with pytest.raises(FileNotFoundError):
+            await storage.retrieve_to_file("test/missing.bin", tmp_path / "missing.bin")
+    finally:
+        await storage.delete(key)
+
+
+@pytest.mark.asyncio
+async def test_converter_registry_converts_from_path(tmp_path):
+    """Parsers convert files from local disk when given a path."""
+    from hindsight_api.engine.parsers import FileParserRegistry, MarkitdownParser
+
+    registry = FileParserRegistry()
+    registry.register(MarkitdownParser())
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"This is a test document.\nWith multiple lines.")
+
+    result = await registry.convert_with_fallback(["markitdown"], None, "notes.txt", file_path=path)
+    assert result.parser_name == "markitdown"
+    assert "test document" in result.content.lower()
+
+
+@pytest.mark.asyncio
+async def test_parser_process_pool_converts_and_recovers_from_timeout(tmp_path):
+    """Conversion runs in worker processes; a hung conversion is killed and the pool restarts."""
+    import os
+    import time
+
+    from hindsight_api.engine.parsers import FileParserRegistry, MarkitdownParser, ParserProcessPool
+
+    pool = ParserProcessPool(max_workers=1, timeout=60)
+    try:
+        registry = FileParserRegistry(process_pool=pool)
+        registry.register(MarkitdownParser())
+        path = tmp_path / "notes.txt"
+        path.write_bytes(b"This is a test document.\nWith multiple lines.")
+
+        result = await registry.convert_with_fallback(["markitdown"], None, "notes.txt", file_path=path)
+        assert "test document" in result.content.lower()
+
+        pool._timeout = 0.5
+        with pytest.raises(RuntimeError, match="timed out"):
+            await pool.run(time.sleep, 30)
+
+        pool._timeout = 60
+        assert await pool.run(os.getpid) != os.getpid()
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_parser_process_pool_times_out_only_the_running_conversion():
+    """Queued time does not count against the timeout, and a hung conversion takes down only its own worker."""
+    import os
+    import time
+
+    from hindsight_api.engine.parsers import ParserProcessPool
+
+    pool = ParserProcessPool(max_workers=2, timeout=3)
+    pool.start()
+    try:
+        hung = asyncio.create_task(pool.run(time.sleep, 30))
+        await asyncio.sleep(0.5)
+        # Three 2s jobs share the one free worker: the last waits 4s, longer than the timeout,
+        # and the one running when the hung conversion is killed keeps its worker
+        assert await asyncio.gather(*(pool.run(time.sleep, 2) for _ in range(3))) == [None, None, None]
+        with pytest.raises(RuntimeError, match="timed out"):
+            await hung
+        assert await pool.run(os.getpid) != os.getpid()
+    finally:
+        pool.shutdown()
+
+
 @pytest.mark.asyncio
 async def test_markitdown_converter():
     """Test markitdown parser."""
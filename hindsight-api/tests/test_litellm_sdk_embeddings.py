@@ -223,6 +223,20 @@ class TestLiteLLMSDKEmbeddings:
         with pytest.raises(RuntimeError, match="not initialized"):
             emb.encode(["test"])
 
+    async def test_aencode_before_initialization(self, mock_litellm):
+        """Test that aencode raises error if not initialized."""
+        emb = LiteLLMSDKEmbeddings(
+            api_key="test_key",
+            model="cohere/embed-english-v3.0",
+            api_base=None,
+            batch_size=100,
+            timeout=60.0,
+        )
+
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await emb.aencode(["test"])
+        mock_litellm.aembedding.assert_not_called()
+
     async def test_encode_error_handling(self, embeddings, mock_litellm):
         """Test error handling during encoding."""
         # Make embedding raise an error
@@ -231,6 +245,51 @@ class TestLiteLLMSDKEmbeddings:
         with pytest.raises(Exception, match="API Error"):
             embeddings.encode(["test"])
 
+    async def test_aencode_batches_concurrently(self, embeddings, mock_litellm):
+        """Test aencode sends batch_size slices via aembedding and preserves order."""
+        embeddings.batch_size = 2
+
+        async def fake_aembedding(**kwargs):
+            response = MagicMock()
+            response.data = [
+                {"embedding": [float(len(text))] * 768, "index": i} for i, text in enumerate(kwargs["input"])
+            ]
+            return response
+
+        mock_litellm.aembedding = AsyncMock(side_effect=fake_aembedding)
+
+        result = await embeddings.aencode(["a", "bb", "ccc", "dddd", "eeeee"])
+
+        assert [vector[0] for vector in result] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert mock_litellm.aembedding.call_count == 3
+        mock_litellm.embedding.assert_not_called()
+
+    async def test_aencode_retries_rate_limit(self, embeddings, mock_litellm):
+        """Test aencode retries a 429 error and then succeeds."""
+        embeddings.retry_delay = 0
+
+        rate_limited = Exception("Rate limit exceeded")
+        rate_limited.status_code = 429
+        success = MagicMock()
+        success.data = [{"embedding": [0.3] * 768, "index": 0}]
+        mock_litellm.aembedding = AsyncMock(side_effect=[rate_limited, success])
+
+        result = await embeddings.aencode(["test"])
+
+        assert len(result) == 1
+        assert mock_litellm.aembedding.call_count == 2
+
+    async def test_aencode_does_not_retry_client_errors(self, embeddings, mock_litellm):
+        """Test aencode surfaces non-retryable errors immediately."""
+        bad_request = Exception("Bad request")
+        bad_request.status_code = 400
+        mock_litellm.aembedding = AsyncMock(side_effect=bad_request)
+
+        with pytest.raises(Exception, match="Bad request"):
+            await embeddings.aencode(["test"])
+
+        assert mock_litellm.aembedding.call_count == 1
+
     async def test_dimension_property(self, embeddings):
         """Test dimension property."""
         assert embeddings.dimension == 768
@@ -0,0 +1,223 @@
+"""
+Tests for the adaptive LLM concurrency limiter.
+"""
+
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+
+from hindsight_api.engine.llm_concurrency import (
+    LLM_PRIORITY_CONSOLIDATION,
+    LLM_PRIORITY_INTERACTIVE,
+    LLM_PRIORITY_RETAIN,
+    AdaptiveConcurrencyLimiter,
+    current_llm_work,
+    llm_work,
+    parse_retry_after,
+    report_overload,
+    report_overload_status,
+)
+
+
+def _limiter(max_limit: int = 8, **kwargs) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter("test", "model", "key", max_limit=max_limit, **kwargs)
+
+
+def test_overload_halves_limit_once_per_cooldown():
+    limiter = _limiter(8)
+    limiter.on_overload()
+    assert limiter.limit == 4
+    # A burst of rejections from the same window counts once
+    limiter.on_overload()
+    assert limiter.limit == 4
+
+    limiter._last_decrease -= 10
+    limiter.on_overload()
+    assert limiter.limit == 2
+
+
+def test_limit_recovers_additively_and_respects_bounds():
+    limiter = _limiter(4, min_limit=2)
+    limiter.on_overload()
+    limiter._last_decrease -= 10
+    limiter.on_overload()
+    assert limiter.limit == 2
+
+    # +1/limit per success: 2 -> 2.5 -> 2.9 -> 3.24
+    for _ in range(3):
+        limiter.on_success()
+    assert limiter.limit == 3
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.limit == 4
+
+
+def test_non_adaptive_limit_is_fixed():
+    limiter = _limiter(4, adaptive=False)
+    limiter.on_overload()
+    assert limiter.limit == 4
+
+
+def test_parse_retry_after():
+    assert parse_retry_after({"retry-after": "3"}) == 3.0
+    assert parse_retry_after({"retry-after-ms": "1500", "retry-after": "9"}) == 1.5
+    assert 5 < parse_retry_after({"retry-after": formatdate(time.time() + 10, usegmt=True)}) <= 10
+    assert parse_retry_after({"retry-after": "soon"}) is None
+    assert parse_retry_after({}) is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_admission_is_fifo():
+    limiter = _limiter(1)
+    order = []
+
+    async def call(i: int):
+        async with limiter.slot():
+            order.append(i)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(call(i) for i in range(5)))
+    assert order == [0, 1, 2, 3, 4]
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    limiter = _limiter(1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.waiting == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release()
+    assert limiter.in_flight == 0
+    assert limiter.waiting == 0
+
+    await asyncio.wait_for(limiter.acquire(), timeout=1)
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_admission():
+    limiter = _limiter(4)
+    async with limiter.slot():
+        assert report_overload_status(429, {"retry-after-ms": "200"}) == pytest.approx(0.2)
+
+    start = time.monotonic()
+    async with limiter.slot():
+        pass
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_non_overload_status_is_ignored():
+    limiter = _limiter(4)
+    async with limiter.slot():
+        assert report_overload_status(500, {"retry-after": "5"}) == 0.0
+    assert limiter.limit == 4
+
+
+def test_report_overload_outside_a_call_is_a_noop():
+    report_overload(1.0)
+
+
+@pytest.mark.asyncio
+async def test_token_budget_holds_calls_back():
+    limiter = _limiter(4, tokens_per_minute=1000)
+    await limiter.acquire(800)
+
+    waiter = asyncio.create_task(limiter.acquire(300))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    # Tokens leaving the trailing window free the budget
+    limiter._token_log[0] = (limiter._token_log[0][0] - 60, limiter._token_log[0][1])
+    limiter.release()
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+def test_success_reconciles_reserved_tokens():
+    limiter = _limiter(4, tokens_per_minute=1000)
+    limiter._admit(800, LLM_PRIORITY_INTERACTIVE)
+    limiter.on_success(tokens=200, estimated_tokens=800)
+    assert limiter._tokens_in_window == 200
+
+
+@pytest.mark.asyncio
+async def test_background_work_leaves_reserved_slots_free():
+    limiter = _limiter(4, reserved_fraction=0.5)
+    for _ in range(2):
+        await limiter.acquire(priority=LLM_PRIORITY_RETAIN)
+
+    retain = asyncio.create_task(limiter.acquire(priority=LLM_PRIORITY_RETAIN))
+    await asyncio.sleep(0)
+    assert not retain.done()
+
+    # Interactive calls get the reserved slots without queueing behind retain
+    for _ in range(2):
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+    assert limiter.in_flight == 4
+
+    limiter.release(LLM_PRIORITY_RETAIN)
+    await asyncio.wait_for(retain, timeout=1)
+
+
+def test_reservation_never_blocks_background_entirely():
+    assert _limiter(1, reserved_fraction=0.5).reserved == 0
+    assert _limiter(4, reserved_fraction=1.0).reserved == 3
+
+
+async def _admission_order(limiter: AdaptiveConcurrencyLimiter, calls: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Queue calls behind one held slot and return the order they are admitted in."""
+    await limiter.acquire()
+    order = []
+
+    async def call(priority: str, bank_id: str):
+        await limiter.acquire(priority=priority, bank_id=bank_id)
+        order.append((priority, bank_id))
+        limiter.release(priority)
+
+    tasks = [asyncio.create_task(call(priority, bank_id)) for priority, bank_id in calls]
+    await asyncio.sleep(0)
+    limiter.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_classes_share_slots_by_weight():
+    limiter = _limiter(1)
+    calls = [(LLM_PRIORITY_RETAIN, "a")] * 6 + [(LLM_PRIORITY_INTERACTIVE, "a")] * 6
+    order = await _admission_order(limiter, calls)
+
+    # Weight 8 vs 1: every interactive call goes before the second retain call
+    first_retains = [i for i, (priority, _) in enumerate(order) if priority == LLM_PRIORITY_RETAIN]
+    assert first_retains[1] > max(i for i, (priority, _) in enumerate(order) if priority == LLM_PRIORITY_INTERACTIVE)
+
+
+@pytest.mark.asyncio
+async def test_banks_are_served_round_robin_within_a_class():
+    limiter = _limiter(1)
+    calls = [(LLM_PRIORITY_CONSOLIDATION, "big")] * 4 + [(LLM_PRIORITY_CONSOLIDATION, "small")]
+    order = await _admission_order(limiter, calls)
+    assert [bank_id for _, bank_id in order][:2] == ["big", "small"]
+
+
+def test_llm_work_context():
+    assert current_llm_work("retain_extract_facts") == (LLM_PRIORITY_RETAIN, None)
+    assert current_llm_work("reflect") == (LLM_PRIORITY_INTERACTIVE, None)
+
+    with llm_work(LLM_PRIORITY_CONSOLIDATION, "bank-1"):
+        assert current_llm_work("reflect") == (LLM_PRIORITY_CONSOLIDATION, "bank-1")
+        # None keeps the enclosing class
+        with llm_work(None, "bank-2"):
+            assert current_llm_work("reflect") == (LLM_PRIORITY_CONSOLIDATION, "bank-2")
+
+    with llm_work(None, "bank-3"):
+        assert current_llm_work("consolidation") == (LLM_PRIORITY_INTERACTIVE, "bank-3")
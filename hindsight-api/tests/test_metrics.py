@@ -64,8 +64,9 @@ class TestMetricsCollector:
     def mock_meter(self):
         """Create a mock meter for testing."""
         meter = MagicMock()
-        # Create separate mocks for each histogram (operation_duration, llm_duration, http_request_duration)
-        histogram_mocks = [MagicMock(), MagicMock(), MagicMock()]
+        # Create separate mocks for each histogram (operation_duration, llm_duration, http_request_duration,
+        # retain_embedding_overlap, retain_embedding_tail)
+        histogram_mocks = [MagicMock() for _ in range(5)]
         meter.create_histogram.side_effect = histogram_mocks
         # Create separate mocks for each counter
         # (operation_total, llm_tokens_input, llm_tokens_output, llm_calls_total, http_requests_total)
@@ -257,8 +258,9 @@ class TestLLMMetrics:
     def mock_meter(self):
         """Create a mock meter for testing."""
         meter = MagicMock()
-        # Create separate mocks for each histogram (operation_duration, llm_duration, http_request_duration)
-        histogram_mocks = [MagicMock(), MagicMock(), MagicMock()]
+        # Create separate mocks for each histogram (operation_duration, llm_duration, http_request_duration,
+        # retain_embedding_overlap, retain_embedding_tail)
+        histogram_mocks = [MagicMock() for _ in range(5)]
         meter.create_histogram.side_effect = histogram_mocks
         # Create separate mocks for each counter
         # (operation_total, llm_tokens_input, llm_tokens_output, llm_calls_total, http_requests_total)
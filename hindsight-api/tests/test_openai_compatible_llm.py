@@ -0,0 +1,87 @@
+"""
+Tests for the OpenAI-compatible provider's text streaming.
+"""
+
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from hindsight_api.engine.providers.openai_compatible_llm import OpenAICompatibleLLM
+
+
+def _chunk(text: str | None = None, finish_reason: str | None = None, usage=None):
+    choices = [] if text is None and finish_reason is None else [
+        SimpleNamespace(delta=SimpleNamespace(content=text), finish_reason=finish_reason)
+    ]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class FakeCompletions:
+    """Chat completions endpoint of a server that may not accept stream_options."""
+
+    def __init__(self, accepts_stream_options: bool):
+        self.accepts_stream_options = accepts_stream_options
+        self.calls: list[dict] = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if "stream_options" in kwargs and not self.accepts_stream_options:
+            request = httpx.Request("POST", "http://localhost:1234/v1/chat/completions")
+            raise openai.BadRequestError(
+                "Unrecognized request argument supplied: stream_options",
+                response=httpx.Response(400, request=request),
+                body=None,
+            )
+
+        async def stream():
+            yield _chunk("Hello ")
+            yield _chunk("world", finish_reason="stop")
+            if "stream_options" in kwargs:
+                yield _chunk(usage=SimpleNamespace(prompt_tokens=10, completion_tokens=2))
+
+        return stream()
+
+
+def _llm(completions: FakeCompletions) -> OpenAICompatibleLLM:
+    llm = OpenAICompatibleLLM(provider="lmstudio", api_key="", base_url="http://localhost:1234/v1", model="local")
+    llm._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return llm
+
+
+@pytest.mark.asyncio
+async def test_stream_requests_usage_when_supported():
+    completions = FakeCompletions(accepts_stream_options=True)
+    deltas: list[str] = []
+
+    async def on_text_delta(text: str) -> None:
+        deltas.append(text)
+
+    text, usage, finish_reason = await _llm(completions)._stream_text({"model": "local", "messages": []}, on_text_delta)
+
+    assert (text, finish_reason) == ("Hello world", "stop")
+    assert deltas == ["Hello ", "world"]
+    assert usage.prompt_tokens == 10
+    assert [call["stream_options"] for call in completions.calls] == [{"include_usage": True}]
+
+
+@pytest.mark.asyncio
+async def test_stream_without_stream_options_support_falls_back_once():
+    completions = FakeCompletions(accepts_stream_options=False)
+    llm = _llm(completions)
+    deltas: list[str] = []
+
+    async def on_text_delta(text: str) -> None:
+        deltas.append(text)
+
+    text, usage, _ = await llm._stream_text({"model": "local", "messages": []}, on_text_delta)
+
+    assert text == "Hello world"
+    assert deltas == ["Hello ", "world"]
+    assert usage is None
+    assert ["stream_options" in call for call in completions.calls] == [True, False]
+
+    # Later streams no longer send stream_options
+    await llm._stream_text({"model": "local", "messages": []}, on_text_delta)
+    assert ["stream_options" in call for call in completions.calls] == [True, False, False]
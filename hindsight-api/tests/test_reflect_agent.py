@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from hindsight_api.engine.providers.mock_llm import MockLLM
 from hindsight_api.engine.reflect.agent import (
     _clean_answer_text,
     _clean_done_answer,
@@ -416,6 +417,100 @@ class TestReflectAgentMocked:
         assert result is not None
         assert result.iterations == 3
 
+    @pytest.mark.asyncio
+    async def test_streams_tool_calls_and_synthesized_answer(self, mock_functions):
+        """Tool calls are reported as they finish and a synthesized answer is streamed in chunks."""
+        llm = MockLLM(provider="mock", api_key="", base_url="", model="mock-model")
+        llm.set_mock_response("Alice works at Google as an engineer.")
+        llm.call_with_tools = AsyncMock(
+            return_value=LLMToolCallResult(
+                tool_calls=[LLMToolCall(id="1", name="recall", arguments={"query": "Alice", "reason": "find facts"})],
+                finish_reason="tool_calls",
+            )
+        )
+        events = []
+
+        async def on_event(event):
+            events.append(event)
+
+        result = await run_reflect_agent(
+            llm_config=llm,
+            bank_id="test-bank",
+            query="Where does Alice work?",
+            bank_profile={"name": "Test", "mission": "Testing"},
+            max_iterations=2,
+            on_event=on_event,
+            **mock_functions,
+        )
+
+        assert events[0]["type"] == "tool_call"
+        assert events[0]["tool"] == "recall"
+        assert events[0]["reason"] == "find facts"
+        deltas = [e["text"] for e in events if e["type"] == "answer_delta"]
+        assert len(deltas) > 1
+        assert "".join(deltas) == result.text == "Alice works at Google as an engineer."
+
+    @pytest.mark.asyncio
+    async def test_done_answer_emitted_as_single_delta(self, mock_llm, mock_functions):
+        """An answer given through the done tool is emitted whole."""
+        mock_llm.call_with_tools.side_effect = [
+            LLMToolCallResult(
+                tool_calls=[LLMToolCall(id="1", name="recall", arguments={"query": "test"})],
+                finish_reason="tool_calls",
+            ),
+            LLMToolCallResult(
+                tool_calls=[LLMToolCall(id="2", name="done", arguments={"answer": "Test answer"})],
+                finish_reason="tool_calls",
+            ),
+        ]
+        events = []
+
+        async def on_event(event):
+            events.append(event)
+
+        await run_reflect_agent(
+            llm_config=mock_llm,
+            bank_id="test-bank",
+            query="test query",
+            bank_profile={"name": "Test", "mission": "Testing"},
+            on_event=on_event,
+            **mock_functions,
+        )
+
+        assert [e["type"] for e in events] == ["tool_call", "answer_delta"]
+        assert events[1]["text"] == "Test answer"
+
+    @pytest.mark.asyncio
+    async def test_prefetches_queries_of_parallel_tool_calls(self, mock_llm, mock_functions):
+        """Search queries of one iteration are handed to the prefetch callback before the tools run."""
+        mock_llm.call_with_tools.side_effect = [
+            LLMToolCallResult(
+                tool_calls=[
+                    LLMToolCall(id="1", name="search_mental_models", arguments={"query": "alice"}),
+                    LLMToolCall(id="2", name="functions.recall", arguments={"query": "alice job"}),
+                    LLMToolCall(id="3", name="expand", arguments={"memory_ids": ["mem-1"], "depth": "chunk"}),
+                ],
+                finish_reason="tool_calls",
+            ),
+            LLMToolCallResult(
+                tool_calls=[LLMToolCall(id="4", name="done", arguments={"answer": "Test answer"})],
+                finish_reason="tool_calls",
+            ),
+        ]
+        prefetch = AsyncMock()
+
+        result = await run_reflect_agent(
+            llm_config=mock_llm,
+            bank_id="test-bank",
+            query="test query",
+            bank_profile={"name": "Test", "mission": "Testing"},
+            prefetch_queries_fn=prefetch,
+            **mock_functions,
+        )
+
+        assert result.text == "Test answer"
+        prefetch.assert_awaited_once_with(["alice", "alice job"])
+
 
 class TestContextOverflowHelpers:
     """Unit tests for context-overflow detection helpers."""
@@ -544,6 +639,36 @@ class TestContextOverflowBehavior:
         # Final synthesis was called
         mock_llm.call.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_each_message_tokenized_once(self, mock_llm, mock_functions_with_large_output, monkeypatch):
+        """The context guard keeps a running total instead of re-tokenizing the whole history."""
+        from hindsight_api.engine.reflect import agent as agent_module
+
+        tokenized: list[int] = []
+        count_message_tokens = agent_module._count_message_tokens
+
+        def counting(msg):
+            tokenized.append(id(msg))
+            return count_message_tokens(msg)
+
+        monkeypatch.setattr(agent_module, "_count_message_tokens", counting)
+        mock_llm.call_with_tools.return_value = LLMToolCallResult(
+            tool_calls=[LLMToolCall(id="1", name="recall", arguments={"query": "test"})],
+            finish_reason="tool_calls",
+        )
+
+        await run_reflect_agent(
+            llm_config=mock_llm,
+            bank_id="test-bank",
+            query="What do you know?",
+            bank_profile={"name": "Test", "mission": "Testing"},
+            max_iterations=5,
+            **mock_functions_with_large_output,
+        )
+
+        # system + user + (assistant + tool result) for each of the 4 tool iterations
+        assert len(tokenized) == len(set(tokenized)) == 10
+
 
 class TestContextOverflowIntegration:
     """Integration test: real LLM with a very small max_context_tokens.
@@ -0,0 +1,108 @@
+"""
+Tests for the semantic reflect answer cache.
+"""
+
+import uuid
+
+import pytest
+
+from hindsight_api import RequestContext
+from hindsight_api.engine.memory_engine import MemoryEngine
+from hindsight_api.engine.reflect_cache import (
+    FOLD_THRESHOLD,
+    ReflectCache,
+    fetch_bank_generation,
+    fold_bank_generation_deltas,
+    reflect_scope_key,
+)
+from hindsight_api.engine.response_models import MemoryFact, ReflectResult, TokenUsage
+
+
+async def _insert_unit(conn, bank_id: str, text: str) -> None:
+    await conn.execute(
+        """
+        INSERT INTO memory_units (id, bank_id, text, fact_type, event_date, created_at, updated_at)
+        VALUES ($1, $2, $3, 'world', NOW(), NOW(), NOW())
+        """,
+        uuid.uuid4(),
+        bank_id,
+        text,
+    )
+
+
+@pytest.mark.asyncio
+async def test_similar_query_hits_until_bank_changes(memory: MemoryEngine, request_context: RequestContext):
+    """A close paraphrase is answered from the cache only while the bank generation is unchanged."""
+    bank_id = f"test-reflect-cache-{uuid.uuid4().hex[:8]}"
+    await memory.get_bank_profile(bank_id=bank_id, request_context=request_context)
+
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        await _insert_unit(conn, bank_id, "Alice loves sushi")
+
+    cache = ReflectCache(pool, min_similarity=0.9, max_age_seconds=3600)
+    scope_key = reflect_scope_key({"tags": None, "budget": "low", "directives": []})
+    query_embedding = [1.0, 0.0, 0.0, 0.0]
+    paraphrase_embedding = [0.99, 0.1, 0.0, 0.0]
+    unrelated_embedding = [0.0, 1.0, 0.0, 0.0]
+
+    lookup = await cache.lookup(bank_id, scope_key, query_embedding)
+    assert lookup is not None and lookup.result is None
+
+    answer = ReflectResult(
+        text="Alice likes sushi.",
+        based_on={
+            "world": [MemoryFact(id=str(uuid.uuid4()), text="Alice loves sushi", fact_type="world")],
+            "directives": [{"id": "d1", "name": "Style", "content": "Be brief"}],
+        },
+        usage=TokenUsage(input_tokens=1000, output_tokens=50, total_tokens=1050),
+    )
+    await cache.store(bank_id, scope_key, lookup.generation, "What does Alice like to eat?", query_embedding, answer)
+
+    hit = await cache.lookup(bank_id, scope_key, paraphrase_embedding)
+    assert hit.result is not None
+    assert hit.result.cache_hit
+    assert hit.result.cache_similarity >= 0.9
+    assert hit.result.text == "Alice likes sushi."
+    assert isinstance(hit.result.based_on["world"][0], MemoryFact)
+    assert hit.result.based_on["directives"] == answer.based_on["directives"]
+    assert hit.result.usage.total_tokens == 0
+
+    # Dissimilar queries and other scopes (tags, directives, disposition, ...) miss
+    assert (await cache.lookup(bank_id, scope_key, unrelated_embedding)).result is None
+    other_scope = reflect_scope_key({"tags": ["work"], "budget": "low", "directives": []})
+    assert (await cache.lookup(bank_id, other_scope, query_embedding)).result is None
+
+    # New memories bump the bank generation, which invalidates the cached answer
+    async with pool.acquire() as conn:
+        await _insert_unit(conn, bank_id, "Alice became vegetarian")
+    after_change = await cache.lookup(bank_id, scope_key, query_embedding)
+    assert after_change.result is None
+    assert after_change.generation > lookup.generation
+
+    await memory.delete_bank(bank_id, request_context=request_context)
+    async with pool.acquire() as conn:
+        assert await conn.fetchval("SELECT COUNT(*) FROM reflect_cache WHERE bank_id = $1", bank_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_generation_deltas_fold_without_changing_the_generation(
+    memory: MemoryEngine, request_context: RequestContext
+):
+    """Lookups fold a bank's generation deltas past the threshold; folds keep the generation."""
+    bank_id = f"test-reflect-cache-fold-{uuid.uuid4().hex[:8]}"
+    await memory.get_bank_profile(bank_id=bank_id, request_context=request_context)
+
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        before = await fetch_bank_generation(conn, bank_id)
+        for i in range(FOLD_THRESHOLD):
+            await _insert_unit(conn, bank_id, f"fact {i}")
+        assert await fetch_bank_generation(conn, bank_id) == before + FOLD_THRESHOLD
+        assert await conn.fetchval("SELECT COUNT(*) FROM bank_generation_deltas WHERE bank_id = $1", bank_id) == 0
+
+        await _insert_unit(conn, bank_id, "one more fact")
+        assert await fold_bank_generation_deltas(conn, None)
+        assert await fetch_bank_generation(conn, bank_id) == before + FOLD_THRESHOLD + 1
+
+    await memory.delete_bank(bank_id, request_context=request_context)
@@ -0,0 +1,91 @@
+"""
+Tests for the per-reflect retrieval context that memoizes embeddings and candidate sets.
+"""
+
+import asyncio
+
+import pytest
+
+from hindsight_api.engine.reflect.retrieval_context import ReflectRetrievalContext
+
+
+class _RecordingEmbedder:
+    def __init__(self, fail_times: int = 0):
+        self.batches: list[list[str]] = []
+        self._fail_times = fail_times
+
+    async def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        await asyncio.sleep(0)
+        if self._fail_times:
+            self._fail_times -= 1
+            raise RuntimeError("embedding service unavailable")
+        return [[float(len(t))] for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_prefetched_queries_are_embedded_in_one_batch():
+    """Tool calls of one iteration share a single embedding batch; repeats are never re-embedded."""
+    embedder = _RecordingEmbedder()
+    context = ReflectRetrievalContext(embedder)
+
+    await context.prefetch_embeddings(["alice", "bob", "alice"])
+    results = await asyncio.gather(context.embed("alice"), context.embed("bob"), context.embed("alice"))
+
+    assert results == [[5.0], [3.0], [5.0]]
+    assert embedder.batches == [["alice", "bob"]]
+    assert context.embeddings_computed == 2
+    assert context.embedding_hits == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_embeds_share_in_flight_computation():
+    """A query requested while its embedding is being computed waits for that computation."""
+    embedder = _RecordingEmbedder()
+    context = ReflectRetrievalContext(embedder)
+
+    first, second = await asyncio.gather(context.embed("carol"), context.embed("carol"))
+
+    assert first == second == [5.0]
+    assert embedder.batches == [["carol"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_embedding_is_retried():
+    """Errors reach every waiter but are not memoized."""
+    embedder = _RecordingEmbedder(fail_times=1)
+    context = ReflectRetrievalContext(embedder)
+
+    results = await asyncio.gather(context.embed("dave"), context.embed("dave"), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    assert await context.embed("dave") == [4.0]
+    assert embedder.batches == [["dave"], ["dave"]]
+
+
+@pytest.mark.asyncio
+async def test_candidates_are_memoized_by_key():
+    """The same retrieval key runs its retrieval once; failures are not cached."""
+    context = ReflectRetrievalContext(_RecordingEmbedder())
+    calls = []
+
+    async def retrieve():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return {"facts": len(calls)}
+
+    async def failing_retrieve():
+        raise RuntimeError("db down")
+
+    key = ("alice", ("world",), 100, None, None, "any")
+    assert await asyncio.gather(context.candidates(key, retrieve), context.candidates(key, retrieve)) == [
+        {"facts": 1},
+        {"facts": 1},
+    ]
+    assert await context.candidates(("bob",), retrieve) == {"facts": 2}
+
+    with pytest.raises(RuntimeError):
+        await context.candidates(("carol",), failing_retrieve)
+    assert await context.candidates(("carol",), retrieve) == {"facts": 3}
+    assert context.candidate_sets_computed == 3
+    assert context.candidate_hits == 1
@@ -0,0 +1,91 @@
+"""
+Tests for near-duplicate fact suppression at retain time.
+"""
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from hindsight_api.engine.retain import deduplication, fact_storage
+from hindsight_api.engine.retain.types import EntityRef, ProcessedFact
+
+
+def _fact(
+    text: str,
+    embedding: list[float],
+    entities: list[str] = (),
+    tags: list[str] | None = None,
+    day: int = 1,
+    mentioned_day: int | None = None,
+    document_id: str | None = None,
+) -> ProcessedFact:
+    return ProcessedFact(
+        fact_text=text,
+        fact_type="world",
+        embedding=embedding,
+        occurred_start=datetime(2024, 5, day, tzinfo=UTC),
+        occurred_end=None,
+        mentioned_at=datetime(2024, 5, mentioned_day or day, tzinfo=UTC),
+        context="",
+        metadata={},
+        entities=[EntityRef(name=name) for name in entities],
+        tags=tags or [],
+        document_id=document_id,
+    )
+
+
+def test_resolve_unit_ids_follows_merge_targets():
+    plan = deduplication.DedupPlan(targets=[None, "existing", 0, None, 3])
+    assert plan.kept_indices == [0, 3]
+    assert plan.merged_count == 3
+    assert plan.ratio == pytest.approx(0.6)
+    assert plan.resolve_unit_ids(["new-a", "new-b"]) == ["new-a", "existing", "new-a", "new-b", "new-b"]
+
+
+@pytest.mark.asyncio
+async def test_near_duplicates_merge_into_existing_units(memory, request_context):
+    bank_id = f"test-dedup-{uuid.uuid4().hex[:8]}"
+    await memory._authenticate_tenant(request_context)
+    pool = await memory._get_pool()
+    dimension = memory.embeddings.dimension
+    coffee = [1.0] + [0.0] * (dimension - 1)
+    tea = [0.0, 1.0] + [0.0] * (dimension - 2)
+
+    try:
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await fact_storage.ensure_bank_exists(conn, bank_id)
+                await conn.execute("INSERT INTO documents (id, bank_id) VALUES ('doc-1', $1)", bank_id)
+                [existing_id] = await fact_storage.insert_facts_batch(
+                    conn, bank_id, [_fact("User likes coffee", coffee, ["User"])]
+                )
+
+                facts = [
+                    _fact("The user likes coffee", coffee, ["User"], mentioned_day=3),
+                    # Same wording but a different visibility scope, date or document is kept
+                    _fact("User likes coffee", coffee, ["User"], tags=["team-a"]),
+                    _fact("User liked coffee", coffee, ["User"], day=9),
+                    _fact("User likes tea", tea, ["User"]),
+                    _fact("User enjoys tea", tea, ["User"]),
+                    _fact("User likes tea", tea, ["User"], document_id="doc-1"),
+                ]
+                plan = await deduplication.plan_deduplication(conn, bank_id, facts, threshold=0.95)
+                assert plan.targets == [existing_id, None, None, None, 3, None]
+
+                inserted = await fact_storage.insert_facts_batch(conn, bank_id, [facts[i] for i in plan.kept_indices])
+                unit_ids = plan.resolve_unit_ids(inserted)
+                assert unit_ids[4] == unit_ids[3]
+                await deduplication.record_mentions(conn, plan, facts, unit_ids)
+
+                rows = await conn.fetch(
+                    "SELECT id::text, proof_count, mentioned_at FROM memory_units WHERE bank_id = $1", bank_id
+                )
+        by_id = {row["id"]: row for row in rows}
+        assert len(by_id) == 5
+        assert by_id[existing_id]["proof_count"] == 2
+        assert by_id[existing_id]["mentioned_at"] == datetime(2024, 5, 3, tzinfo=UTC)
+        assert by_id[unit_ids[3]]["proof_count"] == 2
+        assert by_id[unit_ids[1]]["proof_count"] == 1
+    finally:
+        await memory.delete_bank(bank_id, request_context=request_context)
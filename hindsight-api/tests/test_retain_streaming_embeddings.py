@@ -0,0 +1,141 @@
+"""
+Tests for streaming per-chunk embeddings during fact extraction.
+
+These tests cover:
+1. StreamingEmbedder micro-batching and final catch-up for unsubmitted texts
+2. stream_facts_from_contents yielding chunks in completion order
+3. assemble_chunk_extractions restoring content/chunk order and global indices
+"""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from hindsight_api.config import HindsightConfig
+from hindsight_api.engine.response_models import TokenUsage
+from hindsight_api.engine.retain import fact_extraction
+from hindsight_api.engine.retain.embedding_processing import StreamingEmbedder
+from hindsight_api.engine.retain.fact_extraction import (
+    Fact,
+    assemble_chunk_extractions,
+    stream_facts_from_contents,
+)
+from hindsight_api.engine.retain.types import RetainContent
+
+
+class RecordingEmbeddings:
+    """Minimal embeddings backend that records each encode() batch."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def encode(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    async def aencode(self, texts: list[str]) -> list[list[float]]:
+        return self.encode(texts)
+
+
+class TestStreamingEmbedder:
+    async def test_embeds_in_micro_batches(self):
+        backend = RecordingEmbeddings()
+        embedder = StreamingEmbedder(backend, micro_batch_size=2)
+
+        embedder.submit(["a", "bb", "ccc"])
+        embeddings = await embedder.embed(["a", "bb", "ccc"])
+
+        assert embeddings == [[1.0], [2.0], [3.0]]
+        assert all(len(batch) <= 2 for batch in backend.batches)
+        assert sorted(text for batch in backend.batches for text in batch) == ["a", "bb", "ccc"]
+        assert embedder.micro_batches == len(backend.batches)
+
+    async def test_embeds_texts_missing_from_stream(self):
+        backend = RecordingEmbeddings()
+        embedder = StreamingEmbedder(backend, micro_batch_size=8)
+
+        embedder.submit(["a"])
+        embeddings = await embedder.embed(["a", "dddd"])
+
+        assert embeddings == [[1.0], [4.0]]
+        # "a" was embedded from the stream and is not recomputed
+        assert [text for batch in backend.batches for text in batch].count("a") == 1
+
+    async def test_duplicate_texts_embedded_once(self):
+        backend = RecordingEmbeddings()
+        embedder = StreamingEmbedder(backend, micro_batch_size=8)
+
+        embedder.submit(["same", "same"])
+        embeddings = await embedder.embed(["same", "same"])
+
+        assert embeddings == [[4.0], [4.0]]
+        assert [text for batch in backend.batches for text in batch] == ["same"]
+
+    async def test_aclose_stops_worker(self):
+        embedder = StreamingEmbedder(RecordingEmbeddings(), micro_batch_size=8)
+        await embedder.aclose()
+        assert embedder.micro_batches == 0
+
+
+@pytest.fixture
+def config():
+    config = HindsightConfig.from_env()
+    config.retain_chunk_size = 10
+    return config
+
+
+def _fake_extraction(delays: dict[str, float]):
+    """Build a replacement for _extract_facts_with_auto_split that returns one fact per chunk."""
+
+    async def _extract(chunk, **kwargs):
+        await asyncio.sleep(delays.get(chunk, 0))
+        fact = Fact(fact=f"{chunk} happened", fact_type="world")
+        return [fact], TokenUsage(input_tokens=1, output_tokens=1, total_tokens=2)
+
+    return _extract
+
+
+class TestStreamFactsFromContents:
+    async def test_yields_in_completion_order_and_assembles_in_content_order(self, config):
+        contents = [
+            RetainContent(content="first", event_date=datetime(2024, 6, 1, tzinfo=UTC)),
+            RetainContent(content="second", event_date=datetime(2024, 6, 2, tzinfo=UTC)),
+        ]
+        # The first content is slowest, so it must arrive last
+        extract = _fake_extraction({"first": 0.05})
+
+        with patch.object(fact_extraction, "_extract_facts_with_auto_split", side_effect=extract):
+            results = [result async for result in stream_facts_from_contents(contents, None, "agent", config)]
+
+        assert [r.content_index for r in results] == [1, 0]
+
+        facts, chunks, usage = assemble_chunk_extractions(contents, results, config)
+
+        assert [f.content_index for f in facts] == [0, 1]
+        assert [c.chunk_index for c in chunks] == [0, 1]
+        assert [c.content_index for c in chunks] == [0, 1]
+        assert usage.total_tokens == 4
+        # Temporal offsets are applied by global position, as in extract_facts_from_contents
+        assert facts[1].mentioned_at > datetime(2024, 6, 2, tzinfo=UTC)
+
+    async def test_failure_cancels_pending_chunks(self, config):
+        contents = [RetainContent(content="boom"), RetainContent(content="slow")]
+        cancelled = asyncio.Event()
+
+        async def _extract(chunk, **kwargs):
+            if chunk == "boom":
+                raise RuntimeError("extraction failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with patch.object(fact_extraction, "_extract_facts_with_auto_split", side_effect=_extract):
+            with pytest.raises(RuntimeError, match="extraction failed"):
+                async for _ in stream_facts_from_contents(contents, None, "agent", config):
+                    pass
+
+        assert cancelled.is_set()
@@ -0,0 +1,144 @@
+"""
+Tests for staged retain commits: units committed first, links created in follow-up transactions.
+"""
+
+import json
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from hindsight_api.engine.retain import fact_storage, staged_linking
+from hindsight_api.engine.retain.types import EntityRef, ProcessedFact
+
+
+def _fact(text: str, entities: list[str], embedding: list[float]) -> ProcessedFact:
+    now = datetime(2024, 5, 1, tzinfo=UTC)
+    return ProcessedFact(
+        fact_text=text,
+        fact_type="world",
+        embedding=embedding,
+        occurred_start=now,
+        occurred_end=None,
+        mentioned_at=now,
+        context="",
+        metadata={},
+        entities=[EntityRef(name=name) for name in entities],
+    )
+
+
+async def _stage_units(memory, pool, bank_id: str) -> tuple[uuid.UUID, list[str]]:
+    dimension = memory.embeddings.dimension
+    facts = [
+        _fact("Alice moved to Paris", ["Alice", "Paris"], [1.0] + [0.0] * (dimension - 1)),
+        _fact("Alice works in Paris", ["Alice", "Paris"], [1.0] + [0.0] * (dimension - 1)),
+    ]
+    batch_id = uuid.uuid4()
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await fact_storage.ensure_bank_exists(conn, bank_id)
+            unit_ids = await fact_storage.insert_facts_batch(conn, bank_id, facts)
+            await staged_linking.stage_pending_links(
+                conn,
+                bank_id,
+                batch_id,
+                unit_ids,
+                [[{"text": e.name, "type": "CONCEPT"} for e in f.entities] for f in facts],
+            )
+    return batch_id, unit_ids
+
+
+async def _link_counts(conn, unit_ids: list[str]) -> dict[str, int]:
+    rows = await conn.fetch(
+        """
+        SELECT link_type, COUNT(*) AS n FROM memory_links
+        WHERE from_unit_id = ANY($1::uuid[]) GROUP BY link_type
+        """,
+        [uuid.UUID(u) for u in unit_ids],
+    )
+    return {row["link_type"]: row["n"] for row in rows}
+
+
+@pytest.mark.asyncio
+async def test_pending_units_are_linked_once(memory, request_context):
+    bank_id = f"test-staged-{uuid.uuid4().hex[:8]}"
+    await memory._authenticate_tenant(request_context)
+    pool = await memory._get_pool()
+
+    try:
+        batch_id, unit_ids = await _stage_units(memory, pool, bank_id)
+        async with pool.acquire() as conn:
+            assert await _link_counts(conn, unit_ids) == {}
+            task = await conn.fetchrow(
+                "SELECT status, next_retry_at FROM async_operations WHERE operation_id = $1", batch_id
+            )
+            assert task["status"] == "pending"
+            assert task["next_retry_at"] > datetime.now(UTC)
+
+        remaining = await staged_linking.link_pending_units(pool, memory.entity_resolver, bank_id, batch_id)
+        assert remaining == 0
+
+        async with pool.acquire() as conn:
+            counts = await _link_counts(conn, unit_ids)
+            # Two shared entities, one link per direction per entity
+            assert counts["entity"] == 4
+            assert counts["temporal"] == 2
+            assert counts["semantic"] == 2
+            assert await conn.fetchval("SELECT COUNT(*) FROM pending_links WHERE batch_id = $1", batch_id) == 0
+
+        # A second pass over a finished batch does nothing
+        assert await staged_linking.link_pending_units(pool, memory.entity_resolver, bank_id, batch_id) == 0
+        async with pool.acquire() as conn:
+            assert await _link_counts(conn, unit_ids) == counts
+
+        await staged_linking.finish_link_task(pool, memory._task_backend, bank_id, batch_id, remaining)
+        async with pool.acquire() as conn:
+            assert await conn.fetchval("SELECT 1 FROM async_operations WHERE operation_id = $1", batch_id) is None
+    finally:
+        await memory.delete_bank(bank_id, request_context=request_context)
+
+
+@pytest.mark.asyncio
+async def test_worker_recovers_interrupted_linking(memory, request_context):
+    bank_id = f"test-staged-{uuid.uuid4().hex[:8]}"
+    await memory._authenticate_tenant(request_context)
+    pool = await memory._get_pool()
+
+    try:
+        batch_id, unit_ids = await _stage_units(memory, pool, bank_id)
+
+        # Simulates the process dying after the unit transaction committed
+        async with pool.acquire() as conn:
+            task_payload = await conn.fetchval(
+                "SELECT task_payload FROM async_operations WHERE operation_id = $1", batch_id
+            )
+        await memory.execute_task(json.loads(task_payload))
+
+        async with pool.acquire() as conn:
+            assert (await _link_counts(conn, unit_ids))["entity"] == 4
+            assert await conn.fetchval("SELECT COUNT(*) FROM pending_links WHERE batch_id = $1", batch_id) == 0
+            status = await conn.fetchval("SELECT status FROM async_operations WHERE operation_id = $1", batch_id)
+            assert status == "completed"
+    finally:
+        await memory.delete_bank(bank_id, request_context=request_context)
+
+
+@pytest.mark.asyncio
+async def test_unfinished_inline_pass_submits_recovery_task(memory, request_context):
+    bank_id = f"test-staged-{uuid.uuid4().hex[:8]}"
+    await memory._authenticate_tenant(request_context)
+    pool = await memory._get_pool()
+
+    try:
+        batch_id, unit_ids = await _stage_units(memory, pool, bank_id)
+
+        # The inline pass linked nothing: the task goes through the (synchronous) task backend at once
+        await staged_linking.finish_link_task(pool, memory._task_backend, bank_id, batch_id, remaining=len(unit_ids))
+
+        async with pool.acquire() as conn:
+            assert (await _link_counts(conn, unit_ids))["entity"] == 4
+            assert await conn.fetchval("SELECT COUNT(*) FROM pending_links WHERE batch_id = $1", batch_id) == 0
+            status = await conn.fetchval("SELECT status FROM async_operations WHERE operation_id = $1", batch_id)
+            assert status == "completed"
+    finally:
+        await memory.delete_bank(bank_id, request_context=request_context)
@@ -1386,3 +1386,99 @@ async def test_worker_slot_limits_enforced(pool, clean_operations):
             await asyncio.wait_for(poll_task, timeout=1.0)
         except asyncio.CancelledError:
             pass
+
+
+async def test_worker_wakes_on_task_notification(pool, pg0_db_url, clean_operations):
+    """Test that a listening worker claims a submitted task without waiting for the next poll."""
+    from hindsight_api.pg0 import resolve_database_url
+    from hindsight_api.worker.poller import WorkerPoller
+
+    executed = asyncio.Event()
+
+    async def executor(task_dict: dict):
+        executed.set()
+
+    poller = WorkerPoller(
+        pool=pool,
+        worker_id="test-worker-notify",
+        executor=executor,
+        poll_interval_ms=60000,
+        listen_dsn=await resolve_database_url(pg0_db_url),
+        notify_poll_interval_ms=60000,
+    )
+    poll_task = asyncio.create_task(poller.run())
+
+    try:
+        for i in range(100):
+            if poller.listening:
+                break
+            await asyncio.sleep(0.01)
+        assert poller.listening
+        # Let the initial claim finish so the loop is waiting for a wakeup
+        await asyncio.sleep(0.2)
+
+        backend = BrokerTaskBackend(pool_getter=lambda: pool)
+        await backend.initialize()
+        bank_id = f"test-worker-{uuid.uuid4().hex[:8]}"
+        await backend.submit_task({"type": "access_count_update", "bank_id": bank_id, "node_ids": []})
+
+        # Both poll intervals are a minute, so only the notification can wake the worker in time
+        await asyncio.wait_for(executed.wait(), timeout=5.0)
+    finally:
+        await poller.shutdown_graceful(timeout=2.0)
+        try:
+            await asyncio.wait_for(poll_task, timeout=1.0)
+        except asyncio.CancelledError:
+            pass
+        assert not poller.listening
+
+
+async def test_listening_worker_runs_retry_when_due(pool, pg0_db_url, clean_operations):
+    """Test that a listening worker runs a scheduled retry when it is due, not at the next poll."""
+    from datetime import datetime, timedelta, timezone
+
+    from hindsight_api.pg0 import resolve_database_url
+    from hindsight_api.worker.exceptions import RetryTaskAt
+    from hindsight_api.worker.poller import WorkerPoller
+
+    attempts = []
+    retried = asyncio.Event()
+
+    async def executor(task_dict: dict):
+        attempts.append(task_dict["_operation_id"])
+        if len(attempts) == 1:
+            raise RetryTaskAt(retry_at=datetime.now(timezone.utc) + timedelta(seconds=1), message="try again")
+        retried.set()
+
+    poller = WorkerPoller(
+        pool=pool,
+        worker_id="test-worker-retry-due",
+        executor=executor,
+        poll_interval_ms=60000,
+        listen_dsn=await resolve_database_url(pg0_db_url),
+        notify_poll_interval_ms=60000,
+    )
+    poll_task = asyncio.create_task(poller.run())
+
+    try:
+        for i in range(100):
+            if poller.listening:
+                break
+            await asyncio.sleep(0.01)
+        assert poller.listening
+        await asyncio.sleep(0.2)
+
+        backend = BrokerTaskBackend(pool_getter=lambda: pool)
+        await backend.initialize()
+        bank_id = f"test-worker-{uuid.uuid4().hex[:8]}"
+        await backend.submit_task({"type": "access_count_update", "bank_id": bank_id, "node_ids": []})
+
+        # Both poll intervals are a minute, so the retry only runs in time if the wait ends when it is due
+        await asyncio.wait_for(retried.wait(), timeout=5.0)
+        assert len(attempts) == 2
+    finally:
+        await poller.shutdown_graceful(timeout=2.0)
+        try:
+            await asyncio.wait_for(poll_task, timeout=1.0)
+        except asyncio.CancelledError:
+            pass
@@ -16,6 +16,7 @@ import (
 	"io"
 	"net/http"
 	"net/url"
+	"os"
 	"strings"
 	"reflect"
 )
@@ -715,6 +716,173 @@ func (a *MemoryAPIService) GetObservationHistoryExecute(r ApiGetObservationHisto
 	return localVarReturnValue, localVarHTTPResponse, nil
 }
 
+type ApiImportMemoriesRequest struct {
+	ctx context.Context
+	ApiService *MemoryAPIService
+	bankId string
+	body *os.File
+	importId *string
+	format *string
+	authorization *string
+}
+
+func (r ApiImportMemoriesRequest) Body(body *os.File) ApiImportMemoriesRequest {
+	r.body = body
+	return r
+}
+
+// Import identifier to resume an interrupted import (generated when omitted)
+func (r ApiImportMemoriesRequest) ImportId(importId string) ApiImportMemoriesRequest {
+	r.importId = &importId
+	return r
+}
+
+// Format of the request body
+func (r ApiImportMemoriesRequest) Format(format string) ApiImportMemoriesRequest {
+	r.format = &format
+	return r
+}
+
+func (r ApiImportMemoriesRequest) Authorization(authorization string) ApiImportMemoriesRequest {
+	r.authorization = &authorization
+	return r
+}
+
+func (r ApiImportMemoriesRequest) Execute() (*ImportMemoriesResponse, *http.Response, error) {
+	return r.ApiService.ImportMemoriesExecute(r)
+}
+
+/*
+ImportMemories Import pre-extracted facts
+
+Bulk import facts that were already extracted, without chunking or LLM extraction.
+
+Intended for migrations from other memory systems and for replaying exports. The request body is a stream of fact records, as NDJSON (`format=ndjson`, default) or a Parquet file (`format=parquet`).
+
+**Record fields:**
+- `text` (required), `fact_type` (`world` or `experience`), `context`, `document_id`
+- `occurred_start`, `occurred_end`, `mentioned_at` (ISO datetimes)
+- `entities` (names), `tags`, `metadata`
+- `embedding` (optional; computed when missing)
+- `causal_relations`: `[{target_index, relation_type, strength}]`, where `target_index` is the 0-based position of an earlier record of the import
+
+Records are written in batched transactions together with a checkpoint. If an import is interrupted, send the same body with the same `import_id` to resume it: records that were already committed are skipped.
+
+ @param ctx context.Context - for authentication, logging, cancellation, deadlines, tracing, etc. Passed from http.Request or context.Background().
+ @param bankId
+ @return ApiImportMemoriesRequest
+*/
+func (a *MemoryAPIService) ImportMemories(ctx context.Context, bankId string) ApiImportMemoriesRequest {
+	return ApiImportMemoriesRequest{
+		ApiService: a,
+		ctx: ctx,
+		bankId: bankId,
+	}
+}
+
+// Execute executes the request
+//  @return ImportMemoriesResponse
+func (a *MemoryAPIService) ImportMemoriesExecute(r ApiImportMemoriesRequest) (*ImportMemoriesResponse, *http.Response, error) {
+	var (
+		localVarHTTPMethod   = http.MethodPost
+		localVarPostBody     interface{}
+		formFiles            []formFile
+		localVarReturnValue  *ImportMemoriesResponse
+	)
+
+	localBasePath, err := a.client.cfg.ServerURLWithContext(r.ctx, "MemoryAPIService.ImportMemories")
+	if err != nil {
+		return localVarReturnValue, nil, &GenericOpenAPIError{error: err.Error()}
+	}
+
+	localVarPath := localBasePath + "/v1/default/banks/{bank_id}/memories/import"
+	localVarPath = strings.Replace(localVarPath, "{"+"bank_id"+"}", url.PathEscape(parameterValueToString(r.bankId, "bankId")), -1)
+
+	localVarHeaderParams := make(map[string]string)
+	localVarQueryParams := url.Values{}
+	localVarFormParams := url.Values{}
+	if r.body == nil {
+		return localVarReturnValue, nil, reportError("body is required and must be specified")
+	}
+
+	if r.importId != nil {
+		parameterAddToHeaderOrQuery(localVarQueryParams, "import_id", r.importId, "form", "")
+	}
+	if r.format != nil {
+		parameterAddToHeaderOrQuery(localVarQueryParams, "format", r.format, "form", "")
+	} else {
+		var defaultValue string = "ndjson"
+		r.format = &defaultValue
+	}
+	// to determine the Content-Type header
+	localVarHTTPContentTypes := []string{"application/octet-stream"}
+
+	// set Content-Type header
+	localVarHTTPContentType := selectHeaderContentType(localVarHTTPContentTypes)
+	if localVarHTTPContentType != "" {
+		localVarHeaderParams["Content-Type"] = localVarHTTPContentType
+	}
+
+	// to determine the Accept header
+	localVarHTTPHeaderAccepts := []string{"application/json"}
+
+	// set Accept header
+	localVarHTTPHeaderAccept := selectHeaderAccept(localVarHTTPHeaderAccepts)
+	if localVarHTTPHeaderAccept != "" {
+		localVarHeaderParams["Accept"] = localVarHTTPHeaderAccept
+	}
+	if r.authorization != nil {
+		parameterAddToHeaderOrQuery(localVarHeaderParams, "authorization", r.authorization, "simple", "")
+	}
+	// body params
+	localVarPostBody = r.body
+	req, err := a.client.prepareRequest(r.ctx, localVarPath, localVarHTTPMethod, localVarPostBody, localVarHeaderParams, localVarQueryParams, localVarFormParams, formFiles)
+	if err != nil {
+		return localVarReturnValue, nil, err
+	}
+
+	localVarHTTPResponse, err := a.client.callAPI(req)
+	if err != nil || localVarHTTPResponse == nil {
+		return localVarReturnValue, localVarHTTPResponse, err
+	}
+
+	localVarBody, err := io.ReadAll(localVarHTTPResponse.Body)
+	localVarHTTPResponse.Body.Close()
+	localVarHTTPResponse.Body = io.NopCloser(bytes.NewBuffer(localVarBody))
+	if err != nil {
+		return localVarReturnValue, localVarHTTPResponse, err
+	}
+
+	if localVarHTTPResponse.StatusCode >= 300 {
+		newErr := &GenericOpenAPIError{
+			body:  localVarBody,
+			error: localVarHTTPResponse.Status,
+		}
+		if localVarHTTPResponse.StatusCode == 422 {
+			var v HTTPValidationError
+			err = a.client.decode(&v, localVarBody, localVarHTTPResponse.Header.Get("Content-Type"))
+			if err != nil {
+				newErr.error = err.Error()
+				return localVarReturnValue, localVarHTTPResponse, newErr
+			}
+					newErr.error = formatErrorMessage(localVarHTTPResponse.Status, &v)
+					newErr.model = v
+		}
+		return localVarReturnValue, localVarHTTPResponse, newErr
+	}
+
+	err = a.client.decode(&localVarReturnValue, localVarBody, localVarHTTPResponse.Header.Get("Content-Type"))
+	if err != nil {
+		newErr := &GenericOpenAPIError{
+			body:  localVarBody,
+			error: err.Error(),
+		}
+		return localVarReturnValue, localVarHTTPResponse, newErr
+	}
+
+	return localVarReturnValue, localVarHTTPResponse, nil
+}
+
 type ApiListMemoriesRequest struct {
 	ctx context.Context
 	ApiService *MemoryAPIService
@@ -1314,6 +1482,136 @@ func (a *MemoryAPIService) ReflectExecute(r ApiReflectRequest) (*ReflectResponse
 	return localVarReturnValue, localVarHTTPResponse, nil
 }
 
+type ApiReflectStreamRequest struct {
+	ctx context.Context
+	ApiService *MemoryAPIService
+	bankId string
+	reflectRequest *ReflectRequest
+	authorization *string
+}
+
+func (r ApiReflectStreamRequest) ReflectRequest(reflectRequest ReflectRequest) ApiReflectStreamRequest {
+	r.reflectRequest = &reflectRequest
+	return r
+}
+
+func (r ApiReflectStreamRequest) Authorization(authorization string) ApiReflectStreamRequest {
+	r.authorization = &authorization
+	return r
+}
+
+func (r ApiReflectStreamRequest) Execute() (*http.Response, error) {
+	return r.ApiService.ReflectStreamExecute(r)
+}
+
+/*
+ReflectStream Reflect and stream the answer
+
+Same as reflect, but streams the agent's progress and the answer as newline-delimited JSON (`application/x-ndjson`).
+
+Each line is an event object with a `type`:
+- `tool_call`: a tool the agent ran (`tool`, `reason`, `input`, `duration_ms`, `iteration`)
+- `answer_delta`: the next chunk of the answer text (`text`)
+- `done`: the last event, with the complete reflect response as `response`
+- `error`: the reflect failed after the stream started (`status_code`, `detail`)
+
+A synthesized answer is streamed token by token by providers that support streaming; an answer the agent returns through its done tool arrives as one delta. The `text` of the final response is authoritative. Authentication and validation errors are returned as regular HTTP errors.
+
+ @param ctx context.Context - for authentication, logging, cancellation, deadlines, tracing, etc. Passed from http.Request or context.Background().
+ @param bankId
+ @return ApiReflectStreamRequest
+*/
+func (a *MemoryAPIService) ReflectStream(ctx context.Context, bankId string) ApiReflectStreamRequest {
+	return ApiReflectStreamRequest{
+		ApiService: a,
+		ctx: ctx,
+		bankId: bankId,
+	}
+}
+
+// Execute executes the request
+func (a *MemoryAPIService) ReflectStreamExecute(r ApiReflectStreamRequest) (*http.Response, error) {
+	var (
+		localVarHTTPMethod   = http.MethodPost
+		localVarPostBody     interface{}
+		formFiles            []formFile
+	)
+
+	localBasePath, err := a.client.cfg.ServerURLWithContext(r.ctx, "MemoryAPIService.ReflectStream")
+	if err != nil {
+		return nil, &GenericOpenAPIError{error: err.Error()}
+	}
+
+	localVarPath := localBasePath + "/v1/default/banks/{bank_id}/reflect/stream"
+	localVarPath = strings.Replace(localVarPath, "{"+"bank_id"+"}", url.PathEscape(parameterValueToString(r.bankId, "bankId")), -1)
+
+	localVarHeaderParams := make(map[string]string)
+	localVarQueryParams := url.Values{}
+	localVarFormParams := url.Values{}
+	if r.reflectRequest == nil {
+		return nil, reportError("reflectRequest is required and must be specified")
+	}
+
+	// to determine the Content-Type header
+	localVarHTTPContentTypes := []string{"application/json"}
+
+	// set Content-Type header
+	localVarHTTPContentType := selectHeaderContentType(localVarHTTPContentTypes)
+	if localVarHTTPContentType != "" {
+		localVarHeaderParams["Content-Type"] = localVarHTTPContentType
+	}
+
+	// to determine the Accept header
+	localVarHTTPHeaderAccepts := []string{"application/x-ndjson", "application/json"}
+
+	// set Accept header
+	localVarHTTPHeaderAccept := selectHeaderAccept(localVarHTTPHeaderAccepts)
+	if localVarHTTPHeaderAccept != "" {
+		localVarHeaderParams["Accept"] = localVarHTTPHeaderAccept
+	}
+	if r.authorization != nil {
+		parameterAddToHeaderOrQuery(localVarHeaderParams, "authorization", r.authorization, "simple", "")
+	}
+	// body params
+	localVarPostBody = r.reflectRequest
+	req, err := a.client.prepareRequest(r.ctx, localVarPath, localVarHTTPMethod, localVarPostBody, localVarHeaderParams, localVarQueryParams, localVarFormParams, formFiles)
+	if err != nil {
+		return nil, err
+	}
+
+	localVarHTTPResponse, err := a.client.callAPI(req)
+	if err != nil || localVarHTTPResponse == nil {
+		return localVarHTTPResponse, err
+	}
+
+	localVarBody, err := io.ReadAll(localVarHTTPResponse.Body)
+	localVarHTTPResponse.Body.Close()
+	localVarHTTPResponse.Body = io.NopCloser(bytes.NewBuffer(localVarBody))
+	if err != nil {
+		return localVarHTTPResponse, err
+	}
+
+	if localVarHTTPResponse.StatusCode >= 300 {
+		newErr := &GenericOpenAPIError{
+			body:  localVarBody,
+			error: localVarHTTPResponse.Status,
+		}
+		if localVarHTTPResponse.StatusCode == 422 {
+			var v HTTPValidationError
+			err = a.client.decode(&v, localVarBody, localVarHTTPResponse.Header.Get("Content-Type"))
+			if err != nil {
+				newErr.error = err.Error()
+				return localVarHTTPResponse, newErr
+			}
+					newErr.error = formatErrorMessage(localVarHTTPResponse.Status, &v)
+					newErr.model = v
+		}
+		return localVarHTTPResponse, newErr
+	}
+
+	return localVarHTTPResponse, nil
+}
+
 type ApiRetainMemoriesRequest struct {
 	ctx context.Context
 	ApiService *MemoryAPIService
@@ -0,0 +1,302 @@
+/*
+Hindsight HTTP API
+
+HTTP API for Hindsight
+
+API version: 0.4.16
+*/
+
+// Code generated by OpenAPI Generator (https://openapi-generator.tech); DO NOT EDIT.
+
+package hindsight
+
+import (
+	"encoding/json"
+	"bytes"
+	"fmt"
+)
+
+// checks if the ImportMemoriesResponse type satisfies the MappedNullable interface at compile time
+var _ MappedNullable = &ImportMemoriesResponse{}
+
+// ImportMemoriesResponse Response model for the bulk fact import endpoint.
+type ImportMemoriesResponse struct {
+	Success bool `json:"success"`
+	BankId string `json:"bank_id"`
+	// Import identifier. Send it again to resume an interrupted import.
+	ImportId string `json:"import_id"`
+	// Records of the import committed so far, including earlier attempts
+	RecordsCommitted int32 `json:"records_committed"`
+	// Records skipped because an earlier attempt already committed them
+	RecordsSkipped int32 `json:"records_skipped"`
+	// Memory units created by this import, including earlier attempts
+	UnitsImported int32 `json:"units_imported"`
+}
+
+type _ImportMemoriesResponse ImportMemoriesResponse
+
+// NewImportMemoriesResponse instantiates a new ImportMemoriesResponse object
+// This constructor will assign default values to properties that have it defined,
+// and makes sure properties required by API are set, but the set of arguments
+// will change when the set of required properties is changed
+func NewImportMemoriesResponse(success bool, bankId string, importId string, recordsCommitted int32, recordsSkipped int32, unitsImported int32) *ImportMemoriesResponse {
+	this := ImportMemoriesResponse{}
+	this.Success = success
+	this.BankId = bankId
+	this.ImportId = importId
+	this.RecordsCommitted = recordsCommitted
+	this.RecordsSkipped = recordsSkipped
+	this.UnitsImported = unitsImported
+	return &this
+}
+
+// NewImportMemoriesResponseWithDefaults instantiates a new ImportMemoriesResponse object
+// This constructor will only assign default values to properties that have it defined,
+// but it doesn't guarantee that properties required by API are set
+func NewImportMemoriesResponseWithDefaults() *ImportMemoriesResponse {
+	this := ImportMemoriesResponse{}
+	return &this
+}
+
+// GetSuccess returns the Success field value
+func (o *ImportMemoriesResponse) GetSuccess() bool {
+	if o == nil {
+		var ret bool
+		return ret
+	}
+
+	return o.Success
+}
+
+// GetSuccessOk returns a tuple with the Success field value
+// and a boolean to check if the value has been set.
+func (o *ImportMemoriesResponse) GetSuccessOk() (*bool, bool) {
+	if o == nil {
+		return nil, false
+	}
+	return &o.Success, true
+}
+
+// SetSuccess sets field value
+func (o *ImportMemoriesResponse) SetSuccess(v bool) {
+	o.Success = v
+}
+
+// GetBankId returns the BankId field value
+func (o *ImportMemoriesResponse) GetBankId() string {
+	if o == nil {
+		var ret string
+		return ret
+	}
+
+	return o.BankId
+}
+
+// GetBankIdOk returns a tuple with the BankId field value
+// and a boolean to check if the value has been set.
+func (o *ImportMemoriesResponse) GetBankIdOk() (*string, bool) {
+	if o == nil {
+		return nil, false
+	}
+	return &o.BankId, true
+}
+
+// SetBankId sets field value
+func (o *ImportMemoriesResponse) SetBankId(v string) {
+	o.BankId = v
+}
+
+// GetImportId returns the ImportId field value
+func (o *ImportMemoriesResponse) GetImportId() string {
+	if o == nil {
+		var ret string
+		return ret
+	}
+
+	return o.ImportId
+}
+
+// GetImportIdOk returns a tuple with the ImportId field value
+// and a boolean to check if the value has been set.
+func (o *ImportMemoriesResponse) GetImportIdOk() (*string, bool) {
+	if o == nil {
+		return nil, false
+	}
+	return &o.ImportId, true
+}
+
+// SetImportId sets field value
+func (o *ImportMemoriesResponse) SetImportId(v string) {
+	o.ImportId = v
+}
+
+// GetRecordsCommitted returns the RecordsCommitted field value
+func (o *ImportMemoriesResponse) GetRecordsCommitted() int32 {
+	if o == nil {
+		var ret int32
+		return ret
+	}
+
+	return o.RecordsCommitted
+}
+
+// GetRecordsCommittedOk returns a tuple with the RecordsCommitted field value
+// and a boolean to check if the value has been set.
+func (o *ImportMemoriesResponse) GetRecordsCommittedOk() (*int32, bool) {
+	if o == nil {
+		return nil, false
+	}
+	return &o.RecordsCommitted, true
+}
+
+// SetRecordsCommitted sets field value
+func (o *ImportMemoriesResponse) SetRecordsCommitted(v int32) {
+	o.RecordsCommitted = v
+}
+
+// GetRecordsSkipped returns the RecordsSkipped field value
+func (o *ImportMemoriesResponse) GetRecordsSkipped() int32 {
+	if o == nil {
+		var ret int32
+		return ret
+	}
+
+	return o.RecordsSkipped
+}
+
+// GetRecordsSkippedOk returns a tuple with the RecordsSkipped field value
+// and a boolean to check if the value has been set.
+func (o *ImportMemoriesResponse) GetRecordsSkippedOk() (*int32, bool) {
+	if o == nil {
+		return nil, false
+	}
+	return &o.RecordsSkipped, true
+}
+
+// SetRecordsSkipped sets field value
+func (o *ImportMemoriesResponse) SetRecordsSkipped(v int32) {
+	o.RecordsSkipped = v
+}
+
+// GetUnitsImported returns the UnitsImported field value
+func (o *ImportMemoriesResponse) GetUnitsImported() int32 {
+	if o == nil {
+		var ret int32
+		return ret
+	}
+
+	return o.UnitsImported
+}
+
+// GetUnitsImportedOk returns a tuple with the UnitsImported field value
+// and a boolean to check if the value has been set.
+func (o *ImportMemoriesResponse) GetUnitsImportedOk() (*int32, bool) {
+	if o == nil {
+		return nil, false
+	}
+	return &o.UnitsImported, true
+}
+
+// SetUnitsImported sets field value
+func (o *ImportMemoriesResponse) SetUnitsImported(v int32) {
+	o.UnitsImported = v
+}
+
+func (o ImportMemoriesResponse) MarshalJSON() ([]byte, error) {
+	toSerialize,err := o.ToMap()
+	if err != nil {
+		return []byte{}, err
+	}
+	return json.Marshal(toSerialize)
+}
+
+func (o ImportMemoriesResponse) ToMap() (map[string]interface{}, error) {
+	toSerialize := map[string]interface{}{}
+	toSerialize["success"] = o.Success
+	toSerialize["bank_id"] = o.BankId
+	toSerialize["import_id"] = o.ImportId
+	toSerialize["records_committed"] = o.RecordsCommitted
+	toSerialize["records_skipped"] = o.RecordsSkipped
+	toSerialize["units_imported"] = o.UnitsImported
+	return toSerialize, nil
+}
+
+func (o *ImportMemoriesResponse) UnmarshalJSON(data []byte) (err error) {
+	// This validates that all required properties are included in the JSON object
+	// by unmarshalling the object into a generic map with string keys and checking
+	// that every required field exists as a key in the generic map.
+	requiredProperties := []string{
+		"success",
+		"bank_id",
+		"import_id",
+		"records_committed",
+		"records_skipped",
+		"units_imported",
+	}
+
+	allProperties := make(map[string]interface{})
+
+	err = json.Unmarshal(data, &allProperties)
+
+	if err != nil {
+		return err;
+	}
+
+	for _, requiredProperty := range(requiredProperties) {
+		if _, exists := allProperties[requiredProperty]; !exists {
+			return fmt.Errorf("no value given for required property %v", requiredProperty)
+		}
+	}
+
+	varImportMemoriesResponse := _ImportMemoriesResponse{}
+
+	decoder := json.NewDecoder(bytes.NewReader(data))
+	decoder.DisallowUnknownFields()
+	err = decoder.Decode(&varImportMemoriesResponse)
+
+	if err != nil {
+		return err
+	}
+
+	*o = ImportMemoriesResponse(varImportMemoriesResponse)
+
+	return err
+}
+
+type NullableImportMemoriesResponse struct {
+	value *ImportMemoriesResponse
+	isSet bool
+}
+
+func (v NullableImportMemoriesResponse) Get() *ImportMemoriesResponse {
+	return v.value
+}
+
+func (v *NullableImportMemoriesResponse) Set(val *ImportMemoriesResponse) {
+	v.value = val
+	v.isSet = true
+}
+
+func (v NullableImportMemoriesResponse) IsSet() bool {
+	return v.isSet
+}
+
+func (v *NullableImportMemoriesResponse) Unset() {
+	v.value = nil
+	v.isSet = false
+}
+
+func NewNullableImportMemoriesResponse(val *ImportMemoriesResponse) *NullableImportMemoriesResponse {
+	return &NullableImportMemoriesResponse{value: val, isSet: true}
+}
+
+func (v NullableImportMemoriesResponse) MarshalJSON() ([]byte, error) {
+	return json.Marshal(v.value)
+}
+
+func (v *NullableImportMemoriesResponse) UnmarshalJSON(src []byte) error {
+	v.isSet = true
+	return json.Unmarshal(src, &v.value)
+}
+
+
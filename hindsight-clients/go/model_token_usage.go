@@ -25,6 +25,8 @@ type TokenUsage struct {
 	OutputTokens *int32 `json:"output_tokens,omitempty"`
 	// Total tokens (input + output)
 	TotalTokens *int32 `json:"total_tokens,omitempty"`
+	// Input tokens served from the provider's prompt cache (included in input_tokens)
+	CachedInputTokens *int32 `json:"cached_input_tokens,omitempty"`
 }
 
 // NewTokenUsage instantiates a new TokenUsage object
@@ -39,6 +41,8 @@ func NewTokenUsage() *TokenUsage {
 	this.OutputTokens = &outputTokens
 	var totalTokens int32 = 0
 	this.TotalTokens = &totalTokens
+	var cachedInputTokens int32 = 0
+	this.CachedInputTokens = &cachedInputTokens
 	return &this
 }
 
@@ -53,6 +57,8 @@ func NewTokenUsageWithDefaults() *TokenUsage {
 	this.OutputTokens = &outputTokens
 	var totalTokens int32 = 0
 	this.TotalTokens = &totalTokens
+	var cachedInputTokens int32 = 0
+	this.CachedInputTokens = &cachedInputTokens
 	return &this
 }
 
@@ -152,6 +158,38 @@ func (o *TokenUsage) SetTotalTokens(v int32) {
 	o.TotalTokens = &v
 }
 
+// GetCachedInputTokens returns the CachedInputTokens field value if set, zero value otherwise.
+func (o *TokenUsage) GetCachedInputTokens() int32 {
+	if o == nil || IsNil(o.CachedInputTokens) {
+		var ret int32
+		return ret
+	}
+	return *o.CachedInputTokens
+}
+
+// GetCachedInputTokensOk returns a tuple with the CachedInputTokens field value if set, nil otherwise
+// and a boolean to check if the value has been set.
+func (o *TokenUsage) GetCachedInputTokensOk() (*int32, bool) {
+	if o == nil || IsNil(o.CachedInputTokens) {
+		return nil, false
+	}
+	return o.CachedInputTokens, true
+}
+
+// HasCachedInputTokens returns a boolean if a field has been set.
+func (o *TokenUsage) HasCachedInputTokens() bool {
+	if o != nil && !IsNil(o.CachedInputTokens) {
+		return true
+	}
+
+	return false
+}
+
+// SetCachedInputTokens gets a reference to the given int32 and assigns it to the CachedInputTokens field.
+func (o *TokenUsage) SetCachedInputTokens(v int32) {
+	o.CachedInputTokens = &v
+}
+
 func (o TokenUsage) MarshalJSON() ([]byte, error) {
 	toSerialize,err := o.ToMap()
 	if err != nil {
@@ -171,6 +209,9 @@ func (o TokenUsage) ToMap() (map[string]interface{}, error) {
 	if !IsNil(o.TotalTokens) {
 		toSerialize["total_tokens"] = o.TotalTokens
 	}
+	if !IsNil(o.CachedInputTokens) {
+		toSerialize["cached_input_tokens"] = o.CachedInputTokens
+	}
 	return toSerialize, nil
 }
 
@@ -7,12 +7,14 @@ easy-to-use interface on top of the auto-generated OpenAPI client.
 
 import asyncio
 import json
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
 
 import hindsight_client_api
 from hindsight_client_api.api import banks_api, directives_api, files_api, memory_api, mental_models_api
+from hindsight_client_api.exceptions import ApiException
 from hindsight_client_api.models import (
     memory_item,
     recall_request,
@@ -366,6 +368,52 @@ class Hindsight:
 
         return _run_async(self._memory_api.reflect(bank_id, request_obj, _request_timeout=self._timeout))
 
+    def reflect_stream(
+        self,
+        bank_id: str,
+        query: str,
+        budget: str = "low",
+        context: str | None = None,
+        max_tokens: int | None = None,
+        response_schema: dict[str, Any] | None = None,
+        tags: list[str] | None = None,
+        tags_match: Literal["any", "all", "any_strict", "all_strict"] = "any",
+        include_facts: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Generate a contextual answer, yielding progress events as the server streams them.
+
+        Takes the same arguments as reflect(). See areflect_stream() for the events.
+
+        Example:
+            ```python
+            for event in client.reflect_stream(bank_id="alice", query="What are my interests?"):
+                if event["type"] == "answer_delta":
+                    print(event["text"], end="", flush=True)
+                elif event["type"] == "done":
+                    response = event["response"]
+            ```
+        """
+        events = self.areflect_stream(
+            bank_id,
+            query,
+            budget=budget,
+            context=context,
+            max_tokens=max_tokens,
+            response_schema=response_schema,
+            tags=tags,
+            tags_match=tags_match,
+            include_facts=include_facts,
+        )
+        try:
+            while True:
+                try:
+                    yield _run_async(events.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            _run_async(events.aclose())
+
     def list_memories(
         self,
         bank_id: str,
@@ -782,6 +830,63 @@ class Hindsight:
 
         return await self._memory_api.reflect(bank_id, request_obj, _request_timeout=self._timeout)
 
+    async def areflect_stream(
+        self,
+        bank_id: str,
+        query: str,
+        budget: str = "low",
+        context: str | None = None,
+        max_tokens: int | None = None,
+        response_schema: dict[str, Any] | None = None,
+        tags: list[str] | None = None,
+        tags_match: Literal["any", "all", "any_strict", "all_strict"] = "any",
+        include_facts: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Generate a contextual answer, yielding progress events as the server streams them (async).
+
+        Takes the same arguments as reflect(). Events are dicts with a "type":
+            - "tool_call": a tool the agent ran ("tool", "reason", "input", "duration_ms", "iteration")
+            - "answer_delta": the next chunk of the answer ("text")
+            - "done": the last event; "response" is the complete ReflectResponse
+
+        Raises:
+            ApiException: If the request is rejected or the reflect fails mid-stream
+        """
+        import aiohttp
+
+        include = ReflectIncludeOptions(facts={}) if include_facts else None
+        request_obj = reflect_request.ReflectRequest(
+            query=query,
+            budget=budget,
+            context=context,
+            max_tokens=max_tokens,
+            response_schema=response_schema,
+            tags=tags,
+            tags_match=tags_match,
+            include=include,
+        )
+        url = f"{self._base_url}/v1/default/banks/{bank_id}/reflect/stream"
+        headers = {"Authorization": f"Bearer {self._api_key}"} if self._api_key else {}
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                url,
+                json=request_obj.to_dict(),
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+            ) as resp:
+                if resp.status >= 400:
+                    raise ApiException(status=resp.status, reason=resp.reason, body=await resp.text())
+                async for line in resp.content:
+                    if not line.strip():
+                        continue
+                    event = json.loads(line)
+                    if event["type"] == "error":
+                        raise ApiException(status=event.get("status_code"), reason=event.get("detail"))
+                    if event["type"] == "done":
+                        event["response"] = ReflectResponse.from_dict(event["response"])
+                    yield event
+
     # Mental Models methods
 
     def create_mental_model(
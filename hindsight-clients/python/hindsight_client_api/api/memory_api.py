@@ -16,12 +16,13 @@ from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
-from pydantic import Field, StrictInt, StrictStr
-from typing import Any, List, Optional
+from pydantic import Field, StrictBytes, StrictInt, StrictStr
+from typing import Any, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 from hindsight_client_api.models.clear_memory_observations_response import ClearMemoryObservationsResponse
 from hindsight_client_api.models.delete_response import DeleteResponse
 from hindsight_client_api.models.graph_data_response import GraphDataResponse
+from hindsight_client_api.models.import_memories_response import ImportMemoriesResponse
 from hindsight_client_api.models.list_memory_units_response import ListMemoryUnitsResponse
 from hindsight_client_api.models.list_tags_response import ListTagsResponse
 from hindsight_client_api.models.recall_request import RecallRequest
@@ -1587,6 +1588,354 @@ class MemoryApi:
 
 
 
+    @validate_call
+    async def import_memories(
+        self,
+        bank_id: StrictStr,
+        body: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
+        import_id: Annotated[Optional[StrictStr], Field(description="Import identifier to resume an interrupted import (generated when omitted)")] = None,
+        format: Annotated[Optional[StrictStr], Field(description="Format of the request body")] = None,
+        authorization: Optional[StrictStr] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ImportMemoriesResponse:
+        """Import pre-extracted facts
+
+        Bulk import facts that were already extracted, without chunking or LLM extraction.  Intended for migrations from other memory systems and for replaying exports. The request body is a stream of fact records, as NDJSON (`format=ndjson`, default) or a Parquet file (`format=parquet`).  **Record fields:** - `text` (required), `fact_type` (`world` or `experience`), `context`, `document_id` - `occurred_start`, `occurred_end`, `mentioned_at` (ISO datetimes) - `entities` (names), `tags`, `metadata` - `embedding` (optional; computed when missing) - `causal_relations`: `[{target_index, relation_type, strength}]`, where `target_index` is the 0-based position of an earlier record of the import  Records are written in batched transactions together with a checkpoint. If an import is interrupted, send the same body with the same `import_id` to resume it: records that were already committed are skipped.
+
+        :param bank_id: (required)
+        :type bank_id: str
+        :param body: (required)
+        :type body: bytearray
+        :param import_id: Import identifier to resume an interrupted import (generated when omitted)
+        :type import_id: str
+        :param format: Format of the request body
+        :type format: str
+        :param authorization:
+        :type authorization: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._import_memories_serialize(
+            bank_id=bank_id,
+            body=body,
+            import_id=import_id,
+            format=format,
+            authorization=authorization,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ImportMemoriesResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    async def import_memories_with_http_info(
+        self,
+        bank_id: StrictStr,
+        body: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
+        import_id: Annotated[Optional[StrictStr], Field(description="Import identifier to resume an interrupted import (generated when omitted)")] = None,
+        format: Annotated[Optional[StrictStr], Field(description="Format of the request body")] = None,
+        authorization: Optional[StrictStr] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[ImportMemoriesResponse]:
+        """Import pre-extracted facts
+
+        Bulk import facts that were already extracted, without chunking or LLM extraction.  Intended for migrations from other memory systems and for replaying exports. The request body is a stream of fact records, as NDJSON (`format=ndjson`, default) or a Parquet file (`format=parquet`).  **Record fields:** - `text` (required), `fact_type` (`world` or `experience`), `context`, `document_id` - `occurred_start`, `occurred_end`, `mentioned_at` (ISO datetimes) - `entities` (names), `tags`, `metadata` - `embedding` (optional; computed when missing) - `causal_relations`: `[{target_index, relation_type, strength}]`, where `target_index` is the 0-based position of an earlier record of the import  Records are written in batched transactions together with a checkpoint. If an import is interrupted, send the same body with the same `import_id` to resume it: records that were already committed are skipped.
+
+        :param bank_id: (required)
+        :type bank_id: str
+        :param body: (required)
+        :type body: bytearray
+        :param import_id: Import identifier to resume an interrupted import (generated when omitted)
+        :type import_id: str
+        :param format: Format of the request body
+        :type format: str
+        :param authorization:
+        :type authorization: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._import_memories_serialize(
+            bank_id=bank_id,
+            body=body,
+            import_id=import_id,
+            format=format,
+            authorization=authorization,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ImportMemoriesResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    async def import_memories_without_preload_content(
+        self,
+        bank_id: StrictStr,
+        body: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
+        import_id: Annotated[Optional[StrictStr], Field(description="Import identifier to resume an interrupted import (generated when omitted)")] = None,
+        format: Annotated[Optional[StrictStr], Field(description="Format of the request body")] = None,
+        authorization: Optional[StrictStr] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Import pre-extracted facts
+
+        Bulk import facts that were already extracted, without chunking or LLM extraction.  Intended for migrations from other memory systems and for replaying exports. The request body is a stream of fact records, as NDJSON (`format=ndjson`, default) or a Parquet file (`format=parquet`).  **Record fields:** - `text` (required), `fact_type` (`world` or `experience`), `context`, `document_id` - `occurred_start`, `occurred_end`, `mentioned_at` (ISO datetimes) - `entities` (names), `tags`, `metadata` - `embedding` (optional; computed when missing) - `causal_relations`: `[{target_index, relation_type, strength}]`, where `target_index` is the 0-based position of an earlier record of the import  Records are written in batched transactions together with a checkpoint. If an import is interrupted, send the same body with the same `import_id` to resume it: records that were already committed are skipped.
+
+        :param bank_id: (required)
+        :type bank_id: str
+        :param body: (required)
+        :type body: bytearray
+        :param import_id: Import identifier to resume an interrupted import (generated when omitted)
+        :type import_id: str
+        :param format: Format of the request body
+        :type format: str
+        :param authorization:
+        :type authorization: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._import_memories_serialize(
+            bank_id=bank_id,
+            body=body,
+            import_id=import_id,
+            format=format,
+            authorization=authorization,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ImportMemoriesResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _import_memories_serialize(
+        self,
+        bank_id,
+        body,
+        import_id,
+        format,
+        authorization,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        if bank_id is not None:
+            _path_params['bank_id'] = bank_id
+        # process the query parameters
+        if import_id is not None:
+            
+            _query_params.append(('import_id', import_id))
+            
+        if format is not None:
+            
+            _query_params.append(('format', format))
+            
+        # process the header parameters
+        if authorization is not None:
+            _header_params['authorization'] = authorization
+        # process the form parameters
+        # process the body parameter
+        if body is not None:
+            # convert to byte array if the input is a file name (str)
+            if isinstance(body, str):
+                with open(body, "rb") as _fp:
+                   _body_params = _fp.read()
+            elif isinstance(body, tuple):
+                # drop the filename from the tuple
+                _body_params = body[1]
+            else:
+                _body_params = body
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/octet-stream'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path='/v1/default/banks/{bank_id}/memories/import',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
     @validate_call
     async def list_memories(
         self,
@@ -1608,7 +1957,183 @@ class MemoryApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ListMemoryUnitsResponse:
+    ) -> ListMemoryUnitsResponse:
+        """List memory units
+
+        List memory units with pagination and optional full-text search. Supports filtering by type. Results are sorted by most recent first (mentioned_at DESC, then created_at DESC).
+
+        :param bank_id: (required)
+        :type bank_id: str
+        :param type:
+        :type type: str
+        :param q:
+        :type q: str
+        :param limit:
+        :type limit: int
+        :param offset:
+        :type offset: int
+        :param authorization:
+        :type authorization: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._list_memories_serialize(
+            bank_id=bank_id,
+            type=type,
+            q=q,
+            limit=limit,
+            offset=offset,
+            authorization=authorization,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ListMemoryUnitsResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    async def list_memories_with_http_info(
+        self,
+        bank_id: StrictStr,
+        type: Optional[StrictStr] = None,
+        q: Optional[StrictStr] = None,
+        limit: Optional[StrictInt] = None,
+        offset: Optional[StrictInt] = None,
+        authorization: Optional[StrictStr] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[ListMemoryUnitsResponse]:
+        """List memory units
+
+        List memory units with pagination and optional full-text search. Supports filtering by type. Results are sorted by most recent first (mentioned_at DESC, then created_at DESC).
+
+        :param bank_id: (required)
+        :type bank_id: str
+        :param type:
+        :type type: str
+        :param q:
+        :type q: str
+        :param limit:
+        :type limit: int
+        :param offset:
+        :type offset: int
+        :param authorization:
+        :type authorization: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._list_memories_serialize(
+            bank_id=bank_id,
+            type=type,
+            q=q,
+            limit=limit,
+            offset=offset,
+            authorization=authorization,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ListMemoryUnitsResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    async def list_memories_without_preload_content(
+        self,
+        bank_id: StrictStr,
+        type: Optional[StrictStr] = None,
+        q: Optional[StrictStr] = None,
+        limit: Optional[StrictInt] = None,
+        offset: Optional[StrictInt] = None,
+        authorization: Optional[StrictStr] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
         """List memory units
 
         List memory units with pagination and optional full-text search. Supports filtering by type. Results are sorted by most recent first (mentioned_at DESC, then created_at DESC).
@@ -1668,6 +2193,172 @@ class MemoryApi:
             *_param,
             _request_timeout=_request_timeout
         )
+        return response_data.response
+
+
+    def _list_memories_serialize(
+        self,
+        bank_id,
+        type,
+        q,
+        limit,
+        offset,
+        authorization,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        if bank_id is not None:
+            _path_params['bank_id'] = bank_id
+        # process the query parameters
+        if type is not None:
+            
+            _query_params.append(('type', type))
+            
+        if q is not None:
+            
+            _query_params.append(('q', q))
+            
+        if limit is not None:
+            
+            _query_params.append(('limit', limit))
+            
+        if offset is not None:
+            
+            _query_params.append(('offset', offset))
+            
+        # process the header parameters
+        if authorization is not None:
+            _header_params['authorization'] = authorization
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='GET',
+            resource_path='/v1/default/banks/{bank_id}/memories/list',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    async def list_tags(
+        self,
+        bank_id: StrictStr,
+        q: Annotated[Optional[StrictStr], Field(description="Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.")] = None,
+        limit: Annotated[Optional[StrictInt], Field(description="Maximum number of tags to return")] = None,
+        offset: Annotated[Optional[StrictInt], Field(description="Offset for pagination")] = None,
+        authorization: Optional[StrictStr] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ListTagsResponse:
+        """List tags
+
+        List all unique tags in a memory bank with usage counts. Supports wildcard search using '*' (e.g., 'user:*', '*-fred', 'tag*-2'). Case-insensitive.
+
+        :param bank_id: (required)
+        :type bank_id: str
+        :param q: Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.
+        :type q: str
+        :param limit: Maximum number of tags to return
+        :type limit: int
+        :param offset: Offset for pagination
+        :type offset: int
+        :param authorization:
+        :type authorization: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._list_tags_serialize(
+            bank_id=bank_id,
+            q=q,
+            limit=limit,
+            offset=offset,
+            authorization=authorization,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ListTagsResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
         await response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
@@ -1676,13 +2367,12 @@ class MemoryApi:
 
 
     @validate_call
-    async def list_memories_with_http_info(
+    async def list_tags_with_http_info(
         self,
         bank_id: StrictStr,
-        type: Optional[StrictStr] = None,
-        q: Optional[StrictStr] = None,
-        limit: Optional[StrictInt] = None,
-        offset: Optional[StrictInt] = None,
+        q: Annotated[Optional[StrictStr], Field(description="Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.")] = None,
+        limit: Annotated[Optional[StrictInt], Field(description="Maximum number of tags to return")] = None,
+        offset: Annotated[Optional[StrictInt], Field(description="Offset for pagination")] = None,
         authorization: Optional[StrictStr] = None,
         _request_timeout: Union[
             None,
@@ -1696,20 +2386,18 @@ class MemoryApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListMemoryUnitsResponse]:
-        """List memory units
+    ) -> ApiResponse[ListTagsResponse]:
+        """List tags
 
-        List memory units with pagination and optional full-text search. Supports filtering by type. Results are sorted by most recent first (mentioned_at DESC, then created_at DESC).
+        List all unique tags in a memory bank with usage counts. Supports wildcard search using '*' (e.g., 'user:*', '*-fred', 'tag*-2'). Case-insensitive.
 
         :param bank_id: (required)
         :type bank_id: str
-        :param type:
-        :type type: str
-        :param q:
+        :param q: Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.
         :type q: str
-        :param limit:
+        :param limit: Maximum number of tags to return
         :type limit: int
-        :param offset:
+        :param offset: Offset for pagination
         :type offset: int
         :param authorization:
         :type authorization: str
@@ -1735,9 +2423,8 @@ class MemoryApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._list_memories_serialize(
+        _param = self._list_tags_serialize(
             bank_id=bank_id,
-            type=type,
             q=q,
             limit=limit,
             offset=offset,
@@ -1749,7 +2436,7 @@ class MemoryApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ListMemoryUnitsResponse",
+            '200': "ListTagsResponse",
             '422': "HTTPValidationError",
         }
         response_data = await self.api_client.call_api(
@@ -1764,13 +2451,12 @@ class MemoryApi:
 
 
     @validate_call
-    async def list_memories_without_preload_content(
+    async def list_tags_without_preload_content(
         self,
         bank_id: StrictStr,
-        type: Optional[StrictStr] = None,
-        q: Optional[StrictStr] = None,
-        limit: Optional[StrictInt] = None,
-        offset: Optional[StrictInt] = None,
+        q: Annotated[Optional[StrictStr], Field(description="Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.")] = None,
+        limit: Annotated[Optional[StrictInt], Field(description="Maximum number of tags to return")] = None,
+        offset: Annotated[Optional[StrictInt], Field(description="Offset for pagination")] = None,
         authorization: Optional[StrictStr] = None,
         _request_timeout: Union[
             None,
@@ -1785,19 +2471,17 @@ class MemoryApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """List memory units
+        """List tags
 
-        List memory units with pagination and optional full-text search. Supports filtering by type. Results are sorted by most recent first (mentioned_at DESC, then created_at DESC).
+        List all unique tags in a memory bank with usage counts. Supports wildcard search using '*' (e.g., 'user:*', '*-fred', 'tag*-2'). Case-insensitive.
 
         :param bank_id: (required)
         :type bank_id: str
-        :param type:
-        :type type: str
-        :param q:
+        :param q: Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.
         :type q: str
-        :param limit:
+        :param limit: Maximum number of tags to return
         :type limit: int
-        :param offset:
+        :param offset: Offset for pagination
         :type offset: int
         :param authorization:
         :type authorization: str
@@ -1823,9 +2507,8 @@ class MemoryApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._list_memories_serialize(
+        _param = self._list_tags_serialize(
             bank_id=bank_id,
-            type=type,
             q=q,
             limit=limit,
             offset=offset,
@@ -1837,7 +2520,7 @@ class MemoryApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ListMemoryUnitsResponse",
+            '200': "ListTagsResponse",
             '422': "HTTPValidationError",
         }
         response_data = await self.api_client.call_api(
@@ -1847,10 +2530,9 @@ class MemoryApi:
         return response_data.response
 
 
-    def _list_memories_serialize(
+    def _list_tags_serialize(
         self,
         bank_id,
-        type,
         q,
         limit,
         offset,
@@ -1879,10 +2561,6 @@ class MemoryApi:
         if bank_id is not None:
             _path_params['bank_id'] = bank_id
         # process the query parameters
-        if type is not None:
-            
-            _query_params.append(('type', type))
-            
         if q is not None:
             
             _query_params.append(('q', q))
@@ -1917,7 +2595,7 @@ class MemoryApi:
 
         return self.api_client.param_serialize(
             method='GET',
-            resource_path='/v1/default/banks/{bank_id}/memories/list',
+            resource_path='/v1/default/banks/{bank_id}/tags',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -1934,12 +2612,10 @@ class MemoryApi:
 
 
     @validate_call
-    async def list_tags(
+    async def recall_memories(
         self,
         bank_id: StrictStr,
-        q: Annotated[Optional[StrictStr], Field(description="Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.")] = None,
-        limit: Annotated[Optional[StrictInt], Field(description="Maximum number of tags to return")] = None,
-        offset: Annotated[Optional[StrictInt], Field(description="Offset for pagination")] = None,
+        recall_request: RecallRequest,
         authorization: Optional[StrictStr] = None,
         _request_timeout: Union[
             None,
@@ -1953,19 +2629,15 @@ class MemoryApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ListTagsResponse:
-        """List tags
+    ) -> RecallResponse:
+        """Recall memory
 
-        List all unique tags in a memory bank with usage counts. Supports wildcard search using '*' (e.g., 'user:*', '*-fred', 'tag*-2'). Case-insensitive.
+        Recall memory using semantic similarity and spreading activation.  The type parameter is optional and must be one of: - `world`: General knowledge about people, places, events, and things that happen - `experience`: Memories about experience, conversations, actions taken, and tasks performed
 
         :param bank_id: (required)
         :type bank_id: str
-        :param q: Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.
-        :type q: str
-        :param limit: Maximum number of tags to return
-        :type limit: int
-        :param offset: Offset for pagination
-        :type offset: int
+        :param recall_request: (required)
+        :type recall_request: RecallRequest
         :param authorization:
         :type authorization: str
         :param _request_timeout: timeout setting for this request. If one
@@ -1990,11 +2662,9 @@ class MemoryApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._list_tags_serialize(
+        _param = self._recall_memories_serialize(
             bank_id=bank_id,
-            q=q,
-            limit=limit,
-            offset=offset,
+            recall_request=recall_request,
             authorization=authorization,
             _request_auth=_request_auth,
             _content_type=_content_type,
@@ -2003,7 +2673,7 @@ class MemoryApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ListTagsResponse",
+            '200': "RecallResponse",
             '422': "HTTPValidationError",
         }
         response_data = await self.api_client.call_api(
@@ -2018,12 +2688,10 @@ class MemoryApi:
 
 
     @validate_call
-    async def list_tags_with_http_info(
+    async def recall_memories_with_http_info(
         self,
         bank_id: StrictStr,
-        q: Annotated[Optional[StrictStr], Field(description="Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.")] = None,
-        limit: Annotated[Optional[StrictInt], Field(description="Maximum number of tags to return")] = None,
-        offset: Annotated[Optional[StrictInt], Field(description="Offset for pagination")] = None,
+        recall_request: RecallRequest,
         authorization: Optional[StrictStr] = None,
         _request_timeout: Union[
             None,
@@ -2037,19 +2705,15 @@ class MemoryApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListTagsResponse]:
-        """List tags
+    ) -> ApiResponse[RecallResponse]:
+        """Recall memory
 
-        List all unique tags in a memory bank with usage counts. Supports wildcard search using '*' (e.g., 'user:*', '*-fred', 'tag*-2'). Case-insensitive.
+        Recall memory using semantic similarity and spreading activation.  The type parameter is optional and must be one of: - `world`: General knowledge about people, places, events, and things that happen - `experience`: Memories about experience, conversations, actions taken, and tasks performed
 
         :param bank_id: (required)
         :type bank_id: str
-        :param q: Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.
-        :type q: str
-        :param limit: Maximum number of tags to return
-        :type limit: int
-        :param offset: Offset for pagination
-        :type offset: int
+        :param recall_request: (required)
+        :type recall_request: RecallRequest
         :param authorization:
         :type authorization: str
         :param _request_timeout: timeout setting for this request. If one
@@ -2074,11 +2738,9 @@ class MemoryApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._list_tags_serialize(
+        _param = self._recall_memories_serialize(
             bank_id=bank_id,
-            q=q,
-            limit=limit,
-            offset=offset,
+            recall_request=recall_request,
             authorization=authorization,
             _request_auth=_request_auth,
             _content_type=_content_type,
@@ -2087,7 +2749,7 @@ class MemoryApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ListTagsResponse",
+            '200': "RecallResponse",
             '422': "HTTPValidationError",
         }
         response_data = await self.api_client.call_api(
@@ -2102,12 +2764,10 @@ class MemoryApi:
 
 
     @validate_call
-    async def list_tags_without_preload_content(
+    async def recall_memories_without_preload_content(
         self,
         bank_id: StrictStr,
-        q: Annotated[Optional[StrictStr], Field(description="Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.")] = None,
-        limit: Annotated[Optional[StrictInt], Field(description="Maximum number of tags to return")] = None,
-        offset: Annotated[Optional[StrictInt], Field(description="Offset for pagination")] = None,
+        recall_request: RecallRequest,
         authorization: Optional[StrictStr] = None,
         _request_timeout: Union[
             None,
@@ -2122,18 +2782,14 @@ class MemoryApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """List tags
+        """Recall memory
 
-        List all unique tags in a memory bank with usage counts. Supports wildcard search using '*' (e.g., 'user:*', '*-fred', 'tag*-2'). Case-insensitive.
+        Recall memory using semantic similarity and spreading activation.  The type parameter is optional and must be one of: - `world`: General knowledge about people, places, events, and things that happen - `experience`: Memories about experience, conversations, actions taken, and tasks performed
 
         :param bank_id: (required)
         :type bank_id: str
-        :param q: Wildcard pattern to filter tags (e.g., 'user:*' for user:alice, '*-admin' for role-admin). Use '*' as wildcard. Case-insensitive.
-        :type q: str
-        :param limit: Maximum number of tags to return
-        :type limit: int
-        :param offset: Offset for pagination
-        :type offset: int
+        :param recall_request: (required)
+        :type recall_request: RecallRequest
         :param authorization:
         :type authorization: str
         :param _request_timeout: timeout setting for this request. If one
@@ -2158,11 +2814,9 @@ class MemoryApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._list_tags_serialize(
+        _param = self._recall_memories_serialize(
             bank_id=bank_id,
-            q=q,
-            limit=limit,
-            offset=offset,
+            recall_request=recall_request,
             authorization=authorization,
             _request_auth=_request_auth,
             _content_type=_content_type,
@@ -2171,7 +2825,7 @@ class MemoryApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ListTagsResponse",
+            '200': "RecallResponse",
             '422': "HTTPValidationError",
         }
         response_data = await self.api_client.call_api(
@@ -2181,12 +2835,10 @@ class MemoryApi:
         return response_data.response
 
 
-    def _list_tags_serialize(
+    def _recall_memories_serialize(
         self,
         bank_id,
-        q,
-        limit,
-        offset,
+        recall_request,
         authorization,
         _request_auth,
         _content_type,
@@ -2212,23 +2864,13 @@ class MemoryApi:
         if bank_id is not None:
             _path_params['bank_id'] = bank_id
         # process the query parameters
-        if q is not None:
-            
-            _query_params.append(('q', q))
-            
-        if limit is not None:
-            
-            _query_params.append(('limit', limit))
-            
-        if offset is not None:
-            
-            _query_params.append(('offset', offset))
-            
         # process the header parameters
         if authorization is not None:
             _header_params['authorization'] = authorization
         # process the form parameters
         # process the body parameter
+        if recall_request is not None:
+            _body_params = recall_request
 
 
         # set the HTTP header `Accept`
@@ -2239,14 +2881,27 @@ class MemoryApi:
                 ]
             )
 
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/json'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
 
         # authentication setting
         _auth_settings: List[str] = [
         ]
 
         return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/v1/default/banks/{bank_id}/tags',
+            method='POST',
+            resource_path='/v1/default/banks/{bank_id}/memories/recall',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -2263,10 +2918,10 @@ class MemoryApi:
 
 
     @validate_call
-    async def recall_memories(
+    async def reflect(
         self,
         bank_id: StrictStr,
-        recall_request: RecallRequest,
+        reflect_request: ReflectRequest,
         authorization: Optional[StrictStr] = None,
         _request_timeout: Union[
             None,
@@ -2280,15 +2935,15 @@ class MemoryApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RecallResponse:
-        """Recall memory
+    ) -> ReflectResponse:
+        """Reflect and generate answer
 
-        Recall memory using semantic similarity and spreading activation.  The type parameter is optional and must be one of: - `world`: General knowledge about people, places, events, and things that happen - `experience`: Memories about experience, conversations, actions taken, and tasks performed
+        Reflect and formulate an answer using bank identity, world facts, and opinions.  This endpoint: 1. Retrieves experience (conversations and events) 2. Retrieves world facts relevant to the query 3. Retrieves existing opinions (bank's perspectives) 4. Uses LLM to formulate a contextual answer 5. Returns plain text answer and the facts used
 
         :param bank_id: (required)
         :type bank_id: str
-        :param recall_request: (required)
-        :type recall_request: RecallRequest
+        :param reflect_request: (required)
+        :type reflect_request: ReflectRequest
         :param authorization:
         :type authorization: str
         :param _request_timeout: timeout setting for this request. If one
@@ -2313,9 +2968,9 @@ class MemoryApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._recall_memories_serialize(
+        _param = self._reflect_serialize(
             bank_id=bank_id,
-            recall_request=recall_request,
+            reflect_request=reflect_request,
             authorization=authorization,
             _request_auth=_request_auth,
             _content_type=_content_type,
@@ -2324,7 +2979,7 @@ class MemoryApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "RecallResponse",
+            '200': "ReflectResponse",
             '422': "HTTPValidationError",
         }
         response_data = await self.api_client.call_api(
@@ -2339,10 +2994,10 @@ class MemoryApi:
 
 
     @validate_call
-    async def recall_memories_with_http_info(
+    async def reflect_with_http_info(
         self,
         bank_id: StrictStr,
-        recall_request: RecallRequest,
+        reflect_request: ReflectRequest,
         authorization: Optional[StrictStr] = None,
         _request_timeout: Union[
             None,
@@ -2356,15 +3011,15 @@ class MemoryApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[RecallResponse]:
-        """Recall memory
+    ) -> ApiResponse[ReflectResponse]:
+        """Reflect and generate answer
 
-        Recall memory using semantic similarity and spreading activation.  The type parameter is optional and must be one of: - `world`: General knowledge about people, places, events, and things that happen - `experience`: Memories about experience, conversations, actions taken, and tasks performed
+        Reflect and formulate an answer using bank identity, world facts, and opinions.  This endpoint: 1. Retrieves experience (conversations and events) 2. Retrieves world facts relevant to the query 3. Retrieves existing opinions (bank's perspectives) 4. Uses LLM to formulate a contextual answer 5. Returns plain text answer and the facts used
 
         :param bank_id: (required)
         :type bank_id: str
-        :param recall_request: (required)
-        :type recall_request: RecallRequest
+        :param reflect_request: (required)
+        :type reflect_request: ReflectRequest
         :param authorization:
         :type authorization: str
         :param _request_timeout: timeout setting for this request. If one
@@ -2389,9 +3044,9 @@ class MemoryApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._recall_memories_serialize(
+        _param = self._reflect_serialize(
             bank_id=bank_id,
-            recall_request=recall_request,
+            reflect_request=reflect_request,
             authorization=authorization,
             _request_auth=_request_auth,
             _content_type=_content_type,
@@ -2400,7 +3055,7 @@ class MemoryApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "RecallResponse",
+            '200': "ReflectResponse",
             '422': "HTTPValidationError",
         }
         response_data = await self.api_client.call_api(
@@ -2415,10 +3070,10 @@ class MemoryApi:
 
 
     @validate_call
-    async def recall_memories_without_preload_content(
+    async def reflect_without_preload_content(
         self,
         bank_id: StrictStr,
-        recall_request: RecallRequest,
+        reflect_request: ReflectRequest,
         authorization: Optional[StrictStr] = None,
         _request_timeout: Union[
             None,
@@ -2433,14 +3088,14 @@ class MemoryApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Recall memory
+        """Reflect and generate answer
 
-        Recall memory using semantic similarity and spreading activation.  The type parameter is optional and must be one of: - `world`: General knowledge about people, places, events, and things that happen - `experience`: Memories about experience, conversations, actions taken, and tasks performed
+        Reflect and formulate an answer using bank identity, world facts, and opinions.  This endpoint: 1. Retrieves experience (conversations and events) 2. Retrieves world facts relevant to the query 3. Retrieves existing opinions (bank's perspectives) 4. Uses LLM to formulate a contextual answer 5. Returns plain text answer and the facts used
 
         :param bank_id: (required)
         :type bank_id: str
-        :param recall_request: (required)
-        :type recall_request: RecallRequest
+        :param reflect_request: (required)
+        :type reflect_request: ReflectRequest
         :param authorization:
         :type authorization: str
         :param _request_timeout: timeout setting for this request. If one
@@ -2465,9 +3120,9 @@ class MemoryApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._recall_memories_serialize(
+        _param = self._reflect_serialize(
             bank_id=bank_id,
-            recall_request=recall_request,
+            reflect_request=reflect_request,
             authorization=authorization,
             _request_auth=_request_auth,
             _content_type=_content_type,
@@ -2476,7 +3131,7 @@ class MemoryApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "RecallResponse",
+            '200': "ReflectResponse",
             '422': "HTTPValidationError",
         }
         response_data = await self.api_client.call_api(
@@ -2486,10 +3141,10 @@ class MemoryApi:
         return response_data.response
 
 
-    def _recall_memories_serialize(
+    def _reflect_serialize(
         self,
         bank_id,
-        recall_request,
+        reflect_request,
         authorization,
         _request_auth,
         _content_type,
@@ -2520,8 +3175,8 @@ class MemoryApi:
             _header_params['authorization'] = authorization
         # process the form parameters
         # process the body parameter
-        if recall_request is not None:
-            _body_params = recall_request
+        if reflect_request is not None:
+            _body_params = reflect_request
 
 
         # set the HTTP header `Accept`
@@ -2552,7 +3207,7 @@ class MemoryApi:
 
         return self.api_client.param_serialize(
             method='POST',
-            resource_path='/v1/default/banks/{bank_id}/memories/recall',
+            resource_path='/v1/default/banks/{bank_id}/reflect',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -2569,7 +3224,7 @@ class MemoryApi:
 
 
     @validate_call
-    async def reflect(
+    async def reflect_stream(
         self,
         bank_id: StrictStr,
         reflect_request: ReflectRequest,
@@ -2586,10 +3241,10 @@ class MemoryApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ReflectResponse:
-        """Reflect and generate answer
+    ) -> None:
+        """Reflect and stream the answer
 
-        Reflect and formulate an answer using bank identity, world facts, and opinions.  This endpoint: 1. Retrieves experience (conversations and events) 2. Retrieves world facts relevant to the query 3. Retrieves existing opinions (bank's perspectives) 4. Uses LLM to formulate a contextual answer 5. Returns plain text answer and the facts used
+        Same as reflect, but streams the agent's progress and the answer as newline-delimited JSON (`application/x-ndjson`).  Each line is an event object with a `type`: - `tool_call`: a tool the agent ran (`tool`, `reason`, `input`, `duration_ms`, `iteration`) - `answer_delta`: the next chunk of the answer text (`text`) - `done`: the last event, with the complete reflect response as `response` - `error`: the reflect failed after the stream started (`status_code`, `detail`)  A synthesized answer is streamed token by token by providers that support streaming; an answer the agent returns through its done tool arrives as one delta. The `text` of the final response is authoritative. Authentication and validation errors are returned as regular HTTP errors.
 
         :param bank_id: (required)
         :type bank_id: str
@@ -2619,7 +3274,7 @@ class MemoryApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._reflect_serialize(
+        _param = self._reflect_stream_serialize(
             bank_id=bank_id,
             reflect_request=reflect_request,
             authorization=authorization,
@@ -2630,7 +3285,7 @@ class MemoryApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ReflectResponse",
+            '200': None,
             '422': "HTTPValidationError",
         }
         response_data = await self.api_client.call_api(
@@ -2645,7 +3300,7 @@ class MemoryApi:
 
 
     @validate_call
-    async def reflect_with_http_info(
+    async def reflect_stream_with_http_info(
         self,
         bank_id: StrictStr,
         reflect_request: ReflectRequest,
@@ -2662,10 +3317,10 @@ class MemoryApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ReflectResponse]:
-        """Reflect and generate answer
+    ) -> ApiResponse[None]:
+        """Reflect and stream the answer
 
-        Reflect and formulate an answer using bank identity, world facts, and opinions.  This endpoint: 1. Retrieves experience (conversations and events) 2. Retrieves world facts relevant to the query 3. Retrieves existing opinions (bank's perspectives) 4. Uses LLM to formulate a contextual answer 5. Returns plain text answer and the facts used
+        Same as reflect, but streams the agent's progress and the answer as newline-delimited JSON (`application/x-ndjson`).  Each line is an event object with a `type`: - `tool_call`: a tool the agent ran (`tool`, `reason`, `input`, `duration_ms`, `iteration`) - `answer_delta`: the next chunk of the answer text (`text`) - `done`: the last event, with the complete reflect response as `response` - `error`: the reflect failed after the stream started (`status_code`, `detail`)  A synthesized answer is streamed token by token by providers that support streaming; an answer the agent returns through its done tool arrives as one delta. The `text` of the final response is authoritative. Authentication and validation errors are returned as regular HTTP errors.
 
         :param bank_id: (required)
         :type bank_id: str
@@ -2695,7 +3350,7 @@ class MemoryApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._reflect_serialize(
+        _param = self._reflect_stream_serialize(
             bank_id=bank_id,
             reflect_request=reflect_request,
             authorization=authorization,
@@ -2706,7 +3361,7 @@ class MemoryApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ReflectResponse",
+            '200': None,
             '422': "HTTPValidationError",
         }
         response_data = await self.api_client.call_api(
@@ -2721,7 +3376,7 @@ class MemoryApi:
 
 
     @validate_call
-    async def reflect_without_preload_content(
+    async def reflect_stream_without_preload_content(
         self,
         bank_id: StrictStr,
         reflect_request: ReflectRequest,
@@ -2739,9 +3394,9 @@ class MemoryApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Reflect and generate answer
+        """Reflect and stream the answer
 
-        Reflect and formulate an answer using bank identity, world facts, and opinions.  This endpoint: 1. Retrieves experience (conversations and events) 2. Retrieves world facts relevant to the query 3. Retrieves existing opinions (bank's perspectives) 4. Uses LLM to formulate a contextual answer 5. Returns plain text answer and the facts used
+        Same as reflect, but streams the agent's progress and the answer as newline-delimited JSON (`application/x-ndjson`).  Each line is an event object with a `type`: - `tool_call`: a tool the agent ran (`tool`, `reason`, `input`, `duration_ms`, `iteration`) - `answer_delta`: the next chunk of the answer text (`text`) - `done`: the last event, with the complete reflect response as `response` - `error`: the reflect failed after the stream started (`status_code`, `detail`)  A synthesized answer is streamed token by token by providers that support streaming; an answer the agent returns through its done tool arrives as one delta. The `text` of the final response is authoritative. Authentication and validation errors are returned as regular HTTP errors.
 
         :param bank_id: (required)
         :type bank_id: str
@@ -2771,7 +3426,7 @@ class MemoryApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._reflect_serialize(
+        _param = self._reflect_stream_serialize(
             bank_id=bank_id,
             reflect_request=reflect_request,
             authorization=authorization,
@@ -2782,7 +3437,7 @@ class MemoryApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ReflectResponse",
+            '200': None,
             '422': "HTTPValidationError",
         }
         response_data = await self.api_client.call_api(
@@ -2792,7 +3447,7 @@ class MemoryApi:
         return response_data.response
 
 
-    def _reflect_serialize(
+    def _reflect_stream_serialize(
         self,
         bank_id,
         reflect_request,
@@ -2834,6 +3489,7 @@ class MemoryApi:
         if 'Accept' not in _header_params:
             _header_params['Accept'] = self.api_client.select_header_accept(
                 [
+                    'application/x-ndjson', 
                     'application/json'
                 ]
             )
@@ -2858,7 +3514,7 @@ class MemoryApi:
 
         return self.api_client.param_serialize(
             method='POST',
-            resource_path='/v1/default/banks/{bank_id}/reflect',
+            resource_path='/v1/default/banks/{bank_id}/reflect/stream',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
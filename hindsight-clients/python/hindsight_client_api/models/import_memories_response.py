@@ -0,0 +1,98 @@
+# coding: utf-8
+
+"""
+    Hindsight HTTP API
+
+    HTTP API for Hindsight
+
+    The version of the OpenAPI document: 0.4.16
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
+from typing import Any, ClassVar, Dict, List
+from typing import Optional, Set
+from typing_extensions import Self
+
+class ImportMemoriesResponse(BaseModel):
+    """
+    Response model for the bulk fact import endpoint.
+    """ # noqa: E501
+    success: StrictBool
+    bank_id: StrictStr
+    import_id: StrictStr = Field(description="Import identifier. Send it again to resume an interrupted import.")
+    records_committed: StrictInt = Field(description="Records of the import committed so far, including earlier attempts")
+    records_skipped: StrictInt = Field(description="Records skipped because an earlier attempt already committed them")
+    units_imported: StrictInt = Field(description="Memory units created by this import, including earlier attempts")
+    __properties: ClassVar[List[str]] = ["success", "bank_id", "import_id", "records_committed", "records_skipped", "units_imported"]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of ImportMemoriesResponse from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([
+        ])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of ImportMemoriesResponse from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "success": obj.get("success"),
+            "bank_id": obj.get("bank_id"),
+            "import_id": obj.get("import_id"),
+            "records_committed": obj.get("records_committed"),
+            "records_skipped": obj.get("records_skipped"),
+            "units_imported": obj.get("units_imported")
+        })
+        return _obj
+
+
@@ -29,7 +29,8 @@ class TokenUsage(BaseModel):
     input_tokens: Optional[StrictInt] = Field(default=0, description="Number of input/prompt tokens consumed")
     output_tokens: Optional[StrictInt] = Field(default=0, description="Number of output/completion tokens generated")
     total_tokens: Optional[StrictInt] = Field(default=0, description="Total tokens (input + output)")
-    __properties: ClassVar[List[str]] = ["input_tokens", "output_tokens", "total_tokens"]
+    cached_input_tokens: Optional[StrictInt] = Field(default=0, description="Input tokens served from the provider's prompt cache (included in input_tokens)")
+    __properties: ClassVar[List[str]] = ["input_tokens", "output_tokens", "total_tokens", "cached_input_tokens"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -84,7 +85,8 @@ class TokenUsage(BaseModel):
         _obj = cls.model_validate({
             "input_tokens": obj.get("input_tokens") if obj.get("input_tokens") is not None else 0,
             "output_tokens": obj.get("output_tokens") if obj.get("output_tokens") is not None else 0,
-            "total_tokens": obj.get("total_tokens") if obj.get("total_tokens") is not None else 0
+            "total_tokens": obj.get("total_tokens") if obj.get("total_tokens") is not None else 0,
+            "cached_input_tokens": obj.get("cached_input_tokens") if obj.get("cached_input_tokens") is not None else 0
         })
         return _obj
 
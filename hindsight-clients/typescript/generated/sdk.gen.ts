@@ -96,6 +96,9 @@ import type {
   GetVersionResponses,
   HealthEndpointHealthGetData,
   HealthEndpointHealthGetResponses,
+  ImportMemoriesData,
+  ImportMemoriesErrors,
+  ImportMemoriesResponses,
   ListBanksData,
   ListBanksErrors,
   ListBanksResponses,
@@ -134,6 +137,9 @@ import type {
   ReflectData,
   ReflectErrors,
   ReflectResponses,
+  ReflectStreamData,
+  ReflectStreamErrors,
+  ReflectStreamResponses,
   RefreshMentalModelData,
   RefreshMentalModelErrors,
   RefreshMentalModelResponses,
@@ -339,6 +345,35 @@ export const reflect = <ThrowOnError extends boolean = false>(
     },
   });
 
+/**
+ * Reflect and stream the answer
+ *
+ * Same as reflect, but streams the agent's progress and the answer as newline-delimited JSON (`application/x-ndjson`).
+ *
+ * Each line is an event object with a `type`:
+ * - `tool_call`: a tool the agent ran (`tool`, `reason`, `input`, `duration_ms`, `iteration`)
+ * - `answer_delta`: the next chunk of the answer text (`text`)
+ * - `done`: the last event, with the complete reflect response as `response`
+ * - `error`: the reflect failed after the stream started (`status_code`, `detail`)
+ *
+ * A synthesized answer is streamed token by token by providers that support streaming; an answer the agent returns through its done tool arrives as one delta. The `text` of the final response is authoritative. Authentication and validation errors are returned as regular HTTP errors.
+ */
+export const reflectStream = <ThrowOnError extends boolean = false>(
+  options: Options<ReflectStreamData, ThrowOnError>,
+) =>
+  (options.client ?? client).post<
+    ReflectStreamResponses,
+    ReflectStreamErrors,
+    ThrowOnError
+  >({
+    url: "/v1/default/banks/{bank_id}/reflect/stream",
+    ...options,
+    headers: {
+      "Content-Type": "application/json",
+      ...options.headers,
+    },
+  });
+
 /**
  * List all memory banks
  *
@@ -1112,6 +1147,39 @@ export const retainMemories = <ThrowOnError extends boolean = false>(
     },
   });
 
+/**
+ * Import pre-extracted facts
+ *
+ * Bulk import facts that were already extracted, without chunking or LLM extraction.
+ *
+ * Intended for migrations from other memory systems and for replaying exports. The request body is a stream of fact records, as NDJSON (`format=ndjson`, default) or a Parquet file (`format=parquet`).
+ *
+ * **Record fields:**
+ * - `text` (required), `fact_type` (`world` or `experience`), `context`, `document_id`
+ * - `occurred_start`, `occurred_end`, `mentioned_at` (ISO datetimes)
+ * - `entities` (names), `tags`, `metadata`
+ * - `embedding` (optional; computed when missing)
+ * - `causal_relations`: `[{target_index, relation_type, strength}]`, where `target_index` is the 0-based position of an earlier record of the import
+ *
+ * Records are written in batched transactions together with a checkpoint. If an import is interrupted, send the same body with the same `import_id` to resume it: records that were already committed are skipped.
+ */
+export const importMemories = <ThrowOnError extends boolean = false>(
+  options: Options<ImportMemoriesData, ThrowOnError>,
+) =>
+  (options.client ?? client).post<
+    ImportMemoriesResponses,
+    ImportMemoriesErrors,
+    ThrowOnError
+  >({
+    bodySerializer: null,
+    url: "/v1/default/banks/{bank_id}/memories/import",
+    ...options,
+    headers: {
+      "Content-Type": "application/octet-stream",
+      ...options.headers,
+    },
+  });
+
 /**
  * Convert files to memories
  *
@@ -1093,6 +1093,46 @@ export type HttpValidationError = {
   detail?: Array<ValidationError>;
 };
 
+/**
+ * ImportMemoriesResponse
+ *
+ * Response model for the bulk fact import endpoint.
+ */
+export type ImportMemoriesResponse = {
+  /**
+   * Success
+   */
+  success: boolean;
+  /**
+   * Bank Id
+   */
+  bank_id: string;
+  /**
+   * Import Id
+   *
+   * Import identifier. Send it again to resume an interrupted import.
+   */
+  import_id: string;
+  /**
+   * Records Committed
+   *
+   * Records of the import committed so far, including earlier attempts
+   */
+  records_committed: number;
+  /**
+   * Records Skipped
+   *
+   * Records skipped because an earlier attempt already committed them
+   */
+  records_skipped: number;
+  /**
+   * Units Imported
+   *
+   * Memory units created by this import, including earlier attempts
+   */
+  units_imported: number;
+};
+
 /**
  * IncludeOptions
  *
@@ -2018,6 +2058,12 @@ export type TokenUsage = {
    * Total tokens (input + output)
    */
   total_tokens?: number;
+  /**
+   * Cached Input Tokens
+   *
+   * Input tokens served from the provider's prompt cache (included in input_tokens)
+   */
+  cached_input_tokens?: number;
 };
 
 /**
@@ -2662,6 +2708,43 @@ export type ReflectResponses = {
 
 export type ReflectResponse2 = ReflectResponses[keyof ReflectResponses];
 
+export type ReflectStreamData = {
+  body: ReflectRequest;
+  headers?: {
+    /**
+     * Authorization
+     */
+    authorization?: string | null;
+  };
+  path: {
+    /**
+     * Bank Id
+     */
+    bank_id: string;
+  };
+  query?: never;
+  url: "/v1/default/banks/{bank_id}/reflect/stream";
+};
+
+export type ReflectStreamErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type ReflectStreamError = ReflectStreamErrors[keyof ReflectStreamErrors];
+
+export type ReflectStreamResponses = {
+  /**
+   * Stream of reflect events
+   */
+  200: unknown;
+};
+
+export type ReflectStreamResponse =
+  ReflectStreamResponses[keyof ReflectStreamResponses];
+
 export type ListBanksData = {
   body?: never;
   headers?: {
@@ -4516,6 +4599,57 @@ export type RetainMemoriesResponses = {
 export type RetainMemoriesResponse =
   RetainMemoriesResponses[keyof RetainMemoriesResponses];
 
+export type ImportMemoriesData = {
+  body: Blob | File;
+  headers?: {
+    /**
+     * Authorization
+     */
+    authorization?: string | null;
+  };
+  path: {
+    /**
+     * Bank Id
+     */
+    bank_id: string;
+  };
+  query?: {
+    /**
+     * Import Id
+     *
+     * Import identifier to resume an interrupted import (generated when omitted)
+     */
+    import_id?: string | null;
+    /**
+     * Format
+     *
+     * Format of the request body
+     */
+    format?: "ndjson" | "parquet";
+  };
+  url: "/v1/default/banks/{bank_id}/memories/import";
+};
+
+export type ImportMemoriesErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type ImportMemoriesError =
+  ImportMemoriesErrors[keyof ImportMemoriesErrors];
+
+export type ImportMemoriesResponses = {
+  /**
+   * Successful Response
+   */
+  200: ImportMemoriesResponse;
+};
+
+export type ImportMemoriesResponse2 =
+  ImportMemoriesResponses[keyof ImportMemoriesResponses];
+
 export type FileRetainData = {
   body: BodyFileRetain;
   headers?: {
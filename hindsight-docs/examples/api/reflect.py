@@ -120,6 +120,17 @@ print(f"Key factors: {result.key_factors}")
 # [/docs:reflect-structured-output]
 
 
+# [docs:reflect-streaming]
+for event in client.reflect_stream(bank_id="my-bank", query="What should I know about Alice?"):
+    if event["type"] == "tool_call":
+        print(f"[{event['tool']}] {event['reason']}")
+    elif event["type"] == "answer_delta":
+        print(event["text"], end="", flush=True)
+    elif event["type"] == "done":
+        response = event["response"]
+# [/docs:reflect-streaming]
+
+
 # =============================================================================
 # Cleanup (not shown in docs)
 # =============================================================================